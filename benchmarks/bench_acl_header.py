@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+ACL header encodes and decodes per second and bytes allocated per header:
+the binary string formatting and int(..., 2) parse plus the bitfield
+uctypes.struct the HCI_ACL used before, versus the shift/mask ACL_HEADER
+codec packing into and unpacking from a caller provided buffer
+
+    micropython benchmarks/bench_acl_header.py
+"""
+import gc
+import utime
+import ustruct
+import uctypes
+import logging
+
+from bluetooth_low_energy.protocols.hci.acl import (
+    ACL_HEADER,
+    HCI_ACL_STRUCT)
+
+logging.basicConfig(level=logging.INFO)
+log = logging.getLogger("benchmarks.bench_acl_header")
+
+ROUNDS = 1000
+HANDLE = 0x0801
+PB = 2
+BC = 0
+LENGTH = 27
+
+
+def encode_format(buf, handle, pb, bc, length):
+    tobytes = int("{:016b}{:02b}{:02b}{:012b}".format(
+        length, bc, pb, handle), 2)
+    ustruct.pack_into("<I", buf, 0, tobytes)
+
+
+def decode_struct(buf):
+    header = uctypes.struct(
+        uctypes.addressof(buf), HCI_ACL_STRUCT, uctypes.LITTLE_ENDIAN)
+    return header.handle, header.pb, header.bc, header.length
+
+
+def encode_codec(buf, handle, pb, bc, length):
+    ACL_HEADER.pack_into(buf, 0, handle, pb, bc, length)
+
+
+def decode_codec(buf):
+    return ACL_HEADER.unpack_from(buf)
+
+
+def bench(name, encode, decode):
+    buf = bytearray(ACL_HEADER.size)
+    gc.collect()
+    mem_before = gc.mem_alloc()
+    start = utime.ticks_us()
+    for _ in range(ROUNDS):
+        encode(buf, HANDLE, PB, BC, LENGTH)
+    encoded = utime.ticks_diff(utime.ticks_us(), start)
+    start = utime.ticks_us()
+    for _ in range(ROUNDS):
+        if decode(buf)[0] != HANDLE:
+            raise ValueError(buf)
+    decoded = utime.ticks_diff(utime.ticks_us(), start)
+    mem_after = gc.mem_alloc()
+    log.info(
+        "%-7s %7d encodes/s, %7d decodes/s, %4d bytes/header",
+        name,
+        ROUNDS * 1000000 // max(encoded, 1),
+        ROUNDS * 1000000 // max(decoded, 1),
+        (mem_after - mem_before) // (ROUNDS * 2))
+
+
+def main():
+    gc.disable()
+    try:
+        bench("format", encode_format, decode_struct)
+        bench("codec", encode_codec, decode_codec)
+    finally:
+        gc.enable()
+
+
+if __name__ == "__main__":
+    main()
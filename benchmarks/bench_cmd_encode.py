@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+Encoding time and allocations per command: format string + ustruct.pack +
+header concatenation (as the wrappers did) versus the precompiled
+HCI_ENCODER packing into the reusable command buffer
+
+    micropython benchmarks/bench_cmd_encode.py
+"""
+import gc
+import utime
+import ustruct
+import logging
+
+from bluetooth_low_energy.modules.st_microelectronics.bluenrg_ms import (
+    BlueNRG_MS)
+from bluetooth_low_energy.protocols.hci import HCI_COMMAND_PKT
+from bluetooth_low_energy.protocols.hci.cmd import (
+    HCI_COMMAND,
+    OCF_LE_SET_ADV_DATA,
+    OGF_LE_CTL,
+    OGF_VENDOR_CMD)
+from bluetooth_low_energy.protocols.hci.vendor_specifics.st_microelectronics.bluenrg_ms.cmd import (
+    OCF_GAP_SET_DISCOVERABLE,
+    OCF_GATT_UPD_CHAR_VAL)
+
+logging.basicConfig(level=logging.INFO)
+log = logging.getLogger("benchmarks.bench_cmd_encode")
+
+ROUNDS = 1000
+VALUE = b'\x01' * 20
+NAME = b'\x09uble'
+ADV = b'\x02\x01\x06\x05\x09uble'
+
+
+class Encoder(BlueNRG_MS):
+    """Captures the packets instead of sending them"""
+
+    def __init__(self):
+        pass
+
+    def hci_send_cmd(self, cmd, is_async=False, timeout=1000, retry=5):
+        header, param = cmd.to_buffer(split=True)
+        if len(header) == cmd.struct_size:
+            header = ustruct.pack("<B3s", HCI_COMMAND_PKT, header)
+
+
+def before_update_char_value(ble):
+    data = ustruct.pack(
+        "<HHBB{:d}s".format(len(VALUE)),
+        0x000C, 0x000E, 0, len(VALUE), VALUE)
+    ble.hci_send_cmd(HCI_COMMAND(
+        ogf=OGF_VENDOR_CMD, ocf=OCF_GATT_UPD_CHAR_VAL, data=data))
+
+
+def before_set_discoverable(ble):
+    data = ustruct.pack(
+        "<BHHBBB{:d}sB{:d}sHH".format(len(NAME), 0),
+        0, 0x800, 0x900, 0, 0, len(NAME), NAME, 0, b'', 0, 0)
+    ble.hci_send_cmd(HCI_COMMAND(
+        ogf=OGF_VENDOR_CMD, ocf=OCF_GAP_SET_DISCOVERABLE, data=data))
+
+
+def before_set_advertising_data(ble):
+    data = ustruct.pack("<B{:d}s".format(len(ADV)), len(ADV), ADV)
+    ble.hci_send_cmd(HCI_COMMAND(
+        ogf=OGF_LE_CTL, ocf=OCF_LE_SET_ADV_DATA, data=data))
+
+
+def after_update_char_value(ble):
+    ble.aci_gatt_update_char_value(
+        serv_handle=0x000C, char_handle=0x000E, char_val_offset=0,
+        char_value_len=len(VALUE), char_value=VALUE)
+
+
+def after_set_discoverable(ble):
+    ble.aci_gap_set_discoverable(
+        adv_type=0, adv_interv_min=0x800, adv_interv_max=0x900,
+        local_name_len=len(NAME), local_name=NAME)
+
+
+def after_set_advertising_data(ble):
+    ble.hci_le_set_advertising_data(length=len(ADV), data=ADV)
+
+
+def bench(name, function, ble):
+    function(ble)  # compile the encoder
+    gc.collect()
+    mem_before = gc.mem_alloc()
+    start = utime.ticks_us()
+    for _ in range(ROUNDS):
+        function(ble)
+    elapsed = utime.ticks_diff(utime.ticks_us(), start)
+    mem_after = gc.mem_alloc()
+    log.info(
+        "%-28s %6d us/1000 cmds, %5d bytes/cmd",
+        name, elapsed, (mem_after - mem_before) // ROUNDS)
+
+
+def main():
+    ble = Encoder()
+    gc.disable()
+    try:
+        for name in ("update_char_value", "set_discoverable",
+                     "set_advertising_data"):
+            bench("before " + name, globals()["before_" + name], ble)
+            bench("after  " + name, globals()["after_" + name], ble)
+    finally:
+        gc.enable()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+GATT database setup with one command at a time versus pipelined commands,
+against the virtual BlueNRG-MS with a 500 us command latency
+
+    micropython benchmarks/bench_cmd_pipeline.py
+"""
+import utime
+import logging
+
+from bluetooth_low_energy.modules.st_microelectronics.bluenrg_ms import (
+    BlueNRG_MS)
+from bluetooth_low_energy.modules.st_microelectronics.virtual_bluenrg_ms import (
+    VirtualBlueNRG_MS)
+
+logging.basicConfig(level=logging.INFO)
+log = logging.getLogger("benchmarks.bench_cmd_pipeline")
+
+CHARACTERISTICS = 32
+LATENCY_US = 500
+
+
+def add_chars(bluenrg, service_handle):
+    return [
+        bluenrg.aci_gatt_add_char(
+            service_handle=service_handle,
+            char_uuid_type=1,
+            char_uuid=bytes([index & 0xFF, 0x2A]),
+            char_value_len=20,
+            char_properties=0x12,
+            sec_permissions=0,
+            gatt_evt_mask=0,
+            encry_key_size=16,
+            is_variable=1
+        ) for index in range(CHARACTERISTICS)
+    ]
+
+
+def bench(ncmd, pipelined):
+    controller = VirtualBlueNRG_MS(latency_us=LATENCY_US, boot_us=0, ncmd=ncmd)
+    bluenrg = BlueNRG_MS(**controller.wiring())
+    bluenrg.reset()
+    bluenrg.aci_gatt_init()
+    service_handle = bluenrg.aci_gatt_add_serv(
+        service_uuid_type=1, service_uuid=b'\x0F\x18', service_type=1,
+        max_attr_records=2 * CHARACTERISTICS + 1).response_struct.handle
+
+    start = utime.ticks_us()
+    if pipelined:
+        with bluenrg.pipelined():
+            cmds = add_chars(bluenrg, service_handle)
+    else:
+        cmds = add_chars(bluenrg, service_handle)
+    elapsed = utime.ticks_diff(utime.ticks_us(), start)
+
+    for cmd in cmds:
+        if cmd.response_struct.status:
+            raise ValueError("status")
+    log.info(
+        "ncmd %d, %-9s: %7d us, %5d us/command, %d in flight",
+        ncmd,
+        "pipelined" if pipelined else "blocking",
+        elapsed,
+        elapsed // CHARACTERISTICS,
+        bluenrg._cmd_scheduler.max_in_flight
+    )
+
+
+def main():
+    for ncmd in (1, 4):
+        bench(ncmd, False)
+        bench(ncmd, True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+Garbage collections and bytes allocated per 10k events dispatched to their
+handlers, on a scan-like mix of events from the virtual BlueNRG-MS: an
+HCI_UART, an HCI_EVENT, views and a uctypes.struct built for every event
+as hci_dispatch() did, versus the records of the EventPool reused once the
+handlers return
+
+    micropython benchmarks/bench_event_pool.py
+
+A collection is counted whenever gc.mem_alloc() drops between two events.
+"""
+import gc
+import logging
+
+from bluetooth_low_energy.modules.st_microelectronics.bluenrg_ms import (
+    BlueNRG_MS)
+from bluetooth_low_energy.modules.st_microelectronics.virtual_bluenrg_ms import (
+    VirtualBlueNRG_MS,
+    advertising_report,
+    gatt_attribute_modified,
+    num_completed_packets)
+from bluetooth_low_energy.protocols.hci.event import (
+    EVT_LE_ADVERTISING_REPORT,
+    EVT_LE_META_EVENT,
+    EVT_NUM_COMP_PKTS,
+    EVT_VENDOR,
+    HCI_EVENT)
+from bluetooth_low_energy.protocols.hci.uart import HCI_UART
+from bluetooth_low_energy.protocols.hci.vendor_specifics.st_microelectronics.bluenrg_ms.event import (
+    EVT_BLUE_GATT_ATTRIBUTE_MODIFIED)
+
+logging.basicConfig(level=logging.INFO)
+log = logging.getLogger("benchmarks.bench_event_pool")
+
+EVENTS = 10000
+
+# 8 advertising reports for every write and completion
+PACKETS = [advertising_report(
+    bytes((index, 2, 3, 4, 5, 6)), b'\x02\x01\x06\x03\x03\x0F\x18')
+    for index in range(8)] + [
+    gatt_attribute_modified(0x0801, 0x000E, b'\x01\x02'),
+    num_completed_packets(0x0801, 1)
+]
+
+
+class LegacyDispatch(BlueNRG_MS):
+    """hci_dispatch() decoding a new HCI_EVENT for every event"""
+
+    def hci_dispatch(self, event):
+        handlers = self._handlers.get(
+            HCI_EVENT.peek_evtcode(event) << 16 |
+            HCI_EVENT.peek_subevtcode(event))
+        if handlers is None:
+            self.__process__(event)
+            return False
+        hci_evt = HCI_EVENT.from_buffer(HCI_UART.from_buffer(event).data)
+        for handler, filter_ in handlers:
+            if filter_ is None or filter_(hci_evt):
+                handler(hci_evt)
+        return True
+
+
+def setup(cls):
+    controller = VirtualBlueNRG_MS(latency_us=0, boot_us=0)
+    bluenrg = cls(**controller.wiring())
+    counters = [0]
+
+    def report(hci_evt):
+        counters[0] += hci_evt.data[0] + hci_evt.struct.data_length
+
+    def attribute_modified(hci_evt):
+        counters[0] += hci_evt.struct.attr_handle
+
+    def completed(hci_evt):
+        counters[0] += hci_evt.struct.num_hndl
+
+    bluenrg.on(EVT_LE_META_EVENT, EVT_LE_ADVERTISING_REPORT, report)
+    bluenrg.on(EVT_VENDOR, EVT_BLUE_GATT_ATTRIBUTE_MODIFIED,
+               attribute_modified)
+    bluenrg.on(EVT_NUM_COMP_PKTS, handler=completed)
+    return bluenrg
+
+
+def bench(name, bluenrg):
+    packets = [memoryview(bytearray(packet)) for packet in PACKETS]
+    count = len(packets)
+    for packet in packets:
+        bluenrg.hci_dispatch(packet)
+
+    gc.collect()
+    gc.disable()
+    mem_before = gc.mem_alloc()
+    for index in range(EVENTS):
+        bluenrg.hci_dispatch(packets[index % count])
+    mem_after = gc.mem_alloc()
+    gc.enable()
+
+    collections = 0
+    gc.collect()
+    last = gc.mem_alloc()
+    for index in range(EVENTS):
+        bluenrg.hci_dispatch(packets[index % count])
+        now = gc.mem_alloc()
+        if now < last:
+            collections += 1
+        last = now
+    log.info(
+        "%-6s %7d bytes, %4d collections per %d events",
+        name, (mem_after - mem_before) * 10000 // EVENTS, collections, EVENTS)
+
+
+def main():
+    bench("legacy", setup(LegacyDispatch))
+    bench("pooled", setup(BlueNRG_MS))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+Throughput of HCI_UART_FRAMER fed with 1 byte, 64 bytes and 4 KB chunks
+
+    micropython benchmarks/bench_h4_framer.py
+"""
+import gc
+import utime
+import logging
+
+from bluetooth_low_energy.protocols.hci.uart import HCI_UART_FRAMER
+
+logging.basicConfig(level=logging.INFO)
+log = logging.getLogger("benchmarks.bench_h4_framer")
+
+# recorded mix: command complete, number of completed packets, ATT over ACL,
+# LE advertising report
+PACKETS = (
+    b'\x04\x0e\x0c\x01\x01\x10\x00\x07\x071\x070\x00\x13\x00',
+    b'\x04\x13\x05\x01@\x00\x01\x00',
+    b'\x02@ \x07\x00\x03\x00\x04\x00\x0b@\x04',
+    b'\x04>\x13\x01\x00\x01\x08\x01\x01\xc5l\x0c\xc36T\x18\x00\x00\x00H\x00\x05'
+)
+
+STREAM_SIZE = 64 * 1024
+
+
+def build_stream():
+    packets = b''.join(PACKETS)
+    repeat = STREAM_SIZE // len(packets)
+    return memoryview(packets * repeat), repeat * len(PACKETS)
+
+
+def bench(stream, frames, chunk):
+    framer = HCI_UART_FRAMER()
+    received = [0]
+
+    def on_frame(frame):
+        received[0] += 1
+
+    length = len(stream)
+    gc.collect()
+    mem_before = gc.mem_alloc()
+    start = utime.ticks_us()
+    offset = 0
+    while offset < length:
+        end = min(offset + chunk, length)
+        # keep the chunk boundaries of a UART read, without copying
+        while offset < end:
+            offset = framer.consume(stream, offset, end)
+            if framer.frame is not None:
+                on_frame(framer.frame)
+    elapsed = utime.ticks_diff(utime.ticks_us(), start)
+    mem_after = gc.mem_alloc()
+
+    if received[0] != frames:
+        raise ValueError("frames: {:d} != {:d}".format(received[0], frames))
+    log.info(
+        "chunk %4d: %7d us, %6d KB/s, %6d frames/s, %d bytes allocated",
+        chunk,
+        elapsed,
+        (length * 1000000 // elapsed) // 1024,
+        frames * 1000000 // elapsed,
+        mem_after - mem_before
+    )
+
+
+def main():
+    stream, frames = build_stream()
+    log.info("%d bytes, %d frames", len(stream), frames)
+    for chunk in (1, 64, 4096):
+        bench(stream, frames, chunk)
+
+
+if __name__ == "__main__":
+    main()
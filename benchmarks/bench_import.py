@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Import time of bluetooth_low_energy.modules.st_microelectronics.bluenrg_ms
+(its protocol tables included) and heap still allocated after the import,
+then time and heap of every group of vendor specific descriptors, loaded
+on first use, run once per fresh interpreter:
+
+    micropython benchmarks/bench_import.py
+
+From .py sources the import time is mostly compilation, mpy-cross the
+package to compare the bytecode alone.
+"""
+import gc
+import utime
+import logging
+
+logging.basicConfig(level=logging.INFO)
+log = logging.getLogger("benchmarks.bench_import")
+
+
+def measure(function):
+    gc.collect()
+    mem_before = gc.mem_alloc()
+    start = utime.ticks_us()
+    result = function()
+    elapsed = utime.ticks_diff(utime.ticks_us(), start)
+    gc.collect()
+    return result, elapsed, gc.mem_alloc() - mem_before
+
+
+def import_bluenrg_ms():
+    from bluetooth_low_energy.modules.st_microelectronics import bluenrg_ms
+    return bluenrg_ms
+
+
+def main():
+    bluenrg_ms, elapsed, allocated = measure(import_bluenrg_ms)
+    log.info(
+        "%s: %d us, %d bytes after import",
+        bluenrg_ms.__name__, elapsed, allocated)
+
+    from bluetooth_low_energy.protocols.hci.vendor_specifics.st_microelectronics.bluenrg_ms import (
+        cmd,
+        event)
+    groups = (
+        ("HAL commands", cmd.HCI_VENDOR_COMMANDS[1],
+         cmd.OCF_HAL_GET_FW_BUILD_NUMBER),
+        ("updater commands", cmd.HCI_VENDOR_COMMANDS[1],
+         cmd.OCF_UPDATER_START),
+        ("GAP commands", cmd.HCI_VENDOR_COMMANDS[1], cmd.OCF_GAP_INIT),
+        ("GATT commands", cmd.HCI_VENDOR_COMMANDS[1], cmd.OCF_GATT_INIT),
+        ("L2CAP commands", cmd.HCI_VENDOR_COMMANDS[1],
+         cmd.OCF_L2CAP_CONN_PARAM_UPDATE_REQ),
+        ("HAL events", event.HCI_VENDOR_EVENTS,
+         event.EVT_BLUE_HAL_INITIALIZED),
+        ("GAP events", event.HCI_VENDOR_EVENTS,
+         event.EVT_BLUE_GAP_PAIRING_CMPLT),
+        ("L2CAP events", event.HCI_VENDOR_EVENTS,
+         event.EVT_BLUE_L2CAP_CONN_UPD_RESP),
+        ("GATT events", event.HCI_VENDOR_EVENTS,
+         event.EVT_BLUE_GATT_ATTRIBUTE_MODIFIED)
+    )
+    total_elapsed = total_allocated = 0
+    for name, table, code in groups:
+        _, elapsed, allocated = measure(lambda: table[code])
+        total_elapsed += elapsed
+        total_allocated += allocated
+        log.info("%-16s %6d us, %6d bytes on first use",
+                 name, elapsed, allocated)
+    log.info("%-16s %6d us, %6d bytes", "all groups",
+             total_elapsed, total_allocated)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+Attribute access cost and memory per packet object over a mix of recorded
+events: properties of HCI_EVENT / HCI_ACL versus the `if name == ...`
+chain of __getattr__ the classes used before
+
+    micropython benchmarks/bench_packet_attrs.py
+"""
+import gc
+import utime
+import logging
+
+# registers the vendor specific events
+from bluetooth_low_energy.modules.st_microelectronics.bluenrg_ms import (
+    BlueNRG_MS)
+from bluetooth_low_energy.modules.st_microelectronics.virtual_bluenrg_ms import (
+    advertising_report,
+    connection_complete,
+    disconnection_complete,
+    gatt_attribute_modified,
+    num_completed_packets)
+from bluetooth_low_energy.protocols.hci.acl import HCI_ACL
+from bluetooth_low_energy.protocols.hci.event import HCI_EVENT
+from bluetooth_low_energy.protocols.hci.uart import HCI_UART
+
+logging.basicConfig(level=logging.INFO)
+log = logging.getLogger("benchmarks.bench_packet_attrs")
+
+ROUNDS = 200
+BDADDR = b'\x01\x02\x03\x04\x05\x06'
+
+EVENTS = (
+    b'\x04\x0e\x0c\x01\x01\x10\x00\x07\x071\x070\x00\x13\x00',
+    num_completed_packets(0x0801, 1),
+    advertising_report(BDADDR, b'\x02\x01\x06'),
+    connection_complete(0x0801, BDADDR),
+    gatt_attribute_modified(0x0801, 0x000E, b'\x01\x00'),
+    disconnection_complete(0x0801)
+)
+ACL = b'\x02\x01\x28\x07\x00\x03\x00\x04\x00\x0b\x40\x04'
+
+
+class GetattrEvent(object):
+    """HCI_EVENT fields behind the former __getattr__ dispatch"""
+
+    def __init__(self, event):
+        self._evtcode = event.evtcode
+        self._evtname = event.evtname
+        self._subevtcode = event.subevtcode
+        self._subevtname = event.subevtname
+        self._data = event.data
+
+    def __getattr__(self, name):
+        if name == "evtcode":
+            return self._evtcode
+        elif name == "evtname":
+            return self._evtname
+        elif name == "subevtcode":
+            return self._subevtcode
+        elif name == "subevtname":
+            return self._subevtname
+        elif name == "length":
+            return len(self._data)
+        elif name == "data":
+            return self._data
+
+
+class GetattrACL(object):
+    """HCI_ACL fields behind the former __getattr__ dispatch"""
+
+    def __init__(self, acl):
+        self._handle = acl._handle
+        self._pb = acl._pb
+        self._pb_name = acl._pb_name
+        self._bc = acl._bc
+        self._tobytes = acl.tobytes
+        self._data = acl._data
+
+    def __getattr__(self, name):
+        if name == "handle":
+            return self._handle
+        elif name == "pb":
+            return self._pb
+        elif name == "pb_name":
+            return self._pb_name
+        elif name == "bc":
+            return self._bc
+        elif name == "tobytes":
+            return self._tobytes
+        elif name == "length":
+            return len(self._data)
+        elif name == "data":
+            return self._data
+
+
+def read_events(events):
+    total = 0
+    for _ in range(ROUNDS):
+        for event in events:
+            total += event.evtcode + event.subevtcode + event.length
+            if event.data is None:
+                raise ValueError("data")
+    return total
+
+
+def read_acl(packets):
+    total = 0
+    for _ in range(ROUNDS):
+        for acl in packets:
+            total += acl.handle + acl.pb + acl.length
+            if acl.data is None:
+                raise ValueError("data")
+    return total
+
+
+def bench_access(name, function, objects):
+    start = utime.ticks_us()
+    function(objects)
+    elapsed = utime.ticks_diff(utime.ticks_us(), start)
+    log.info(
+        "%-16s %5d ns/attribute",
+        name, elapsed * 1000 // (ROUNDS * len(objects) * 4))
+
+
+def bench_memory(name, factory, packet):
+    objects = [None] * ROUNDS
+    gc.collect()
+    mem_before = gc.mem_alloc()
+    for index in range(ROUNDS):
+        objects[index] = factory(packet)
+    mem_after = gc.mem_alloc()
+    log.info(
+        "%-16s %5d bytes/object", name, (mem_after - mem_before) // ROUNDS)
+
+
+def main():
+    events = [HCI_EVENT.from_buffer(HCI_UART.from_buffer(packet).data)
+              for packet in EVENTS]
+    acls = [HCI_ACL.from_buffer(HCI_UART.from_buffer(ACL).data)]
+    gc.disable()
+    try:
+        bench_access("HCI_EVENT", read_events, events)
+        bench_access("__getattr__", read_events,
+                     [GetattrEvent(event) for event in events])
+        bench_access("HCI_ACL", read_acl, acls)
+        bench_access("__getattr__", read_acl,
+                     [GetattrACL(acl) for acl in acls])
+        bench_memory("HCI_EVENT", lambda event: HCI_EVENT(
+            event.evtcode, event.data), events[1])
+        bench_memory("__getattr__ EVT", GetattrEvent, events[1])
+        bench_memory("HCI_ACL", lambda acl: HCI_ACL(
+            acl.handle, acl.pb, acl.bc, acl.data), acls[0])
+        bench_memory("__getattr__ ACL", GetattrACL, acls[0])
+    finally:
+        gc.enable()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+GATT value updates per second and bytes allocated per update against the
+virtual BlueNRG-MS (no command latency): aci_gatt_update_char_value and
+its response_struct versus a command prepared once and re-sent with
+aci_gatt_update_prepared_char_value
+
+    micropython benchmarks/bench_prepared_update.py
+"""
+import gc
+import utime
+import ustruct
+import logging
+
+from bluetooth_low_energy.modules.st_microelectronics.bluenrg_ms import (
+    BlueNRG_MS)
+from bluetooth_low_energy.modules.st_microelectronics.virtual_bluenrg_ms import (
+    VirtualBlueNRG_MS)
+
+logging.basicConfig(level=logging.INFO)
+log = logging.getLogger("benchmarks.bench_prepared_update")
+
+UPDATES = 500
+VALUE_LEN = 6
+
+
+def setup():
+    controller = VirtualBlueNRG_MS(latency_us=0, boot_us=0)
+    bluenrg = BlueNRG_MS(**controller.wiring())
+    bluenrg.reset()
+    bluenrg.aci_gatt_init()
+    serv_handle = bluenrg.aci_gatt_add_serv(
+        service_uuid_type=1, service_uuid=b'\x0F\x18', service_type=1,
+        max_attr_records=3).response_struct.handle
+    char_handle = bluenrg.aci_gatt_add_char(
+        service_handle=serv_handle,
+        char_uuid_type=1,
+        char_uuid=b'\x19\x2A',
+        char_value_len=VALUE_LEN,
+        char_properties=0x12,
+        sec_permissions=0,
+        gatt_evt_mask=0,
+        encry_key_size=16,
+        is_variable=0
+    ).response_struct.handle
+    return bluenrg, serv_handle, char_handle
+
+
+def update(bluenrg, serv_handle, char_handle, value):
+    return bluenrg.aci_gatt_update_char_value(
+        serv_handle=serv_handle,
+        char_handle=char_handle,
+        char_val_offset=0,
+        char_value_len=len(value),
+        char_value=value).response_struct.status
+
+
+def update_prepared(bluenrg, cmd, value):
+    return bluenrg.aci_gatt_update_prepared_char_value(cmd, value).status
+
+
+def bench(name, function, *args):
+    value = bytearray(VALUE_LEN)
+    function(*(args + (value,)))
+    gc.collect()
+    mem_before = gc.mem_alloc()
+    start = utime.ticks_us()
+    for index in range(UPDATES):
+        ustruct.pack_into("<HHH", value, 0, index, index, index)
+        if function(*(args + (value,))):
+            raise ValueError("status")
+    elapsed = utime.ticks_diff(utime.ticks_us(), start)
+    mem_after = gc.mem_alloc()
+    log.info(
+        "%-9s %6d updates/s, %5d bytes/update",
+        name,
+        UPDATES * 1000000 // max(elapsed, 1),
+        (mem_after - mem_before) // UPDATES)
+
+
+def main():
+    bluenrg, serv_handle, char_handle = setup()
+    cmd = bluenrg.aci_gatt_prepare_char_value(
+        serv_handle=serv_handle, char_handle=char_handle,
+        char_value_len=VALUE_LEN)
+    gc.disable()
+    try:
+        bench("update", update, bluenrg, serv_handle, char_handle)
+        bench("prepared", update_prepared, bluenrg, cmd)
+    finally:
+        gc.enable()
+
+
+if __name__ == "__main__":
+    main()
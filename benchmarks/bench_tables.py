@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+Heap and lookup time of the command and event tables: the dicts of lists
+of uctypes descriptors they used to be, rebuilt here, versus the compact
+descriptors looked up with expand()
+
+    micropython benchmarks/bench_tables.py
+
+Frozen into the firmware the compact tables only keep their {code: entry}
+dicts in RAM ("frozen" below), from .py sources their strings and tuples
+are allocated by the import as well.
+"""
+import gc
+import utime
+import logging
+
+from bluetooth_low_energy.protocols.hci.cmd import HCI_COMMANDS
+from bluetooth_low_energy.protocols.hci.event import (
+    HCI_EVENTS,
+    HCI_LE_META_EVENTS)
+from bluetooth_low_energy.protocols.hci.table import expand
+from bluetooth_low_energy.protocols.hci.vendor_specifics.st_microelectronics.bluenrg_ms.cmd import (
+    HCI_VENDOR_COMMANDS)
+from bluetooth_low_energy.protocols.hci.vendor_specifics.st_microelectronics.bluenrg_ms.event import (
+    HCI_VENDOR_EVENTS)
+
+logging.basicConfig(level=logging.INFO)
+log = logging.getLogger("benchmarks.bench_tables")
+
+ROUNDS = 20
+MODULE = "IDB05A1"
+
+
+def _copy(descriptor):
+    # a descriptor of its own, as every entry of the literal tables had
+    if descriptor is None:
+        return None
+    copy = {}
+    for name, field in descriptor.items():
+        if isinstance(field, tuple) and len(field) == 3:
+            field = (field[0], field[1], _copy(field[2]))
+        copy[name] = field
+    return copy
+
+
+def _descriptor(spec):
+    if isinstance(spec, tuple):
+        return dict((module, _copy(expand(spec, module)))
+                    for module, _ in spec)
+    return _copy(expand(spec))
+
+
+def tables():
+    """The compact tables, (name, {code: entry}) each"""
+    HCI_VENDOR_COMMANDS[1].load()
+    HCI_VENDOR_EVENTS.load()
+    commands = [(name, ocfs) for _, (name, ocfs) in HCI_COMMANDS.items()
+                if ocfs is not None]
+    return commands + [
+        ("VENDOR_CMD", dict(HCI_VENDOR_COMMANDS[1].items())),
+        ("EVENTS", HCI_EVENTS),
+        ("LE_META_EVENTS", HCI_LE_META_EVENTS),
+        ("VENDOR_EVENTS", dict(HCI_VENDOR_EVENTS.items()))
+    ]
+
+
+def dict_of_lists(compact):
+    return [(name, dict(
+        (code, [entry[0]] + [_descriptor(spec) for spec in entry[1:]])
+        for code, entry in table.items())) for name, table in compact]
+
+
+def frozen(compact):
+    return [(name, dict(table)) for name, table in compact]
+
+
+def expanded(compact):
+    return [[expand(spec, MODULE) for spec in entry[1:]]
+            for _, table in compact for entry in table.values()]
+
+
+def lookup_lists(lists):
+    for _ in range(ROUNDS):
+        for _, table in lists:
+            for code in table:
+                entry = table[code]
+                for descriptor in entry[1:]:
+                    if descriptor is not None:
+                        descriptor.get(MODULE, descriptor)
+
+
+def lookup_compact(compact):
+    for _ in range(ROUNDS):
+        for _, table in compact:
+            for code in table:
+                entry = table[code]
+                for spec in entry[1:]:
+                    expand(spec, MODULE)
+
+
+def heap(name, function, compact):
+    gc.collect()
+    mem_before = gc.mem_alloc()
+    result = function(compact)
+    gc.collect()
+    log.info("%-14s %6d bytes", name, gc.mem_alloc() - mem_before)
+    return result
+
+
+def lookups(name, function, tables, count):
+    start = utime.ticks_us()
+    function(tables)
+    elapsed = utime.ticks_diff(utime.ticks_us(), start)
+    log.info("%-14s %6d ns/lookup", name,
+             elapsed * 1000 // (ROUNDS * count))
+
+
+def main():
+    compact = tables()
+    count = sum(len(table) for _, table in compact)
+    log.info("%d entries", count)
+    heap("frozen", frozen, compact)
+    # every descriptor in use, expanded once
+    heap("all expanded", expanded, compact)
+    lists = heap("dict of lists", dict_of_lists, compact)
+    lookups("dict of lists", lookup_lists, lists, count)
+    lookups("compact", lookup_compact, compact, count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+Bytes copied and allocated per decoded packet, from the receive buffer
+down to the innermost layer (events, ACL, L2CAP, ATT and SMP): payload
+copied at every layer as the decoders did with sliced bytes, versus the
+memoryviews of the receive buffer they hold now
+
+    micropython benchmarks/bench_zero_copy.py
+"""
+import gc
+import logging
+
+# registers the vendor specific events
+from bluetooth_low_energy.modules.st_microelectronics.bluenrg_ms import (
+    BlueNRG_MS)
+from bluetooth_low_energy.modules.st_microelectronics.virtual_bluenrg_ms import (
+    connection_complete,
+    gatt_attribute_modified)
+from bluetooth_low_energy.protocols.hci.acl import HCI_ACL
+from bluetooth_low_energy.protocols.hci.att import ATT
+from bluetooth_low_energy.protocols.hci.event import HCI_EVENT
+from bluetooth_low_energy.protocols.hci.l2cap import L2CAP
+from bluetooth_low_energy.protocols.hci.smp import SMP
+from bluetooth_low_energy.protocols.hci.uart import HCI_UART
+
+logging.basicConfig(level=logging.INFO)
+log = logging.getLogger("benchmarks.bench_zero_copy")
+
+ROUNDS = 200
+
+PACKETS = (
+    ("event", (HCI_UART, HCI_EVENT),
+     b'\x04\x0e\x0c\x01\x01\x10\x00\x07\x071\x070\x00\x13\x00'),
+    ("le meta event", (HCI_UART, HCI_EVENT),
+     connection_complete(0x0801, b'\x01\x02\x03\x04\x05\x06')),
+    ("vendor event", (HCI_UART, HCI_EVENT),
+     gatt_attribute_modified(0x0801, 0x000E, b'\x01' * 20)),
+    ("acl", (HCI_UART, HCI_ACL),
+     b'\x02\x01\x28\x1b\x00\x17\x00\x04\x00\x1b\x0e\x00' + b'\x01' * 20),
+    ("l2cap", (HCI_UART, HCI_ACL, L2CAP),
+     b'\x02\x01\x28\x1b\x00\x17\x00\x04\x00\x1b\x0e\x00' + b'\x01' * 20),
+    ("att", (HCI_UART, HCI_ACL, L2CAP, ATT),
+     b'\x02\x01\x28\x1b\x00\x17\x00\x04\x00\x1b\x0e\x00' + b'\x01' * 20),
+    ("smp", (HCI_UART, HCI_ACL, L2CAP, SMP),
+     b'\x02\x01\x28\x0b\x00\x07\x00\x06\x00\x01\x03\x00\x01\x10\x07\x07'),
+)
+
+
+def decode_copy(layers, data):
+    """Every layer gets its own bytes, as with data[struct_size:] on bytes"""
+    copied = 0
+    for layer in layers:
+        packet = layer.from_buffer(data)
+        data = bytes(packet.data)
+        copied += len(data)
+    return copied
+
+
+def decode_views(layers, data):
+    for layer in layers:
+        data = layer.from_buffer(data).data
+    return 0
+
+
+def bench(name, layers, packet):
+    buffer = memoryview(bytearray(packet))
+    copied = decode_copy(layers, buffer)
+    for mode, function in (("copy", decode_copy), ("views", decode_views)):
+        gc.collect()
+        mem_before = gc.mem_alloc()
+        for _ in range(ROUNDS):
+            function(layers, buffer)
+        mem_after = gc.mem_alloc()
+        log.info(
+            "%-13s %-5s %4d bytes copied, %5d bytes allocated/packet",
+            name, mode, copied if mode == "copy" else 0,
+            (mem_after - mem_before) // ROUNDS)
+
+
+def main():
+    gc.disable()
+    try:
+        for name, layers, packet in PACKETS:
+            bench(name, layers, packet)
+    finally:
+        gc.enable()
+
+
+if __name__ == "__main__":
+    main()
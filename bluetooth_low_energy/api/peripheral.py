@@ -10,8 +10,7 @@ from bluetooth_low_energy.api.service import Service
 from bluetooth_low_energy.api.uuid import UUID
 from bluetooth_low_energy.modules.st_microelectronics.spbtle_rf import \
     SPBTLE_RF
-from bluetooth_low_energy.protocols.hci import (HCI_EVENT_PKT, event, status,
-                                                uart)
+from bluetooth_low_energy.protocols.hci import event, status
 
 
 class Peripheral(SPBTLE_RF):
@@ -51,6 +50,17 @@ class Peripheral(SPBTLE_RF):
         if event_handler:
             self.set_event_handler(event_handler)
 
+        self.on(event.EVT_DISCONN_COMPLETE,
+                handler=self._disconnection_complete)
+        self.on(event.EVT_LE_META_EVENT, event.EVT_LE_CONN_COMPLETE,
+                self._connection_complete)
+        self.on(event.EVT_VENDOR, st_event.EVT_BLUE_GATT_ATTRIBUTE_MODIFIED,
+                self._attribute_modified)
+        self.on(event.EVT_VENDOR, st_event.EVT_BLUE_GATT_WRITE_PERMIT_REQ,
+                self._write_permit_req)
+        self.on(event.EVT_VENDOR, st_event.EVT_BLUE_GATT_READ_PERMIT_REQ,
+                self._read_permit_req)
+
     def run(self, callback=None, callback_time=1000):
         super(Peripheral, self).run(
             callback=callback, callback_time=callback_time)
@@ -109,11 +119,9 @@ class Peripheral(SPBTLE_RF):
             raise ValueError("aci_gatt_init status: {:02x}".format(
                 result.status))
 
-        # Init BlueNRG GAP layer as peripheral
-        result = self.aci_gap_init_IDB05A1(
-            role=st_constant.GAP_PERIPHERAL_ROLE_IDB05A1,
-            privacy_enabled=bool(st_constant.PRIVACY_DISABLED),
-            device_name_char_len=len(self.name)).response_struct
+        # Init BlueNRG GAP layer as peripheral (of the module detected)
+        result = self.gap_init(
+            "peripheral", device_name_char_len=len(self.name)).response_struct
         if result.status != status.BLE_STATUS_SUCCESS:
             raise ValueError("aci_gap_init status: {:02x}".format(
                 result.status))
@@ -164,32 +172,46 @@ class Peripheral(SPBTLE_RF):
                     result.status))
             _service.handle = result.handle
 
-            # Add Characteristics
-            for _characteristic in _service.get_characteristics():
-                result = self.aci_gatt_add_char(
-                    **_characteristic.__properties__(
-                        service_handle=_service.handle,
-                        char_value_len=_characteristic.char_value_len
-                    )
-                ).response_struct
+            # Add Characteristics, pipelined: up to ncmd in flight
+            characteristics = _service.get_characteristics()
+            with self.pipelined():
+                cmds = [
+                    self.aci_gatt_add_char(
+                        **_characteristic.__properties__(
+                            service_handle=_service.handle,
+                            char_value_len=_characteristic.char_value_len
+                        )
+                    ) for _characteristic in characteristics
+                ]
+            for _characteristic, cmd in zip(characteristics, cmds):
+                result = cmd.response_struct
                 if result.status != status.BLE_STATUS_SUCCESS:
                     raise ValueError("aci_gatt_add_char status: {:02x}".format(
                         result.status))
                 _characteristic.handle = result.handle
 
-                # Add Descriptors
-                for _descriptor in _characteristic.get_descriptors():
-                    result = self.aci_gatt_add_char_desc(
+            # Add Descriptors
+            descriptors = [
+                (_characteristic, _descriptor)
+                for _characteristic in characteristics
+                for _descriptor in _characteristic.get_descriptors()
+            ]
+            with self.pipelined():
+                cmds = [
+                    self.aci_gatt_add_char_desc(
                         **_descriptor.__properties__(
                             service_handle=_service.handle,
                             char_handle=_characteristic.handle
                         )
-                    ).response_struct
-                    _descriptor.handle = result.handle
-                    if result.status != status.BLE_STATUS_SUCCESS:
-                        raise ValueError(
-                            "aci_gatt_add_char_desc status: {:02x}".format(
-                                result.status))
+                    ) for _characteristic, _descriptor in descriptors
+                ]
+            for (_, _descriptor), cmd in zip(descriptors, cmds):
+                result = cmd.response_struct
+                _descriptor.handle = result.handle
+                if result.status != status.BLE_STATUS_SUCCESS:
+                    raise ValueError(
+                        "aci_gatt_add_char_desc status: {:02x}".format(
+                            result.status))
 
         self.set_discoverable()
 
@@ -198,76 +220,69 @@ class Peripheral(SPBTLE_RF):
         # Reset BlueNRG-MS
         self.reset()
 
-    def __process__(self, evt):
-        """ Process event received from BlueNRG-MS """
-        hci_uart = uart.HCI_UART.from_buffer(evt)
-        if hci_uart.pkt_type == HCI_EVENT_PKT:
-            hci_evt = event.HCI_EVENT.from_buffer(hci_uart.data)
-            if hci_evt.evtcode == event.EVT_DISCONN_COMPLETE:
-                self.connection_handle = None
-                if callable(self.event_handler):
-                    self.event_handler(
-                        EVT_GAP_DISCONNECTED,
-                        handler=self.connection_handle,
-                        data=None
-                    )
-            elif hci_evt.evtcode == event.EVT_LE_META_EVENT:
-                if hci_evt.subevtcode == event.EVT_LE_CONN_COMPLETE:
-                    self.connection_handle = hci_evt.struct.handle
-                    if callable(self.event_handler):
-                        self.event_handler(
-                            EVT_GAP_CONNECTED,
-                            handler=self.connection_handle,
-                            data=hci_evt.struct.peer_bdaddr
-                        )
-            elif hci_evt.evtcode == event.EVT_VENDOR:
-                if hci_evt.subevtcode == st_event.EVT_BLUE_GATT_ATTRIBUTE_MODIFIED:
-                    if callable(self.event_handler):
-                        self.event_handler(
-                            EVT_GATTS_WRITE,
-                            handler=hci_evt.struct.attr_handle,
-                            data=hci_evt.struct.att_data[
-                                :hci_evt.struct.data_length]
-                        )
-                elif hci_evt.subevtcode == st_event.EVT_BLUE_GATT_WRITE_PERMIT_REQ:
-                    if callable(self.event_handler):
-                        if self.event_handler(
-                                EVT_GATTS_WRITE_PERMIT_REQ,
-                                handler=hci_evt.struct.attr_handle,
-                                data=hci_evt.struct.data_buffer[
-                                    :hci_evt.struct.data_length]
-                            ):
-                            result = self.aci_gatt_write_response(
-                                conn_handle=self.connection_handle,
-                                attr_handle=hci_evt.struct.attr_handle,
-                                write_status=False,
-                                err_code=0,
-                                att_val_len=hci_evt.struct.data_length,
-                                att_val=hci_evt.struct.data_buffer[
-                                    :hci_evt.struct.data_length]
-                            ).response_struct
-                            if result.status != status.BLE_STATUS_SUCCESS:
-                                raise ValueError(
-                                    "aci_gatt_write_response status: {:02x}".format(
-                                        result.status))
-                            elif result.status == status.BLE_STATUS_SUCCESS:
-                                pass
-
-                elif hci_evt.subevtcode == st_event.EVT_BLUE_GATT_READ_PERMIT_REQ:
-                    if self.connection_handle is not None and callable(self.event_handler):
-                        if self.event_handler(
-                                EVT_GATTS_READ_PERMIT_REQ,
-                                handler=hci_evt.struct.attr_handle,
-                                data=None
-                            ):
-                            result = self.aci_gatt_allow_read(
-                                conn_handle=self.connection_handle).response_struct
-                            if result.status != status.BLE_STATUS_SUCCESS:
-                                raise ValueError(
-                                    "aci_gatt_allow_read status: {:02x}".format(
-                                        result.status))
-                            elif result.status == status.BLE_STATUS_SUCCESS:
-                                pass
+    def _disconnection_complete(self, hci_evt):
+        self.connection_handle = None
+        if callable(self.event_handler):
+            self.event_handler(
+                EVT_GAP_DISCONNECTED,
+                handler=self.connection_handle,
+                data=None
+            )
+
+    def _connection_complete(self, hci_evt):
+        self.connection_handle = hci_evt.struct.handle
+        if callable(self.event_handler):
+            self.event_handler(
+                EVT_GAP_CONNECTED,
+                handler=self.connection_handle,
+                data=bytes(hci_evt.struct.peer_bdaddr)
+            )
+
+    def _attribute_modified(self, hci_evt):
+        if callable(self.event_handler):
+            self.event_handler(
+                EVT_GATTS_WRITE,
+                handler=hci_evt.struct.attr_handle,
+                data=bytes(hci_evt.struct.att_data[
+                    :hci_evt.struct.data_length])
+            )
+
+    def _write_permit_req(self, hci_evt):
+        if callable(self.event_handler):
+            # hci_evt is reused once the handlers return, see on()
+            data = bytes(
+                hci_evt.struct.data_buffer[:hci_evt.struct.data_length])
+            if self.event_handler(
+                    EVT_GATTS_WRITE_PERMIT_REQ,
+                    handler=hci_evt.struct.attr_handle,
+                    data=data
+                ):
+                result = self.aci_gatt_write_response(
+                    conn_handle=self.connection_handle,
+                    attr_handle=hci_evt.struct.attr_handle,
+                    write_status=False,
+                    err_code=0,
+                    att_val_len=len(data),
+                    att_val=data
+                ).response_struct
+                if result.status != status.BLE_STATUS_SUCCESS:
+                    raise ValueError(
+                        "aci_gatt_write_response status: {:02x}".format(
+                            result.status))
+
+    def _read_permit_req(self, hci_evt):
+        if self.connection_handle is not None and callable(self.event_handler):
+            if self.event_handler(
+                    EVT_GATTS_READ_PERMIT_REQ,
+                    handler=hci_evt.struct.attr_handle,
+                    data=None
+                ):
+                result = self.aci_gatt_allow_read(
+                    conn_handle=self.connection_handle).response_struct
+                if result.status != status.BLE_STATUS_SUCCESS:
+                    raise ValueError(
+                        "aci_gatt_allow_read status: {:02x}".format(
+                            result.status))
 
     def set_discoverable(self):
         """ set_discoverable """
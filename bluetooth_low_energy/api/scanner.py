@@ -9,8 +9,7 @@ from bluetooth_low_energy.api.constants import *
 from bluetooth_low_energy.api.scan_entry import ScanEntry
 from bluetooth_low_energy.modules.st_microelectronics.spbtle_rf import \
     SPBTLE_RF
-from bluetooth_low_energy.protocols.hci import (HCI_EVENT_PKT, event, status,
-                                                uart)
+from bluetooth_low_energy.protocols.hci import event, status
 
 
 class Scanner(SPBTLE_RF):
@@ -26,6 +25,9 @@ class Scanner(SPBTLE_RF):
         self.name = name
         self.response = []
 
+        self.on(event.EVT_LE_META_EVENT, event.EVT_LE_ADVERTISING_REPORT,
+                self._advertising_report)
+
     def __start__(self):
         # Reset BlueNRG-MS
         self.reset()
@@ -64,11 +66,9 @@ class Scanner(SPBTLE_RF):
             raise ValueError("aci_gatt_init status: {:02x}".format(
                 result.status))
 
-        # Init BlueNRG GAP layer as central
-        result = self.aci_gap_init_IDB05A1(
-            role=st_constant.GAP_CENTRAL_ROLE_IDB05A1,
-            privacy_enabled=bool(st_constant.PRIVACY_DISABLED),
-            device_name_char_len=len(self.name)).response_struct
+        # Init BlueNRG GAP layer as central (of the module detected)
+        result = self.gap_init(
+            "central", device_name_char_len=len(self.name)).response_struct
         if result.status != status.BLE_STATUS_SUCCESS:
             raise ValueError("aci_gap_init status: {:02x}".format(
                 result.status))
@@ -87,31 +87,21 @@ class Scanner(SPBTLE_RF):
         # Reset BlueNRG-MS
         self.reset()
 
-    def __process__(self, evt):
-        """ Process event received from BlueNRG-MS """
-        hci_uart = uart.HCI_UART.from_buffer(evt)
-        if hci_uart.pkt_type == HCI_EVENT_PKT:
-            hci_evt = event.HCI_EVENT.from_buffer(hci_uart.data)
-            if hci_evt.evtcode == event.EVT_LE_META_EVENT:
-                if hci_evt.subevtcode == event.EVT_LE_ADVERTISING_REPORT:
-                    hci_evt.data = hci_evt.data[1:]
-                    if hci_evt.struct.evt_type in (
-                        st_constant.ADV_IND, st_constant.ADV_SCAN_IND
-                    ):
-                        data = bytes(
-                            hci_evt.struct.data_RSSI[
-                                :hci_evt.struct.data_length]
-                        ) if hci_evt.struct.data_length else b''
-                        bdaddr = bytes(hci_evt.struct.bdaddr)
-                        bdaddr_type = hci_evt.struct.bdaddr_type
-                        rssi = data[-1] if hci_evt.struct.data_length else 0
-                        self.response.append(
-                            ScanEntry(bdaddr, bdaddr_type, rssi, data)
-                        )
-            elif hci_evt.evtcode == event.EVT_VENDOR:
-                if hci_evt.subevtcode == st_event.EVT_BLUE_GAP_PROCEDURE_COMPLETE:
-                    if hci_evt.struct.procedure_code == st_constant.GAP_GENERAL_DISCOVERY_PROC:
-                        pass
+    def _advertising_report(self, hci_evt):
+        hci_evt.data = hci_evt.data[1:]
+        if hci_evt.struct.evt_type in (
+            st_constant.ADV_IND, st_constant.ADV_SCAN_IND
+        ):
+            data = bytes(
+                hci_evt.struct.data_RSSI[
+                    :hci_evt.struct.data_length]
+            ) if hci_evt.struct.data_length else b''
+            bdaddr = bytes(hci_evt.struct.bdaddr)
+            bdaddr_type = hci_evt.struct.bdaddr_type
+            rssi = data[-1] if hci_evt.struct.data_length else 0
+            self.response.append(
+                ScanEntry(bdaddr, bdaddr_type, rssi, data)
+            )
 
     def start(self):
         """ start """
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0103
+# pylint: disable=C0111
+from micropython import const
+
+IRQ_RISING = const(1)
+IRQ_FALLING = const(2)
+
+
+class SimulatedPin(object):
+    """
+    Software driven stand-in for machine.Pin, for ports without GPIO
+    (unix) or to inject IRQ edges from tests.
+
+    Driving the level with value()/on()/off() calls the handler installed
+    with irq() on the matching edge, as the hardware IRQ would.
+    """
+    IN = const(0)
+    OUT = const(1)
+    OUT_PP = const(1)
+    PULL_NONE = const(0)
+    PULL_UP = const(1)
+    PULL_DOWN = const(2)
+    IRQ_RISING = IRQ_RISING
+    IRQ_FALLING = IRQ_FALLING
+
+    def __init__(self, value=0):
+        self._value = 1 if value else 0
+        self._handler = None
+        self._trigger = 0
+
+    def init(self, mode=-1, pull=-1, value=None):
+        """init"""
+        if value is not None:
+            self.value(value)
+
+    def value(self, value=None):
+        """value"""
+        if value is None:
+            return self._value
+        prev, self._value = self._value, 1 if value else 0
+        if self._handler is not None and prev != self._value:
+            if (self._value and self._trigger & IRQ_RISING) or \
+                    (not self._value and self._trigger & IRQ_FALLING):
+                self._handler(self)
+
+    def on(self):
+        """on"""
+        self.value(1)
+
+    def off(self):
+        """off"""
+        self.value(0)
+
+    def irq(self, handler=None, trigger=IRQ_RISING | IRQ_FALLING):
+        """irq"""
+        self._handler = handler
+        self._trigger = trigger
@@ -5,7 +5,7 @@
 import machine
 import utime
 import ustruct
-from micropython import const, heap_lock, heap_unlock
+from micropython import const, schedule
 from ubinascii import hexlify, unhexlify
 
 from bluetooth_low_energy.modules.base_hci import (
@@ -13,6 +13,7 @@ from bluetooth_low_energy.modules.base_hci import (
     HardwareException
 )
 from bluetooth_low_energy.protocols.hci import (
+    HCI_ACLDATA_PKT,
     HCI_COMMAND_PKT,
     HCI_EVENT_HDR_SIZE,
     HCI_EVENT_PKT,
@@ -23,16 +24,37 @@ from bluetooth_low_energy.protocols.hci.cmd import (
     HCI_COMMANDS,
     OGF_VENDOR_CMD
 )
+from bluetooth_low_energy.protocols.hci.acl import HCI_ACL
+from bluetooth_low_energy.protocols.hci.encoder import (
+    HCI_PREPARED_COMMAND,
+    command_method)
+from bluetooth_low_energy.protocols.hci.fragment import (
+    ACL_FRAGMENTER,
+    ACL_REASSEMBLER)
+from bluetooth_low_energy.protocols.hci.future import HCI_FUTURE, asyncio
+from bluetooth_low_energy.protocols.hci.pool import (
+    EventPool,
+    PacketPool,
+    PacketRing)
+from bluetooth_low_energy.protocols.hci.scheduler import (
+    HCI_ACL_SCHEDULER,
+    HCI_COMMAND_SCHEDULER)
+from bluetooth_low_energy.transports import Transport
+from bluetooth_low_energy.transports.spi_bluenrg import SPIBlueNRG
 from bluetooth_low_energy.protocols.hci.event import (
     EVT_CMD_COMPLETE,
     EVT_CMD_STATUS,
+    EVT_DISCONN_COMPLETE,
     EVT_HARDWARE_ERROR,
     EVT_LE_META_EVENT,
+    EVT_NUM_COMP_PKTS,
     EVT_VENDOR,
     HCI_EVENT,
     HCI_EVENTS,
     HCI_VENDOR_EVENTS
 )
+from bluetooth_low_energy.protocols.hci.table import DESCRIPTORS
+from bluetooth_low_energy.protocols.hci.timer import TimerWheel
 from bluetooth_low_energy.protocols.hci.status import (
     BLE_STATUS_SUCCESS
 )
@@ -144,7 +166,18 @@ from bluetooth_low_energy.protocols.hci.vendor_specifics.st_microelectronics.blu
     OCF_UPDATER_RESET_BLUE_FLAG,
     OCF_UPDATER_START
 )
+from bluetooth_low_energy.protocols.hci.vendor_specifics.st_microelectronics.bluenrg_ms.status import (
+    BLE_STATUS_TIMEOUT
+)
 from bluetooth_low_energy.protocols.hci.vendor_specifics.st_microelectronics.bluenrg_ms.constant import (
+    GAP_BROADCASTER_ROLE_IDB04A1,
+    GAP_BROADCASTER_ROLE_IDB05A1,
+    GAP_CENTRAL_ROLE_IDB04A1,
+    GAP_CENTRAL_ROLE_IDB05A1,
+    GAP_OBSERVER_ROLE_IDB04A1,
+    GAP_OBSERVER_ROLE_IDB05A1,
+    GAP_PERIPHERAL_ROLE_IDB04A1,
+    GAP_PERIPHERAL_ROLE_IDB05A1,
     UUID_TYPE_16
 )
 from bluetooth_low_energy.protocols.hci.vendor_specifics.st_microelectronics.bluenrg_ms.event import (
@@ -153,29 +186,49 @@ from bluetooth_low_energy.protocols.hci.vendor_specifics.st_microelectronics.blu
 
 # Add ST Microelectronics Vendor Specific HCI_COMMANDS
 HCI_COMMANDS[OGF_VENDOR_CMD] = HCI_VENDOR_COMMANDS
-# Add ST Microelectronics Vendor Specific HCI_EVENTS
+# Add ST Microelectronics Vendor Specific HCI_EVENTS, both only register
+# the groups of descriptors, imported on first use
 HCI_VENDOR_EVENTS.update(ST_HCI_VENDOR_EVENTS)
 
 HCI_PCK_TYPE_OFFSET = const(0)
 EVENT_PARAMETER_TOT_LEN_OFFSET = const(2)
 
-_READ_HEADER_MASTER = b'\x0B\x00\x00\x00\x00'
-_WRITE_HEADER_MASTER = b'\x0A\x00\x00\x00\x00'
+# variants of the module, see BlueNRG_MS.bind_module()
+MODULES = ("IDB05A1", "IDB04A1")
+
+# aci_gap_init role of each module, by the role name of gap_init()
+GAP_ROLES_IDB05A1 = {
+    "peripheral": GAP_PERIPHERAL_ROLE_IDB05A1,
+    "broadcaster": GAP_BROADCASTER_ROLE_IDB05A1,
+    "central": GAP_CENTRAL_ROLE_IDB05A1,
+    "observer": GAP_OBSERVER_ROLE_IDB05A1
+}
+GAP_ROLES_IDB04A1 = {
+    "peripheral": GAP_PERIPHERAL_ROLE_IDB04A1,
+    "broadcaster": GAP_BROADCASTER_ROLE_IDB04A1,
+    "central": GAP_CENTRAL_ROLE_IDB04A1,
+    "observer": GAP_OBSERVER_ROLE_IDB04A1
+}
 
 
-class CSContext(object):
+class PipelineContext(object):
 
-    def __init__(self, pin):
-        self._pin = pin
+    def __init__(self, bluenrg, timeout=1000, retry=5):
+        self._bluenrg = bluenrg
+        self._timeout = timeout
+        self._retry = retry
 
     def __enter__(self):
-        # Assert CS line
-        self._pin.off()
+        self._bluenrg._pipelined += 1
+        return self
 
     def __exit__(self, exc_type, exc_value, traceback):
-        # Release CS line
-        self._pin.on()
-        return all(map(lambda x: x is None, [exc_type, exc_value, traceback]))
+        self._bluenrg._pipelined -= 1
+        if exc_type is None and not self._bluenrg._pipelined:
+            if not self._bluenrg.hci_flush(
+                    timeout=self._timeout, retry=self._retry):
+                raise ValueError("timeout")
+        return False
 
 
 class BlueNRG_MS(BaseHCI):
@@ -186,10 +239,15 @@ class BlueNRG_MS(BaseHCI):
 
     def __init__(
         self,
-        spi_bus=machine.SPI(2, baudrate=8000000, polarity=0),
-        irq_pin=machine.Pin('B8', machine.Pin.IN, machine.Pin.PULL_DOWN),
-        rst_pin=machine.Pin('B9', machine.Pin.OUT_PP),
-        nss_pin=machine.Pin('B12', machine.Pin.OUT_PP),
+        spi_bus=None,
+        irq_pin=None,
+        rst_pin=None,
+        nss_pin=None,
+        rx_pool_size=4,
+        transport=None,
+        event_queue_size=8,
+        event_pool_size=2,
+        module=None
     ):
         """
         Defaults:
@@ -221,47 +279,192 @@ class BlueNRG_MS(BaseHCI):
             - MISO on A6 Pin
             - MOSI on A5 Pin
 
-        """
+            rx_pool_size: number of preallocated receive buffers, a packet
+                          returned by read() stays valid for as many reads
 
-        if not isinstance(spi_bus, machine.SPI):
-            raise TypeError("")
+            Any object with the machine.SPI/machine.Pin interface is
+            accepted, e.g. SimulatedPin on the unix port.
+
+            transport: any Transport (H4UART, Loopback, ...), the SPI bus and
+                       pins are ignored when given
+
+            event_queue_size: events read while waiting for a command
+                              completion or for another event are kept
+                              for the event loop, up to this many
 
-        m_pins = (irq_pin, rst_pin, nss_pin)
-        if not all([isinstance(pin, machine.Pin) for pin in m_pins]):
+            event_pool_size: preallocated records the events are decoded
+                             into for their handlers, see on()
+
+            module: "IDB05A1" or "IDB04A1", bound at once when given,
+                    else by detect_module() once the module is up
+        """
+        if transport is None:
+            if spi_bus is None:
+                spi_bus = machine.SPI(2, baudrate=8000000, polarity=0)
+            if irq_pin is None:
+                irq_pin = machine.Pin(
+                    'B8', machine.Pin.IN, machine.Pin.PULL_DOWN)
+            if rst_pin is None:
+                rst_pin = machine.Pin('B9', machine.Pin.OUT_PP)
+            if nss_pin is None:
+                nss_pin = machine.Pin('B12', machine.Pin.OUT_PP)
+            transport = SPIBlueNRG(spi_bus, irq_pin, rst_pin, nss_pin)
+
+        if not isinstance(transport, Transport):
             raise TypeError("")
 
-        self._spi_bus = spi_bus
+        self._transport = transport
+        self._rx_pool = PacketPool(count=rx_pool_size)
+
+        # burst and IRQ modes, see enable_burst() and enable_irq()
+        self._rx_ring = None
+        self._irq_mode = False
+        self._irq_pending = False
+        self._bursts = 0
+        self._burst_packets = 0
+        self._burst_max = 0
+        self._wasted_headers = 0
+        self._irq_drain_ref = self._irq_drain
+        self._irq_handler_ref = self._irq_handler
+
+        # commands in flight, see hci_send_cmd() and pipelined()
+        self._cmd_scheduler = HCI_COMMAND_SCHEDULER()
+        self._pipelined = 0
+
+        # events read by the waiters, processed first by the event loop
+        self._deferred = PacketRing(count=event_queue_size + 3)
+        self._deferred_events = 0
+        self._deferred_max = 0
+
+        # HCI_FUTURE of the commands sent without waiting, see hci_async()
+        self._futures = {}
+        self._async = 0
+        self._last_future = None
+
+        # event handlers keyed by evtcode << 16 | subevtcode, see on()
+        self._handlers = {}
+        self._event_pool = EventPool(count=event_pool_size)
+
+        # ACL fragmentation, flow control and L2CAP recombination,
+        # see acl_init()
+        self._acl_fragmenter = None
+        self._acl_reassembler = None
+        self._acl_scheduler = None
+
+        # periodic and one-shot tasks of the event loop, see call_every()
+        self._timers = TimerWheel()
+
+        # time spent in idle() since run(), see power_stats()
+        self._power_start = None
+        self._asleep_us = 0
+        self._wakeups = 0
+        self._sleeps = 0
+
+        # variant of the commands and descriptors, see bind_module()
+        self._module = None
+        if module is not None:
+            self.bind_module(module)
+
+    @property
+    def module(self):
+        return self._module
+
+    def bind_module(self, module):
+        """
+        Resolve the IDB05A1 / IDB04A1 variants once: the descriptors of the
+        commands and events (DESCRIPTORS) and the wrappers of the module
+        under their unsuffixed names (aci_gap_init is aci_gap_init_IDB05A1)
 
-        self._irq_pin = irq_pin
-        self._rst_pin = rst_pin
-        self._nss_pin = nss_pin
+        The wrappers are bound per instance but DESCRIPTORS is global to
+        the process: the last module bound decodes the packets of every
+        instance, one module per application.
+        """
+        if module not in MODULES:
+            raise ValueError("module")
+        DESCRIPTORS.bind(module)
+        if self._module is not None:
+            # the aliases of the module bound so far
+            suffix = "_" + self._module
+            for name in dir(self.__class__):
+                if name.endswith(suffix):
+                    delattr(self, name[:-len(suffix)])
+        suffix = "_" + module
+        for name in dir(self.__class__):
+            if name.endswith(suffix):
+                setattr(self, name[:-len(suffix)], getattr(self, name))
+        self._module = module
+
+    def detect_module(self):
+        """
+        Read the hardware version of the running module (high byte of
+        hci_revision, greater than 0x30 on an IDB05A1), bind its variant
+        and return it
+        """
+        response = self.hci_le_read_local_version().response_struct
+        if response.status != BLE_STATUS_SUCCESS:
+            raise ValueError("status")
+        hw_version = response.hci_revision >> 8
+        module = "IDB05A1" if hw_version > 0x30 else "IDB04A1"
+        self.bind_module(module)
+        return module
 
-        self._rw_header_slave = bytearray(5)
+    def gap_init(self, role, device_name_char_len=0):
+        """
+        Init the GAP layer as role ("peripheral", "broadcaster", "central"
+        or "observer") with the arguments of the module variant, privacy
+        disabled; the module is detected first if none is bound. Returns
+        the aci_gap_init HCI_COMMAND.
 
-        # Release CS line
-        self._nss_pin.on()
+        bind_module() binds gap_init_IDB05A1 / gap_init_IDB04A1 in its
+        place.
+        """
+        if self._module is None:
+            self.detect_module()
+        return self.gap_init(role, device_name_char_len)
+
+    def gap_init_IDB05A1(self, role, device_name_char_len=0):
+        """gap_init of an IDB05A1"""
+        if role not in GAP_ROLES_IDB05A1:
+            raise ValueError("role")
+        return self.aci_gap_init_IDB05A1(
+            role=GAP_ROLES_IDB05A1[role], privacy_enabled=False,
+            device_name_char_len=device_name_char_len)
+
+    def gap_init_IDB04A1(self, role, device_name_char_len=0):
+        """gap_init of an IDB04A1, its device name length is fixed"""
+        if role not in GAP_ROLES_IDB04A1:
+            raise ValueError("role")
+        return self.aci_gap_init_IDB04A1(role=GAP_ROLES_IDB04A1[role])
 
     def reset(self):
         """
         Reset BlueNRG-MS module
         """
-        self._rst_pin.off()
-        utime.sleep_us(5)
-        self._rst_pin.on()
-        utime.sleep_us(5)
+        self._transport.reset()
+        self._cmd_scheduler.reset()
+        if self._acl_scheduler is not None:
+            self._acl_scheduler.reset()
+        self.hci_fail_futures(ValueError("reset"))
+        self._deferred.clear()
+
+    def prime(self, lengths=None):
+        """
+        Cache the receive views of the given packet lengths (default: all
+        of them), from then on read() does not allocate, see PacketPool
+        """
+        self._rx_pool.prime(lengths)
 
     def any(self):
         """any"""
-        return bool(self._irq_pin.value())
+        return self._transport.any()
 
     def set_spi_irq_as_output(self):
         """Pull IRQ high"""
-        self._irq_pin.init(mode=machine.Pin.OUT_PP,
-                           pull=machine.Pin.PULL_NONE, value=1)
+        self._transport.set_irq_as_output()
 
     def set_spi_irq_as_input(self):
         """IRQ input"""
-        self._irq_pin.init(mode=machine.Pin.IN, pull=machine.Pin.PULL_DOWN)
+        self._transport.set_irq_as_input()
 
     def hw_bootloader(self):
         """hw_bootloader"""
@@ -270,7 +473,114 @@ class BlueNRG_MS(BaseHCI):
         utime.sleep_ms(4)
         self.set_spi_irq_as_input()
 
-    def run(self, callback=None, callback_time=1000):
+    def enable_burst(self, slots=8):
+        """
+        Switch to burst mode: whenever the IRQ line is asserted read() drains
+        every pending packet into a ring of `slots` receive buffers and then
+        serves them from there, without the per-packet guard delay.
+        """
+        if self._rx_ring is None or self._rx_ring.count != slots:
+            self._rx_ring = PacketRing(count=slots)
+
+    def disable_burst(self):
+        """Back to single packet reads, packets left in the ring are dropped"""
+        self._rx_ring = None
+
+    def enable_irq(self, slots=8):
+        """
+        Switch to IRQ mode: a rising edge on the IRQ line schedules a handler
+        that drains the controller into a ring of `slots` receive buffers,
+        read() then returns packets from the ring and idles while it is empty.
+        """
+        self.enable_burst(slots=slots)
+        self._irq_mode = True
+        self._irq_pending = False
+        self._transport.irq(self._irq_handler_ref)
+        # the line may already be asserted, no edge would be seen
+        if self._transport.any():
+            self._irq_drain(None)
+
+    def disable_irq(self):
+        """Back to polling mode, packets left in the ring are dropped"""
+        self._transport.irq(None)
+        self._irq_mode = False
+        self._irq_pending = False
+        self.disable_burst()
+
+    def burst_stats(self):
+        """Counters of the burst drain, see drain()"""
+        return {
+            "bursts": self._bursts,
+            "packets": self._burst_packets,
+            "max_burst": self._burst_max,
+            "wasted_headers": self._wasted_headers,
+            "ring_full": (
+                self._rx_ring.overflows if self._rx_ring is not None else 0)
+        }
+
+    def event_pool_stats(self):
+        """Event records built and records retained by the handlers"""
+        return {
+            "records": self._event_pool.records,
+            "retained": self._event_pool.retained
+        }
+
+    def event_queue_stats(self):
+        """Counters of the events kept by the waiters, see hci_defer()"""
+        return {
+            "queued": len(self._deferred),
+            "deferred": self._deferred_events,
+            "max_queued": self._deferred_max,
+            "dropped": self._deferred.overflows
+        }
+
+    def _irq_handler(self, transport):
+        # hard IRQ context: must not allocate, defer the SPI transfers
+        if not self._irq_pending:
+            self._irq_pending = True
+            schedule(self._irq_drain_ref, None)
+
+    def _irq_drain(self, _):
+        self._irq_pending = False
+        # a transfer is in progress, read() drains while the line is high
+        if not self._transport.busy:
+            self.drain()
+
+    def drain(self, size=HCI_READ_PACKET_SIZE, retry=5):
+        """
+        Read packets into the ring for as long as the IRQ line stays high
+
+        The guard delay is only spent when a header exchange reports nothing
+        to read while the line is still asserted, up to `retry` times in a
+        row. Returns the number of packets read.
+        """
+        ring = self._rx_ring
+        if ring is None:
+            return 0
+        packets = 0
+        while retry and self._transport.any():
+            buf = ring.reserve()
+            if buf is None:
+                break
+            view = self._transport.recv_into(buf, size)
+            if view is None:
+                self._wasted_headers += 1
+                if not self._transport.any():
+                    break
+                retry -= 1
+                utime.sleep_us(150)
+                continue
+            ring.commit(view)
+            packets += 1
+        if packets:
+            self._bursts += 1
+            self._burst_packets += packets
+            if packets > self._burst_max:
+                self._burst_max = packets
+        return packets
+
+    def run(self, callback=None, callback_time=1000, irq=False, burst=False,
+            low_power=False):
         """
         BLE event loop
 
@@ -278,26 +588,199 @@ class BlueNRG_MS(BaseHCI):
               KeyboardInterrupt, StopIteration or an Exception
               is raised.
 
-              __process__() called whenever there is an event to be processed
+              the handlers registered with on() are called for their events,
+              __process__() for the other ones, the timers of call_every()
+              and call_later() when due; callback is called every
+              callback_time (ms) as well
+
+              irq: use the IRQ mode (see enable_irq()) instead of polling
+            burst: drain all pending packets per IRQ assertion
+                   (see enable_burst()), implied by irq
+        low_power: sleep (see idle()) until the controller raises its IRQ
+                   line or a timer is due, implies irq; the time spent
+                   asleep is reported by power_stats()
         """
+        irq = irq or low_power
+        timer = None
+        timers = self._timers
         try:
+            if irq:
+                self.enable_irq()
+            elif burst:
+                self.enable_burst()
             self.__start__()
-            start = utime.ticks_ms()
+            # user defined periodic callback
+            if callable(callback):
+                timer = timers.call_every(callback_time, callback)
+            self._power_start = utime.ticks_us()
             while True:
-                event = self.read(retry=5)
-                if self.hci_verify(event):
-                    self.__process__(event)
-                # user defined periodic callback
-                if callable(callback) and utime.ticks_diff(
-                        utime.ticks_ms(), start) >= callback_time:
-                    callback()
-                    start = utime.ticks_ms()
+                event = self._deferred.get()
+                if event is None:
+                    if not low_power:
+                        event = self.read(retry=5)
+                    elif self.idle(self._wakeup()):
+                        event = self.read(retry=5)
+                self._step(event)
 
         except (KeyboardInterrupt, StopIteration) as ex:
             raise ex
         except Exception as ex:
             raise ex
         finally:
+            if timer is not None:
+                timers.cancel(timer)
+            if irq:
+                self.disable_irq()
+            elif burst:
+                self.disable_burst()
+            self.__stop__()
+
+    def _step(self, event):
+        # one iteration of run() / run_async(): event (None if nothing was
+        # read) then the futures and timers that are due, on every one so
+        # that a steady event stream starves neither of them
+        if self.hci_verify(event):
+            if self._cmd_scheduler:
+                self.hci_cmd_event(event)
+            if self._acl_scheduler is None or \
+                    not self.hci_acl_event(event):
+                self.hci_dispatch(event)
+        elif self._acl_reassembler is not None and \
+                event is not None and event[0] == HCI_ACLDATA_PKT:
+            self.hci_recv_acl(event)
+        if self._futures:
+            self.hci_expire_futures()
+        if self._timers:
+            self._timers.advance()
+
+    def _wakeup(self):
+        # deadline of the sleep: next timer or first future to expire
+        deadline = self._timers.next_deadline()
+        for future in self._futures.values():
+            if deadline is None or \
+                    utime.ticks_diff(future.deadline, deadline) < 0:
+                deadline = future.deadline
+        return deadline
+
+    def idle(self, deadline=None):
+        """
+        Sleep (machine.idle(), WFI on the stm32 port) until the controller
+        has a packet to read or until ticks_ms() reaches deadline (None:
+        no deadline). Returns True if there is a packet to read.
+
+        Every interrupt wakes the CPU (the 1 ms SysTick too), the conditions
+        are checked again before the next sleep.
+        """
+        ring = self._rx_ring
+        transport = self._transport
+        start = utime.ticks_us()
+        sleeps = 0
+        ready = False
+        while True:
+            if len(self._deferred) or (ring is not None and len(ring)) or \
+                    transport.any():
+                ready = True
+                break
+            if deadline is not None and \
+                    utime.ticks_diff(deadline, utime.ticks_ms()) <= 0:
+                break
+            machine.idle()
+            sleeps += 1
+        if sleeps:
+            self._asleep_us += utime.ticks_diff(utime.ticks_us(), start)
+            self._sleeps += sleeps
+            self._wakeups += 1
+        return ready
+
+    def call_every(self, period_ms, callback, delay_ms=None):
+        """
+        Call callback() from the event loop every period_ms, the first time
+        in delay_ms (default period_ms). Returns the Timer, see
+        cancel_timer(). The deadlines do not drift: a late call does not
+        delay the next ones.
+        """
+        return self._timers.call_every(period_ms, callback, delay_ms)
+
+    def call_later(self, delay_ms, callback):
+        """Call callback() once from the event loop in delay_ms"""
+        return self._timers.call_later(delay_ms, callback)
+
+    def call_every_connected(self, period_ms, callback, delay_ms=None):
+        """
+        call_every() skipping the calls while connection_handle (kept by
+        the subclass from the connection events) is None. Register it from
+        __start__() and cancel it from __stop__()
+        """
+        def connected():
+            if getattr(self, "connection_handle", None) is not None:
+                callback()
+        return self._timers.call_every(period_ms, connected, delay_ms)
+
+    def cancel_timer(self, timer):
+        """Stop a timer of call_every() or call_later()"""
+        self._timers.cancel(timer)
+
+    def timer_stats(self):
+        """
+        Calls, missed deadlines and lateness (jitter, ms) of the active
+        timers, Timer.stats() has the ones of a timer
+        """
+        return self._timers.stats()
+
+    def power_stats(self):
+        """
+        Duty cycle of the low power event loop, see idle(): time awake and
+        asleep since run() started (us), wakeups (idle() returning after a
+        sleep) and their rate per second, sleeps (machine.idle() calls),
+        awake time in percent
+        """
+        elapsed = 0
+        if self._power_start is not None:
+            elapsed = utime.ticks_diff(utime.ticks_us(), self._power_start)
+        asleep = min(self._asleep_us, elapsed)
+        return {
+            "awake_us": elapsed - asleep,
+            "asleep_us": asleep,
+            "wakeups": self._wakeups,
+            "sleeps": self._sleeps,
+            "wakeups_per_s": (
+                self._wakeups * 1000000 // elapsed if elapsed else 0),
+            "duty_cycle": (
+                (elapsed - asleep) * 100 // elapsed if elapsed else 0)
+        }
+
+    async def run_async(self, irq=False, burst=False, poll_ms=1):
+        """
+        uasyncio task equivalent to run(): reads and processes the events,
+        resolves the HCI_FUTURE of the commands sent with hci_async() and
+        calls the timers that are due, even under a steady event stream. It
+        yields to the other tasks after every event, for poll_ms when the
+        controller has nothing to read.
+
+            asyncio.create_task(bluenrg.run_async(irq=True))
+        """
+        if asyncio is None:
+            raise NotImplementedError("uasyncio")
+        try:
+            if irq:
+                self.enable_irq()
+            elif burst:
+                self.enable_burst()
+            self.__start__()
+            while True:
+                ring = self._rx_ring
+                event = self._deferred.get()
+                if event is None and (
+                        (ring is not None and len(ring)) or self.any()):
+                    event = self.read(retry=5)
+                self._step(event)
+                # nothing read: the controller is idle, poll it later
+                await asyncio.sleep_ms(0 if event is not None else poll_ms)
+        finally:
+            if irq:
+                self.disable_irq()
+            elif burst:
+                self.disable_burst()
             self.__stop__()
 
     def __start__(self):
@@ -307,34 +790,51 @@ class BlueNRG_MS(BaseHCI):
         raise NotImplementedError()
 
     def __process__(self, event):
-        raise NotImplementedError()
+        """Events without a handler, see on()"""
+        pass
+
+    def __process_l2cap__(self, handle, l2cap):
+        """L2CAP PDUs reassembled by the event loop, see acl_init()"""
+        pass
 
     def read(self, size=HCI_READ_PACKET_SIZE, retry=5):
         """
         Read packet from BlueNRG-MS module
+
+        Returns a memoryview into the next buffer of the receive pool, it is
+        overwritten after rx_pool_size further reads.
+
+        In burst and IRQ modes the packet comes from the ring filled by
+        drain(), in IRQ mode the CPU idles until the next interrupt when
+        nothing is pending.
+        """
+        ring = self._rx_ring
+        if ring is None:
+            return self.readinto(self._rx_pool.next(), size=size, retry=retry)
+        event = ring.get()
+        if event is None:
+            if self._transport.any():
+                # burst mode, or IRQ edge consumed while the ring was full
+                # or the bus busy
+                self.drain(size=size, retry=retry)
+            elif self._irq_mode:
+                machine.idle()
+            event = ring.get()
+        return event
+
+    def readinto(self, buf, size=HCI_READ_PACKET_SIZE, retry=5):
+        """
+        Read packet from BlueNRG-MS module into a preallocated PacketBuffer
+
+        Returns a memoryview of the filled slice or None, nothing is allocated
+        once the packet length has been seen by buf.
         """
         result = None
         while retry:
-            with CSContext(self._nss_pin):
-                # Exchange header
-                self._spi_bus.write_readinto(
-                    _READ_HEADER_MASTER,
-                    self._rw_header_slave
-                )
-                rx_read_bytes = (
-                    self._rw_header_slave[4] << 8
-                ) | self._rw_header_slave[3]
-                if self._rw_header_slave[0] == 0x02 and rx_read_bytes > 0:
-                    # SPI is ready
-                    # avoid to read more data that size of the buffer
-                    if rx_read_bytes > size:
-                        rx_read_bytes = size
-                    data = b'\xFF' * rx_read_bytes
-                    result = bytearray(rx_read_bytes)
-                    self._spi_bus.write_readinto(data, result)
-                    break
-                else:
-                    utime.sleep_us(50)
+            result = self._transport.recv_into(buf, size)
+            if result is not None:
+                break
+            utime.sleep_us(50)
             retry -= 1
 
         # Add a small delay to give time to the BlueNRG to set the IRQ pin low
@@ -346,48 +846,7 @@ class BlueNRG_MS(BaseHCI):
         """
         Write packet to BlueNRG-MS module
         """
-        result = None
-        while retry:
-            with CSContext(self._nss_pin):
-                # Exchange header
-                self._spi_bus.write_readinto(
-                    _WRITE_HEADER_MASTER,
-                    self._rw_header_slave
-                )
-                rx_write_bytes = self._rw_header_slave[1]
-                rx_read_bytes = (
-                    self._rw_header_slave[4] << 8
-                ) | self._rw_header_slave[3]
-                if self._rw_header_slave[0] == 0x02 and (
-                        rx_write_bytes > 0 or rx_read_bytes > 0):
-                    # SPI is ready
-                    if header:
-                        # avoid to write more data that size of the buffer
-                        if rx_write_bytes >= len(header):
-                            result = bytearray(len(header))
-                            self._spi_bus.write_readinto(header, result)
-                            if param:
-                                rx_write_bytes -= len(header)
-                                # avoid to read more data that size of the
-                                # buffer
-                                if len(param) > rx_write_bytes:
-                                    tx_bytes = rx_write_bytes
-                                else:
-                                    tx_bytes = len(param)
-                                result = bytearray(tx_bytes)
-                                self._spi_bus.write_readinto(param, result)
-                                break
-                            else:
-                                break
-                        else:
-                            break
-                    else:
-                        break
-                else:
-                    utime.sleep_us(50)
-            retry -= 1
-
-        return result
+        return self._transport.send(header, param, retry=retry)
 
     def hci_verify(self, hci_pckt):
         """
@@ -407,78 +866,356 @@ class BlueNRG_MS(BaseHCI):
 
     def hci_wait_event(self, evtcode=0, subevtcode=0, timeout=1000, retry=5):
         """
-        Wait for event and filter it if needed
+        Wait for event and filter it if needed: evtcode and subevtcode
+        (LE meta and vendor events) both match when given. The events
+        deferred while waiting for something else are searched first, the
+        one returned is taken out of the queue. A command completion read
+        on the way completes its command (see hci_cmd_event()) before it is
+        matched.
         """
+        def match(event):
+            # filter on the raw packet, decode only the one returned
+            code = HCI_EVENT.peek_evtcode(event)
+            return (not evtcode or code == evtcode) and \
+                (not subevtcode or
+                 (code in (EVT_LE_META_EVENT, EVT_VENDOR) and
+                  HCI_EVENT.peek_subevtcode(event) == subevtcode))
+
+        def completion(event):
+            return HCI_EVENT.peek_evtcode(event) in (
+                EVT_CMD_STATUS, EVT_CMD_COMPLETE)
+
+        def wanted(event):
+            # the completions too, their command is completed first
+            return completion(event) or match(event)
+
+        event = self._deferred.take(wanted)
+        while event is not None:
+            if completion(event):
+                self.hci_cmd_event(event)
+            elif self._acl_scheduler is not None:
+                # not seen by the event loop
+                self.hci_acl_event(event)
+            if match(event):
+                return HCI_EVENT.from_buffer(HCI_UART.from_buffer(event).data)
+            event = self._deferred.take(wanted)
         # Maximum timeout is 1 seconds
         start = utime.ticks_ms()
         while utime.ticks_diff(utime.ticks_ms(), start) <= min(timeout, 1000):
             event = self.read(retry=retry)
-            if self.hci_verify(event) and isinstance(event, (bytearray, bytes)):
-                hci_uart = HCI_UART.from_buffer(event)
-                if hci_uart.pkt_type == HCI_EVENT_PKT:
-                    hci_evt = HCI_EVENT.from_buffer(hci_uart.data)
-                    if not evtcode and not subevtcode:
-                        return hci_evt
-                    if subevtcode:
-                        if hci_evt.evtcode in (EVT_LE_META_EVENT, EVT_VENDOR):
-                            if hci_evt.subevtcode == subevtcode:
-                                return hci_evt
-                            else:
-                                raise ValueError("unexpected subevtcode")
-                    if evtcode:
-                        if hci_evt.evtcode == evtcode:
-                            return hci_evt
-                        else:
-                            raise ValueError("unexpected evtcode")
-                else:
-                    raise TypeError("not HCI_EVENT_PKT")
+            if self.hci_verify(event):
+                if completion(event):
+                    # the command in flight is completed before matching
+                    self.hci_cmd_event(event)
+                    if match(event):
+                        return HCI_EVENT.from_buffer(
+                            HCI_UART.from_buffer(event).data)
+                    continue
+                if match(event):
+                    if self._acl_scheduler is not None:
+                        self.hci_acl_event(event)
+                    return HCI_EVENT.from_buffer(HCI_UART.from_buffer(event).data)
+                if HCI_EVENT.peek_evtcode(event) == EVT_NUM_COMP_PKTS and \
+                        self._acl_scheduler is not None:
+                    self.hci_acl_event(event)
+                    continue
+                # not the one waited for, keep it for the event loop
+                self.hci_defer(event)
             else:
                 continue
 
     def hci_send_cmd(self, cmd, is_async=False, timeout=1000, retry=5):
-        """hci_send_cmd"""
+        """
+        Queue cmd, send it as soon as the controller accepts a command
+        (Num_HCI_Command_Packets credits) and wait for its completion.
+
+        is_async (or inside hci_async()): return an HCI_FUTURE resolved
+        when the completion of cmd is read by a later hci_send_cmd(), by
+        hci_flush() or by the event loop, failed after timeout.
+
+        Inside pipelined(): return right away, the response is stored
+        when the block exits.
+        """
         if not isinstance(cmd, HCI_COMMAND):
             raise TypeError("HCI_COMMAND")
 
-        header, param = cmd.to_buffer(split=True)
-        if len(header) == cmd.struct_size:
-            header = ustruct.pack("<B3s", HCI_COMMAND_PKT, header)
-        self.hci_send(header, param)
-
-        if is_async:
+        self._cmd_scheduler.submit(cmd)
+        self.hci_send_queued(retry=retry)
+        if self._cmd_scheduler.is_queued(cmd):
+            cmd.detach()
+
+        if is_async or self._async:
+            future = HCI_FUTURE(cmd, timeout=timeout)
+            self._futures[id(cmd)] = future
+            self._last_future = future
+            return future
+        if self._pipelined:
             return
+        return self.hci_wait_cmd(cmd, timeout=timeout, retry=retry)
+
+    def hci_send_queued(self, retry=5):
+        """Send the queued commands while credits are left"""
+        cmd = self._cmd_scheduler.next()
+        while cmd is not None:
+            header, param = cmd.to_buffer(split=True)
+            if len(header) == cmd.struct_size:
+                header = ustruct.pack("<B3s", HCI_COMMAND_PKT, header)
+            self.hci_send(header, param, retry=retry)
+            cmd = self._cmd_scheduler.next()
+
+    def hci_cmd_event(self, event):
+        """
+        Match an EVT_CMD_STATUS / EVT_CMD_COMPLETE packet with the command
+        in flight, store its response, send the commands waiting for a
+        credit and return the completed command (None otherwise)
+        """
+        if event[HCI_PCK_TYPE_OFFSET] != HCI_EVENT_PKT or \
+                event[1] not in (EVT_CMD_STATUS, EVT_CMD_COMPLETE):
+            return None
+        hci_evt = self._event_pool.acquire(event)
+        try:
+            cmd = self._cmd_scheduler.complete(
+                hci_evt.struct.opcode, hci_evt.struct.ncmd)
+            if cmd is None:
+                # credit update, or late completion of a command timed out
+                self.hci_send_queued()
+                return None
+            cmd.response_data = bytes(hci_evt.data[hci_evt.struct_size:])
+            error = None
+            if hci_evt.evtcode == EVT_CMD_STATUS and \
+                    cmd.evtcode != hci_evt.evtcode:
+                if hci_evt.struct.status != BLE_STATUS_SUCCESS:
+                    # no completion event will follow
+                    cmd.fail(hci_evt.struct.status)
+                    error = ValueError(hci_evt.struct.status)
+        finally:
+            self._event_pool.release(hci_evt)
+        self.hci_send_queued()
+        future = self._futures.pop(id(cmd), None)
+        if future is not None:
+            if error is None:
+                future.set_result()
+            else:
+                future.set_exception(error)
+        elif error is not None:
+            raise error
+        return cmd
 
-        # Maximum timeout is 1 seconds
+    def hci_wait_cmd(self, cmd=None, timeout=1000, retry=5):
+        """
+        Read events until cmd is completed, return its completion packet.
+        Without cmd, until every command in flight is completed or one of
+        them was sent more than timeout ago (see hci_flush())
+        """
         start = utime.ticks_ms()
-        while utime.ticks_diff(utime.ticks_ms(), start) <= min(timeout, 1000):
+        scheduler = self._cmd_scheduler
+        while True:
+            if cmd is None:
+                if not scheduler or scheduler.expired(timeout) is not None:
+                    return None
+            # Maximum timeout is 1 seconds
+            elif utime.ticks_diff(
+                    utime.ticks_ms(), start) > min(timeout, 1000):
+                break
             event = self.read(retry=retry)
-            if self.hci_verify(event) and isinstance(event, (bytearray, bytes)):
-                hci_uart = HCI_UART.from_buffer(event)
-                if hci_uart.pkt_type == HCI_EVENT_PKT:
-                    hci_evt = HCI_EVENT.from_buffer(hci_uart.data)
-                    if hci_evt.evtcode == EVT_CMD_STATUS:
-                        if hci_evt.struct.opcode != cmd.opcode:
-                            raise ValueError(hci_evt.struct.opcode)
-                        if cmd.evtcode != hci_evt.evtcode:
-                            if hci_evt.struct.status != BLE_STATUS_SUCCESS:
-                                raise ValueError(hci_evt.struct.status)
-                        cmd.response_data = hci_evt.data[hci_evt.struct_size:]
+            if self.hci_verify(event):
+                code = HCI_EVENT.peek_evtcode(event)
+                if code in (EVT_CMD_STATUS, EVT_CMD_COMPLETE):
+                    if self.hci_cmd_event(event) is cmd and \
+                            cmd is not None:
                         return event
-                    elif hci_evt.evtcode == EVT_CMD_COMPLETE:
-                        if hci_evt.struct.opcode != cmd.opcode:
-                            raise ValueError(hci_evt.struct.opcode)
-                        cmd.response_data = hci_evt.data[hci_evt.struct_size:]
+                    continue
+                elif code == EVT_LE_META_EVENT:
+                    if cmd is not None and \
+                            HCI_EVENT.peek_subevtcode(event) == cmd.evtcode and \
+                            self._cmd_scheduler.is_pending(cmd):
+                        hci_evt = HCI_EVENT.from_buffer(
+                            HCI_UART.from_buffer(event).data)
+                        self._cmd_scheduler.remove(cmd)
+                        cmd.response_data = bytes(
+                            hci_evt.data[hci_evt.struct_size:])
                         return event
-                    elif hci_evt.evtcode == EVT_LE_META_EVENT:
-                        if hci_evt.subevtcode != cmd.evtcode:
-                            raise ValueError(hci_evt.subevtcode)
-                        cmd.response_data = hci_evt.data[hci_evt.struct_size:]
-                        return event
-                    elif hci_evt.evtcode == EVT_HARDWARE_ERROR:
-                        cmd.response_data = hci_evt.data[hci_evt.struct_size:]
-                        raise HardwareException(cmd.response_data)
+                elif code == EVT_NUM_COMP_PKTS and \
+                        self._acl_scheduler is not None:
+                    self.hci_acl_event(event)
+                    continue
+                elif code == EVT_HARDWARE_ERROR:
+                    hci_evt = HCI_EVENT.from_buffer(
+                        HCI_UART.from_buffer(event).data)
+                    data = bytes(hci_evt.data[hci_evt.struct_size:])
+                    if cmd is not None:
+                        cmd.response_data = data
+                    self.hci_fail_futures(HardwareException(data))
+                    raise HardwareException(data)
+                # not a completion, keep it for the event loop
+                self.hci_defer(event)
             else:
                 continue
+        if cmd is not None:
+            self._cmd_scheduler.expire(cmd)
+
+    def on(self, evtcode, subevtcode=0, handler=None, filter_=None):
+        """
+        Call handler(hci_evt) for every event evtcode (and subevtcode for
+        the LE meta and vendor events) accepted by filter_(hci_evt), from
+        the event loop; without handler return a decorator.
+
+        hci_evt is a pooled EventRecord reused once the handlers return, a
+        handler keeping it (or its struct) calls hci_evt.retain().
+
+            bluenrg.on(EVT_VENDOR, EVT_BLUE_GATT_ATTRIBUTE_MODIFIED,
+                       attribute_modified,
+                       lambda hci_evt: hci_evt.struct.attr_handle == handle)
+        """
+        if handler is None:
+            def decorator(function):
+                return self.on(evtcode, subevtcode, function, filter_)
+            return decorator
+        key = evtcode << 16 | subevtcode
+        entry = (handler, filter_)
+        handlers = self._handlers.get(key)
+        self._handlers[key] = (
+            (entry,) if handlers is None else handlers + (entry,))
+        return handler
+
+    def off(self, evtcode, subevtcode=0, handler=None):
+        """Remove handler (default: all the handlers) of an event"""
+        key = evtcode << 16 | subevtcode
+        handlers = tuple(
+            entry for entry in self._handlers.get(key, ())
+            if handler is not None and entry[0] != handler)
+        if handlers:
+            self._handlers[key] = handlers
+        else:
+            self._handlers.pop(key, None)
+
+    def hci_dispatch(self, event):
+        """
+        Decode event once and call its handlers, or __process__(event)
+        when none is registered for it; return True if handled
+        """
+        handlers = self._handlers.get(
+            HCI_EVENT.peek_evtcode(event) << 16 |
+            HCI_EVENT.peek_subevtcode(event))
+        if handlers is None:
+            self.__process__(event)
+            return False
+        hci_evt = self._event_pool.acquire(event)
+        try:
+            for handler, filter_ in handlers:
+                if filter_ is None or filter_(hci_evt):
+                    handler(hci_evt)
+        finally:
+            self._event_pool.release(hci_evt)
+        return True
+
+    def hci_defer(self, event):
+        """
+        Copy an event read while waiting for something else into the
+        bounded queue drained first by run() / run_async(), return False
+        if the queue is full (the event is dropped and counted)
+        """
+        buf = self._deferred.reserve()
+        if buf is None:
+            return False
+        length = len(event)
+        if length > buf.size:
+            length = buf.size
+            event = event[:length]
+        buf.buffer[:length] = event
+        self._deferred.commit(buf.view(length))
+        self._deferred_events += 1
+        if len(self._deferred) > self._deferred_max:
+            self._deferred_max = len(self._deferred)
+        return True
+
+    def hci_flush(self, timeout=1000, retry=5):
+        """
+        Wait for the completion of every command in flight, each one for
+        timeout after it was sent. A command timed out is failed with
+        BLE_STATUS_TIMEOUT (see HCI_COMMAND.fail()) and its future too.
+
+        Returns False if a command timed out; the first error reported by
+        an EVT_CMD_STATUS is raised once the other commands are done.
+        """
+        scheduler = self._cmd_scheduler
+        error = None
+        timed_out = False
+        self.hci_send_queued(retry=retry)
+        while scheduler:
+            try:
+                self.hci_wait_cmd(timeout=timeout, retry=retry)
+            except ValueError as ex:
+                # the command is done, keep waiting for the others
+                if error is None:
+                    error = ex
+                continue
+            cmd = scheduler.expired(timeout)
+            if cmd is not None:
+                scheduler.expire(cmd)
+                cmd.fail(BLE_STATUS_TIMEOUT)
+                future = self._futures.pop(id(cmd), None)
+                if future is not None:
+                    future.set_exception(ValueError("timeout"))
+                timed_out = True
+                self.hci_send_queued(retry=retry)
+        if error is not None:
+            raise error
+        return not timed_out
+
+    def hci_async(self, method, *args, **kwargs):
+        """
+        Call a hci_*/aci_* wrapper without waiting for its completion,
+        return the HCI_FUTURE of its command:
+
+            future = bluenrg.hci_async(bluenrg.aci_gatt_update_char_value,
+                                       serv_handle=..., ...)
+            cmd = await future  # from a uasyncio task
+        """
+        self._last_future = None
+        self._async += 1
+        try:
+            method(*args, **kwargs)
+        finally:
+            self._async -= 1
+        return self._last_future
+
+    def hci_expire_futures(self):
+        """Fail the futures still pending after their timeout"""
+        now = utime.ticks_ms()
+        expired = False
+        for key, future in list(self._futures.items()):
+            if future.expired(now):
+                del self._futures[key]
+                self._cmd_scheduler.expire(future.cmd)
+                future.set_exception(ValueError("timeout"))
+                expired = True
+        if expired:
+            # the credit of a command lost by a stalled controller is back
+            self.hci_send_queued()
+
+    def hci_fail_futures(self, exception):
+        """Fail every pending future"""
+        futures = self._futures
+        self._futures = {}
+        for future in futures.values():
+            future.set_exception(exception)
+
+    def pipelined(self, timeout=1000, retry=5):
+        """
+        Context manager: the commands issued inside the block do not wait
+        for their completion, up to ncmd of them are in flight at once,
+        every response is available when the block exits:
+
+            with bluenrg.pipelined():
+                cmds = [bluenrg.aci_gatt_add_char(...) for ...]
+            handles = [cmd.response_struct.handle for cmd in cmds]
+
+        Every command has timeout ms from the time it is sent, the block
+        raises ValueError("timeout") if one of them timed out, see
+        hci_flush()
+        """
+        return PipelineContext(self, timeout=timeout, retry=retry)
 
     def hci_send(self, header, param=b'', retry=5):
         """
@@ -486,6 +1223,117 @@ class BlueNRG_MS(BaseHCI):
         """
         return self.write(header, param, retry=retry)
 
+    def acl_init(self, mtu=23, connections=1):
+        """
+        Size the ACL fragments and the send credits to the controller
+        buffers reported by hci_le_read_buffer_size() (pkt_len, max_pkt)
+        and preallocate the recombination of L2CAP PDUs of up to mtu bytes
+        on as many connections at once.
+
+        From now on EVT_NUM_COMP_PKTS is consumed by the flow control,
+        the event loop hands the PDUs to __process_l2cap__() and the
+        disconnection of a connection frees its buffers (see
+        hci_acl_event(), the event is still dispatched).
+        """
+        response = self.hci_le_read_buffer_size().response_struct
+        # pkt_len 0: LE shares the BR/EDR buffers, assume the LE minimum
+        self._acl_fragmenter = ACL_FRAGMENTER(response.pkt_len or 27)
+        self._acl_reassembler = ACL_REASSEMBLER(
+            mtu=mtu, connections=connections)
+        self._acl_scheduler = HCI_ACL_SCHEDULER(response.max_pkt or 1)
+
+    def acl_stats(self):
+        """Free controller buffers, packets sent, PDUs queued and their peak"""
+        acl_scheduler = self._acl_scheduler
+        if acl_scheduler is None:
+            return None
+        return {
+            "credits": acl_scheduler.credits,
+            "max_pkt": acl_scheduler.max_pkt,
+            "sent": acl_scheduler.sent,
+            "queued": len(acl_scheduler),
+            "max_queued": acl_scheduler.max_queued
+        }
+
+    def hci_send_acl(self, handle, cid, payload, retry=5):
+        """
+        Queue payload for the L2CAP channel cid of handle and send as many
+        of its ACL packets as the controller has free buffers, without
+        waiting: the rest goes out as EVT_NUM_COMP_PKTS gives the buffers
+        back (event loop, hci_acl_flush()). payload must not change until
+        it is sent, return the number of PDUs still queued.
+        """
+        if self._acl_scheduler is None:
+            raise ValueError("acl_init")
+        self._acl_scheduler.submit(
+            handle,
+            self._acl_fragmenter.fragments(handle, cid, payload),
+            self._acl_fragmenter.count(len(payload)))
+        self.hci_send_acl_queued(retry=retry)
+        return len(self._acl_scheduler)
+
+    def hci_send_acl_queued(self, retry=5):
+        """Send the queued ACL packets while credits are left"""
+        fragment = self._acl_scheduler.next()
+        while fragment is not None:
+            self.write(fragment[1], fragment[2], retry=retry)
+            fragment = self._acl_scheduler.next()
+
+    def hci_acl_event(self, event):
+        """
+        Give back the controller buffers of an EVT_NUM_COMP_PKTS packet
+        and send the queued ACL packets, return False for other events.
+        An EVT_DISCONN_COMPLETE frees the buffers and drops the partial
+        PDU of its connection, and is left to the caller (False).
+        """
+        if event[1] == EVT_DISCONN_COMPLETE:
+            # | 0x04 | 0x05 | length | status | handle | reason |
+            if event[3] == BLE_STATUS_SUCCESS:
+                handle = event[4] | (event[5] & 0x0F) << 8
+                self._acl_reassembler.reset(handle)
+                self._acl_scheduler.disconnect(handle)
+            return False
+        if event[1] != EVT_NUM_COMP_PKTS:
+            return False
+        # | 0x04 | 0x13 | length | num_hndl | (handle, count) * num_hndl |
+        for index in range(event[3]):
+            offset = 4 + 4 * index
+            self._acl_scheduler.complete(
+                event[offset] | (event[offset + 1] & 0x0F) << 8,
+                event[offset + 2] | event[offset + 3] << 8)
+        self.hci_send_acl_queued()
+        return True
+
+    def hci_acl_flush(self, timeout=1000, retry=5):
+        """
+        Process events until every queued ACL packet is sent, return False
+        if some are still queued after timeout
+        """
+        start = utime.ticks_ms()
+        while len(self._acl_scheduler) and utime.ticks_diff(
+                utime.ticks_ms(), start) <= timeout:
+            event = self.read(retry=retry)
+            if self.hci_verify(event):
+                if event[1] == EVT_NUM_COMP_PKTS:
+                    self.hci_acl_event(event)
+                    continue
+                if event[1] in (EVT_CMD_STATUS, EVT_CMD_COMPLETE):
+                    self.hci_cmd_event(event)
+                    continue
+                self.hci_defer(event)
+        return not len(self._acl_scheduler)
+
+    def hci_recv_acl(self, packet):
+        """
+        Add the H4 ACL packet to the PDU of its connection handle, call
+        __process_l2cap__() and return the L2CAP PDU once complete
+        """
+        acl = HCI_ACL.from_buffer(HCI_UART.from_buffer(packet).data)
+        l2cap = self._acl_reassembler.feed(acl)
+        if l2cap is not None:
+            self.__process_l2cap__(acl.handle, l2cap)
+        return l2cap
+
     def get_version(self):
         """
         Get BlueNRG-MS firmware version
@@ -509,363 +1357,120 @@ class BlueNRG_MS(BaseHCI):
     #                                GAP                                      #
     ###########################################################################
 
-    def aci_gap_init_IDB04A1(self, role=0):
-        """aci_gap_init_IDB04A1"""
-        data = ustruct.pack(
-            "<B",
-            role)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_INIT,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
-
-    def aci_gap_init_IDB05A1(
-            self, role=0, privacy_enabled=False, device_name_char_len=0):
-        """aci_gap_init_IDB05A1"""
-        data = ustruct.pack(
-            "<BBB",
-            role, int(privacy_enabled), device_name_char_len)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_INIT,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
-
-    def aci_gap_set_non_discoverable(self):
-        """aci_gap_set_non_discoverable"""
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_SET_NON_DISCOVERABLE)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
-
-    def aci_gap_set_limited_discoverable(
-            self, adv_type=0, adv_interv_min=0, adv_interv_max=0,
-            own_addr_type=0, adv_filter_policy=0, local_name_len=0,
-            local_name=b'', service_uuid_len=0, service_uuid_list=b'',
-            slave_conn_interv_min=0, slave_conn_interv_max=0):
-        """aci_gap_set_limited_discoverable"""
-        data = ustruct.pack(
-            "<BHHBBB{:d}sB{:d}sHH".format(local_name_len, service_uuid_len),
-            adv_type, adv_interv_min, adv_interv_max,
-            own_addr_type,
-            adv_filter_policy,
-            local_name_len,
-            local_name,
-            service_uuid_len,
-            service_uuid_list,
-            slave_conn_interv_min, slave_conn_interv_max)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_SET_LIMITED_DISCOVERABLE,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
-
-    def aci_gap_set_discoverable(
-            self, adv_type=0, adv_interv_min=0, adv_interv_max=0,
-            own_addr_type=0, adv_filter_policy=0, local_name_len=0,
-            local_name=b'', service_uuid_len=0, service_uuid_list=b'',
-            slave_conn_interv_min=0, slave_conn_interv_max=0):
-        """aci_gap_set_discoverable"""
-        data = ustruct.pack(
-            "<BHHBBB{:d}sB{:d}sHH".format(local_name_len, service_uuid_len),
-            adv_type, adv_interv_min, adv_interv_max,
-            own_addr_type, adv_filter_policy,
-            local_name_len,
-            local_name,
-            service_uuid_len,
-            service_uuid_list,
-            slave_conn_interv_min, slave_conn_interv_max)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_SET_DISCOVERABLE,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
-
-    def aci_gap_set_direct_connectable_IDB05A1(
-            self, own_addr_type=0, directed_adv_type=0, initiator_addr_type=0,
-            initiator_addr=b'', adv_interv_min=0, adv_interv_max=0):
-        """aci_gap_set_direct_connectable_IDB05A1"""
-        data = ustruct.pack(
-            "<BBB6sHH",
-            own_addr_type, directed_adv_type,
-            initiator_addr_type, initiator_addr,
-            adv_interv_min, adv_interv_max)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_SET_DIRECT_CONNECTABLE,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
-
-    def aci_gap_set_direct_connectable_IDB04A1(
-            self, own_addr_type=0, initiator_addr_type=0, initiator_addr=b''):
-        """aci_gap_set_direct_connectable_IDB04A1"""
-        data = ustruct.pack(
-            "<BB6s",
-            own_addr_type, initiator_addr_type,
-            initiator_addr)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_SET_DIRECT_CONNECTABLE,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
-
-    def aci_gap_set_io_capability(self, io_capability=0):
-        """aci_gap_set_io_capability"""
-        data = ustruct.pack(
-            "<B",
-            io_capability)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_SET_IO_CAPABILITY,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
-
-    def aci_gap_set_auth_requirement(
-            self, mitm_mode=0, oob_enable=False, oob_data=b'',
-            min_encryption_key_size=0, max_encryption_key_size=0,
-            use_fixed_pin=False, fixed_pin=0, bonding_mode=0):
-        """aci_gap_set_auth_requirement"""
-        data = ustruct.pack(
-            "<BB16sBBBIB",
-            mitm_mode, int(oob_enable), oob_data,
-            min_encryption_key_size, max_encryption_key_size,
-            int(use_fixed_pin), fixed_pin, bonding_mode)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_SET_AUTH_REQUIREMENT,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
-
-    def aci_gap_set_author_requirement(
-            self, conn_handle=0, authorization_enable=False):
-        """aci_gap_set_author_requirement"""
-        data = ustruct.pack(
-            "<HB",
-            conn_handle, int(authorization_enable))
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_SET_AUTHOR_REQUIREMENT,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
-
-    def aci_gap_pass_key_response(self, conn_handle=0, passkey=0):
-        """aci_gap_pass_key_response"""
-        data = ustruct.pack(
-            "<HI",
-            conn_handle, passkey)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_PASSKEY_RESPONSE,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
-
-    def aci_gap_authorization_response(self, conn_handle=0, authorize=0):
-        """aci_gap_authorization_response"""
-        data = ustruct.pack(
-            "<HB",
-            conn_handle, authorize)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_AUTHORIZATION_RESPONSE,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
-
-    def aci_gap_set_non_connectable_IDB05A1(
-            self, adv_type=0, own_address_type=0):
-        """aci_gap_set_non_connectable_IDB05A1"""
-        data = ustruct.pack(
-            "<BB",
-            adv_type, own_address_type)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_SET_NON_CONNECTABLE,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
-
-    def aci_gap_set_non_connectable_IDB04A1(
-            self, adv_type=0):
-        """aci_gap_set_non_connectable_IDB04A1"""
-        data = ustruct.pack(
-            "<B",
-            adv_type)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_SET_NON_CONNECTABLE,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
-
-    def aci_gap_set_undirected_connectable(
-            self, own_addr_type=0, adv_filter_policy=0):
-        """aci_gap_set_undirected_connectable"""
-        data = ustruct.pack(
-            "<BB",
-            own_addr_type, adv_filter_policy)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_SET_UNDIRECTED_CONNECTABLE,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
-
-    def aci_gap_slave_security_request(
-            self, conn_handle=0, bonding=0, mitm_protection=0):
-        """aci_gap_slave_security_request"""
-        data = ustruct.pack(
-            "<HBB",
-            conn_handle, bonding, mitm_protection)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_SLAVE_SECURITY_REQUEST,
-            data=data,
-            evtcode=EVT_CMD_STATUS)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
-
-    def aci_gap_update_adv_data(self, adv_len=0, adv_data=b''):
-        """aci_gap_update_adv_data"""
-        data = ustruct.pack(
-            "<B{:d}s".format(adv_len),
-            adv_len, adv_data)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_UPDATE_ADV_DATA,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
-
-    def aci_gap_delete_ad_type(self, ad_type=0):
-        """aci_gap_delete_ad_type"""
-        data = ustruct.pack(
-            "<B",
-            ad_type)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_DELETE_AD_TYPE,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
-
-    def aci_gap_get_security_level(self):
-        """aci_gap_get_security_level"""
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_GET_SECURITY_LEVEL)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
-
-    def aci_gap_configure_whitelist(self):
-        """aci_gap_configure_whitelist"""
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_CONFIGURE_WHITELIST)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
-
-    def aci_gap_terminate(self, conn_handle=0, reason=0):
-        """aci_gap_terminate"""
-        data = ustruct.pack(
-            "<HB",
-            conn_handle, reason)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_TERMINATE,
-            data=data,
-            evtcode=EVT_CMD_STATUS)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
-
-    def aci_gap_clear_security_database(self):
-        """aci_gap_clear_security_database"""
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_CLEAR_SECURITY_DB)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
-
-    def aci_gap_allow_rebond_IDB05A1(self, conn_handle=0):
-        """aci_gap_allow_rebond_IDB05A1"""
-        data = ustruct.pack(
-            "<H",
-            conn_handle)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_ALLOW_REBOND_DB,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
-
-    def aci_gap_allow_rebond_IDB04A1(self):
-        """aci_gap_allow_rebond_IDB04A1"""
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_ALLOW_REBOND_DB)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
-
-    def aci_gap_start_limited_discovery_proc(
-            self, scan_interval=0, scan_window=0,
-            own_address_type=0, filter_duplicates=0):
-        """aci_gap_start_limited_discovery_proc"""
-        data = ustruct.pack(
-            "<HHBB",
-            scan_interval, scan_window, own_address_type, filter_duplicates)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_START_LIMITED_DISCOVERY_PROC,
-            data=data,
-            evtcode=EVT_CMD_STATUS)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gap_init_IDB04A1 = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_INIT, "<B", "role", module="IDB04A1")
 
-    def aci_gap_start_general_discovery_proc(
-            self, scan_interval=0, scan_window=0,
-            own_address_type=0, filter_duplicates=0):
-        """aci_gap_start_general_discovery_proc"""
-        data = ustruct.pack(
-            "<HHBB",
-            scan_interval, scan_window, own_address_type, filter_duplicates)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_START_GENERAL_DISCOVERY_PROC,
-            data=data,
-            evtcode=EVT_CMD_STATUS)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gap_init_IDB05A1 = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_INIT, "<BBB", "role", "privacy_enabled",
+        "device_name_char_len", module="IDB05A1")
+
+    aci_gap_set_non_discoverable = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_SET_NON_DISCOVERABLE)
 
-    def aci_gap_start_name_discovery_proc(
-            self, scan_interval=0, scan_window=0, peer_bdaddr_type=0,
-            peer_bdaddr=b'', own_bdaddr_type=0, conn_min_interval=0,
-            conn_max_interval=0, conn_latency=0, supervision_timeout=0,
-            min_conn_length=0, max_conn_length=0):
-        """aci_gap_start_name_discovery_proc"""
-        data = ustruct.pack(
-            "<HHB6sBHHHHHH",
-            scan_interval, scan_window,
-            peer_bdaddr_type, peer_bdaddr, own_bdaddr_type,
-            conn_min_interval, conn_max_interval, conn_latency,
-            supervision_timeout, min_conn_length, max_conn_length)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_START_NAME_DISCOVERY_PROC,
-            data=data,
-            evtcode=EVT_CMD_STATUS)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gap_set_limited_discoverable = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_SET_LIMITED_DISCOVERABLE, "<BHHBBB*B*HH",
+        "adv_type", "adv_interv_min", "adv_interv_max", "own_addr_type",
+        "adv_filter_policy", "local_name_len", "local_name_len", "local_name",
+        "service_uuid_len", "service_uuid_len", "service_uuid_list",
+        "slave_conn_interv_min", "slave_conn_interv_max")
+
+    aci_gap_set_discoverable = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_SET_DISCOVERABLE, "<BHHBBB*B*HH", "adv_type",
+        "adv_interv_min", "adv_interv_max", "own_addr_type",
+        "adv_filter_policy", "local_name_len", "local_name_len", "local_name",
+        "service_uuid_len", "service_uuid_len", "service_uuid_list",
+        "slave_conn_interv_min", "slave_conn_interv_max")
+
+    aci_gap_set_direct_connectable_IDB05A1 = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_SET_DIRECT_CONNECTABLE, None, "own_addr_type",
+        "directed_adv_type", "initiator_addr_type", "initiator_addr",
+        "adv_interv_min", "adv_interv_max", module="IDB05A1")
+
+    aci_gap_set_direct_connectable_IDB04A1 = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_SET_DIRECT_CONNECTABLE, "<BB6s",
+        "own_addr_type", "initiator_addr_type", "initiator_addr",
+        module="IDB04A1")
+
+    aci_gap_set_io_capability = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_SET_IO_CAPABILITY, None, "io_capability")
+
+    aci_gap_set_auth_requirement = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_SET_AUTH_REQUIREMENT, "<BB16sBBBIB",
+        "mitm_mode", "oob_enable", "oob_data", "min_encryption_key_size",
+        "max_encryption_key_size", "use_fixed_pin", "fixed_pin",
+        "bonding_mode")
+
+    aci_gap_set_author_requirement = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_SET_AUTHOR_REQUIREMENT, "<HB", "conn_handle",
+        "authorization_enable")
+
+    aci_gap_pass_key_response = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_PASSKEY_RESPONSE, None, "conn_handle",
+        "passkey")
+
+    aci_gap_authorization_response = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_AUTHORIZATION_RESPONSE, None, "conn_handle",
+        "authorize")
+
+    aci_gap_set_non_connectable_IDB05A1 = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_SET_NON_CONNECTABLE, None, "adv_type",
+        "own_address_type", module="IDB05A1")
+
+    aci_gap_set_non_connectable_IDB04A1 = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_SET_NON_CONNECTABLE, "<B", "adv_type",
+        module="IDB04A1")
+
+    aci_gap_set_undirected_connectable = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_SET_UNDIRECTED_CONNECTABLE, None,
+        "own_addr_type", "adv_filter_policy")
+
+    aci_gap_slave_security_request = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_SLAVE_SECURITY_REQUEST, None, "conn_handle",
+        "bonding", "mitm_protection", evtcode=EVT_CMD_STATUS)
+
+    aci_gap_update_adv_data = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_UPDATE_ADV_DATA, "<B*", "adv_len", "adv_len",
+        "adv_data")
+
+    aci_gap_delete_ad_type = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_DELETE_AD_TYPE, None, "ad_type")
+
+    aci_gap_get_security_level = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_GET_SECURITY_LEVEL)
+
+    aci_gap_configure_whitelist = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_CONFIGURE_WHITELIST)
+
+    aci_gap_terminate = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_TERMINATE, "<HB", "conn_handle", "reason",
+        evtcode=EVT_CMD_STATUS)
+
+    aci_gap_clear_security_database = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_CLEAR_SECURITY_DB)
+
+    aci_gap_allow_rebond_IDB05A1 = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_ALLOW_REBOND_DB, None, "conn_handle",
+        module="IDB05A1")
+
+    aci_gap_allow_rebond_IDB04A1 = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_ALLOW_REBOND_DB, module="IDB04A1")
+
+    aci_gap_start_limited_discovery_proc = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_START_LIMITED_DISCOVERY_PROC, "<HHBB",
+        "scan_interval", "scan_window", "own_address_type",
+        "filter_duplicates", evtcode=EVT_CMD_STATUS)
+
+    aci_gap_start_general_discovery_proc = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_START_GENERAL_DISCOVERY_PROC, "<HHBB",
+        "scan_interval", "scan_window", "own_address_type",
+        "filter_duplicates", evtcode=EVT_CMD_STATUS)
+
+    aci_gap_start_name_discovery_proc = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_START_NAME_DISCOVERY_PROC, None,
+        "scan_interval", "scan_window", "peer_bdaddr_type", "peer_bdaddr",
+        "own_bdaddr_type", "conn_min_interval", "conn_max_interval",
+        "conn_latency", "supervision_timeout", "min_conn_length",
+        "max_conn_length", evtcode=EVT_CMD_STATUS)
 
     def aci_gap_start_auto_conn_establish_proc_IDB05A1(
             self, scan_interval=0, scan_window=0, own_bdaddr_type=0,
@@ -873,21 +1478,16 @@ class BlueNRG_MS(BaseHCI):
             supervision_timeout=0, min_conn_length=0, max_conn_length=0,
             num_whitelist_entries=0, addr_array=b''):
         """aci_gap_start_auto_conn_establish_proc_IDB05A1"""
-        data = ustruct.pack(
-            "<HHBHHHHHHB{:d}s".format(num_whitelist_entries * 7),
-            scan_interval, scan_window,
-            own_bdaddr_type,
-            conn_min_interval, conn_max_interval, conn_latency,
-            supervision_timeout,
-            min_conn_length, max_conn_length,
-            num_whitelist_entries,
-            addr_array)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_START_AUTO_CONN_ESTABLISH_PROC,
-            data=data,
-            evtcode=EVT_CMD_STATUS)
+        hci_cmd = self.hci_encode(
+            OGF_VENDOR_CMD, OCF_GAP_START_AUTO_CONN_ESTABLISH_PROC,
+            "<HHBHHHHHHB*",
+            scan_interval, scan_window, own_bdaddr_type, conn_min_interval,
+            conn_max_interval, conn_latency, supervision_timeout,
+            min_conn_length, max_conn_length, num_whitelist_entries,
+            num_whitelist_entries * 7, addr_array, evtcode=EVT_CMD_STATUS,
+            module="IDB05A1")
         self.hci_send_cmd(hci_cmd)
+        hci_cmd.detach()
         return hci_cmd
 
     def aci_gap_start_auto_conn_establish_proc_IDB04A1(
@@ -897,242 +1497,114 @@ class BlueNRG_MS(BaseHCI):
             use_reconn_addr=False, reconn_addr=b'', num_whitelist_entries=0,
             addr_array=b''):
         """aci_gap_start_auto_conn_establish_proc_IDB04A1"""
-        data = ustruct.pack(
-            "<HHBHHHHHHB6sB{:d}s".format(num_whitelist_entries * 7),
-            scan_interval, scan_window,
-            own_bdaddr_type,
-            conn_min_interval, conn_max_interval, conn_latency,
-            supervision_timeout,
-            min_conn_length, max_conn_length,
-            int(use_reconn_addr), reconn_addr,
-            num_whitelist_entries,
-            addr_array)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_START_AUTO_CONN_ESTABLISH_PROC,
-            data=data,
-            evtcode=EVT_CMD_STATUS)
+        hci_cmd = self.hci_encode(
+            OGF_VENDOR_CMD, OCF_GAP_START_AUTO_CONN_ESTABLISH_PROC,
+            "<HHBHHHHHHB6sB*",
+            scan_interval, scan_window, own_bdaddr_type, conn_min_interval,
+            conn_max_interval, conn_latency, supervision_timeout,
+            min_conn_length, max_conn_length, use_reconn_addr,
+            reconn_addr, num_whitelist_entries, num_whitelist_entries * 7,
+            addr_array, evtcode=EVT_CMD_STATUS, module="IDB04A1")
         self.hci_send_cmd(hci_cmd)
+        hci_cmd.detach()
         return hci_cmd
 
-    def aci_gap_start_general_conn_establish_proc_IDB05A1(
-            self, scan_type=0, scan_interval=0, scan_window=0,
-            own_address_type=0, filter_duplicates=False):
-        """aci_gap_start_general_conn_establish_proc_IDB05A1"""
-        data = ustruct.pack(
-            "<BHHBB",
-            scan_type, scan_interval, scan_window,
-            own_address_type, int(filter_duplicates))
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_START_GENERAL_CONN_ESTABLISH_PROC,
-            data=data,
-            evtcode=EVT_CMD_STATUS)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gap_start_general_conn_establish_proc_IDB05A1 = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_START_GENERAL_CONN_ESTABLISH_PROC, "<BHHBB",
+        "scan_type", "scan_interval", "scan_window", "own_address_type",
+        "filter_duplicates", evtcode=EVT_CMD_STATUS, module="IDB05A1")
 
-    def aci_gap_start_general_conn_establish_proc_IDB04A1(
-            self, scan_type=0, scan_interval=0, scan_window=0,
-            own_address_type=0, filter_duplicates=False, reconn_addr=b''):
-        """aci_gap_start_general_conn_establish_proc_IDB04A1"""
-        data = ustruct.pack(
-            "<BHHBB6s",
-            scan_type, scan_interval, scan_window,
-            own_address_type, int(filter_duplicates),
-            reconn_addr)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_START_GENERAL_CONN_ESTABLISH_PROC,
-            data=data,
-            evtcode=EVT_CMD_STATUS)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gap_start_general_conn_establish_proc_IDB04A1 = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_START_GENERAL_CONN_ESTABLISH_PROC, "<BHHBB6s",
+        "scan_type", "scan_interval", "scan_window", "own_address_type",
+        "filter_duplicates", "reconn_addr", evtcode=EVT_CMD_STATUS,
+        module="IDB04A1")
 
     def aci_gap_start_selective_conn_establish_proc(
             self, scan_type=0, scan_interval=0, scan_window=0,
             own_address_type=0, filter_duplicates=False,
             num_whitelist_entries=0, addr_array=b''):
         """aci_gap_start_selective_conn_establish_proc"""
-        data = ustruct.pack(
-            "<BHHBBB{:d}s".format(num_whitelist_entries * 7),
+        hci_cmd = self.hci_encode(
+            OGF_VENDOR_CMD, OCF_GAP_START_SELECTIVE_CONN_ESTABLISH_PROC, None,
             scan_type, scan_interval, scan_window, own_address_type,
-            int(filter_duplicates), num_whitelist_entries, addr_array)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_START_SELECTIVE_CONN_ESTABLISH_PROC,
-            data=data,
-            evtcode=EVT_CMD_STATUS)
+            filter_duplicates, num_whitelist_entries,
+            num_whitelist_entries * 7, addr_array, evtcode=EVT_CMD_STATUS)
         self.hci_send_cmd(hci_cmd)
+        hci_cmd.detach()
         return hci_cmd
 
-    def aci_gap_create_connection(
-            self, scan_interval=0, scan_window=0, peer_bdaddr_type=0,
-            peer_bdaddr=b'', own_bdaddr_type=0, conn_min_interval=0,
-            conn_max_interval=0, conn_latency=0, supervision_timeout=0,
-            min_conn_length=0, max_conn_length=0):
-        """aci_gap_create_connection"""
-        data = ustruct.pack(
-            "<HHB6sBHHHHHH",
-            scan_interval, scan_window,
-            peer_bdaddr_type, peer_bdaddr,
-            own_bdaddr_type,
-            conn_min_interval, conn_max_interval, conn_latency,
-            supervision_timeout,
-            min_conn_length, max_conn_length)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_CREATE_CONNECTION,
-            data=data,
-            evtcode=EVT_CMD_STATUS)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gap_create_connection = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_CREATE_CONNECTION, None, "scan_interval",
+        "scan_window", "peer_bdaddr_type", "peer_bdaddr", "own_bdaddr_type",
+        "conn_min_interval", "conn_max_interval", "conn_latency",
+        "supervision_timeout", "min_conn_length", "max_conn_length",
+        evtcode=EVT_CMD_STATUS)
 
-    def aci_gap_terminate_gap_procedure(self, procedure_code=0):
-        """aci_gap_terminate_gap_procedure"""
-        data = ustruct.pack(
-            "<B",
-            procedure_code)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_TERMINATE_GAP_PROCEDURE,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gap_terminate_gap_procedure = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_TERMINATE_GAP_PROCEDURE, "<B",
+        "procedure_code")
 
-    def aci_gap_start_connection_update(
-            self, conn_handle=0, conn_min_interval=0, conn_max_interval=0,
-            conn_latency=0, supervision_timeout=0, min_conn_length=0,
-            max_conn_length=0):
-        """aci_gap_start_connection_update"""
-        data = ustruct.pack(
-            "<HHHHHHH",
-            conn_handle,
-            conn_min_interval, conn_max_interval, conn_latency,
-            supervision_timeout, min_conn_length, max_conn_length)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_START_CONNECTION_UPDATE,
-            data=data,
-            evtcode=EVT_CMD_STATUS)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gap_start_connection_update = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_START_CONNECTION_UPDATE, None, "conn_handle",
+        "conn_min_interval", "conn_max_interval", "conn_latency",
+        "supervision_timeout", "min_conn_length", "max_conn_length",
+        evtcode=EVT_CMD_STATUS)
 
-    def aci_gap_send_pairing_request(self, conn_handle=0, force_rebond=False):
-        """aci_gap_send_pairing_request"""
-        data = ustruct.pack(
-            "<HB",
-            conn_handle, int(force_rebond))
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_SEND_PAIRING_REQUEST,
-            data=data,
-            evtcode=EVT_CMD_STATUS)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gap_send_pairing_request = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_SEND_PAIRING_REQUEST, "<HB", "conn_handle",
+        "force_rebond", evtcode=EVT_CMD_STATUS)
 
-    def aci_gap_resolve_private_address_IDB05A1(self, private_address=b''):
-        """aci_gap_resolve_private_address_IDB05A1"""
-        data = ustruct.pack(
-            "<6s",
-            private_address)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_RESOLVE_PRIVATE_ADDRESS,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gap_resolve_private_address_IDB05A1 = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_RESOLVE_PRIVATE_ADDRESS, "<6s",
+        "private_address", module="IDB05A1")
 
-    def aci_gap_resolve_private_address_IDB04A1(self):
-        """aci_gap_resolve_private_address_IDB04A1"""
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_RESOLVE_PRIVATE_ADDRESS)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gap_resolve_private_address_IDB04A1 = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_RESOLVE_PRIVATE_ADDRESS, module="IDB04A1")
 
     def aci_gap_set_broadcast_mode(
             self, adv_interv_min=0, adv_interv_max=0, adv_type=0,
             own_addr_type=0, adv_data_length=0, adv_data=b'',
             num_whitelist_entries=0, addr_array=b''):
         """aci_gap_set_broadcast_mode"""
-        data = ustruct.pack(
-            "<HHBBB{:d}sB{:d}s".format(
-                adv_data_length, num_whitelist_entries * 7),
-            adv_interv_min, adv_interv_max,
-            adv_type, own_addr_type,
-            adv_data_length,
-            adv_data,
-            num_whitelist_entries,
-            addr_array)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_SET_BROADCAST_MODE,
-            data=data)
+        hci_cmd = self.hci_encode(
+            OGF_VENDOR_CMD, OCF_GAP_SET_BROADCAST_MODE, "<HHBBB*B*",
+            adv_interv_min, adv_interv_max, adv_type, own_addr_type,
+            adv_data_length, adv_data_length, adv_data, num_whitelist_entries,
+            num_whitelist_entries * 7, addr_array)
         self.hci_send_cmd(hci_cmd)
+        hci_cmd.detach()
         return hci_cmd
 
-    def aci_gap_start_observation_procedure(
-            self, scan_interval=0, scan_window=0, scan_type=0,
-            own_address_type=0, filter_duplicates=False):
-        """aci_gap_start_observation_procedure"""
-        data = ustruct.pack(
-            "<HHBBB",
-            scan_interval, scan_window, scan_type,
-            own_address_type, int(filter_duplicates))
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_START_OBSERVATION_PROC,
-            data=data,
-            evtcode=EVT_CMD_STATUS)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gap_start_observation_procedure = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_START_OBSERVATION_PROC, "<HHBBB",
+        "scan_interval", "scan_window", "scan_type", "own_address_type",
+        "filter_duplicates", evtcode=EVT_CMD_STATUS)
 
-    def aci_gap_is_device_bonded(self, peer_address_type=0, peer_address=b''):
-        """aci_gap_is_device_bonded"""
-        data = ustruct.pack(
-            "<B6s",
-            peer_address_type, peer_address)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_IS_DEVICE_BONDED,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gap_is_device_bonded = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_IS_DEVICE_BONDED, "<B6s", "peer_address_type",
+        "peer_address")
 
-    def aci_gap_get_bonded_devices(self):
-        """aci_gap_get_bonded_devices"""
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GAP_GET_BONDED_DEVICES)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gap_get_bonded_devices = command_method(
+        OGF_VENDOR_CMD, OCF_GAP_GET_BONDED_DEVICES)
 
     ###########################################################################
     #                               GATT                                      #
     ###########################################################################
 
-    def aci_gatt_init(self):
-        """aci_gatt_init"""
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_INIT)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gatt_init = command_method(OGF_VENDOR_CMD, OCF_GATT_INIT)
 
     def aci_gatt_add_serv(
             self, service_uuid_type=0, service_uuid=b'', service_type=0,
             max_attr_records=0):
         """aci_gatt_add_serv"""
         uuid_len = 2 if service_uuid_type == UUID_TYPE_16 else 16
-        data = ustruct.pack(
-            "<B{:d}sBB".format(uuid_len),
-            service_uuid_type, service_uuid,
-            service_type, max_attr_records)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_ADD_SERV,
-            data=data)
+        hci_cmd = self.hci_encode(
+            OGF_VENDOR_CMD, OCF_GATT_ADD_SERV, "<B*BB",
+            service_uuid_type, uuid_len, service_uuid, service_type,
+            max_attr_records)
         self.hci_send_cmd(hci_cmd)
+        hci_cmd.detach()
         return hci_cmd
 
     def aci_gatt_include_service(
@@ -1140,16 +1612,12 @@ class BlueNRG_MS(BaseHCI):
             included_end_handle=0, included_uuid_type=0, included_uuid=b''):
         """aci_gatt_include_service"""
         uuid_len = 2 if included_uuid_type == UUID_TYPE_16 else 16
-        data = ustruct.pack(
-            "<HHHB{:d}s".format(uuid_len),
-            service_handle, included_start_handle,
-            included_end_handle, included_uuid_type,
-            included_uuid)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_INCLUDE_SERV,
-            data=data)
+        hci_cmd = self.hci_encode(
+            OGF_VENDOR_CMD, OCF_GATT_INCLUDE_SERV, "<HHHB*",
+            service_handle, included_start_handle, included_end_handle,
+            included_uuid_type, uuid_len, included_uuid)
         self.hci_send_cmd(hci_cmd)
+        hci_cmd.detach()
         return hci_cmd
 
     def aci_gatt_add_char(
@@ -1158,16 +1626,13 @@ class BlueNRG_MS(BaseHCI):
             gatt_evt_mask=0, encry_key_size=0, is_variable=False):
         """aci_gatt_add_char"""
         uuid_len = 2 if char_uuid_type == UUID_TYPE_16 else 16
-        data = ustruct.pack(
-            "<HB{:d}sBBBBBB".format(uuid_len),
-            service_handle, char_uuid_type, char_uuid,
-            char_value_len, char_properties, sec_permissions,
-            gatt_evt_mask, encry_key_size, int(is_variable))
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_ADD_CHAR,
-            data=data)
+        hci_cmd = self.hci_encode(
+            OGF_VENDOR_CMD, OCF_GATT_ADD_CHAR, "<HB*BBBBBB",
+            service_handle, char_uuid_type, uuid_len, char_uuid,
+            char_value_len, char_properties, sec_permissions, gatt_evt_mask,
+            encry_key_size, is_variable)
         self.hci_send_cmd(hci_cmd)
+        hci_cmd.detach()
         return hci_cmd
 
     def aci_gatt_add_char_desc(
@@ -1177,138 +1642,76 @@ class BlueNRG_MS(BaseHCI):
             encry_key_size=0, is_variable=False):
         """aci_gatt_add_char_desc"""
         uuid_len = 2 if desc_uuid_type == UUID_TYPE_16 else 16
-        data = ustruct.pack(
-            "<HHB{:d}sBB{:d}sBBBBB".format(uuid_len, desc_value_len),
-            service_handle, char_handle, desc_uuid_type,
-            uuid, desc_value_max_len, desc_value_len,
-            desc_value, sec_permissions,
-            acc_permissions, gatt_evt_mask, encry_key_size,
-            int(is_variable))
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_ADD_CHAR_DESC,
-            data=data)
+        hci_cmd = self.hci_encode(
+            OGF_VENDOR_CMD, OCF_GATT_ADD_CHAR_DESC, "<HHB*BB*BBBBB",
+            service_handle, char_handle, desc_uuid_type, uuid_len, uuid,
+            desc_value_max_len, desc_value_len, desc_value_len, desc_value,
+            sec_permissions, acc_permissions, gatt_evt_mask, encry_key_size,
+            is_variable)
         self.hci_send_cmd(hci_cmd)
+        hci_cmd.detach()
         return hci_cmd
 
-    def aci_gatt_update_char_value(
+    aci_gatt_update_char_value = command_method(
+        OGF_VENDOR_CMD, OCF_GATT_UPD_CHAR_VAL, "<HHBB*", "serv_handle",
+        "char_handle", "char_val_offset", "char_value_len", "char_value_len",
+        "char_value")
+
+    def aci_gatt_prepare_char_value(
             self, serv_handle=0, char_handle=0, char_val_offset=0,
-            char_value_len=0, char_value=b''):
-        """aci_gatt_update_char_value"""
-        data = ustruct.pack(
-            "<HHBB{:d}s".format(char_value_len),
-            serv_handle, char_handle, char_val_offset,
-            char_value_len, char_value)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_UPD_CHAR_VAL,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+            char_value_len=20):
+        """
+        aci_gatt_update_char_value built once for a characteristic, to be
+        sent with aci_gatt_update_prepared_char_value()
+        """
+        return HCI_PREPARED_COMMAND(
+            OGF_VENDOR_CMD, OCF_GATT_UPD_CHAR_VAL,
+            ustruct.pack("<HHBB", serv_handle, char_handle, char_val_offset, 0),
+            char_value_len, length_offset=5)
 
-    def aci_gatt_del_char(self, serv_handle=0, char_handle=0):
-        """aci_gatt_del_char"""
-        data = ustruct.pack(
-            "<HH",
-            serv_handle, char_handle)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_DEL_CHAR,
-            data=data)
+    def aci_gatt_update_prepared_char_value(self, hci_cmd, char_value=b''):
+        """aci_gatt_update_prepared_char_value"""
+        if self._cmd_scheduler.is_pending(hci_cmd):
+            raise ValueError("pending")
+        hci_cmd.set_value(char_value)
         self.hci_send_cmd(hci_cmd)
         return hci_cmd
 
-    def aci_gatt_del_service(self, serv_handle=0):
-        """aci_gatt_del_service"""
-        data = ustruct.pack(
-            "<H",
-            serv_handle)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_DEL_SERV,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gatt_del_char = command_method(
+        OGF_VENDOR_CMD, OCF_GATT_DEL_CHAR, None, "serv_handle", "char_handle")
 
-    def aci_gatt_del_include_service(
-            self, serv_handle=0, include_serv_handle=0):
-        """aci_gatt_del_include_service"""
-        data = ustruct.pack(
-            "<HH",
-            serv_handle, include_serv_handle)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_DEL_INC_SERV,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gatt_del_service = command_method(
+        OGF_VENDOR_CMD, OCF_GATT_DEL_SERV, None, "serv_handle")
 
-    def aci_gatt_set_event_mask(self, event_mask=0):
-        """aci_gatt_set_event_mask"""
-        data = ustruct.pack(
-            "<I",
-            event_mask)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_SET_EVT_MASK,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gatt_del_include_service = command_method(
+        OGF_VENDOR_CMD, OCF_GATT_DEL_INC_SERV, "<HH", "serv_handle",
+        "include_serv_handle")
 
-    def aci_gatt_exchange_configuration(self, conn_handle=0):
-        """aci_gatt_exchange_configuration"""
-        data = ustruct.pack(
-            "<H",
-            conn_handle)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_EXCHANGE_CONFIG,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gatt_set_event_mask = command_method(
+        OGF_VENDOR_CMD, OCF_GATT_SET_EVT_MASK, None, "event_mask")
 
-    def aci_att_find_information_req(
-            self, conn_handle=0, start_handle=0, end_handle=0):
-        """aci_att_find_information_req"""
-        data = ustruct.pack(
-            "<HHH",
-            conn_handle, start_handle, end_handle)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_ATT_FIND_INFO_REQ,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gatt_exchange_configuration = command_method(
+        OGF_VENDOR_CMD, OCF_GATT_EXCHANGE_CONFIG, None, "conn_handle")
 
-    def aci_att_find_by_type_value_req(
-            self, conn_handle=0, start_handle=0, end_handle=0,
-            uuid=b'', attr_val_len=0, attr_val=b''):
-        """aci_att_find_by_type_value_req"""
-        data = ustruct.pack(
-            "<HHH2sB{:d}s".format(attr_val_len),
-            conn_handle, start_handle, end_handle, uuid,
-            attr_val_len, attr_val)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_ATT_FIND_BY_TYPE_VALUE_REQ,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_att_find_information_req = command_method(
+        OGF_VENDOR_CMD, OCF_ATT_FIND_INFO_REQ, None, "conn_handle",
+        "start_handle", "end_handle")
+
+    aci_att_find_by_type_value_req = command_method(
+        OGF_VENDOR_CMD, OCF_ATT_FIND_BY_TYPE_VALUE_REQ, None, "conn_handle",
+        "start_handle", "end_handle", "uuid", "attr_val_len", "attr_val_len",
+        "attr_val")
 
     def aci_att_read_by_type_req(
             self, conn_handle=0, start_handle=0, end_handle=0,
             uuid_type=0, uuid=b''):
         """aci_att_read_by_type_req"""
         uuid_len = 2 if uuid_type == UUID_TYPE_16 else 16
-        data = ustruct.pack(
-            "<HHHB{:d}s".format(uuid_len),
-            conn_handle, start_handle, end_handle,
-            uuid_type, uuid)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_ATT_READ_BY_TYPE_REQ,
-            data=data)
+        hci_cmd = self.hci_encode(
+            OGF_VENDOR_CMD, OCF_ATT_READ_BY_TYPE_REQ, None,
+            conn_handle, start_handle, end_handle, uuid_type, uuid_len, uuid)
         self.hci_send_cmd(hci_cmd)
+        hci_cmd.detach()
         return hci_cmd
 
     def aci_att_read_by_group_type_req(
@@ -1316,673 +1719,254 @@ class BlueNRG_MS(BaseHCI):
             uuid_type=0, uuid=b''):
         """aci_att_read_by_group_type_req"""
         uuid_len = 2 if uuid_type == UUID_TYPE_16 else 16
-        data = ustruct.pack(
-            "<HHHB{:d}s".format(uuid_len),
-            conn_handle, start_handle, end_handle,
-            uuid_type, uuid)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_ATT_READ_BY_GROUP_TYPE_REQ,
-            data=data)
+        hci_cmd = self.hci_encode(
+            OGF_VENDOR_CMD, OCF_ATT_READ_BY_GROUP_TYPE_REQ, None,
+            conn_handle, start_handle, end_handle, uuid_type, uuid_len, uuid)
         self.hci_send_cmd(hci_cmd)
+        hci_cmd.detach()
         return hci_cmd
 
-    def aci_att_prepare_write_req(
-            self, conn_handle=0, attr_handle=0, value_offset=0,
-            attr_val_len=0, attr_val=b''):
-        """aci_att_prepare_write_req"""
-        data = ustruct.pack(
-            "<HHHB{:d}s".format(attr_val_len),
-            conn_handle, attr_handle, value_offset,
-            attr_val_len, attr_val)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_ATT_PREPARE_WRITE_REQ,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_att_prepare_write_req = command_method(
+        OGF_VENDOR_CMD, OCF_ATT_PREPARE_WRITE_REQ, None, "conn_handle",
+        "attr_handle", "value_offset", "attr_val_len", "attr_val_len",
+        "attr_val")
 
-    def aci_att_execute_write_req(self, conn_handle=0, execute=0):
-        """aci_att_execute_write_req"""
-        data = ustruct.pack(
-            "<HB",
-            conn_handle, execute)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_ATT_EXECUTE_WRITE_REQ,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_att_execute_write_req = command_method(
+        OGF_VENDOR_CMD, OCF_ATT_EXECUTE_WRITE_REQ, None, "conn_handle",
+        "execute")
 
-    def aci_gatt_disc_all_prim_services(self, conn_handle=0):
-        """aci_gatt_disc_all_prim_services"""
-        data = ustruct.pack(
-            "<H",
-            conn_handle)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_DISC_ALL_PRIM_SERVICES,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gatt_disc_all_prim_services = command_method(
+        OGF_VENDOR_CMD, OCF_GATT_DISC_ALL_PRIM_SERVICES, None, "conn_handle")
 
     def aci_gatt_disc_prim_service_by_uuid(
             self, conn_handle=0, uuid_type=0, uuid=b''):
         """aci_gatt_disc_prim_service_by_uuid"""
         uuid_len = 2 if uuid_type == UUID_TYPE_16 else 16
-        data = ustruct.pack(
-            "<HB{:d}s".format(uuid_len),
-            conn_handle, uuid_type, uuid)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_DISC_PRIM_SERVICE_BY_UUID,
-            data=data,
-            evtcode=EVT_CMD_STATUS)
+        hci_cmd = self.hci_encode(
+            OGF_VENDOR_CMD, OCF_GATT_DISC_PRIM_SERVICE_BY_UUID, None,
+            conn_handle, uuid_type, uuid_len, uuid, evtcode=EVT_CMD_STATUS)
         self.hci_send_cmd(hci_cmd)
+        hci_cmd.detach()
         return hci_cmd
 
-    def aci_gatt_find_included_services(
-            self, conn_handle=0, start_handle=0, end_handle=0):
-        """aci_gatt_find_included_services"""
-        data = ustruct.pack(
-            "<HHH",
-            conn_handle, start_handle, end_handle)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_FIND_INCLUDED_SERVICES,
-            data=data,
-            evtcode=EVT_CMD_STATUS)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gatt_find_included_services = command_method(
+        OGF_VENDOR_CMD, OCF_GATT_FIND_INCLUDED_SERVICES, None, "conn_handle",
+        "start_handle", "end_handle", evtcode=EVT_CMD_STATUS)
 
-    def aci_gatt_disc_all_charac_of_serv(
-            self, conn_handle=0, start_attr_handle=0, end_attr_handle=0):
-        """aci_gatt_disc_all_charac_of_serv"""
-        data = ustruct.pack(
-            "<HHH",
-            conn_handle, start_attr_handle, end_attr_handle)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_DISC_ALL_CHARAC_OF_SERV,
-            data=data,
-            evtcode=EVT_CMD_STATUS)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gatt_disc_all_charac_of_serv = command_method(
+        OGF_VENDOR_CMD, OCF_GATT_DISC_ALL_CHARAC_OF_SERV, None, "conn_handle",
+        "start_attr_handle", "end_attr_handle", evtcode=EVT_CMD_STATUS)
 
     def aci_gatt_disc_charac_by_uuid(
             self, conn_handle=0, start_handle=0, end_handle=0,
             uuid_type=0, uuid=b''):
         """aci_gatt_disc_charac_by_uuid"""
         uuid_len = 2 if uuid_type == UUID_TYPE_16 else 16
-        data = ustruct.pack(
-            "<HHHB{:d}s".format(uuid_len),
-            conn_handle, start_handle, end_handle, uuid_type, uuid)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_DISC_CHARAC_BY_UUID,
-            data=data,
+        hci_cmd = self.hci_encode(
+            OGF_VENDOR_CMD, OCF_GATT_DISC_CHARAC_BY_UUID, "<HHHB*",
+            conn_handle, start_handle, end_handle, uuid_type, uuid_len, uuid,
             evtcode=EVT_CMD_STATUS)
         self.hci_send_cmd(hci_cmd)
+        hci_cmd.detach()
         return hci_cmd
 
-    def aci_gatt_disc_all_charac_descriptors(
-            self, conn_handle=0, char_val_handle=0, char_end_handle=0):
-        """aci_gatt_disc_all_charac_descriptors"""
-        data = ustruct.pack(
-            "<HHH",
-            conn_handle, char_val_handle, char_end_handle)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_DISC_ALL_CHARAC_DESCRIPTORS,
-            data=data,
-            evtcode=EVT_CMD_STATUS)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gatt_disc_all_charac_descriptors = command_method(
+        OGF_VENDOR_CMD, OCF_GATT_DISC_ALL_CHARAC_DESCRIPTORS, None,
+        "conn_handle", "char_val_handle", "char_end_handle",
+        evtcode=EVT_CMD_STATUS)
 
-    def aci_gatt_read_charac_val(self, conn_handle=0, attr_handle=0):
-        """aci_gatt_read_charac_val"""
-        data = ustruct.pack(
-            "<HH",
-            conn_handle, attr_handle)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_READ_CHARAC_VAL,
-            data=data,
-            evtcode=EVT_CMD_STATUS)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gatt_read_charac_val = command_method(
+        OGF_VENDOR_CMD, OCF_GATT_READ_CHARAC_VAL, None, "conn_handle",
+        "attr_handle", evtcode=EVT_CMD_STATUS)
 
     def aci_gatt_read_using_charac_uuid(
             self, conn_handle=0, start_handle=0, end_handle=0,
             uuid_type=0, uuid=b''):
         """aci_gatt_read_using_charac_uuid"""
         uuid_len = 2 if uuid_type == UUID_TYPE_16 else 16
-        data = ustruct.pack(
-            "<HHHB{:d}s".format(uuid_len),
-            conn_handle, start_handle, end_handle, uuid_type, uuid)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_READ_USING_CHARAC_UUID,
-            data=data)
+        hci_cmd = self.hci_encode(
+            OGF_VENDOR_CMD, OCF_GATT_READ_USING_CHARAC_UUID, None,
+            conn_handle, start_handle, end_handle, uuid_type, uuid_len, uuid)
         self.hci_send_cmd(hci_cmd)
+        hci_cmd.detach()
         return hci_cmd
 
-    def aci_gatt_read_long_charac_val(
-            self, conn_handle=0, attr_handle=0, val_offset=0):
-        """aci_gatt_read_long_charac_val"""
-        data = ustruct.pack(
-            "<HHH",
-            conn_handle, attr_handle, val_offset)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_READ_LONG_CHARAC_VAL,
-            data=data,
-            evtcode=EVT_CMD_STATUS)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gatt_read_long_charac_val = command_method(
+        OGF_VENDOR_CMD, OCF_GATT_READ_LONG_CHARAC_VAL, None, "conn_handle",
+        "attr_handle", "val_offset", evtcode=EVT_CMD_STATUS)
 
     def aci_gatt_read_multiple_charac_val(
             self, conn_handle=0, num_handles=0, set_of_handles=b''):
         """aci_gatt_read_multiple_charac_val"""
-        data = ustruct.pack(
-            "<HB{:d}s".format(num_handles * 2),
-            conn_handle, num_handles, set_of_handles)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_READ_MULTIPLE_CHARAC_VAL,
-            data=data,
+        hci_cmd = self.hci_encode(
+            OGF_VENDOR_CMD, OCF_GATT_READ_MULTIPLE_CHARAC_VAL, None,
+            conn_handle, num_handles, num_handles * 2, set_of_handles,
             evtcode=EVT_CMD_STATUS)
         self.hci_send_cmd(hci_cmd)
+        hci_cmd.detach()
         return hci_cmd
 
-    def aci_gatt_write_charac_value(
-            self, conn_handle=0, attr_handle=0, val_len=0, attr_value=b''):
-        """aci_gatt_write_charac_value"""
-        data = ustruct.pack(
-            "<HHB{:d}s".format(val_len),
-            conn_handle, attr_handle, val_len, attr_value)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_WRITE_CHAR_VALUE,
-            data=data,
-            evtcode=EVT_CMD_STATUS)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gatt_write_charac_value = command_method(
+        OGF_VENDOR_CMD, OCF_GATT_WRITE_CHAR_VALUE, "<HHB*", "conn_handle",
+        "attr_handle", "val_len", "val_len", "attr_value",
+        evtcode=EVT_CMD_STATUS)
 
-    def aci_gatt_write_long_charac_val(
-            self, conn_handle=0, attr_handle=0, val_offset=0,
-            val_len=0, attr_val=b''):
-        """aci_gatt_write_long_charac_val"""
-        data = ustruct.pack(
-            "<HHHB{:d}s".format(val_len),
-            conn_handle, attr_handle, val_offset, val_len, attr_val)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_WRITE_LONG_CHARAC_VAL,
-            data=data,
-            evtcode=EVT_CMD_STATUS)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gatt_write_long_charac_val = command_method(
+        OGF_VENDOR_CMD, OCF_GATT_WRITE_LONG_CHARAC_VAL, None, "conn_handle",
+        "attr_handle", "val_offset", "val_len", "val_len", "attr_val",
+        evtcode=EVT_CMD_STATUS)
 
-    def aci_gatt_write_charac_reliable(
-            self, conn_handle=0, attr_handle=0, val_offset=0,
-            val_len=0, attr_val=b''):
-        """aci_gatt_write_charac_reliable"""
-        data = ustruct.pack(
-            "<HHHB{:d}s".format(val_len),
-            conn_handle, attr_handle, val_offset, val_len, attr_val)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_WRITE_CHARAC_RELIABLE,
-            data=data,
-            evtcode=EVT_CMD_STATUS)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gatt_write_charac_reliable = command_method(
+        OGF_VENDOR_CMD, OCF_GATT_WRITE_CHARAC_RELIABLE, None, "conn_handle",
+        "attr_handle", "val_offset", "val_len", "val_len", "attr_val",
+        evtcode=EVT_CMD_STATUS)
 
-    def aci_gatt_write_long_charac_desc(
-            self, conn_handle=0, attr_handle=0,
-            val_offset=0, val_len=0, attr_val=b''):
-        """aci_gatt_write_long_charac_desc"""
-        data = ustruct.pack(
-            "<HHHB{:d}s".format(val_len),
-            conn_handle, attr_handle, val_offset, val_len, attr_val)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_WRITE_LONG_CHARAC_DESC,
-            data=data,
-            evtcode=EVT_CMD_STATUS)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gatt_write_long_charac_desc = command_method(
+        OGF_VENDOR_CMD, OCF_GATT_WRITE_LONG_CHARAC_DESC, None, "conn_handle",
+        "attr_handle", "val_offset", "val_len", "val_len", "attr_val",
+        evtcode=EVT_CMD_STATUS)
 
-    def aci_gatt_read_long_charac_desc(
-            self, conn_handle=0, attr_handle=0, val_offset=0):
-        """aci_gatt_read_long_charac_desc"""
-        data = ustruct.pack(
-            "<HHH",
-            conn_handle, attr_handle, val_offset)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_READ_LONG_CHARAC_DESC,
-            data=data,
-            evtcode=EVT_CMD_STATUS)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gatt_read_long_charac_desc = command_method(
+        OGF_VENDOR_CMD, OCF_GATT_READ_LONG_CHARAC_DESC, None, "conn_handle",
+        "attr_handle", "val_offset", evtcode=EVT_CMD_STATUS)
 
-    def aci_gatt_write_charac_descriptor(
-            self, conn_handle=0, attr_handle=0, val_len=0, attr_val=b''):
-        """aci_gatt_write_charac_descriptor"""
-        data = ustruct.pack(
-            "<HHB{:d}s".format(val_len),
-            conn_handle, attr_handle, val_len, attr_val)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_WRITE_CHAR_DESC,
-            data=data,
-            evtcode=EVT_CMD_STATUS)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gatt_write_charac_descriptor = command_method(
+        OGF_VENDOR_CMD, OCF_GATT_WRITE_CHAR_DESC, "<HHB*", "conn_handle",
+        "attr_handle", "val_len", "val_len", "attr_val",
+        evtcode=EVT_CMD_STATUS)
 
-    def aci_gatt_read_charac_desc(self, conn_handle=0, attr_handle=0):
-        """aci_gatt_read_charac_desc"""
-        data = ustruct.pack(
-            "<HH",
-            conn_handle, attr_handle)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_READ_CHAR_DESC,
-            data=data,
-            evtcode=EVT_CMD_STATUS)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gatt_read_charac_desc = command_method(
+        OGF_VENDOR_CMD, OCF_GATT_READ_CHAR_DESC, None, "conn_handle",
+        "attr_handle", evtcode=EVT_CMD_STATUS)
 
-    def aci_gatt_write_without_response(
-            self, conn_handle=0, attr_handle=0, val_len=0, attr_val=b''):
-        """aci_gatt_write_without_response"""
-        data = ustruct.pack(
-            "<HHB{:d}s".format(val_len),
-            conn_handle, attr_handle, val_len, attr_val)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_WRITE_WITHOUT_RESPONSE,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gatt_write_without_response = command_method(
+        OGF_VENDOR_CMD, OCF_GATT_WRITE_WITHOUT_RESPONSE, None, "conn_handle",
+        "attr_handle", "val_len", "val_len", "attr_val")
 
-    def aci_gatt_signed_write_without_resp(
-            self, conn_handle=0, attr_handle=0, val_len=0, attr_val=b''):
-        """aci_gatt_signed_write_without_resp"""
-        data = ustruct.pack(
-            "<HHB{:d}s".format(val_len),
-            conn_handle, attr_handle, val_len, attr_val)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_SIGNED_WRITE_WITHOUT_RESPONSE,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gatt_signed_write_without_resp = command_method(
+        OGF_VENDOR_CMD, OCF_GATT_SIGNED_WRITE_WITHOUT_RESPONSE, None,
+        "conn_handle", "attr_handle", "val_len", "val_len", "attr_val")
 
-    def aci_gatt_confirm_indication(self, conn_handle=0):
-        """aci_gatt_confirm_indication"""
-        data = ustruct.pack(
-            "<H",
-            conn_handle)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_CONFIRM_INDICATION,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gatt_confirm_indication = command_method(
+        OGF_VENDOR_CMD, OCF_GATT_CONFIRM_INDICATION, None, "conn_handle")
 
-    def aci_gatt_write_response(
-            self, conn_handle=0, attr_handle=0, write_status=False, err_code=0,
-            att_val_len=0, att_val=b''):
-        """aci_gatt_write_response"""
-        data = ustruct.pack(
-            "<HHBBB{:d}s".format(att_val_len),
-            conn_handle, attr_handle, int(write_status), err_code, att_val_len,
-            att_val)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_WRITE_RESPONSE,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gatt_write_response = command_method(
+        OGF_VENDOR_CMD, OCF_GATT_WRITE_RESPONSE, "<HHBBB*", "conn_handle",
+        "attr_handle", "write_status", "err_code", "att_val_len",
+        "att_val_len", "att_val")
 
-    def aci_gatt_allow_read(self, conn_handle=0):
-        """aci_gatt_allow_read"""
-        data = ustruct.pack(
-            "<H",
-            conn_handle)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_ALLOW_READ,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gatt_allow_read = command_method(
+        OGF_VENDOR_CMD, OCF_GATT_ALLOW_READ, None, "conn_handle")
 
-    def aci_gatt_set_security_permission(
-            self, service_handle=0, attr_handle=0, security_permission=0):
-        """aci_gatt_set_security_permission"""
-        data = ustruct.pack(
-            "<HHB",
-            service_handle, attr_handle, security_permission)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_SET_SECURITY_PERMISSION,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gatt_set_security_permission = command_method(
+        OGF_VENDOR_CMD, OCF_GATT_SET_SECURITY_PERMISSION, None,
+        "service_handle", "attr_handle", "security_permission")
 
-    def aci_gatt_set_desc_value(
-            self, serv_handle=0, char_handle=0, char_desc_handle=0,
-            char_desc_val_offset=0, char_desc_value_len=0, char_desc_value=b''):
-        """aci_gatt_set_desc_value"""
-        data = ustruct.pack(
-            "<HHHHB{:d}s".format(char_desc_value_len),
-            serv_handle, char_handle, char_desc_handle, char_desc_val_offset,
-            char_desc_value_len, char_desc_value)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_SET_DESC_VAL,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gatt_set_desc_value = command_method(
+        OGF_VENDOR_CMD, OCF_GATT_SET_DESC_VAL, "<HHHHB*", "serv_handle",
+        "char_handle", "char_desc_handle", "char_desc_val_offset",
+        "char_desc_value_len", "char_desc_value_len", "char_desc_value")
 
-    def aci_gatt_read_handle_value(self, attr_handle=0):
-        """aci_gatt_read_handle_value"""
-        data = ustruct.pack(
-            "<H",
-            attr_handle)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_READ_HANDLE_VALUE,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gatt_read_handle_value = command_method(
+        OGF_VENDOR_CMD, OCF_GATT_READ_HANDLE_VALUE, None, "attr_handle")
 
-    def aci_gatt_read_handle_value_offset_IDB05A1(
-            self, attr_handle=0, offset=0):
-        """aci_gatt_read_handle_value_offset_IDB05A1"""
-        data = ustruct.pack(
-            "<HH",
-            attr_handle, offset)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_READ_HANDLE_VALUE_OFFSET,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gatt_read_handle_value_offset_IDB05A1 = command_method(
+        OGF_VENDOR_CMD, OCF_GATT_READ_HANDLE_VALUE_OFFSET, "<HH",
+        "attr_handle", "offset", module="IDB05A1")
 
-    def aci_gatt_update_char_value_ext_IDB05A1(
-            self, service_handle=0, char_handle=0, update_type=0, char_length=0,
-            value_offset=0, value_length=0, value=b''):
-        """aci_gatt_update_char_value_ext_IDB05A1"""
-        data = ustruct.pack(
-            "<HHBHHB{:d}s".format(value_length),
-            service_handle, char_handle, update_type, char_length,
-            value_offset, value_length, value)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GATT_UPD_CHAR_VAL_EXT,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_gatt_update_char_value_ext_IDB05A1 = command_method(
+        OGF_VENDOR_CMD, OCF_GATT_UPD_CHAR_VAL_EXT, None, "service_handle",
+        "char_handle", "update_type", "char_length", "value_offset",
+        "value_length", "value_length", "value", module="IDB05A1")
 
     ###########################################################################
     #                                HAL                                      #
     ###########################################################################
 
-    def aci_hal_get_fw_build_number(self):
-        """aci_hal_get_fw_build_number"""
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_HAL_GET_FW_BUILD_NUMBER)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_hal_get_fw_build_number = command_method(
+        OGF_VENDOR_CMD, OCF_HAL_GET_FW_BUILD_NUMBER)
 
-    def aci_hal_write_config_data(self, offset=0, length=0, data=b''):
-        """aci_hal_write_config_data"""
-        data = ustruct.pack(
-            "<BB{:d}s".format(length),
-            offset, length, data)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_HAL_WRITE_CONFIG_DATA,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_hal_write_config_data = command_method(
+        OGF_VENDOR_CMD, OCF_HAL_WRITE_CONFIG_DATA, "<BB*", "offset", "length",
+        "length", "data")
 
-    def aci_hal_read_config_data(self, offset=0):
-        """aci_hal_read_config_data"""
-        data = ustruct.pack(
-            "<B",
-            offset)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_HAL_READ_CONFIG_DATA,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_hal_read_config_data = command_method(
+        OGF_VENDOR_CMD, OCF_HAL_READ_CONFIG_DATA, "<B", "offset")
 
-    def aci_hal_set_tx_power_level(self, en_high_power=0, pa_level=0):
-        """aci_hal_set_tx_power_level"""
-        data = ustruct.pack(
-            "<BB",
-            en_high_power, pa_level)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_HAL_SET_TX_POWER_LEVEL,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_hal_set_tx_power_level = command_method(
+        OGF_VENDOR_CMD, OCF_HAL_SET_TX_POWER_LEVEL, None, "en_high_power",
+        "pa_level")
 
-    def aci_hal_le_tx_test_packet_number(self):
-        """aci_hal_le_tx_test_packet_number"""
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_HAL_LE_TX_TEST_PACKET_NUMBER)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_hal_le_tx_test_packet_number = command_method(
+        OGF_VENDOR_CMD, OCF_HAL_LE_TX_TEST_PACKET_NUMBER)
 
-    def aci_hal_device_standby(self):
-        """aci_hal_device_standby"""
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_HAL_DEVICE_STANDBY)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_hal_device_standby = command_method(
+        OGF_VENDOR_CMD, OCF_HAL_DEVICE_STANDBY)
 
-    def aci_hal_tone_start(self, rf_channel=0):
-        """aci_hal_tone_start"""
-        data = ustruct.pack(
-            "<B",
-            rf_channel)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_HAL_TONE_START,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_hal_tone_start = command_method(
+        OGF_VENDOR_CMD, OCF_HAL_TONE_START, None, "rf_channel")
 
-    def aci_hal_tone_stop(self):
-        """aci_hal_tone_stop"""
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_HAL_TONE_STOP)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_hal_tone_stop = command_method(OGF_VENDOR_CMD, OCF_HAL_TONE_STOP)
 
-    def aci_hal_get_link_status(self):
-        """aci_hal_get_link_status"""
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_HAL_GET_LINK_STATUS)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_hal_get_link_status = command_method(
+        OGF_VENDOR_CMD, OCF_HAL_GET_LINK_STATUS)
 
-    def aci_hal_get_anchor_period(self):
-        """aci_hal_get_anchor_period"""
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_HAL_GET_ANCHOR_PERIOD)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_hal_get_anchor_period = command_method(
+        OGF_VENDOR_CMD, OCF_HAL_GET_ANCHOR_PERIOD)
 
     ###########################################################################
     #                                L2CAP                                    #
     ###########################################################################
 
-    def aci_l2cap_connection_parameter_update_request(
-            self, conn_handle=0, interval_min=0, interval_max=0,
-            slave_latency=0, timeout_multiplier=0):
-        """aci_l2cap_connection_parameter_update_request"""
-        data = ustruct.pack(
-            "<HHHHH",
-            conn_handle, interval_min, interval_max, slave_latency,
-            timeout_multiplier)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_L2CAP_CONN_PARAM_UPDATE_REQ,
-            data=data,
-            evtcode=EVT_CMD_STATUS)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_l2cap_connection_parameter_update_request = command_method(
+        OGF_VENDOR_CMD, OCF_L2CAP_CONN_PARAM_UPDATE_REQ, None, "conn_handle",
+        "interval_min", "interval_max", "slave_latency", "timeout_multiplier",
+        evtcode=EVT_CMD_STATUS)
 
-    def aci_l2cap_connection_parameter_update_response_IDB05A1(
-            self, conn_handle=0, interval_min=0, interval_max=0,
-            slave_latency=0, timeout_multiplier=0,
-            min_ce_length=0, max_ce_length=0, id_=0, accept=False):
-        """aci_l2cap_connection_parameter_update_response_IDB05A1"""
-        data = ustruct.pack(
-            "<HHHHHHHBB",
-            conn_handle, interval_min, interval_max, slave_latency,
-            timeout_multiplier, min_ce_length, max_ce_length, id_, int(accept))
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_L2CAP_CONN_PARAM_UPDATE_RESP,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_l2cap_connection_parameter_update_response_IDB05A1 = command_method(
+        OGF_VENDOR_CMD, OCF_L2CAP_CONN_PARAM_UPDATE_RESP, "<HHHHHHHBB",
+        "conn_handle", "interval_min", "interval_max", "slave_latency",
+        "timeout_multiplier", "min_ce_length", "max_ce_length", "id_",
+        "accept", module="IDB05A1")
 
-    def aci_l2cap_connection_parameter_update_response_IDB04A1(
-            self, conn_handle=0, interval_min=0, interval_max=0,
-            slave_latency=0, timeout_multiplier=0, id_=0, accept=False):
-        """aci_l2cap_connection_parameter_update_response_IDB04A1"""
-        data = ustruct.pack(
-            "<HHHHHBB",
-            conn_handle, interval_min, interval_max, slave_latency,
-            timeout_multiplier, id_, int(accept))
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_L2CAP_CONN_PARAM_UPDATE_RESP,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_l2cap_connection_parameter_update_response_IDB04A1 = command_method(
+        OGF_VENDOR_CMD, OCF_L2CAP_CONN_PARAM_UPDATE_RESP, "<HHHHHBB",
+        "conn_handle", "interval_min", "interval_max", "slave_latency",
+        "timeout_multiplier", "id_", "accept", module="IDB04A1")
 
     ###########################################################################
     #                                UPDATER                                  #
     ###########################################################################
 
-    def aci_updater_start(self):
-        """aci_updater_start"""
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_UPDATER_START)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_updater_start = command_method(OGF_VENDOR_CMD, OCF_UPDATER_START)
 
-    def aci_updater_reboot(self):
-        """aci_updater_reboot"""
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_UPDATER_REBOOT)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_updater_reboot = command_method(OGF_VENDOR_CMD, OCF_UPDATER_REBOOT)
 
-    def aci_get_updater_version(self):
-        """aci_get_updater_version"""
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GET_UPDATER_VERSION)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_get_updater_version = command_method(
+        OGF_VENDOR_CMD, OCF_GET_UPDATER_VERSION)
 
-    def aci_get_updater_buffer_size(self):
-        """aci_get_updater_buffer_size"""
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_GET_UPDATER_BUFSIZE)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_get_updater_buffer_size = command_method(
+        OGF_VENDOR_CMD, OCF_GET_UPDATER_BUFSIZE)
 
-    def aci_erase_blue_flag(self):
-        """aci_erase_blue_flag"""
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_UPDATER_ERASE_BLUE_FLAG)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_erase_blue_flag = command_method(
+        OGF_VENDOR_CMD, OCF_UPDATER_ERASE_BLUE_FLAG)
 
-    def aci_reset_blue_flag(self):
-        """aci_reset_blue_flag"""
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_UPDATER_RESET_BLUE_FLAG)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_reset_blue_flag = command_method(
+        OGF_VENDOR_CMD, OCF_UPDATER_RESET_BLUE_FLAG)
 
-    def aci_updater_erase_sector(self, address=0):
-        """aci_updater_erase_sector"""
-        data = ustruct.pack(
-            "<I",
-            address)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_UPDATER_ERASE_SECTOR,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_updater_erase_sector = command_method(
+        OGF_VENDOR_CMD, OCF_UPDATER_ERASE_SECTOR, None, "address")
 
-    def aci_updater_program_data_block(self, address=0, data_len=0, data=b''):
-        """aci_updater_program_data_block"""
-        data = ustruct.pack(
-            "<IH{:d}s".format(data_len),
-            address, data_len, data)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_UPDATER_PROG_DATA_BLOCK,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_updater_program_data_block = command_method(
+        OGF_VENDOR_CMD, OCF_UPDATER_PROG_DATA_BLOCK, None, "address",
+        "data_len", "data_len", "data")
 
-    def aci_updater_read_data_block(self, address=0, data_len=0):
-        """aci_updater_read_data_block"""
-        data = ustruct.pack(
-            "<IH",
-            address, data_len)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_UPDATER_READ_DATA_BLOCK,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_updater_read_data_block = command_method(
+        OGF_VENDOR_CMD, OCF_UPDATER_READ_DATA_BLOCK, None, "address",
+        "data_len")
 
-    def aci_updater_calc_crc(self, address=0, num_sectors=0):
-        """aci_updater_calc_crc"""
-        data = ustruct.pack(
-            "<IH",
-            address, num_sectors)
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_UPDATER_CALC_CRC,
-            data=data)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_updater_calc_crc = command_method(
+        OGF_VENDOR_CMD, OCF_UPDATER_CALC_CRC, "<IH", "address", "num_sectors")
 
-    def aci_updater_hw_version(self):
-        """aci_updater_hw_version"""
-        hci_cmd = HCI_COMMAND(
-            ogf=OGF_VENDOR_CMD,
-            ocf=OCF_UPDATER_HW_VERSION)
-        self.hci_send_cmd(hci_cmd)
-        return hci_cmd
+    aci_updater_hw_version = command_method(
+        OGF_VENDOR_CMD, OCF_UPDATER_HW_VERSION)
@@ -0,0 +1,614 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0103
+# pylint: disable=C0111
+# pylint: disable=W0235
+import ustruct
+import uctypes
+import utime
+from micropython import const
+
+from bluetooth_low_energy.modules.simulated import (
+    SimulatedPin,
+    IRQ_RISING,
+    IRQ_FALLING
+)
+from bluetooth_low_energy.protocols.hci import (
+    HCI_COMMAND_PKT,
+    HCI_ACLDATA_PKT,
+    HCI_EVENT_PKT,
+    HCI_READ_PACKET_SIZE
+)
+from bluetooth_low_energy.protocols.hci.cmd import (
+    HCI_COMMANDS,
+    OCF_LE_READ_BUFFER_SIZE,
+    OCF_READ_LOCAL_VERSION,
+    OGF_INFO_PARAM,
+    OGF_LE_CTL,
+    OGF_VENDOR_CMD,
+    OPCODE
+)
+from bluetooth_low_energy.protocols.hci.event import (
+    EVT_CMD_COMPLETE,
+    EVT_CMD_STATUS,
+    EVT_DISCONN_COMPLETE,
+    EVT_LE_ADVERTISING_REPORT,
+    EVT_LE_CONN_COMPLETE,
+    EVT_LE_META_EVENT,
+    EVT_NUM_COMP_PKTS,
+    EVT_VENDOR
+)
+from bluetooth_low_energy.protocols.hci.status import (
+    BLE_STATUS_SUCCESS,
+    ERR_UNKNOWN_HCI_COMMAND
+)
+from bluetooth_low_energy.protocols.hci.table import descriptors
+from bluetooth_low_energy.protocols.hci.vendor_specifics.st_microelectronics.bluenrg_ms.cmd import (
+    HCI_VENDOR_COMMANDS,
+    OCF_ATT_EXECUTE_WRITE_REQ,
+    OCF_ATT_FIND_BY_TYPE_VALUE_REQ,
+    OCF_ATT_FIND_INFO_REQ,
+    OCF_ATT_PREPARE_WRITE_REQ,
+    OCF_ATT_READ_BY_GROUP_TYPE_REQ,
+    OCF_ATT_READ_BY_TYPE_REQ,
+    OCF_GAP_CREATE_CONNECTION,
+    OCF_GAP_SEND_PAIRING_REQUEST,
+    OCF_GAP_SLAVE_SECURITY_REQUEST,
+    OCF_GAP_START_AUTO_CONN_ESTABLISH_PROC,
+    OCF_GAP_START_CONNECTION_UPDATE,
+    OCF_GAP_START_GENERAL_CONN_ESTABLISH_PROC,
+    OCF_GAP_START_GENERAL_DISCOVERY_PROC,
+    OCF_GAP_START_LIMITED_DISCOVERY_PROC,
+    OCF_GAP_START_NAME_DISCOVERY_PROC,
+    OCF_GAP_START_OBSERVATION_PROC,
+    OCF_GAP_START_SELECTIVE_CONN_ESTABLISH_PROC,
+    OCF_GAP_TERMINATE,
+    OCF_GAP_TERMINATE_GAP_PROCEDURE,
+    OCF_GATT_DISC_ALL_CHARAC_DESCRIPTORS,
+    OCF_GATT_DISC_ALL_CHARAC_OF_SERV,
+    OCF_GATT_DISC_ALL_PRIM_SERVICES,
+    OCF_GATT_DISC_CHARAC_BY_UUID,
+    OCF_GATT_DISC_PRIM_SERVICE_BY_UUID,
+    OCF_GATT_FIND_INCLUDED_SERVICES,
+    OCF_GATT_READ_CHARAC_VAL,
+    OCF_GATT_READ_CHAR_DESC,
+    OCF_GATT_READ_LONG_CHARAC_DESC,
+    OCF_GATT_READ_LONG_CHARAC_VAL,
+    OCF_GATT_READ_MULTIPLE_CHARAC_VAL,
+    OCF_GATT_WRITE_CHARAC_RELIABLE,
+    OCF_GATT_WRITE_CHAR_DESC,
+    OCF_GATT_WRITE_CHAR_VALUE,
+    OCF_GATT_WRITE_LONG_CHARAC_DESC,
+    OCF_GATT_WRITE_LONG_CHARAC_VAL,
+    OCF_HAL_GET_FW_BUILD_NUMBER,
+    OCF_L2CAP_CONN_PARAM_UPDATE_REQ
+)
+from bluetooth_low_energy.protocols.hci.vendor_specifics.st_microelectronics.bluenrg_ms.constant import (
+    ADV_IND,
+    PUBLIC_ADDR,
+    RESET_NORMAL
+)
+from bluetooth_low_energy.protocols.hci.vendor_specifics.st_microelectronics.bluenrg_ms.event import (
+    EVT_BLUE_GATT_ATTRIBUTE_MODIFIED,
+    EVT_BLUE_HAL_INITIALIZED
+)
+
+"""
+Virtual BlueNRG-MS
+
+A software controller speaking the BlueNRG-MS SPI protocol, for running
+BlueNRG_MS and everything built on it (Peripheral, Scanner, examples) on
+the unix port:
+
+    controller = VirtualBlueNRG_MS()
+    ble = BlueNRG_MS(**controller.wiring())
+
+Commands are answered from the request/response descriptors of
+HCI_COMMANDS and HCI_VENDOR_COMMANDS: a zeroed response with a success
+status, handles allocated for GAP/GATT objects and plausible version and
+buffer information. Procedures answered with EVT_CMD_STATUS by the real
+controller (GAP procedures, GATT client requests) get a CMD_STATUS.
+
+Every packet is released after a configurable latency; advertising
+reports, connections and GATT writes can be injected once or periodically.
+"""
+
+# Vendor commands answered with EVT_CMD_STATUS
+_CMD_STATUS_VENDOR_OCFS = (
+    OCF_ATT_EXECUTE_WRITE_REQ,
+    OCF_ATT_FIND_BY_TYPE_VALUE_REQ,
+    OCF_ATT_FIND_INFO_REQ,
+    OCF_ATT_PREPARE_WRITE_REQ,
+    OCF_ATT_READ_BY_GROUP_TYPE_REQ,
+    OCF_ATT_READ_BY_TYPE_REQ,
+    OCF_GAP_CREATE_CONNECTION,
+    OCF_GAP_SEND_PAIRING_REQUEST,
+    OCF_GAP_SLAVE_SECURITY_REQUEST,
+    OCF_GAP_START_AUTO_CONN_ESTABLISH_PROC,
+    OCF_GAP_START_CONNECTION_UPDATE,
+    OCF_GAP_START_GENERAL_CONN_ESTABLISH_PROC,
+    OCF_GAP_START_GENERAL_DISCOVERY_PROC,
+    OCF_GAP_START_LIMITED_DISCOVERY_PROC,
+    OCF_GAP_START_NAME_DISCOVERY_PROC,
+    OCF_GAP_START_OBSERVATION_PROC,
+    OCF_GAP_START_SELECTIVE_CONN_ESTABLISH_PROC,
+    OCF_GAP_TERMINATE,
+    OCF_GATT_DISC_ALL_CHARAC_DESCRIPTORS,
+    OCF_GATT_DISC_ALL_CHARAC_OF_SERV,
+    OCF_GATT_DISC_ALL_PRIM_SERVICES,
+    OCF_GATT_DISC_CHARAC_BY_UUID,
+    OCF_GATT_DISC_PRIM_SERVICE_BY_UUID,
+    OCF_GATT_FIND_INCLUDED_SERVICES,
+    OCF_GATT_READ_CHARAC_VAL,
+    OCF_GATT_READ_CHAR_DESC,
+    OCF_GATT_READ_LONG_CHARAC_DESC,
+    OCF_GATT_READ_LONG_CHARAC_VAL,
+    OCF_GATT_READ_MULTIPLE_CHARAC_VAL,
+    OCF_GATT_WRITE_CHARAC_RELIABLE,
+    OCF_GATT_WRITE_CHAR_DESC,
+    OCF_GATT_WRITE_CHAR_VALUE,
+    OCF_GATT_WRITE_LONG_CHARAC_DESC,
+    OCF_GATT_WRITE_LONG_CHARAC_VAL,
+    OCF_L2CAP_CONN_PARAM_UPDATE_REQ
+)
+
+_DISCOVERY_VENDOR_OCFS = (
+    OCF_GAP_START_GENERAL_DISCOVERY_PROC,
+    OCF_GAP_START_LIMITED_DISCOVERY_PROC,
+    OCF_GAP_START_OBSERVATION_PROC
+)
+
+# Response fields holding a newly allocated attribute handle
+_HANDLE_FIELDS = (
+    "handle",
+    "service_handle",
+    "dev_name_char_handle",
+    "appearance_char_handle"
+)
+
+# Longest response generated for descriptors ending with a variable array
+_MAX_RESPONSE_SIZE = const(32)
+
+# SPI transaction states
+_SPI_IDLE = const(0)
+_SPI_HEADER = const(1)
+_SPI_READ = const(2)
+_SPI_WRITE = const(3)
+
+# Firmware reported by HCI_READ_LOCAL_VERSION: (hci_revision, lmp_pal_subversion),
+# the hardware version in the high byte of hci_revision
+_VERSIONS = {
+    "IDB05A1": (0x3107, 0x23),
+    "IDB04A1": (0x3006, 0x40)
+}
+
+
+def advertising_report(bdaddr, data=b'', rssi=-60, evt_type=ADV_IND,
+                       bdaddr_type=PUBLIC_ADDR):
+    """LE advertising report with a single report"""
+    return ustruct.pack(
+        "<BBBBBBB6sB{:d}sb".format(len(data)),
+        HCI_EVENT_PKT, EVT_LE_META_EVENT, 12 + len(data),
+        EVT_LE_ADVERTISING_REPORT, 1, evt_type, bdaddr_type, bdaddr,
+        len(data), data, rssi
+    )
+
+
+def connection_complete(handle, peer_bdaddr, role=1, interval=40,
+                        latency=0, supervision_timeout=400,
+                        peer_bdaddr_type=PUBLIC_ADDR):
+    """LE connection complete"""
+    return ustruct.pack(
+        "<BBBBBHBB6sHHHB",
+        HCI_EVENT_PKT, EVT_LE_META_EVENT, 19,
+        EVT_LE_CONN_COMPLETE, BLE_STATUS_SUCCESS, handle, role,
+        peer_bdaddr_type, peer_bdaddr, interval, latency,
+        supervision_timeout, 0
+    )
+
+
+def disconnection_complete(handle, reason=0x13):
+    """Disconnection complete"""
+    return ustruct.pack(
+        "<BBBBHB",
+        HCI_EVENT_PKT, EVT_DISCONN_COMPLETE, 4,
+        BLE_STATUS_SUCCESS, handle, reason
+    )
+
+
+def gatt_attribute_modified(conn_handle, attr_handle, data, offset=0,
+                            module="IDB05A1"):
+    """ST vendor event: attribute written by the peer"""
+    if module == "IDB04A1":
+        param = ustruct.pack(
+            "<HHHB{:d}s".format(len(data)),
+            EVT_BLUE_GATT_ATTRIBUTE_MODIFIED, conn_handle, attr_handle,
+            len(data), data
+        )
+    else:
+        param = ustruct.pack(
+            "<HHHBH{:d}s".format(len(data)),
+            EVT_BLUE_GATT_ATTRIBUTE_MODIFIED, conn_handle, attr_handle,
+            len(data), offset, data
+        )
+    return ustruct.pack("<BBB", HCI_EVENT_PKT, EVT_VENDOR, len(param)) + param
+
+
+def num_completed_packets(handle, count):
+    """Number of completed packets for a single connection handle"""
+    return ustruct.pack(
+        "<BBBBHH",
+        HCI_EVENT_PKT, EVT_NUM_COMP_PKTS, 5, 1, handle, count
+    )
+
+
+class _IRQPin(SimulatedPin):
+    """IRQ line, sampling it releases the packets that are due"""
+
+    def __init__(self, controller):
+        super(_IRQPin, self).__init__(0)
+        self._controller = controller
+
+    def value(self, value=None):
+        if value is None:
+            self._controller.poll()
+        return super(_IRQPin, self).value(value)
+
+
+class VirtualBlueNRG_MS(object):
+    """
+    Simulated BlueNRG-MS: acts as the SPI bus and drives the IRQ line
+
+    Params:
+        module: "IDB05A1" or "IDB04A1", selects version and descriptors
+        latency_us: delay between a command and its completion event
+        boot_us: delay between the reset and EVT_BLUE_HAL_INITIALIZED
+        scan_rate_hz: advertising reports per second during a discovery
+                      procedure, 0 to disable
+        acl_buffers, acl_pkt_len: controller ACL buffers reported by
+                                  LE_READ_BUFFER_SIZE
+        acl_latency_us: time an ACL packet holds its buffer before
+                        EVT_NUM_COMP_PKTS, default latency_us; a packet
+                        sent while no buffer is free is lost
+                        (acl_overruns)
+        ncmd: commands the controller accepts at once, the free slots are
+              reported with every completion (Num_HCI_Command_Packets)
+        wake_headers: read header exchanges answered with nothing to read
+                      after the IRQ line rises, as by a controller still
+                      waking up
+    """
+
+    def __init__(self, module="IDB05A1", latency_us=200, boot_us=1000,
+                 scan_rate_hz=0, acl_buffers=8, acl_pkt_len=27, ncmd=1,
+                 acl_latency_us=None, wake_headers=0):
+        self.module = module
+        self.ncmd = ncmd
+        self.wake_headers = wake_headers
+        self.latency_us = latency_us
+        self.boot_us = boot_us
+        self.scan_rate_hz = scan_rate_hz
+        self.acl_buffers = acl_buffers
+        self.acl_pkt_len = acl_pkt_len
+        self.acl_latency_us = acl_latency_us
+
+        self.irq_pin = _IRQPin(self)
+        self.rst_pin = SimulatedPin(1)
+        self.nss_pin = SimulatedPin(1)
+        self.rst_pin.irq(handler=self._on_reset, trigger=IRQ_RISING)
+        self.nss_pin.irq(
+            handler=self._on_cs,
+            trigger=IRQ_RISING | IRQ_FALLING
+        )
+
+        # statistics
+        self.commands = 0
+        self.events = 0
+        self.acl_packets = 0
+        self.acl_overruns = 0
+        self.header_exchanges = 0
+
+        self._spi_state = _SPI_IDLE
+        self._rx = bytearray()
+        self._tx = []
+        self._pending = []
+        self._timers = []
+        self._scan_timer = None
+        self._next_handle = 0x0001
+        self._acl_free = acl_buffers
+        self._cmds_in_flight = 0
+        self._waking = 0
+        self._rejects = {}
+        self.reset()
+
+    def wiring(self):
+        """Keyword arguments for BlueNRG_MS and its subclasses"""
+        return {
+            "spi_bus": self,
+            "irq_pin": self.irq_pin,
+            "rst_pin": self.rst_pin,
+            "nss_pin": self.nss_pin
+        }
+
+    def reset(self):
+        """Drop every queued packet and timer, as after a hardware reset"""
+        self._rx = bytearray()
+        self._tx = []
+        self._pending = []
+        self._timers = []
+        self._scan_timer = None
+        self._next_handle = 0x0001
+        self._acl_free = self.acl_buffers
+        self._cmds_in_flight = 0
+
+    ###########################################################################
+    #                           Event injection                               #
+    ###########################################################################
+
+    def inject(self, packet, delay_us=0):
+        """Queue an H4 packet for the host, after delay_us"""
+        due = utime.ticks_add(utime.ticks_us(), delay_us)
+        index = len(self._pending)
+        while index and utime.ticks_diff(self._pending[index - 1][0], due) > 0:
+            index -= 1
+        self._pending.insert(index, (due, packet))
+
+    def every(self, period_us, factory, count=-1, delay_us=0):
+        """
+        Queue factory() every period_us, count times (-1: until cancel())
+        Returns the timer.
+        """
+        timer = [
+            utime.ticks_add(utime.ticks_us(), delay_us or period_us),
+            period_us,
+            count,
+            factory
+        ]
+        self._timers.append(timer)
+        return timer
+
+    def cancel(self, timer):
+        """Stop a timer returned by every()"""
+        if timer in self._timers:
+            self._timers.remove(timer)
+
+    def advertise(self, rate_hz, count=-1, bdaddr=b'\x01\x02\x03\x04\x05\x06',
+                  data=b'\x02\x01\x06', rssi=-60):
+        """Advertising reports at rate_hz"""
+        packet = advertising_report(bdaddr, data, rssi)
+        return self.every(1000000 // rate_hz, lambda: packet, count=count)
+
+    def connect(self, handle=0x0801, peer_bdaddr=b'\x01\x02\x03\x04\x05\x06',
+                delay_us=0):
+        """A central connects"""
+        self.inject(connection_complete(handle, peer_bdaddr), delay_us)
+
+    def disconnect(self, handle=0x0801, reason=0x13, delay_us=0):
+        """The peer disconnects"""
+        self.inject(disconnection_complete(handle, reason), delay_us)
+
+    def gatt_write(self, attr_handle, data, conn_handle=0x0801, rate_hz=0,
+                   count=1, delay_us=0):
+        """The peer writes data to attr_handle, once or at rate_hz"""
+        packet = gatt_attribute_modified(
+            conn_handle, attr_handle, data, module=self.module)
+        if rate_hz:
+            return self.every(
+                1000000 // rate_hz, lambda: packet, count=count,
+                delay_us=delay_us)
+        self.inject(packet, delay_us)
+
+    def reject(self, ogf, ocf, status):
+        """The next command ogf/ocf is answered by EVT_CMD_STATUS status"""
+        self._rejects[OPCODE.pack(ogf, ocf)] = status
+
+    def poll(self):
+        """Release the packets that are due and update the IRQ line"""
+        now = utime.ticks_us()
+        for timer in self._timers:
+            while timer[2] and utime.ticks_diff(now, timer[0]) >= 0:
+                self._tx.append(timer[3]())
+                timer[0] = utime.ticks_add(timer[0], timer[1])
+                if timer[2] > 0:
+                    timer[2] -= 1
+        if self._timers:
+            self._timers = [timer for timer in self._timers if timer[2]]
+        while self._pending and utime.ticks_diff(now, self._pending[0][0]) >= 0:
+            packet = self._pending.pop(0)[1]
+            if packet[0] == HCI_EVENT_PKT and packet[1] == EVT_CMD_STATUS:
+                packet[4] = self._release_command()
+            elif packet[0] == HCI_EVENT_PKT and packet[1] == EVT_CMD_COMPLETE:
+                packet[3] = self._release_command()
+            elif packet[0] == HCI_EVENT_PKT and packet[1] == EVT_NUM_COMP_PKTS:
+                # the buffer is free once the host is told so
+                self._acl_free += packet[6] | (packet[7] << 8)
+            self._tx.append(packet)
+        if self._spi_state == _SPI_IDLE:
+            self._update_irq()
+
+    def _release_command(self):
+        # Num_HCI_Command_Packets: free command slots once this one is done
+        if self._cmds_in_flight:
+            self._cmds_in_flight -= 1
+        return max(self.ncmd - self._cmds_in_flight, 0)
+
+    def _update_irq(self):
+        level = 1 if self._tx else 0
+        if SimulatedPin.value(self.irq_pin) != level:
+            if level:
+                self._waking = self.wake_headers
+            SimulatedPin.value(self.irq_pin, level)
+
+    ###########################################################################
+    #                              SPI slave                                  #
+    ###########################################################################
+
+    def _on_reset(self, pin):
+        self.reset()
+        self.inject(
+            ustruct.pack(
+                "<BBBHB",
+                HCI_EVENT_PKT, EVT_VENDOR, 3,
+                EVT_BLUE_HAL_INITIALIZED, RESET_NORMAL
+            ),
+            self.boot_us
+        )
+
+    def _on_cs(self, pin):
+        if not pin.value():
+            self._spi_state = _SPI_HEADER
+            return
+        if self._spi_state == _SPI_WRITE:
+            self._process_rx()
+        self._spi_state = _SPI_IDLE
+        self.poll()
+
+    def write_readinto(self, write_buf, read_buf):
+        """machine.SPI.write_readinto"""
+        state = self._spi_state
+        if state == _SPI_HEADER:
+            self.header_exchanges += 1
+            self.poll()
+            read_size = len(self._tx[0]) if self._tx else 0
+            if self._waking and write_buf[0] == 0x0B:
+                self._waking -= 1
+                read_size = 0
+            read_buf[0] = 0x02
+            read_buf[1] = HCI_READ_PACKET_SIZE if write_buf[0] == 0x0A else 0
+            read_buf[2] = 0
+            read_buf[3] = read_size & 0xFF
+            read_buf[4] = read_size >> 8
+            self._spi_state = _SPI_READ if write_buf[0] == 0x0B else _SPI_WRITE
+        elif state == _SPI_READ:
+            packet = self._tx.pop(0)
+            count = min(len(packet), len(read_buf))
+            # no copy of the packet, the host may read under heap_lock()
+            if count == len(packet):
+                read_buf[:count] = packet
+            else:
+                read_buf[:count] = packet[:count]
+            self.events += 1
+        elif state == _SPI_WRITE:
+            self._rx.extend(write_buf)
+            for i in range(len(read_buf)):
+                read_buf[i] = 0
+
+    def write(self, buf):
+        """machine.SPI.write"""
+        self.write_readinto(buf, bytearray(len(buf)))
+
+    ###########################################################################
+    #                           Command handling                              #
+    ###########################################################################
+
+    def _process_rx(self):
+        rx = self._rx
+        while rx:
+            if rx[0] == HCI_COMMAND_PKT and len(rx) >= 4:
+                size = 4 + rx[3]
+                if len(rx) < size:
+                    return
+                opcode = rx[1] | (rx[2] << 8)
+                self._command(opcode, bytes(rx[4:size]))
+            elif rx[0] == HCI_ACLDATA_PKT and len(rx) >= 5:
+                size = 5 + (rx[3] | (rx[4] << 8))
+                if len(rx) < size:
+                    return
+                self._acl(rx[1] | ((rx[2] & 0x0F) << 8))
+            elif rx[0] in (HCI_COMMAND_PKT, HCI_ACLDATA_PKT):
+                return
+            else:
+                # unknown packet type, resynchronize on the next byte
+                size = 1
+            self._rx = rx = rx[size:]
+
+    def _acl(self, handle):
+        self.acl_packets += 1
+        if not self._acl_free:
+            self.acl_overruns += 1
+            return
+        self._acl_free -= 1
+        self.inject(
+            num_completed_packets(handle, 1),
+            self.latency_us if self.acl_latency_us is None
+            else self.acl_latency_us)
+
+    def _descriptors(self, opcode):
+        ogf, ocf = OPCODE.unpack(opcode)
+        if ogf == OGF_VENDOR_CMD:
+            return HCI_VENDOR_COMMANDS[1].get(ocf)
+        if ogf in HCI_COMMANDS:
+            return HCI_COMMANDS[ogf][1].get(ocf)
+        return None
+
+    def _command(self, opcode, param):
+        self.commands += 1
+        self._cmds_in_flight += 1
+        ogf, ocf = OPCODE.unpack(opcode)
+        descriptors = self._descriptors(opcode)
+        if descriptors is None:
+            self._complete(opcode, bytes([ERR_UNKNOWN_HCI_COMMAND]))
+            return
+
+        if opcode in self._rejects:
+            self._status(opcode, self._rejects.pop(opcode))
+            return
+
+        if ogf == OGF_VENDOR_CMD and ocf in _CMD_STATUS_VENDOR_OCFS:
+            self._status(opcode, BLE_STATUS_SUCCESS)
+            if ocf in _DISCOVERY_VENDOR_OCFS and self.scan_rate_hz:
+                self._scan_timer = self.advertise(self.scan_rate_hz)
+            return
+
+        if ogf == OGF_VENDOR_CMD and ocf == OCF_GAP_TERMINATE_GAP_PROCEDURE:
+            if self._scan_timer is not None:
+                self.cancel(self._scan_timer)
+                self._scan_timer = None
+
+        response = self._response(ogf, ocf, descriptors[2])
+        self._complete(opcode, response)
+
+    def _response(self, ogf, ocf, descriptor):
+        descriptor = descriptors(self.module)[descriptor]
+        if descriptor is None:
+            return bytes([BLE_STATUS_SUCCESS])
+        response = bytearray(min(uctypes.sizeof(descriptor), _MAX_RESPONSE_SIZE))
+        fields = uctypes.struct(
+            uctypes.addressof(response),
+            descriptor,
+            uctypes.LITTLE_ENDIAN
+        )
+        for name in _HANDLE_FIELDS:
+            if name in descriptor:
+                setattr(fields, name, self._next_handle)
+                self._next_handle += 1
+        if ogf == OGF_INFO_PARAM and ocf == OCF_READ_LOCAL_VERSION:
+            hci_revision, lmp_pal_subversion = _VERSIONS[self.module]
+            fields.hci_version = 0x07
+            fields.hci_revision = hci_revision
+            fields.lmp_pal_version = 0x07
+            fields.manufacturer_name = 0x0030
+            fields.lmp_pal_subversion = lmp_pal_subversion
+        elif ogf == OGF_LE_CTL and ocf == OCF_LE_READ_BUFFER_SIZE:
+            fields.pkt_len = self.acl_pkt_len
+            fields.max_pkt = self.acl_buffers
+        elif ogf == OGF_VENDOR_CMD and ocf == OCF_HAL_GET_FW_BUILD_NUMBER:
+            fields.build_number = (_VERSIONS[self.module][0] & 0xFF) << 8
+        return response
+
+    def _status(self, opcode, status):
+        self.inject(
+            bytearray(ustruct.pack(
+                "<BBBBBH",
+                HCI_EVENT_PKT, EVT_CMD_STATUS, 4, status, self.ncmd, opcode
+            )),
+            self.latency_us
+        )
+
+    def _complete(self, opcode, response):
+        self.inject(
+            bytearray(ustruct.pack(
+                "<BBBBH",
+                HCI_EVENT_PKT, EVT_CMD_COMPLETE, 3 + len(response), self.ncmd,
+                opcode
+            ) + bytes(response)),
+            self.latency_us
+        )
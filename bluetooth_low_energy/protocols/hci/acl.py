@@ -48,37 +48,84 @@ PB_FLAGS = {
 }
 
 
+class ACL_HEADER(object):
+    """
+    ACL_HEADER
+
+    Shift/mask codec of the 4 bytes ACL header, in place in a caller
+    provided buffer (no format string, no bitfield uctypes.struct).
+    """
+    size = 4
+
+    @staticmethod
+    def pack_into(buf, offset, handle, pb=0, bc=0, length=0):
+        """pack_into"""
+        buf[offset] = handle & 0xff
+        buf[offset + 1] = (handle >> 8) & 0x0f | (pb & 0x03) << 4 | \
+            (bc & 0x03) << 6
+        buf[offset + 2] = length & 0xff
+        buf[offset + 3] = (length >> 8) & 0xff
+
+    @staticmethod
+    def unpack_from(buf, offset=0):
+        """Return handle, pb, bc, length"""
+        flags = buf[offset + 1]
+        return (
+            buf[offset] | (flags & 0x0f) << 8,
+            (flags >> 4) & 0x03,
+            flags >> 6,
+            buf[offset + 2] | buf[offset + 3] << 8
+        )
+
+
 class HCI_ACL(object):
     """HCI_ACL"""
     struct_format = "<I"
     struct_size = ustruct.calcsize(struct_format)
 
+    __slots__ = (
+        "_handle",
+        "_pb",
+        "_pb_name",
+        "_bc",
+        "_data")
+
     def __init__(self, handle, pb=0, bc=0, data=b''):
-        bin_str = "{:016b}{:02b}{:02b}{:012b}".format(
-            len(data) if data else 0, bc, pb, handle
-        )
         self._handle = handle
         self._pb = pb
         self._pb_name = PB_FLAGS[pb]
         self._bc = bc
-        self._tobytes = int(bin_str, 2)
         self._data = data
 
-    def __getattr__(self, name):
-        if name == "handle":
-            return self._handle
-        elif name == "pb":
-            return self._pb
-        elif name == "pb_name":
-            return self._pb_name
-        elif name == "bc":
-            return self._bc
-        elif name == "tobytes":
-            return self._tobytes
-        elif name == "length":
-            return len(self._data)
-        elif name == "data":
-            return self._data
+    @property
+    def handle(self):
+        return self._handle
+
+    @property
+    def pb(self):
+        return self._pb
+
+    @property
+    def pb_name(self):
+        return self._pb_name
+
+    @property
+    def bc(self):
+        return self._bc
+
+    @property
+    def tobytes(self):
+        return (
+            self._handle & 0x0fff | (self._pb & 0x03) << 12 |
+            (self._bc & 0x03) << 14 | len(self._data) << 16)
+
+    @property
+    def length(self):
+        return len(self._data)
+
+    @property
+    def data(self):
+        return self._data
 
     def __str__(self):
         desc_str = (
@@ -107,16 +154,22 @@ class HCI_ACL(object):
         ** [vol 2] Part E (Section 5) - HCI Data Formats
         ** [vol 2] Part E (Section 5.4) - Exchange of HCI-specific information
         """
-        hci_acl = uctypes.struct(
-            uctypes.addressof(data[:HCI_ACL.struct_size]),
-            HCI_ACL_STRUCT,
-            uctypes.LITTLE_ENDIAN
-        )
+        if not isinstance(data, memoryview):
+            data = memoryview(data)
+        handle, pb, bc, _ = ACL_HEADER.unpack_from(data)
         data = data[HCI_ACL.struct_size:]
-        return HCI_ACL(hci_acl.handle, hci_acl.pb, hci_acl.bc, data)
+        return HCI_ACL(handle, pb, bc, data)
+
+    def copy(self):
+        """HCI_ACL owning a copy of its data"""
+        return HCI_ACL(self._handle, self._pb, self._bc, bytes(self._data))
 
     def to_buffer(self):
         """
         Get data string
         """
-        return ustruct.pack(self.struct_format, self.tobytes) + self.data
+        buf = bytearray(ACL_HEADER.size + len(self._data))
+        ACL_HEADER.pack_into(
+            buf, 0, self._handle, self._pb, self._bc, len(self._data))
+        buf[ACL_HEADER.size:] = self._data
+        return bytes(buf)
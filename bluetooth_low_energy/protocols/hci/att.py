@@ -74,20 +74,31 @@ class ATT(object):
     struct_format = "<B"
     struct_size = ustruct.calcsize(struct_format)
 
+    __slots__ = (
+        "_opcode",
+        "_opcode_name",
+        "_data")
+
     def __init__(self, opcode, data=b''):
         self._opcode = opcode
         self._opcode_name = ATT_PDUS[opcode]
         self._data = data
 
-    def __getattr__(self, name):
-        if name == "opcode":
-            return self._opcode
-        elif name == "opcode_name":
-            return self._opcode_name
-        elif name == "length":
-            return len(self._data)
-        elif name == "data":
-            return self._data
+    @property
+    def opcode(self):
+        return self._opcode
+
+    @property
+    def opcode_name(self):
+        return self._opcode_name
+
+    @property
+    def length(self):
+        return len(self._data)
+
+    @property
+    def data(self):
+        return self._data
 
     def __str__(self):
         desc_str = (
@@ -122,7 +133,9 @@ class ATT(object):
             ** Core specification 4.1
             ** [vol 3] Part F (Section 3.3) - Attribute PDU
         """
-        opcode = ustruct.unpack(ATT.struct_format, data[:ATT.struct_size])[0]
+        if not isinstance(data, memoryview):
+            data = memoryview(data)
+        opcode = data[0]
 
         # att = uctypes.struct(
         #     uctypes.addressof(data[:ATT.struct_size]),
@@ -133,6 +146,10 @@ class ATT(object):
         data = data[ATT.struct_size:]
         return ATT(opcode, data)
 
+    def copy(self):
+        """ATT owning a copy of its data"""
+        return ATT(self._opcode, bytes(self._data))
+
     def to_buffer(self):
         """
         Get data string
@@ -7,6 +7,7 @@ from ubinascii import hexlify, unhexlify
 from micropython import const
 
 from bluetooth_low_energy.protocols.hci.event import EVT_CMD_STATUS
+from bluetooth_low_energy.protocols.hci.table import descriptors
 
 """
 OpCodes and names for HCI commands according to the Bluetooth specification
@@ -70,408 +71,231 @@ OCF_LE_TRANSMITTER_TEST = const(0x001E)
 OCF_LE_TEST_END = const(0x001F)
 
 HCI_COMMANDS = {
-    OGF_LINK_CTL: [
+    OGF_LINK_CTL: (
         "LINK_CTL",
         {
-            OCF_DISCONNECT:
-            [
+            OCF_DISCONNECT: (
                 "DISCONNECT",
-                {
-                    "handle": uctypes.UINT16 | 0,
-                    "reason": uctypes.UINT8 | 2
-                },
-                {
-                    "status": uctypes.UINT8 | 0
-                }
-            ]
+                "handle:H@0 reason:B@2",
+                "status:B@0"
+            )
         }
-    ],
-    OGF_HOST_CTL: [
+    ),
+    OGF_HOST_CTL: (
         "HOST_CTL",
         {
-            OCF_RESET: [
+            OCF_RESET: (
                 "RESET",
                 None,
-                {
-                    "status": uctypes.UINT8 | 0
-                }
-            ],
-            OCF_READ_TRANSMIT_POWER_LEVEL: [
+                "status:B@0"
+            ),
+            OCF_READ_TRANSMIT_POWER_LEVEL: (
                 "READ_TRANSMIT_POWER_LEVEL",
-                {
-                    "handle": uctypes.UINT16 | 0,
-                    "type": uctypes.UINT8 | 2
-                },
-                {
-                    "status": uctypes.UINT8 | 0,
-                    "handle": uctypes.UINT16 | 1,
-                    "level": uctypes.UINT8 | 3
-                }
-            ],
-            OCF_SET_CONTROLLER_TO_HOST_FC: [
+                "handle:H@0 type:B@2",
+                "status:B@0 handle:H@1 level:B@3"
+            ),
+            OCF_SET_CONTROLLER_TO_HOST_FC: (
                 "SET_CONTROLLER_TO_HOST_FC",
                 None,
                 None
-            ]
+            )
         }
-    ],
-    OGF_INFO_PARAM: [
+    ),
+    OGF_INFO_PARAM: (
         "INFO_PARAM",
         {
-            OCF_READ_LOCAL_VERSION: [
+            OCF_READ_LOCAL_VERSION: (
                 "READ_LOCAL_VERSION",
                 None,
-                {
-                    "status": uctypes.UINT8 | 0,
-                    "hci_version": uctypes.UINT8 | 1,
-                    "hci_revision": uctypes.UINT16 | 2,
-                    "lmp_pal_version": uctypes.UINT8 | 4,
-                    "manufacturer_name": uctypes.UINT16 | 5,
-                    "lmp_pal_subversion": uctypes.UINT16 | 7
-                }
-            ],
-            OCF_READ_BD_ADDR: [
+                "status:B@0 hci_version:B@1 hci_revision:H@2 "
+                "lmp_pal_version:B@4 manufacturer_name:H@5 "
+                "lmp_pal_subversion:H@7"
+            ),
+            OCF_READ_BD_ADDR: (
                 "READ_BD_ADDR",
                 None,
-                {
-                    "status": uctypes.UINT8 | 0,
-                    "bdaddr": (uctypes.ARRAY | 1, uctypes.UINT8 | 6)
-                }
-            ],
+                "status:B@0 bdaddr:6B@1"
+            )
         }
-    ],
-    OGF_STATUS_PARAM: [
+    ),
+    OGF_STATUS_PARAM: (
         "STATUS_PARAM",
         {
-            OCF_READ_RSSI: [
+            OCF_READ_RSSI: (
                 "READ_RSSI",
-                {
-                    "handle": uctypes.UINT16 | 0
-                },
-                {
-                    "status": uctypes.UINT8 | 0,
-                    "handle": uctypes.UINT16 | 1,
-                    "rssi": uctypes.UINT8 | 3
-                }
-            ]
+                "handle:H@0",
+                "status:B@0 handle:H@1 rssi:B@3"
+            )
         }
-    ],
-    OGF_LE_CTL: [
+    ),
+    OGF_LE_CTL: (
         "LE_CTL",
         {
-            OCF_LE_SET_EVENT_MASK: [
+            OCF_LE_SET_EVENT_MASK: (
                 "LE_SET_EVENT_MASK",
-                {
-                    "mask": (uctypes.ARRAY | 0, uctypes.UINT8 | 8)
-                },
-                {
-                    "status": uctypes.UINT8 | 0
-                }
-            ],
-            OCF_LE_READ_BUFFER_SIZE: [
+                "mask:8B@0",
+                "status:B@0"
+            ),
+            OCF_LE_READ_BUFFER_SIZE: (
                 "LE_READ_BUFFER_SIZE",
                 None,
-                {
-                    "status": uctypes.UINT8 | 0,
-                    "pkt_len": uctypes.UINT16 | 1,
-                    "max_pkt": uctypes.UINT8 | 3,
-                }
-            ],
-            OCF_LE_READ_LOCAL_SUPPORTED_FEATURES: [
+                "status:B@0 pkt_len:H@1 max_pkt:B@3"
+            ),
+            OCF_LE_READ_LOCAL_SUPPORTED_FEATURES: (
                 "LE_READ_LOCAL_SUPPORTED_FEATURES",
                 None,
-                {
-                    "status": uctypes.UINT8 | 0,
-                    "features": (uctypes.ARRAY | 1, uctypes.UINT8 | 8)
-                }
-            ],
-            OCF_LE_SET_RANDOM_ADDRESS: [
+                "status:B@0 features:8B@1"
+            ),
+            OCF_LE_SET_RANDOM_ADDRESS: (
                 "LE_SET_RANDOM_ADDRESS",
-                {
-                    "bdaddr": (uctypes.ARRAY | 0, uctypes.UINT8 | 6)
-                },
-                {
-                    "status": uctypes.UINT8 | 0
-                }
-            ],
-            OCF_LE_SET_ADV_PARAMETERS: [
+                "bdaddr:6B@0",
+                "status:B@0"
+            ),
+            OCF_LE_SET_ADV_PARAMETERS: (
                 "LE_SET_ADV_PARAMETERS",
-                {
-                    "min_interval": uctypes.UINT16 | 0,
-                    "max_interval": uctypes.UINT16 | 2,
-                    "advtype": uctypes.UINT8 | 4,
-                    "own_bdaddr_type": uctypes.UINT8 | 5,
-                    "direct_bdaddr_type": uctypes.UINT8 | 6,
-                    "direct_bdaddr": (uctypes.ARRAY | 7, uctypes.UINT8 | 6),
-                    "chan_map":  uctypes.UINT8 | 13,
-                    "filter":  uctypes.UINT8 | 14
-                },
-                {
-                    "status": uctypes.UINT8 | 0
-                }
-            ],
-            OCF_LE_READ_ADV_CHANNEL_TX_POWER: [
+                "min_interval:H@0 max_interval:H@2 advtype:B@4 "
+                "own_bdaddr_type:B@5 direct_bdaddr_type:B@6 "
+                "direct_bdaddr:6B@7 chan_map:B@13 filter:B@14",
+                "status:B@0"
+            ),
+            OCF_LE_READ_ADV_CHANNEL_TX_POWER: (
                 "LE_READ_ADV_CHANNEL_TX_POWER",
                 None,
-                {
-                    "status": uctypes.UINT8 | 0,
-                    "level": uctypes.INT8 | 1
-                }
-            ],
-            OCF_LE_SET_ADV_DATA: [
+                "status:B@0 level:b@1"
+            ),
+            OCF_LE_SET_ADV_DATA: (
                 "LE_SET_ADV_DATA",
-                {
-                    "length": uctypes.UINT8 | 0,
-                    "data": (uctypes.ARRAY | 1, uctypes.UINT8 | 31)
-                },
-                {
-                    "status": uctypes.UINT8 | 0
-                }
-            ],
-            OCF_LE_SET_SCAN_RESPONSE_DATA: [
+                "length:B@0 data:31B@1",
+                "status:B@0"
+            ),
+            OCF_LE_SET_SCAN_RESPONSE_DATA: (
                 "LE_SET_SCAN_RESPONSE_DATA",
-                {
-                    "length": uctypes.UINT8 | 0,
-                    "data": (uctypes.ARRAY | 1, uctypes.UINT8 | 31)
-                },
-                {
-                    "status": uctypes.UINT8 | 0
-                }
-            ],
-            OCF_LE_SET_ADVERTISE_ENABLE: [
+                "length:B@0 data:31B@1",
+                "status:B@0"
+            ),
+            OCF_LE_SET_ADVERTISE_ENABLE: (
                 "LE_SET_ADVERTISE_ENABLE",
-                {
-                    "enable": uctypes.UINT8 | 0
-                },
-                {
-                    "status": uctypes.UINT8 | 0
-                }
-            ],
-            OCF_LE_SET_SCAN_PARAMETERS: [
+                "enable:B@0",
+                "status:B@0"
+            ),
+            OCF_LE_SET_SCAN_PARAMETERS: (
                 "LE_SET_SCAN_PARAMETERS",
-                {
-                    "type": uctypes.UINT8 | 0,
-                    "interval": uctypes.UINT16 | 1,
-                    "window": uctypes.UINT16 | 3,
-                    "own_bdaddr_type": uctypes.UINT8 | 5,
-                    "filter": uctypes.UINT8 | 6
-                },
-                {
-                    "status": uctypes.UINT8 | 0
-                }
-            ],
-            OCF_LE_SET_SCAN_ENABLE: [
+                "type:B@0 interval:H@1 window:H@3 own_bdaddr_type:B@5 "
+                "filter:B@6",
+                "status:B@0"
+            ),
+            OCF_LE_SET_SCAN_ENABLE: (
                 "LE_SET_SCAN_ENABLE",
-                {
-                    "enable": uctypes.UINT8 | 0,
-                    "filter_dup": uctypes.UINT8 | 1
-                },
-                {
-                    "status": uctypes.UINT8 | 0
-                }
-            ],
-            OCF_LE_CREATE_CONN: [
+                "enable:B@0 filter_dup:B@1",
+                "status:B@0"
+            ),
+            OCF_LE_CREATE_CONN: (
                 "LE_CREATE_CONN",
-                {
-                    "interval": uctypes.UINT16 | 0,
-                    "window": uctypes.UINT16 | 2,
-                    "initiator_filter": uctypes.UINT8 | 4,
-                    "peer_bdaddr_type": uctypes.UINT8 | 5,
-                    "peer_bdaddr": (uctypes.ARRAY | 6, uctypes.UINT8 | 6),
-                    "own_bdaddr_type": uctypes.UINT8 | 12,
-                    "min_interval": uctypes.UINT16 | 13,
-                    "max_interval": uctypes.UINT16 | 15,
-                    "latency": uctypes.UINT16 | 17,
-                    "supervision_timeout": uctypes.UINT16 | 19,
-                    "min_ce_length": uctypes.UINT16 | 21,
-                    "max_ce_length": uctypes.UINT16 | 23
-                },
-                {
-                    "status": uctypes.UINT8 | 0
-                }
-            ],
-            OCF_LE_CREATE_CONN_CANCEL: [
+                "interval:H@0 window:H@2 initiator_filter:B@4 "
+                "peer_bdaddr_type:B@5 peer_bdaddr:6B@6 own_bdaddr_type:B@12 "
+                "min_interval:H@13 max_interval:H@15 latency:H@17 "
+                "supervision_timeout:H@19 min_ce_length:H@21 "
+                "max_ce_length:H@23",
+                "status:B@0"
+            ),
+            OCF_LE_CREATE_CONN_CANCEL: (
                 "LE_CREATE_CONN_CANCEL",
                 None,
-                {
-                    "status": uctypes.UINT8 | 0
-                }
-            ],
-            OCF_LE_READ_WHITE_LIST_SIZE: [
+                "status:B@0"
+            ),
+            OCF_LE_READ_WHITE_LIST_SIZE: (
                 "LE_READ_WHITE_LIST_SIZE",
                 None,
-                {
-                    "status": uctypes.UINT8 | 0,
-                    "size": uctypes.UINT8 | 1
-                }
-            ],
-            OCF_LE_ADD_DEVICE_TO_WHITE_LIST: [
+                "status:B@0 size:B@1"
+            ),
+            OCF_LE_ADD_DEVICE_TO_WHITE_LIST: (
                 "LE_ADD_DEVICE_TO_WHITE_LIST",
-                {
-                    "bdaddr_type": uctypes.UINT8 | 0,
-                    "bdaddr": (uctypes.ARRAY | 1, uctypes.UINT8 | 6)
-                },
-                {
-                    "status": uctypes.UINT8 | 0
-                }
-            ],
-            OCF_LE_CLEAR_WHITE_LIST: [
+                "bdaddr_type:B@0 bdaddr:6B@1",
+                "status:B@0"
+            ),
+            OCF_LE_CLEAR_WHITE_LIST: (
                 "LE_CLEAR_WHITE_LIST",
                 None,
-                {
-                    "status": uctypes.UINT8 | 0
-                }
-            ],
-            OCF_LE_REMOVE_DEVICE_FROM_WHITE_LIST: [
+                "status:B@0"
+            ),
+            OCF_LE_REMOVE_DEVICE_FROM_WHITE_LIST: (
                 "LE_REMOVE_DEVICE_FROM_WHITE_LIST",
-                {
-                    "bdaddr_type": uctypes.UINT8 | 0,
-                    "bdaddr": (uctypes.ARRAY | 1, uctypes.UINT8 | 6)
-                },
-                {
-                    "status": uctypes.UINT8 | 0
-                }
-            ],
-            OCF_LE_CONN_UPDATE: [
+                "bdaddr_type:B@0 bdaddr:6B@1",
+                "status:B@0"
+            ),
+            OCF_LE_CONN_UPDATE: (
                 "LE_CONN_UPDATE",
-                {
-                    "handle": uctypes.UINT16 | 0,
-                    "min_interval": uctypes.UINT16 | 2,
-                    "max_interval": uctypes.UINT16 | 4,
-                    "latency": uctypes.UINT16 | 6,
-                    "supervision_timeout": uctypes.UINT16 | 8,
-                    "min_ce_length": uctypes.UINT16 | 10,
-                    "max_ce_length": uctypes.UINT16 | 12
-                },
-                {
-                    "status": uctypes.UINT8 | 0
-                }
-            ],
-            OCF_LE_SET_HOST_CHANNEL_CLASSIFICATION: [
+                "handle:H@0 min_interval:H@2 max_interval:H@4 latency:H@6 "
+                "supervision_timeout:H@8 min_ce_length:H@10 "
+                "max_ce_length:H@12",
+                "status:B@0"
+            ),
+            OCF_LE_SET_HOST_CHANNEL_CLASSIFICATION: (
                 "LE_SET_HOST_CHANNEL_CLASSIFICATION",
-                {
-                    "map": (uctypes.ARRAY | 0, uctypes.UINT8 | 5)
-                },
-                {
-                    "status": uctypes.UINT8 | 0
-                }
-            ],
-            OCF_LE_READ_CHANNEL_MAP: [
+                "map:5B@0",
+                "status:B@0"
+            ),
+            OCF_LE_READ_CHANNEL_MAP: (
                 "LE_READ_CHANNEL_MAP",
-                {
-                    "handle": uctypes.UINT16 | 0
-                },
-                {
-                    "status": uctypes.UINT8 | 0,
-                    "handle": uctypes.UINT16 | 1,
-                    "map": (uctypes.ARRAY | 3, uctypes.UINT8 | 5)
-                }
-            ],
-            OCF_LE_READ_REMOTE_USED_FEATURES: [
+                "handle:H@0",
+                "status:B@0 handle:H@1 map:5B@3"
+            ),
+            OCF_LE_READ_REMOTE_USED_FEATURES: (
                 "LE_READ_REMOTE_USED_FEATURES",
-                {
-                    "handle": uctypes.UINT16 | 0
-                },
-                {
-                    "status": uctypes.UINT8 | 0
-                }
-            ],
-            OCF_LE_ENCRYPT: [
+                "handle:H@0",
+                "status:B@0"
+            ),
+            OCF_LE_ENCRYPT: (
                 "LE_ENCRYPT",
-                {
-                    "key": (uctypes.ARRAY | 0, uctypes.UINT8 | 16),
-                    "plaintext": (uctypes.ARRAY | 16, uctypes.UINT8 | 16)
-                },
-                {
-                    "status": uctypes.UINT8 | 0,
-                    "encdata": (uctypes.ARRAY | 1, uctypes.UINT8 | 16)
-                }
-            ],
-            OCF_LE_RAND: [
+                "key:16B@0 plaintext:16B@16",
+                "status:B@0 encdata:16B@1"
+            ),
+            OCF_LE_RAND: (
                 "LE_RAND",
                 None,
-                {
-                    "status": uctypes.UINT8 | 0,
-                    "random": (uctypes.ARRAY | 1, uctypes.UINT8 | 8)
-                }
-            ],
-            OCF_LE_START_ENCRYPTION: [
+                "status:B@0 random:8B@1"
+            ),
+            OCF_LE_START_ENCRYPTION: (
                 "LE_START_ENCRYPTION",
-                {
-                    "handle": uctypes.UINT16 | 0,
-                    "random": (uctypes.ARRAY | 2, uctypes.UINT8 | 8),
-                    "diversifier": uctypes.UINT16 | 10,
-                    "key": (uctypes.ARRAY | 12, uctypes.UINT8 | 16)
-                },
-                {
-                    "status": uctypes.UINT8 | 0
-                }
-            ],
-            OCF_LE_LTK_REPLY: [
+                "handle:H@0 random:8B@2 diversifier:H@10 key:16B@12",
+                "status:B@0"
+            ),
+            OCF_LE_LTK_REPLY: (
                 "LE_LTK_REPLY",
-                {
-                    "handle": uctypes.UINT16 | 0,
-                    "key": (uctypes.ARRAY | 2, uctypes.UINT8 | 16)
-                },
-                {
-                    "status": uctypes.UINT8 | 0,
-                    "handle": uctypes.UINT16 | 1
-                }
-            ],
-            OCF_LE_LTK_NEG_REPLY: [
+                "handle:H@0 key:16B@2",
+                "status:B@0 handle:H@1"
+            ),
+            OCF_LE_LTK_NEG_REPLY: (
                 "LE_LTK_NEG_REPLY",
-                {
-                    "handle": uctypes.UINT16 | 0
-                },
-                {
-                    "status": uctypes.UINT8 | 0,
-                    "handle": uctypes.UINT16 | 1
-                }
-            ],
-            OCF_LE_READ_SUPPORTED_STATES: [
+                "handle:H@0",
+                "status:B@0 handle:H@1"
+            ),
+            OCF_LE_READ_SUPPORTED_STATES: (
                 "LE_READ_SUPPORTED_STATES",
-                {
-                    "status": uctypes.UINT8 | 0,
-                    "states": (uctypes.ARRAY | 1, uctypes.UINT8 | 8)
-                },
-                {
-                    "status": uctypes.UINT8 | 0
-                }
-            ],
-            OCF_LE_RECEIVER_TEST: [
+                "status:B@0 states:8B@1",
+                "status:B@0"
+            ),
+            OCF_LE_RECEIVER_TEST: (
                 "LE_RECEIVER_TEST",
-                {
-                    "frequency": uctypes.UINT8 | 0
-                },
-                {
-                    "status": uctypes.UINT8 | 0
-                }
-            ],
-            OCF_LE_TRANSMITTER_TEST: [
+                "frequency:B@0",
+                "status:B@0"
+            ),
+            OCF_LE_TRANSMITTER_TEST: (
                 "LE_TRANSMITTER_TEST",
-                {
-                    "frequency": uctypes.UINT8 | 0,
-                    "length": uctypes.UINT8 | 1,
-                    "payload": uctypes.UINT8 | 2
-                },
-                {
-                    "status": uctypes.UINT8 | 0
-                }
-            ],
-            OCF_LE_TEST_END: [
+                "frequency:B@0 length:B@1 payload:B@2",
+                "status:B@0"
+            ),
+            OCF_LE_TEST_END: (
                 "LE_TEST_END",
                 None,
-                {
-                    "status": uctypes.UINT8 | 0,
-                    "num_pkts": uctypes.UINT16 | 1
-                }
-            ]
+                "status:B@0 num_pkts:H@1"
+            )
         }
-    ],
-    OGF_VENDOR_CMD: [
+    ),
+    OGF_VENDOR_CMD: (
         "VENDOR_CMD",
         None
-    ]
+    )
 }
 
 
@@ -493,7 +317,20 @@ class HCI_COMMAND(object):
     struct_format = "<HB"
     struct_size = ustruct.calcsize(struct_format)
 
-    def __init__(self, ogf=0, ocf=0, opcode=0, data=b'', evtcode=EVT_CMD_STATUS, module="IDB05A1"):
+    __slots__ = (
+        "_opcode",
+        "_ogf",
+        "_ogf_name",
+        "_ocf",
+        "_ocf_name",
+        "_evtcode",
+        "_request_descriptor",
+        "_request_data",
+        "_response_descriptor",
+        "_response_data",
+        "_header")
+
+    def __init__(self, ogf=0, ocf=0, opcode=0, data=b'', evtcode=EVT_CMD_STATUS, module=None, header=None):
         if ogf and ocf:
             opcode = OPCODE.pack(ogf, ocf)
         elif opcode:
@@ -509,51 +346,91 @@ class HCI_COMMAND(object):
         self._ocf = ocf
         self._ocf_name = ocf_name
         self._evtcode = evtcode
-        self._request_struct = request_struct
+        # resolved once, module None: the one bound by the controller when
+        # the command is built, see table.descriptors()
+        bound = descriptors(module)
+        self._request_descriptor = bound[request_struct]
         self._request_data = data
-        self._response_struct = response_struct
+        self._response_descriptor = bound[response_struct]
         self._response_data = b''
-        self._module = module
-
-    def __getattr__(self, name):
-        if name == "ogf":
-            return self._ogf
-        elif name == "ogf_name":
-            return self._ogf_name
-        elif name == "ocf":
-            return self._ocf
-        elif name == "ocf_name":
-            return self._ocf_name
-        elif name == "opcode":
-            return self._opcode
-        elif name == "evtcode":
-            return self._evtcode
-        elif name == "request_struct":
-            if self._request_struct is None:
-                return None
-            return uctypes.struct(
-                uctypes.addressof(self.request_data),
-                self._request_struct.get(self._module, self._request_struct),
-                uctypes.LITTLE_ENDIAN
-            )
-        elif name == "response_struct":
-            if self._response_struct is None:
-                return None
-            return uctypes.struct(
-                uctypes.addressof(self.response_data),
-                self._response_struct.get(self._module, self._response_struct),
-                uctypes.LITTLE_ENDIAN
-            )
-        elif name == "request_length":
-            return len(self._request_data)
-        elif name == "request_data":
-            return self._request_data
-        elif name == "response_length":
-            return len(self._response_data)
-        elif name == "response_data":
-            return self._response_data
-        else:
-            raise AttributeError(name)
+        # H4 header already packed by an HCI_ENCODER, see to_buffer()
+        self._header = header
+
+    @property
+    def ogf(self):
+        return self._ogf
+
+    @property
+    def ogf_name(self):
+        return self._ogf_name
+
+    @property
+    def ocf(self):
+        return self._ocf
+
+    @property
+    def ocf_name(self):
+        return self._ocf_name
+
+    @property
+    def opcode(self):
+        return self._opcode
+
+    @property
+    def evtcode(self):
+        return self._evtcode
+
+    @property
+    def request_struct(self):
+        descriptor = self._request_descriptor
+        if descriptor is None:
+            return None
+        return uctypes.struct(
+            uctypes.addressof(self._request_data),
+            descriptor,
+            uctypes.LITTLE_ENDIAN
+        )
+
+    @property
+    def response_struct(self):
+        descriptor = self._response_descriptor
+        if descriptor is None:
+            return None
+        return uctypes.struct(
+            uctypes.addressof(self._response_data),
+            descriptor,
+            uctypes.LITTLE_ENDIAN
+        )
+
+    @property
+    def request_length(self):
+        return len(self._request_data)
+
+    @property
+    def request_data(self):
+        return self._request_data
+
+    @property
+    def response_length(self):
+        return len(self._response_data)
+
+    @property
+    def response_data(self):
+        return self._response_data
+
+    @response_data.setter
+    def response_data(self, value):
+        self._response_data = value
+
+    def fail(self, status):
+        """
+        Complete the command with the error status and no other response
+        field (zeroed), for a command whose completion never comes
+        """
+        descriptor = self._response_descriptor
+        data = bytearray(uctypes.sizeof(descriptor) if descriptor else 1)
+        data[0] = status
+        self._response_data = bytes(data)
 
     def __str__(self):
         desc_str = (
@@ -587,10 +464,21 @@ class HCI_COMMAND(object):
         data = data[HCI_COMMAND.struct_size:]
         return HCI_COMMAND(opcode=opcode, data=data)
 
+    def detach(self):
+        """
+        Copy the parameters packed in a shared HCI_COMMAND_BUFFER, before
+        the next command packed in the buffer overwrites them
+        """
+        if self._header is not None:
+            self._request_data = bytes(self._request_data)
+            self._header = None
+
     def to_buffer(self, split=False):
         """
         Get data string
         """
+        if split and self._header is not None:
+            return self._header, self._request_data
         header_param = (
             ustruct.pack(
                 self.struct_format,
@@ -0,0 +1,373 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0103
+# pylint: disable=C0111
+import ustruct
+import uctypes
+
+from bluetooth_low_energy.protocols.hci import HCI_COMMAND_PKT
+from bluetooth_low_energy.protocols.hci.cmd import (
+    HCI_COMMAND,
+    HCI_COMMANDS,
+    OPCODE)
+from bluetooth_low_energy.protocols.hci.event import EVT_CMD_STATUS
+from bluetooth_low_energy.protocols.hci.table import descriptors
+
+"""
+Precompiled command encoders
+
+A layout is a ustruct format where `*` stands for a variable length byte
+string taking two arguments, its size and its value (padded or truncated
+to size, as "{:d}s".format(size) would do):
+
+    "<HHBB*"   serv_handle, char_handle, offset, length, length, value
+
+It is compiled once into runs of fixed fields packed with pack_into and
+variable strings copied in place, so encoding a command allocates neither
+format strings nor intermediate bytes. Without an explicit layout the
+request descriptor of HCI_COMMANDS is used, a trailing UINT8 array being
+the variable part.
+"""
+
+HCI_COMMAND_HDR_SIZE = 4
+HCI_COMMAND_MAX_PARAM = 255
+
+_OFFSET_MASK = 0x1FFFF
+_TYPE_CODES = {
+    uctypes.UINT8: "B",
+    uctypes.INT8: "b",
+    uctypes.UINT16: "H",
+    uctypes.INT16: "h",
+    uctypes.UINT32: "I",
+    uctypes.INT32: "i"
+}
+
+_ENCODERS = {}
+
+
+class HCI_COMMAND_BUFFER(object):
+    """
+    Reusable H4 command packet: | 0x01 | opcode (LE16) | length | params |
+
+    The views handed out are only valid until the next command is encoded,
+    a command that is not sent right away must copy its parameters.
+    """
+
+    def __init__(self):
+        self.buffer = bytearray(HCI_COMMAND_HDR_SIZE + HCI_COMMAND_MAX_PARAM)
+        self.buffer[0] = HCI_COMMAND_PKT
+        self.header = memoryview(self.buffer)[:HCI_COMMAND_HDR_SIZE]
+        self._params = {}
+
+    def param(self, length):
+        """Return a memoryview of the first length parameter bytes"""
+        view = self._params.get(length)
+        if view is None:
+            view = memoryview(self.buffer)[
+                HCI_COMMAND_HDR_SIZE:HCI_COMMAND_HDR_SIZE + length]
+            self._params[length] = view
+        return view
+
+
+def layout_from_descriptor(descriptor):
+    """Build the layout of a uctypes request descriptor"""
+    fields = sorted(
+        descriptor.values(),
+        key=lambda field: (field[0] if isinstance(field, tuple) else field)
+        & _OFFSET_MASK
+    )
+    layout = "<"
+    size = 0
+    for index, field in enumerate(fields):
+        if isinstance(field, tuple):
+            offset = field[0] & _OFFSET_MASK
+            count = field[1] & _OFFSET_MASK
+            if field[1] & ~_OFFSET_MASK != uctypes.UINT8:
+                raise ValueError("array")
+            if index == len(fields) - 1:
+                code = "*"
+            else:
+                code = "{:d}s".format(count)
+            width = count
+        else:
+            offset = field & _OFFSET_MASK
+            code = _TYPE_CODES[field & ~_OFFSET_MASK]
+            width = ustruct.calcsize(code)
+        if offset != size:
+            raise ValueError("offset")
+        layout += code
+        size += width
+    return layout
+
+
+class HCI_ENCODER(object):
+    """HCI_ENCODER"""
+
+    def __init__(self, opcode, layout):
+        self.opcode = opcode
+        self.layout = layout
+        self._steps = []
+        order = layout[0] if layout[0] in "<>!=@" else "<"
+        codes = layout[1:] if layout[0] in "<>!=@" else layout
+        run = ""
+        nargs = 0
+        count = ""
+        for code in codes:
+            if code.isdigit():
+                count += code
+                continue
+            if code == "*":
+                if run:
+                    self._add_run(order + run, nargs)
+                    run = ""
+                    nargs = 0
+                self._steps.append((None, 0, 2))
+            else:
+                run += count + code
+                nargs += 1 if code == "s" else int(count or "1")
+            count = ""
+        if run:
+            self._add_run(order + run, nargs)
+        # most layouts are a single fixed run
+        if len(self._steps) == 1 and self._steps[0][0] is not None:
+            self._single = self._steps[0][0]
+            self._single_size = self._steps[0][1]
+        else:
+            self._single = None
+            self._single_size = 0
+
+    def _add_run(self, fmt, nargs):
+        self._steps.append((fmt, ustruct.calcsize(fmt), nargs))
+
+    @staticmethod
+    def get(ogf, ocf, layout=None, module=None):
+        """
+        Return the encoder of a command, compiled on first use (from the
+        request descriptor for module if layout is None)
+        """
+        opcode = OPCODE.pack(ogf, ocf)
+        bound = descriptors(module)
+        key = (opcode, layout or bound.module)
+        encoder = _ENCODERS.get(key)
+        if encoder is None:
+            if layout is None:
+                layout = layout_from_descriptor(
+                    bound[HCI_COMMANDS[ogf][1][ocf][1]])
+            encoder = HCI_ENCODER(opcode, layout)
+            _ENCODERS[key] = encoder
+        return encoder
+
+    def encode(self, buf, *args):
+        """
+        Pack args into the HCI_COMMAND_BUFFER buf (header included),
+        return the length of the parameters
+        """
+        buffer = buf.buffer
+        if self._single is not None:
+            ustruct.pack_into(self._single, buffer, HCI_COMMAND_HDR_SIZE, *args)
+            length = self._single_size
+        else:
+            offset = HCI_COMMAND_HDR_SIZE
+            index = 0
+            for fmt, size, nargs in self._steps:
+                if fmt is None:
+                    size = args[index]
+                    value = args[index + 1]
+                    copy = len(value)
+                    if copy > size:
+                        copy = size
+                        value = value[:size]
+                    buffer[offset:offset + copy] = value
+                    for i in range(offset + copy, offset + size):
+                        buffer[i] = 0
+                elif nargs == 1:
+                    ustruct.pack_into(fmt, buffer, offset, args[index])
+                else:
+                    ustruct.pack_into(
+                        fmt, buffer, offset, *args[index:index + nargs])
+                offset += size
+                index += nargs
+            length = offset - HCI_COMMAND_HDR_SIZE
+        ustruct.pack_into("<HB", buffer, 1, self.opcode, length)
+        return length
+
+
+class HCI_PREPARED_COMMAND(HCI_COMMAND):
+    """
+    Command built once and sent again with only its trailing value patched
+    (aci_gatt_update_char_value of a sensor reading):
+
+        | 0x01 | opcode | length | prefix | value (up to size bytes) |
+
+    The packet, the response buffer and the response_struct are owned by
+    the command, set_value() writes the value, its length (the prefix byte
+    at length_offset, if any) and the header in place. A command must not
+    be changed while it is in flight.
+    """
+
+    def __init__(self, ogf, ocf, prefix, size, length_offset=-1,
+                 evtcode=EVT_CMD_STATUS, module=None):
+        if len(prefix) + size > HCI_COMMAND_MAX_PARAM:
+            raise ValueError("size")
+        super(HCI_PREPARED_COMMAND, self).__init__(
+            ogf=ogf, ocf=ocf, evtcode=evtcode, module=module)
+        self.size = size
+        self._prefix_size = len(prefix)
+        self._length_offset = length_offset
+        self._packet = bytearray(HCI_COMMAND_HDR_SIZE + len(prefix) + size)
+        self._packet[0] = HCI_COMMAND_PKT
+        ustruct.pack_into("<H", self._packet, 1, self.opcode)
+        self._packet[
+            HCI_COMMAND_HDR_SIZE:HCI_COMMAND_HDR_SIZE + len(prefix)] = prefix
+        self._packet_view = memoryview(self._packet)
+        self._header_view = self._packet_view[:HCI_COMMAND_HDR_SIZE]
+        self._params = {}
+        self._response = bytearray(HCI_COMMAND_MAX_PARAM)
+        self._response_view = memoryview(self._response)
+        self._response_length = 0
+        self._struct = None
+        self.set_value(b'')
+
+    def set_value(self, value):
+        """Patch value (at most size bytes) and the lengths in place"""
+        count = len(value)
+        if count > self.size:
+            raise ValueError("size")
+        start = HCI_COMMAND_HDR_SIZE + self._prefix_size
+        self._packet[start:start + count] = value
+        if self._length_offset >= 0:
+            self._packet[HCI_COMMAND_HDR_SIZE + self._length_offset] = count
+        length = self._prefix_size + count
+        self._packet[HCI_COMMAND_HDR_SIZE - 1] = length
+        view = self._params.get(length)
+        if view is None:
+            view = self._packet_view[
+                HCI_COMMAND_HDR_SIZE:HCI_COMMAND_HDR_SIZE + length]
+            self._params[length] = view
+        self._request_data = view
+        self._header = self._header_view
+
+    def detach(self):
+        """The parameters are not shared, nothing to copy"""
+        pass
+
+    @property
+    def response_data(self):
+        """response_data"""
+        return self._response_view[:self._response_length]
+
+    @response_data.setter
+    def response_data(self, data):
+        count = len(data)
+        self._response[:count] = data
+        self._response_length = count
+
+    @property
+    def response_struct(self):
+        """response_struct, built once over the response buffer"""
+        if self._struct is None:
+            descriptor = self._response_descriptor
+            if descriptor is None:
+                return None
+            self._struct = uctypes.struct(
+                uctypes.addressof(self._response),
+                descriptor,
+                uctypes.LITTLE_ENDIAN
+            )
+        return self._struct
+
+    @property
+    def status(self):
+        """Status byte of the last response, None before the first one"""
+        if not self._response_length:
+            return None
+        return self._response[0]
+
+
+def _layout_defaults(layout):
+    # default of every argument packed by layout: b'' for strings, else 0
+    defaults = []
+    count = ""
+    for code in layout[1:] if layout[0] in "<>!=@" else layout:
+        if code.isdigit():
+            count += code
+            continue
+        if code == "*":
+            defaults.append(0)
+            defaults.append(b'')
+        elif code == "s":
+            defaults.append(b'')
+        else:
+            defaults.extend([0] * int(count or "1"))
+        count = ""
+    return defaults
+
+
+def command_method(ogf, ocf, layout=None, *params, **kwargs):
+    """
+    Table entry of a command wrapper: a method packing its arguments
+    with HCI_ENCODER (layout, default: derived from the request descriptor
+    of HCI_COMMANDS), sending the command and returning the HCI_COMMAND.
+
+        hci_disconnect = command_method(
+            OGF_LINK_CTL, OCF_DISCONNECT, "<HB", "handle", "reason")
+
+    params name the arguments in packing order, a name packed twice (the
+    size and the length of a `*` string) is a single argument. Every
+    argument is optional, 0 or b'' for strings, a bool packs as 0 or 1;
+    kwargs (evtcode, module) are given to HCI_COMMAND.
+    """
+    names = []
+    for name in params:
+        if name not in names:
+            names.append(name)
+    indexes = [names.index(name) for name in params]
+    # resolved on the first call, not at import
+    state = [None]
+
+    if not params:
+        def method(self):
+            hci_cmd = HCI_COMMAND(ogf=ogf, ocf=ocf, **kwargs)
+            self.hci_send_cmd(hci_cmd)
+            return hci_cmd
+        return _describe(method, ogf, ocf, names)
+
+    def method(self, *args, **values):
+        defaults = state[0]
+        if defaults is None:
+            packed = _layout_defaults(
+                HCI_ENCODER.get(
+                    ogf, ocf, layout, kwargs.get("module")).layout)
+            if len(packed) != len(indexes):
+                raise ValueError("layout")
+            defaults = [None] * len(names)
+            for index, default in zip(indexes, packed):
+                defaults[index] = default
+            state[0] = defaults
+        if len(args) > len(names):
+            raise TypeError("")
+        arguments = list(defaults)
+        arguments[:len(args)] = args
+        for name in values:
+            if name not in names:
+                raise TypeError(name)
+            arguments[names.index(name)] = values[name]
+        hci_cmd = self.hci_encode(
+            ogf, ocf, layout, *[arguments[index] for index in indexes],
+            **kwargs)
+        self.hci_send_cmd(hci_cmd)
+        # the buffer of hci_encode() is reused by the next command
+        hci_cmd.detach()
+        return hci_cmd
+    return _describe(method, ogf, ocf, names)
+
+
+def _describe(method, ogf, ocf, names):
+    # name and arguments for help(), MicroPython functions take no attribute
+    try:
+        method.__name__ = "command_{:04x}".format(OPCODE.pack(ogf, ocf))
+        method.__doc__ = "Send the command (opcode 0x{:04x}) with ({}), " \
+            "return the HCI_COMMAND".format(
+                OPCODE.pack(ogf, ocf), ", ".join(names))
+    except AttributeError:
+        pass
+    return method
@@ -6,7 +6,8 @@ import uctypes
 from ubinascii import hexlify, unhexlify
 from micropython import const
 
-from bluetooth_low_energy.protocols.hci import HCI_MAX_PAYLOAD_SIZE
+from bluetooth_low_energy.protocols.hci import HCI_EVENT_PKT
+from bluetooth_low_energy.protocols.hci.table import LazyTable, descriptors
 
 """
 Event codes and names for HCI events
@@ -42,61 +43,34 @@ EVT_LE_READ_REMOTE_USED_FEATURES_COMPLETE = const(0x04)
 EVT_LE_LTK_REQUEST = const(0x05)
 
 HCI_LE_META_EVENTS = {
-    EVT_LE_CONN_COMPLETE: [
+    EVT_LE_CONN_COMPLETE: (
         "CONN_COMPLETE",
-        {
-            "status": uctypes.UINT8 | 0,
-            "handle": uctypes.UINT16 | 1,
-            "role": uctypes.UINT8 | 3,
-            "peer_bdaddr_type": uctypes.UINT8 | 4,
-            "peer_bdaddr": (uctypes.ARRAY | 5, uctypes.UINT8 | 6),
-            "interval": uctypes.UINT16 | 11,
-            "latency": uctypes.UINT16 | 13,
-            "supervision_timeout": uctypes.UINT16 | 15,
-            "master_clock_accuracy": uctypes.UINT8 | 17
-        }
-    ],
-    EVT_LE_ADVERTISING_REPORT: [
+        "status:B@0 handle:H@1 role:B@3 peer_bdaddr_type:B@4 peer_bdaddr:6B@5 "
+        "interval:H@11 latency:H@13 supervision_timeout:H@15 "
+        "master_clock_accuracy:B@17"
+    ),
+    EVT_LE_ADVERTISING_REPORT: (
         "ADVERTISING_REPORT",
-        {
-            "evt_type": uctypes.UINT8 | 0,
-            "bdaddr_type":  uctypes.UINT8 | 1,
-            "bdaddr": (uctypes.ARRAY | 2, uctypes.UINT8 | 6),
-            "data_length":  uctypes.UINT8 | 8,
-            "data_RSSI":
-            (uctypes.ARRAY | 9, uctypes.UINT8 | HCI_MAX_PAYLOAD_SIZE - 9)
-        }
-    ],
-    EVT_LE_CONN_UPDATE_COMPLETE: [
+        "evt_type:B@0 bdaddr_type:B@1 bdaddr:6B@2 data_length:B@8 "
+        "data_RSSI:119B@9"
+    ),
+    EVT_LE_CONN_UPDATE_COMPLETE: (
         "CONN_UPDATE_COMPLETE",
-        {
-            "status": uctypes.UINT8 | 0,
-            "handle": uctypes.UINT16 | 1,
-            "interval": uctypes.UINT16 | 3,
-            "latency": uctypes.UINT16 | 5,
-            "supervision_timeout": uctypes.UINT16 | 7,
-        }
-    ],
-    EVT_LE_READ_REMOTE_USED_FEATURES_COMPLETE: [
+        "status:B@0 handle:H@1 interval:H@3 latency:H@5 "
+        "supervision_timeout:H@7"
+    ),
+    EVT_LE_READ_REMOTE_USED_FEATURES_COMPLETE: (
         "READ_REMOTE_USED_FEATURES_COMPLETE",
-        {
-            "status": uctypes.UINT8 | 0,
-            "handle": uctypes.UINT16 | 1,
-            "features": (uctypes.ARRAY | 3, uctypes.UINT8 | 8)
-        }
-    ],
-    EVT_LE_LTK_REQUEST: [
+        "status:B@0 handle:H@1 features:8B@3"
+    ),
+    EVT_LE_LTK_REQUEST: (
         "LTK_REQUEST",
-        {
-            "handle": uctypes.UINT16 | 0,
-            "random": (uctypes.ARRAY | 2, uctypes.UINT8 | 8),
-            "ediv": uctypes.UINT16 | 10,
-        }
-    ]
+        "handle:H@0 random:8B@2 ediv:H@10"
+    )
 }
 
-# Vendor Specific HCI_EVENTS
-HCI_VENDOR_EVENTS = {}
+# Vendor Specific HCI_EVENTS, the tables of a module loaded on first use
+HCI_VENDOR_EVENTS = LazyTable()
 
 """
 HCI Event codes
@@ -119,158 +93,188 @@ EVT_LE_META_EVENT = const(0x3E)
 EVT_VENDOR = const(0xFF)
 
 HCI_EVENTS = {
-    EVT_CONN_COMPLETE: [
+    EVT_CONN_COMPLETE: (
         "CONN_COMPLETE",
-        {
-            "status": uctypes.UINT8 | 0,
-            "handle": uctypes.UINT16 | 1,
-            "bdaddr": (uctypes.ARRAY | 3, uctypes.UINT8 | 6),
-            "link_type": uctypes.UINT8 | 9,
-            "encr_mode": uctypes.UINT8 | 10
-        }
-    ],
-    EVT_DISCONN_COMPLETE: [
+        "status:B@0 handle:H@1 bdaddr:6B@3 link_type:B@9 encr_mode:B@10"
+    ),
+    EVT_DISCONN_COMPLETE: (
         "DISCONN_COMPLETE",
-        {
-            "status": uctypes.UINT8 | 0,
-            "handle": uctypes.UINT16 | 1,
-            "reason": uctypes.UINT8 | 3
-        }
-    ],
-    EVT_ENCRYPT_CHANGE: [
+        "status:B@0 handle:H@1 reason:B@3"
+    ),
+    EVT_ENCRYPT_CHANGE: (
         "ENCRYPT_CHANGE",
-        {
-            "status": uctypes.UINT8 | 0,
-            "handle": uctypes.UINT16 | 1,
-            "encrypt": uctypes.UINT8 | 3
-        }
-    ],
-    EVT_READ_REMOTE_VERSION_COMPLETE: [
+        "status:B@0 handle:H@1 encrypt:B@3"
+    ),
+    EVT_READ_REMOTE_VERSION_COMPLETE: (
         "READ_REMOTE_VERSION_COMPLETE",
-        {
-            "status": uctypes.UINT8 | 0,
-            "connection_handle": uctypes.UINT16 | 1,
-            "version": uctypes.UINT8 | 3,
-            "manufacturer_name": uctypes.UINT16 | 4,
-            "subversion": uctypes.UINT16 | 6
-        }
-    ],
-    EVT_CMD_COMPLETE: [
+        "status:B@0 connection_handle:H@1 version:B@3 manufacturer_name:H@4 "
+        "subversion:H@6"
+    ),
+    EVT_CMD_COMPLETE: (
         "CMD_COMPLETE",
-        {
-            "ncmd": uctypes.UINT8 | 0,
-            "opcode": uctypes.UINT16 | 1
-        }
-    ],
-    EVT_CMD_STATUS: [
+        "ncmd:B@0 opcode:H@1"
+    ),
+    EVT_CMD_STATUS: (
         "CMD_STATUS",
-        {
-            "status": uctypes.UINT8 | 0,
-            "ncmd": uctypes.UINT8 | 1,
-            "opcode": uctypes.UINT16 | 2
-        }
-    ],
-    EVT_HARDWARE_ERROR: [
+        "status:B@0 ncmd:B@1 opcode:H@2"
+    ),
+    EVT_HARDWARE_ERROR: (
         "HARDWARE_ERROR",
-        {
-            "code": uctypes.UINT8 | 0
-        }
-    ],
-    EVT_NUM_COMP_PKTS: [
+        "code:B@0"
+    ),
+    EVT_NUM_COMP_PKTS: (
         "NUM_COMP_PKTS",
-        {
-            "num_hndl": uctypes.UINT8 | 0,
-            "hndl": (
-                uctypes.ARRAY | 1, (HCI_MAX_PAYLOAD_SIZE // 4) - 2,
-                {
-                    "hndl": uctypes.UINT16 | 0,
-                    "num_comp_pkts": uctypes.UINT16 | 2
-                }
-            )
-        }
-    ],
-    EVT_DATA_BUFFER_OVERFLOW: [
+        "num_hndl:B@0 hndl:30{hndl:H@0 num_comp_pkts:H@2}@1"
+    ),
+    EVT_DATA_BUFFER_OVERFLOW: (
         "DATA_BUFFER_OVERFLOW",
-        {
-            "link_type": uctypes.UINT8 | 0
-        }
-    ],
-    EVT_ENCRYPTION_KEY_REFRESH_COMPLETE: [
+        "link_type:B@0"
+    ),
+    EVT_ENCRYPTION_KEY_REFRESH_COMPLETE: (
         "ENCRYPTION_KEY_REFRESH_COMPLETE",
-        {
-            "status": uctypes.UINT8 | 0,
-            "handle": uctypes.UINT16 | 1
-        }
-    ],
-    EVT_LE_META_EVENT: [
+        "status:B@0 handle:H@1"
+    ),
+    EVT_LE_META_EVENT: (
         "LE_META_EVENT",
-        {
-            "subevent": uctypes.UINT8 | 0,
-            "data": (uctypes.ARRAY | 1, uctypes.UINT8 | HCI_MAX_PAYLOAD_SIZE - 1)
-        }
-    ],
-    EVT_VENDOR: [
+        "subevent:B@0 data:127B@1"
+    ),
+    EVT_VENDOR: (
         "VENDOR",
-        {
-            "subevent": uctypes.UINT16 | 0,
-            "data": (uctypes.ARRAY | 2, uctypes.UINT8 | HCI_MAX_PAYLOAD_SIZE - 1)
-        }
-    ]
+        "subevent:H@0 data:127B@2"
+    )
 }
 
 
 class HCI_EVENT(object):
-    """HCI_EVENT"""
+    """
+    HCI_EVENT
+
+    Decoded on demand: the subevent code is read from the parameters when
+    asked, the subevent table, the data view and the uctypes.struct are
+    resolved once on first access and kept by the event. peek_evtcode()
+    and peek_subevtcode() read the codes of a raw H4 packet, to drop an
+    event before any object is built.
+
+    module: "IDB05A1", "IDB04A1" or a Descriptors, default the module
+    bound by the controller (DESCRIPTORS)
+    """
     struct_format = "<BB"
     _struct_size = ustruct.calcsize(struct_format)
 
-    def __init__(self, evtcode, data=b'', module="IDB05A1"):
-        evtname, evtstruct = HCI_EVENTS[evtcode]
-        subevtcode, subevtname = (0, "")
-        if evtcode in (EVT_LE_META_EVENT, EVT_VENDOR):
-            subevt = uctypes.struct(
-                uctypes.addressof(data),
-                evtstruct,
-                uctypes.LITTLE_ENDIAN
-            )
-            subevtcode = subevt.subevent
-            if evtcode == EVT_LE_META_EVENT:
-                subevtname, evtstruct = HCI_LE_META_EVENTS[subevtcode]
-            elif evtcode == EVT_VENDOR:
-                subevtname, evtstruct = HCI_VENDOR_EVENTS[subevtcode]
-            data = bytes(subevt.data)
+    __slots__ = (
+        "_evtcode",
+        "_raw",
+        "_data",
+        "_subevtname",
+        "_descriptor",
+        "_struct",
+        "_descriptors")
 
+    def __init__(self, evtcode, data=b'', module=None):
+        if evtcode not in HCI_EVENTS:
+            raise KeyError(evtcode)
         self._evtcode = evtcode
-        self._evtname = evtname
-        self._subevtcode = subevtcode
-        self._subevtname = subevtname
-        self._struct = evtstruct
-        self._data = data
-        self._module = module
-
-    def __getattr__(self, name):
-        if name == "evtcode":
-            return self._evtcode
-        elif name == "evtname":
-            return self._evtname
-        elif name == "subevtcode":
-            return self._subevtcode
-        elif name == "subevtname":
-            return self._subevtname
-        elif name == "struct_size":
-            return uctypes.sizeof(self.struct)
-        elif name == "struct":
-            if self._struct is None:
+        self._raw = data
+        self._data = None
+        # None until the subevent table is looked up
+        self._subevtname = None
+        self._descriptor = None
+        self._struct = None
+        self._descriptors = descriptors(module)
+
+    @staticmethod
+    def peek_evtcode(packet):
+        """Event code of the H4 packet, 0 if it is not an event"""
+        if packet[0] != HCI_EVENT_PKT:
+            return 0
+        return packet[1]
+
+    @staticmethod
+    def peek_subevtcode(packet):
+        """Subevent code of the H4 packet, 0 if it has none"""
+        if packet[0] != HCI_EVENT_PKT:
+            return 0
+        evtcode = packet[1]
+        if evtcode == EVT_LE_META_EVENT:
+            return packet[3]
+        elif evtcode == EVT_VENDOR:
+            return packet[3] | packet[4] << 8
+        return 0
+
+    def _resolve(self):
+        evtcode = self._evtcode
+        if evtcode == EVT_LE_META_EVENT:
+            self._subevtname, spec = HCI_LE_META_EVENTS[self.subevtcode]
+        elif evtcode == EVT_VENDOR:
+            self._subevtname, spec = HCI_VENDOR_EVENTS[self.subevtcode]
+        else:
+            self._subevtname = ""
+            spec = HCI_EVENTS[evtcode][1]
+        # the uctypes descriptor, looked up once per event
+        self._descriptor = self._descriptors[spec]
+
+    @property
+    def evtcode(self):
+        return self._evtcode
+
+    @property
+    def evtname(self):
+        return HCI_EVENTS[self._evtcode][0]
+
+    @property
+    def subevtcode(self):
+        evtcode = self._evtcode
+        if evtcode == EVT_LE_META_EVENT:
+            return self._raw[0]
+        elif evtcode == EVT_VENDOR:
+            return self._raw[0] | self._raw[1] << 8
+        return 0
+
+    @property
+    def subevtname(self):
+        if self._subevtname is None:
+            self._resolve()
+        return self._subevtname
+
+    @property
+    def struct_size(self):
+        return uctypes.sizeof(self.struct)
+
+    @property
+    def struct(self):
+        if self._struct is None:
+            if self._subevtname is None:
+                self._resolve()
+            descriptor = self._descriptor
+            if descriptor is None:
                 return None
-            return uctypes.struct(
+            self._struct = uctypes.struct(
                 uctypes.addressof(self.data),
-                self._struct.get(self._module, self._struct),
+                descriptor,
                 uctypes.LITTLE_ENDIAN
             )
-        elif name == "length":
-            return len(self._data)
-        elif name == "data":
-            return self._data
+        return self._struct
+
+    @property
+    def length(self):
+        return len(self.data)
+
+    @property
+    def data(self):
+        if self._data is None:
+            evtcode = self._evtcode
+            if evtcode == EVT_LE_META_EVENT:
+                self._data = self._raw[1:]
+            elif evtcode == EVT_VENDOR:
+                self._data = self._raw[2:]
+            else:
+                self._data = self._raw
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+        self._struct = None
 
     def __str__(self):
         desc_str = (
@@ -282,9 +286,9 @@ class HCI_EVENT(object):
             self.evtcode,
             (
                 " subevtcode={:s}(0x{:02x}) ".format(
-                    self._subevtname,
-                    self._subevtcode
-                ) if self._subevtcode else " "
+                    self.subevtname,
+                    self.subevtcode
+                ) if self.subevtcode else " "
             ),
             self.length,
             hexlify(self.data)
@@ -305,13 +309,17 @@ class HCI_EVENT(object):
 
         All integer values are stored in "little-endian" order.
         """
-        evtcode, _ = ustruct.unpack(
-            HCI_EVENT.struct_format,
-            data[:HCI_EVENT._struct_size]
-        )
+        if not isinstance(data, memoryview):
+            data = memoryview(data)
+        evtcode = data[0]
         data = data[HCI_EVENT._struct_size:]
         return HCI_EVENT(evtcode, data=data)
 
+    def copy(self):
+        """HCI_EVENT owning a copy of its data"""
+        return HCI_EVENT(
+            self._evtcode, bytes(self._raw), module=self._descriptors)
+
     def to_buffer(self):
         if self.subevtcode:
             return ustruct.pack(
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0103
+# pylint: disable=C0111
+from bluetooth_low_energy.protocols.hci import HCI_ACLDATA_PKT
+from bluetooth_low_energy.protocols.hci.acl import (
+    ACL_HEADER,
+    ACL_PB_CONT_FRAG_MSG,
+    ACL_PB_START_NON_AUTO_L2CAP_PDU)
+from bluetooth_low_energy.protocols.hci.l2cap import L2CAP
+from bluetooth_low_energy.protocols.hci.pool import PacketBuffer
+
+"""
+ACL fragmentation and L2CAP PDU recombination
+Core specification 4.1 [vol 3] Part A (Section 7.2) - Fragmentation and
+Recombination
+
+An L2CAP PDU longer than the controller ACL buffers (LE_READ_BUFFER_SIZE
+pkt_len) is sent as a start fragment followed by continuation fragments
+(ACL_PB_CONT_FRAG_MSG) of the same connection handle.
+
+Receive side: a PDU carried by a single ACL packet is returned as is, a
+view of the receive buffer. The fragments of a longer PDU are copied once
+into one of the buffers preallocated for the negotiated MTU, owned by the
+connection handle until the PDU is complete.
+
+Transmit side: the H4 and ACL headers (and the L2CAP header of the first
+fragment) are written into a reused header buffer, the fragments are views
+of the payload, written after their header by Transport.send().
+"""
+
+L2CAP_HDR_SIZE = L2CAP.struct_size
+ACL_HDR_SIZE = 1 + ACL_HEADER.size
+
+
+class ACL_REASSEMBLER(object):
+    """
+    Per connection handle recombination of L2CAP PDUs
+
+    mtu: largest L2CAP payload accepted, longer PDUs are dropped
+    connections: PDUs reassembled at once (one per connection handle)
+
+    A PDU returned by feed() is valid until the next call to feed(), its
+    copy() must be kept instead.
+    """
+
+    def __init__(self, mtu=23, connections=1):
+        self.mtu = mtu
+        self.dropped = 0
+        self._free = [
+            PacketBuffer(L2CAP_HDR_SIZE + mtu) for _ in range(connections)]
+        self._released = None
+        # handle: [buffer, received, expected]
+        self._pending = {}
+
+    def __len__(self):
+        return len(self._pending)
+
+    def resize(self, mtu):
+        """Reallocate the buffers for a new MTU, pending PDUs are dropped"""
+        count = len(self._free) + len(self._pending) + \
+            (1 if self._released is not None else 0)
+        self.dropped += len(self._pending)
+        self.mtu = mtu
+        self._free = [
+            PacketBuffer(L2CAP_HDR_SIZE + mtu) for _ in range(count)]
+        self._released = None
+        self._pending = {}
+
+    def reset(self, handle=None):
+        """Drop the PDU pending on handle (all of them if None)"""
+        for key in (list(self._pending) if handle is None else (handle,)):
+            pending = self._pending.pop(key, None)
+            if pending is not None:
+                self._free.append(pending[0])
+                self.dropped += 1
+
+    def _release(self):
+        # the buffer of the last complete PDU is reused from now on
+        if self._released is not None:
+            self._free.append(self._released)
+            self._released = None
+
+    def feed(self, acl):
+        """
+        Add the HCI_ACL packet acl, return the L2CAP PDU it completes or
+        None. Fragments out of sequence, longer than announced or beyond
+        the MTU are dropped and counted.
+        """
+        self._release()
+        handle = acl.handle
+        data = acl.data
+        count = len(data)
+        if acl.pb != ACL_PB_CONT_FRAG_MSG:
+            if handle in self._pending:
+                # start fragment before the end of the previous PDU
+                self.reset(handle)
+            if count < 2:
+                self.dropped += 1
+                return None
+            expected = L2CAP_HDR_SIZE + (data[0] | data[1] << 8)
+            if count == expected:
+                return L2CAP.from_buffer(data)
+            if count > expected or expected > L2CAP_HDR_SIZE + self.mtu \
+                    or not self._free:
+                self.dropped += 1
+                return None
+            buf = self._free.pop()
+            buf.buffer[:count] = data
+            self._pending[handle] = [buf, count, expected]
+            return None
+        pending = self._pending.get(handle)
+        if pending is None:
+            self.dropped += 1
+            return None
+        buf, received, expected = pending
+        if received + count > expected:
+            self.reset(handle)
+            return None
+        buf.buffer[received:received + count] = data
+        received += count
+        if received < expected:
+            pending[1] = received
+            return None
+        del self._pending[handle]
+        self._released = buf
+        return L2CAP.from_buffer(buf.view(expected))
+
+
+class ACL_FRAGMENTER(object):
+    """
+    Split L2CAP PDUs into ACL packets of at most pkt_len bytes of data
+
+    The headers yielded by fragments() are reused, each one is valid until
+    the next fragment is requested.
+    """
+
+    def __init__(self, pkt_len=27):
+        if pkt_len <= L2CAP_HDR_SIZE:
+            raise ValueError("pkt_len")
+        self.pkt_len = pkt_len
+        self._header = PacketBuffer(ACL_HDR_SIZE + L2CAP_HDR_SIZE)
+        self._header.buffer[0] = HCI_ACLDATA_PKT
+
+    def count(self, length):
+        """Number of ACL packets of an L2CAP payload of length bytes"""
+        return (L2CAP_HDR_SIZE + length + self.pkt_len - 1) // self.pkt_len
+
+    def fragments(self, handle, cid, payload):
+        """
+        Yield (header, data) for every ACL packet of the L2CAP PDU carrying
+        payload on cid: H4 type, ACL header and (first fragment only) the
+        L2CAP header, then a view of payload.
+        """
+        if not isinstance(payload, memoryview):
+            payload = memoryview(payload)
+        buffer = self._header.buffer
+        length = len(payload)
+        count = self.pkt_len - L2CAP_HDR_SIZE
+        if count > length:
+            count = length
+        ACL_HEADER.pack_into(
+            buffer, 1, handle, ACL_PB_START_NON_AUTO_L2CAP_PDU, 0,
+            L2CAP_HDR_SIZE + count)
+        buffer[ACL_HDR_SIZE] = length & 0xff
+        buffer[ACL_HDR_SIZE + 1] = length >> 8
+        buffer[ACL_HDR_SIZE + 2] = cid & 0xff
+        buffer[ACL_HDR_SIZE + 3] = cid >> 8
+        yield self._header.view(ACL_HDR_SIZE + L2CAP_HDR_SIZE), \
+            payload[:count]
+        offset = count
+        while offset < length:
+            count = length - offset
+            if count > self.pkt_len:
+                count = self.pkt_len
+            ACL_HEADER.pack_into(
+                buffer, 1, handle, ACL_PB_CONT_FRAG_MSG, 0, count)
+            yield self._header.view(ACL_HDR_SIZE), \
+                payload[offset:offset + count]
+            offset += count
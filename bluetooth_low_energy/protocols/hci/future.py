@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0103
+# pylint: disable=C0111
+import utime
+
+try:
+    import uasyncio as asyncio
+except ImportError:
+    asyncio = None
+
+"""
+Completion of an HCI command sent without waiting
+
+The event loop (BlueNRG_MS.run() or the run_async() task) resolves the
+future when the EVT_CMD_STATUS / EVT_CMD_COMPLETE of the command is read;
+result() then returns the HCI_COMMAND with its response. From a uasyncio
+task the future can be awaited:
+
+    cmd = await bluenrg.hci_async(bluenrg.aci_gatt_update_char_value, ...)
+"""
+
+
+class HCI_FUTURE(object):
+    """HCI_FUTURE"""
+
+    def __init__(self, cmd, timeout=1000):
+        self.cmd = cmd
+        self.deadline = utime.ticks_add(utime.ticks_ms(), timeout)
+        self._done = False
+        self._exception = None
+        self._event = None
+        self._callbacks = []
+
+    def done(self):
+        """True once resolved"""
+        return self._done
+
+    def expired(self, now):
+        """True if still pending after the deadline"""
+        return not self._done and utime.ticks_diff(now, self.deadline) >= 0
+
+    def result(self):
+        """Return the HCI_COMMAND or raise the exception of the command"""
+        if not self._done:
+            raise ValueError("pending")
+        if self._exception is not None:
+            raise self._exception
+        return self.cmd
+
+    def set_result(self):
+        """Resolve, cmd.response_data holds the response"""
+        self._resolve(None)
+
+    def set_exception(self, exception):
+        """Resolve with an error (hardware error, timeout)"""
+        self._resolve(exception)
+
+    def add_done_callback(self, callback):
+        """Call callback(future) once resolved"""
+        if self._done:
+            callback(self)
+        else:
+            self._callbacks.append(callback)
+
+    def _resolve(self, exception):
+        if self._done:
+            return
+        self._done = True
+        self._exception = exception
+        if self._event is not None:
+            self._event.set()
+        for callback in self._callbacks:
+            callback(self)
+        self._callbacks = []
+
+    def __await__(self):
+        if not self._done:
+            if self._event is None:
+                self._event = asyncio.Event()
+            yield from self._event.wait()
+        return self.result()
+
+    __iter__ = __await__
@@ -32,20 +32,31 @@ class L2CAP(object):
     struct_format = "<HH"
     struct_size = ustruct.calcsize(struct_format)
 
+    __slots__ = (
+        "_cid",
+        "_cid_name",
+        "_data")
+
     def __init__(self, cid, data=b''):
         self._cid = cid
         self._cid_name = L2CAP_CHANNEL_IDS[cid]
         self._data = data
 
-    def __getattr__(self, name):
-        if name == "cid":
-            return self._cid
-        elif name == "cid_name":
-            return self._cid_name
-        elif name == "length":
-            return len(self._data)
-        elif name == "data":
-            return self._data
+    @property
+    def cid(self):
+        return self._cid
+
+    @property
+    def cid_name(self):
+        return self._cid_name
+
+    @property
+    def length(self):
+        return len(self._data)
+
+    @property
+    def data(self):
+        return self._data
 
     def __str__(self):
         desc_str = (
@@ -85,13 +96,16 @@ class L2CAP(object):
         ** Core specification 4.1
         ** [vol 3] Part A (Section 3) - Data Packet Format
         """
-        _, cid = ustruct.unpack(
-            L2CAP.struct_format,
-            data[:L2CAP.struct_size]
-        )
+        if not isinstance(data, memoryview):
+            data = memoryview(data)
+        _, cid = ustruct.unpack_from(L2CAP.struct_format, data)
         data = data[L2CAP.struct_size:]
         return L2CAP(cid, data)
 
+    def copy(self):
+        """L2CAP owning a copy of its data"""
+        return L2CAP(self._cid, bytes(self._data))
+
     def to_buffer(self):
         return ustruct.pack(
             self.struct_format,
@@ -164,23 +178,37 @@ class L2CAP_SCH(object):
     struct_format = "<BBH"
     struct_size = ustruct.calcsize(struct_format)
 
+    __slots__ = (
+        "_code",
+        "_cid",
+        "_cid_name",
+        "_data")
+
     def __init__(self, code, cid, data=b''):
         self._code = code
         self._cid = cid
-        self._cid_name = L2CAP_SCH_PDUS[id]
+        self._cid_name = L2CAP_SCH_PDUS[code]
         self._data = data
 
-    def __getattr__(self, name):
-        if name == "_code":
-            return self._code
-        elif name == "cid":
-            return self._cid
-        elif name == "cid_name":
-            return self._cid_name
-        elif name == "length":
-            return len(self._data)
-        elif name == "data":
-            return self._data
+    @property
+    def code(self):
+        return self._code
+
+    @property
+    def cid(self):
+        return self._cid
+
+    @property
+    def cid_name(self):
+        return self._cid_name
+
+    @property
+    def length(self):
+        return len(self._data)
+
+    @property
+    def data(self):
+        return self._data
 
     def __str__(self):
         desc_str = (
@@ -214,13 +242,16 @@ class L2CAP_SCH(object):
         ** Core specification 4.1
         ** [vol 3] Part A (Section 4) - Signaling Packet Formats
         """
-        code, cid, _ = ustruct.unpack(
-            L2CAP_SCH.struct_format,
-            data[:L2CAP_SCH.struct_size]
-        )
+        if not isinstance(data, memoryview):
+            data = memoryview(data)
+        code, cid, _ = ustruct.unpack_from(L2CAP_SCH.struct_format, data)
         data = data[L2CAP_SCH.struct_size:]
         return L2CAP_SCH(code, cid, data)
 
+    def copy(self):
+        """L2CAP_SCH owning a copy of its data"""
+        return L2CAP_SCH(self._code, self._cid, bytes(self._data))
+
     def to_buffer(self):
         """
         Get data string
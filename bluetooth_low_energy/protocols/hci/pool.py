@@ -0,0 +1,295 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0103
+# pylint: disable=C0111
+import uctypes
+
+from bluetooth_low_energy.protocols.hci import HCI_READ_PACKET_SIZE
+from bluetooth_low_energy.protocols.hci.event import (
+    EVT_CMD_COMPLETE,
+    EVT_LE_META_EVENT,
+    EVT_VENDOR,
+    HCI_EVENT,
+    HCI_EVENTS)
+
+"""
+Preallocated receive buffers
+
+Every packet read from the controller is stored in one of a fixed set of
+buffers handed out round-robin. The memoryview of the filled slice is cached
+per buffer and per length, so once every packet length was seen the receive
+path does not touch the heap anymore and can run under heap_lock().
+
+A memoryview returned by the pool is only valid until the same buffer is
+handed out again, that is after PacketPool.count further reads: consumers
+that keep the data must copy it (bytes(view)).
+"""
+
+
+class PacketBuffer(object):
+    """PacketBuffer"""
+
+    def __init__(self, size=HCI_READ_PACKET_SIZE):
+        self.buffer = bytearray(size)
+        self.size = size
+        self._views = {}
+
+    def view(self, length):
+        """Return a memoryview of the first length bytes"""
+        view = self._views.get(length)
+        if view is None:
+            view = memoryview(self.buffer)[:length]
+            self._views[length] = view
+        return view
+
+
+class PacketPool(object):
+    """PacketPool"""
+
+    def __init__(self, count=4, size=HCI_READ_PACKET_SIZE):
+        self._buffers = [PacketBuffer(size) for _ in range(count)]
+        self._index = 0
+        self.count = count
+        self.size = size
+
+    def next(self):
+        """Return the next buffer, round-robin"""
+        buf = self._buffers[self._index]
+        self._index += 1
+        if self._index == self.count:
+            self._index = 0
+        return buf
+
+    def prime(self, lengths=None):
+        """
+        Cache the views for the given packet lengths (default: all of them)
+        so that the first packets are not allocated either
+        """
+        if lengths is None:
+            lengths = range(1, self.size + 1)
+        for length in lengths:
+            for buf in self._buffers:
+                buf.view(length)
+
+
+class PacketRing(PacketPool):
+    """
+    Single producer / single consumer ring of receive buffers
+
+    The producer (a scheduled IRQ handler) only moves the head, the consumer
+    only moves the tail, so no lock is needed. A packet returned by get()
+    is not overwritten before `guard` further get() calls.
+    """
+
+    def __init__(self, count=8, size=HCI_READ_PACKET_SIZE, guard=2):
+        if count < guard + 2:
+            raise ValueError("count")
+        super(PacketRing, self).__init__(count=count, size=size)
+        self._views = [None] * count
+        self._head = 0
+        self._tail = 0
+        self.capacity = count - 1 - guard
+        self.overflows = 0
+
+    def __len__(self):
+        return (self._head - self._tail) % self.count
+
+    def reserve(self):
+        """Return the buffer to fill or None if the ring is full"""
+        if (self._head - self._tail) % self.count >= self.capacity:
+            self.overflows += 1
+            return None
+        return self._buffers[self._head]
+
+    def commit(self, view):
+        """Publish the view of the buffer returned by reserve()"""
+        self._views[self._head] = view
+        self._head = (self._head + 1) % self.count
+
+    def clear(self):
+        """Drop every packet"""
+        self._tail = self._head
+
+    def get(self):
+        """Return the oldest packet or None if the ring is empty"""
+        if self._head == self._tail:
+            return None
+        view = self._views[self._tail]
+        self._tail = (self._tail + 1) % self.count
+        return view
+
+    def take(self, match):
+        """
+        Remove and return the oldest packet for which match(packet) is
+        true, None if there is none; the other packets keep their order
+        """
+        index = self._tail
+        while index != self._head:
+            if match(self._views[index]):
+                break
+            index = (index + 1) % self.count
+        else:
+            return None
+        view = self._views[index]
+        buf = self._buffers[index]
+        # the older packets move up by one slot, along with their buffer
+        while index != self._tail:
+            previous = (index - 1) % self.count
+            self._views[index] = self._views[previous]
+            self._buffers[index] = self._buffers[previous]
+            index = previous
+        self._views[index] = None
+        self._buffers[index] = buf
+        self._tail = (self._tail + 1) % self.count
+        return view
+
+
+"""
+Pooled event records
+
+The event loop decodes every dispatched event into an EventRecord taken
+from an EventPool and gives it back once the handlers return. A record
+copies the packet into its own buffer, so the views of the parameters and
+the uctypes.struct of each event type are built the first time and reused
+by the next events: in the steady state dispatching an event allocates
+nothing (no HCI_UART, HCI_EVENT, memoryview or uctypes.struct).
+
+A record is overwritten by the next event, a handler that keeps it calls
+retain() (the pool builds a new record in its place) or keeps a copy().
+"""
+
+
+class EventRecord(HCI_EVENT):
+    """EventRecord"""
+
+    __slots__ = (
+        "_buffer",
+        "_start",
+        "_views",
+        "_structs",
+        "_retained")
+
+    def __init__(self, size=HCI_READ_PACKET_SIZE, module=None):
+        # placeholder until load()
+        super(EventRecord, self).__init__(
+            EVT_CMD_COMPLETE, b'', module=module)
+        self._buffer = bytearray(size)
+        self._start = None
+        self._views = {}
+        self._structs = {}
+        self._retained = False
+
+    def _view(self, start, length):
+        key = length << 3 | start
+        view = self._views.get(key)
+        if view is None:
+            view = memoryview(self._buffer)[start:start + length]
+            self._views[key] = view
+        return view
+
+    def load(self, packet):
+        """Decode the H4 event packet into the record, return the record"""
+        evtcode = packet[1]
+        if evtcode not in HCI_EVENTS:
+            raise KeyError(evtcode)
+        count = len(packet)
+        if count > len(self._buffer):
+            raise ValueError("size")
+        self._buffer[:count] = packet
+        length = count - 3
+        self._evtcode = evtcode
+        self._raw = self._view(3, length)
+        if evtcode == EVT_LE_META_EVENT:
+            self._start = 4
+        elif evtcode == EVT_VENDOR:
+            self._start = 5
+        else:
+            self._start = 3
+        self._data = None
+        self._subevtname = None
+        self._descriptor = None
+        self._struct = None
+        self._retained = False
+        return self
+
+    def retain(self):
+        """Keep the record after the handlers return, it is not reused"""
+        self._retained = True
+        return self
+
+    @property
+    def retained(self):
+        return self._retained
+
+    @property
+    def data(self):
+        if self._data is None:
+            self._data = self._view(
+                self._start, len(self._raw) + 3 - self._start)
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        # a view of the record buffer keeps its structs cached
+        offset = uctypes.addressof(value) - uctypes.addressof(self._buffer)
+        self._start = offset if 0 <= offset < len(self._buffer) else None
+        self._data = value
+        self._struct = None
+
+    @property
+    def struct(self):
+        if self._struct is None:
+            if self._subevtname is None:
+                self._resolve()
+            # shared by the records, see table.expand()
+            descriptor = self._descriptor
+            if descriptor is None:
+                return None
+            data = self.data
+            if self._start is None:
+                self._struct = uctypes.struct(
+                    uctypes.addressof(data), descriptor,
+                    uctypes.LITTLE_ENDIAN)
+                return self._struct
+            structs = self._structs.get(self._start)
+            if structs is None:
+                structs = {}
+                self._structs[self._start] = structs
+            struct = structs.get(id(descriptor))
+            if struct is None:
+                struct = uctypes.struct(
+                    uctypes.addressof(data), descriptor,
+                    uctypes.LITTLE_ENDIAN)
+                structs[id(descriptor)] = struct
+            self._struct = struct
+        return self._struct
+
+
+class EventPool(object):
+    """EventPool"""
+
+    def __init__(self, count=2, size=HCI_READ_PACKET_SIZE, module=None):
+        self._free = [EventRecord(size, module) for _ in range(count)]
+        self.size = size
+        self.module = module
+        self.records = count
+        self.retained = 0
+
+    def acquire(self, packet):
+        """Return a record holding the H4 event packet"""
+        if self._free:
+            record = self._free.pop()
+        else:
+            record = EventRecord(self.size, self.module)
+            self.records += 1
+        try:
+            return record.load(packet)
+        except (KeyError, ValueError):
+            self._free.append(record)
+            raise
+
+    def release(self, record):
+        """Give back a record, unless it was retained"""
+        if record.retained:
+            self.retained += 1
+        else:
+            self._free.append(record)
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0103
+# pylint: disable=C0111
+import utime
+
+"""
+HCI command flow control
+Core specification 4.1 [vol 2] Part E (Section 4.4) - Command Flow Control
+
+The controller tells the host how many commands it accepts through the
+Num_HCI_Command_Packets (ncmd) field of every EVT_CMD_COMPLETE and
+EVT_CMD_STATUS; after a reset the host may send one command. Commands are
+queued, sent while credits are left and matched back to their completion
+by opcode, oldest first. A completion with opcode 0x0000 only updates the
+credits.
+
+Every command has its own timeout, counted from the time it was sent (see
+expired()): a batch of commands is not bounded by a single deadline. The
+credit of a timed out command comes back with the next ncmd update, unless
+the controller stalled (see expire()).
+"""
+
+
+class HCI_COMMAND_SCHEDULER(object):
+    """HCI_COMMAND_SCHEDULER"""
+
+    def __init__(self, credits=1):
+        self.credits = credits
+        self.max_in_flight = 0
+        self._queue = []
+        self._pending = []
+        # ticks_ms() each command in flight was sent, as _pending
+        self._sent = []
+        # completions read before each command in flight was sent
+        self._seen = []
+        self._completions = 0
+        self._updated = utime.ticks_ms()
+
+    def __len__(self):
+        return len(self._queue) + len(self._pending)
+
+    def reset(self, credits=1):
+        """Forget every command, as after a controller reset"""
+        self.credits = credits
+        self._queue = []
+        self._pending = []
+        self._sent = []
+        self._seen = []
+        self._updated = utime.ticks_ms()
+
+    def submit(self, cmd):
+        """Queue cmd, it is sent by the next() caller"""
+        self._queue.append(cmd)
+
+    def next(self):
+        """
+        Return the next command to send, None if the queue is empty or no
+        credit is left. The command is accounted as in flight.
+        """
+        if not self.credits or not self._queue:
+            return None
+        cmd = self._queue.pop(0)
+        self.credits -= 1
+        self._pending.append(cmd)
+        self._sent.append(utime.ticks_ms())
+        self._seen.append(self._completions)
+        if len(self._pending) > self.max_in_flight:
+            self.max_in_flight = len(self._pending)
+        return cmd
+
+    def complete(self, opcode, ncmd):
+        """
+        Update the credits and return the oldest command in flight with
+        opcode, None for a credit only update or an unknown opcode
+        """
+        self.credits = ncmd
+        self._completions += 1
+        self._updated = utime.ticks_ms()
+        if opcode:
+            for index, cmd in enumerate(self._pending):
+                if cmd.opcode == opcode:
+                    del self._sent[index]
+                    del self._seen[index]
+                    return self._pending.pop(index)
+        return None
+
+    def remove(self, cmd):
+        """
+        Stop waiting for cmd (completed by another event), the credits
+        are the ones of the last ncmd update
+        """
+        if cmd in self._pending:
+            index = self._pending.index(cmd)
+            del self._sent[index]
+            del self._seen[index]
+            self._pending.remove(cmd)
+        elif cmd in self._queue:
+            self._queue.remove(cmd)
+
+    def expire(self, cmd):
+        """
+        Stop waiting for cmd, timed out. Its credit is given back only if
+        no completion was read since it was sent: a stalled controller
+        would never update ncmd again and leave every later command
+        queued. Otherwise the next ncmd update tells the credits.
+        """
+        if cmd in self._pending:
+            stalled = self._seen[self._pending.index(cmd)] == \
+                self._completions
+            self.remove(cmd)
+            if stalled:
+                self.credits += 1
+        else:
+            self.remove(cmd)
+
+    def expired(self, timeout, now=None):
+        """
+        The oldest command in flight for more than timeout ms, else the
+        oldest one waiting that long for a credit (no completion read in
+        the meantime), None if there is none
+        """
+        if now is None:
+            now = utime.ticks_ms()
+        if self._pending:
+            if utime.ticks_diff(now, self._sent[0]) > timeout:
+                return self._pending[0]
+        elif self._queue and utime.ticks_diff(now, self._updated) > timeout:
+            return self._queue[0]
+        return None
+
+    def is_queued(self, cmd):
+        """True while cmd waits for a credit"""
+        return cmd in self._queue
+
+    def is_pending(self, cmd):
+        """True until the completion of cmd is matched"""
+        return cmd in self._pending or cmd in self._queue
+
+
+"""
+HCI ACL data flow control
+Core specification 4.1 [vol 2] Part E (Section 4.1.1) - Packet-based Data
+Flow Control
+
+The controller has max_pkt buffers of pkt_len bytes (LE_READ_BUFFER_SIZE),
+every ACL packet sent takes one of them until EVT_NUM_COMP_PKTS reports it
+completed for its connection handle; the buffers of a connection are freed
+by its disconnection. PDUs are queued as iterators of (header, data)
+fragments (ACL_FRAGMENTER.fragments()), next() hands out one fragment per
+credit in submission order.
+"""
+
+
+class HCI_ACL_SCHEDULER(object):
+    """HCI_ACL_SCHEDULER"""
+
+    def __init__(self, max_pkt=0):
+        self.max_pkt = max_pkt
+        self.credits = max_pkt
+        self.sent = 0
+        self.max_queued = 0
+        # [handle, fragments, remaining]
+        self._queue = []
+        self._in_flight = {}
+
+    def __len__(self):
+        return len(self._queue)
+
+    def reset(self, max_pkt=None):
+        """Forget every packet, as after a controller reset"""
+        if max_pkt is not None:
+            self.max_pkt = max_pkt
+        self.credits = self.max_pkt
+        self._queue = []
+        self._in_flight = {}
+
+    def submit(self, handle, fragments, count):
+        """Queue the count fragments of a PDU on handle"""
+        self._queue.append([handle, fragments, count])
+        if len(self._queue) > self.max_queued:
+            self.max_queued = len(self._queue)
+
+    def next(self):
+        """
+        Return the (handle, header, data) of the next fragment to send,
+        None if the queue is empty or no credit is left. The fragment is
+        accounted as in the controller buffers.
+        """
+        if not self.credits or not self._queue:
+            return None
+        entry = self._queue[0]
+        handle = entry[0]
+        header, data = next(entry[1])
+        entry[2] -= 1
+        if not entry[2]:
+            self._queue.pop(0)
+        self.credits -= 1
+        self.sent += 1
+        self._in_flight[handle] = self._in_flight.get(handle, 0) + 1
+        return handle, header, data
+
+    def complete(self, handle, count):
+        """Give back the buffers of count packets completed on handle"""
+        in_flight = self._in_flight.get(handle, 0)
+        if count > in_flight:
+            count = in_flight
+        if count == in_flight:
+            self._in_flight.pop(handle, None)
+        else:
+            self._in_flight[handle] = in_flight - count
+        self.credits += count
+
+    def disconnect(self, handle):
+        """Free the buffers and drop the PDUs queued for handle"""
+        self.credits += self._in_flight.pop(handle, 0)
+        self._queue = [entry for entry in self._queue if entry[0] != handle]
+
+    def in_flight(self, handle=None):
+        """Packets not completed yet on handle (all of them if None)"""
+        if handle is None:
+            return sum(self._in_flight.values())
+        return self._in_flight.get(handle, 0)
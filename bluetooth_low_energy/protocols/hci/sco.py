@@ -22,34 +22,77 @@ HCI_SCO_STRUCT = {
 }
 
 
+class SCO_HEADER(object):
+    """
+    SCO_HEADER
+
+    Shift/mask codec of the 3 bytes SCO header, in place in a caller
+    provided buffer.
+    """
+    size = 3
+
+    @staticmethod
+    def pack_into(buf, offset, handle, ps=0, xx=0, length=0):
+        """pack_into"""
+        buf[offset] = handle & 0xff
+        buf[offset + 1] = (handle >> 8) & 0x0f | (ps & 0x03) << 4 | \
+            (xx & 0x03) << 6
+        buf[offset + 2] = length & 0xff
+
+    @staticmethod
+    def unpack_from(buf, offset=0):
+        """Return handle, ps, xx, length"""
+        flags = buf[offset + 1]
+        return (
+            buf[offset] | (flags & 0x0f) << 8,
+            (flags >> 4) & 0x03,
+            flags >> 6,
+            buf[offset + 2]
+        )
+
+
 class HCI_SCO(object):
     """HCI_SCO"""
     struct_format = "<HB"
     struct_size = ustruct.calcsize(struct_format)
 
+    __slots__ = (
+        "_handle",
+        "_ps",
+        "_xx",
+        "_data")
+
     def __init__(self, handle, ps=0, xx=0, data=b''):
-        bin_str = "{:016b}{:02b}{:02b}{:012b}".format(
-            len(data) if data else 0, xx, ps, handle
-        )
         self._handle = handle
         self._ps = ps
         self._xx = xx
-        self._tobytes = int(bin_str, 2)
         self._data = data
 
-    def __getattr__(self, name):
-        if name == "handle":
-            return self._handle
-        elif name == "ps":
-            return self._ps
-        elif name == "xx":
-            return self._xx
-        elif name == "tobytes":
-            return self._tobytes
-        elif name == "length":
-            return len(self._data)
-        elif name == "data":
-            return self._data
+    @property
+    def handle(self):
+        return self._handle
+
+    @property
+    def ps(self):
+        return self._ps
+
+    @property
+    def xx(self):
+        return self._xx
+
+    @property
+    def tobytes(self):
+        return (
+            self._handle & 0x0fff | (self._ps & 0x03) << 12 |
+            (self._xx & 0x03) << 14 | len(self._data) << 16)
+
+    @property
+    def length(self):
+        return len(self._data)
+
+    @property
+    def data(self):
+        return self._data
 
     def __str__(self):
         desc_str = (
@@ -77,16 +120,22 @@ class HCI_SCO(object):
         ** [vol 2] Part E (Section 5) - HCI Data Formats
         ** [vol 2] Part E (Section 5.4) - Exchange of HCI-specific information
         """
-        hci_sco = uctypes.struct(
-            uctypes.addressof(data[:HCI_SCO.struct_size]),
-            HCI_SCO_STRUCT,
-            uctypes.LITTLE_ENDIAN
-        )
+        if not isinstance(data, memoryview):
+            data = memoryview(data)
+        handle, ps, xx, _ = SCO_HEADER.unpack_from(data)
         data = data[HCI_SCO.struct_size:]
-        return HCI_SCO(hci_sco.handle, hci_sco.ps, hci_sco.xx, data)
+        return HCI_SCO(handle, ps, xx, data)
+
+    def copy(self):
+        """HCI_SCO owning a copy of its data"""
+        return HCI_SCO(self._handle, self._ps, self._xx, bytes(self._data))
 
     def to_buffer(self):
         """
         Get data string
         """
-        return ustruct.pack(self.struct_format, self.tobytes) + self.data
+        buf = bytearray(SCO_HEADER.size + len(self._data))
+        SCO_HEADER.pack_into(
+            buf, 0, self._handle, self._ps, self._xx, len(self._data))
+        buf[SCO_HEADER.size:] = self._data
+        return bytes(buf)
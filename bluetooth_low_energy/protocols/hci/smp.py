@@ -44,20 +44,31 @@ class SMP(object):
     struct_format = "<B"
     struct_size = ustruct.calcsize(struct_format)
 
+    __slots__ = (
+        "_code",
+        "_code_name",
+        "_data")
+
     def __init__(self, code, data=b''):
         self._code = code
         self._code_name = SMP_PDUS[code]
         self._data = data
 
-    def __getattr__(self, name):
-        if name == "code":
-            return self._code
-        elif name == "code_name":
-            return self._code_name
-        elif name == "length":
-            return len(self._data)
-        elif name == "data":
-            return self._data
+    @property
+    def code(self):
+        return self._code
+
+    @property
+    def code_name(self):
+        return self._code_name
+
+    @property
+    def length(self):
+        return len(self._data)
+
+    @property
+    def data(self):
+        return self._data
 
     def __str__(self):
         desc_str = (
@@ -87,10 +98,16 @@ class SMP(object):
             ** Core specification 4.1
             ** [vol 3] Part H (Section 3.3) - Command Format
         """
-        code = ustruct.unpack(SMP.struct_format, data[:SMP.struct_size])[0]
+        if not isinstance(data, memoryview):
+            data = memoryview(data)
+        code = data[0]
         data = data[SMP.struct_size:]
         return SMP(code, data)
 
+    def copy(self):
+        """SMP owning a copy of its data"""
+        return SMP(self._code, bytes(self._data))
+
     def to_buffer(self):
         """
         Get data string
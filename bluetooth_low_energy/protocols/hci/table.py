@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0103
+# pylint: disable=C0111
+import uctypes
+
+"""
+Descriptor tables
+
+The tables of commands and events (HCI_COMMANDS, HCI_EVENTS,
+HCI_LE_META_EVENTS and the vendor specific ones) map codes to tuples of
+names and compact descriptors, constant strings of space separated fields:
+
+    "status:B@0 handle:H@1 bdaddr:6B@3 hndl:30{hndl:H@0 len:H@2}@1"
+
+name:format@offset, format being a ustruct type (B b H h I i Q q), an array
+of count of them (6B) or an array of count structs ({fields}). A
+descriptor depending on the module is a tuple of (module, descriptor)
+pairs, a None descriptor has no fields. Being made of constants only, the
+tables are frozen into the firmware (mpy-cross, manifest) as they are:
+expand() builds the uctypes descriptor of a compact one once, on first use.
+
+Commands and events index a Descriptors, the variants of one module
+resolved once: DESCRIPTORS unless given a module, bound to the module of
+the controller by BlueNRG_MS.detect_module().
+
+A LazyTable stands for the {code: descriptors} dict of HCI_COMMANDS (ocf)
+or HCI_VENDOR_EVENTS (subevtcode): the descriptors are split by group into
+modules defining DESCRIPTORS, a module being imported (and its entries
+kept) the first time one of its codes is looked up. A code outside of the
+groups, or not in the DESCRIPTORS of its group, raises KeyError as a dict
+would.
+"""
+
+_OFFSET_MASK = 0x1FFFF
+_TYPES = {
+    "B": uctypes.UINT8,
+    "b": uctypes.INT8,
+    "H": uctypes.UINT16,
+    "h": uctypes.INT16,
+    "I": uctypes.UINT32,
+    "i": uctypes.INT32,
+    "Q": uctypes.UINT64,
+    "q": uctypes.INT64
+}
+_TYPE_CODES = dict((value, code) for code, value in _TYPES.items())
+
+# compact descriptor: uctypes descriptor
+_DESCRIPTORS = {}
+
+
+def _fields(spec):
+    # fields of spec, the spaces of a {struct} excluded
+    start = depth = 0
+    for index, char in enumerate(spec):
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+        elif char == " " and not depth:
+            if index > start:
+                yield spec[start:index]
+            start = index + 1
+    if len(spec) > start:
+        yield spec[start:]
+
+
+def _parse(spec):
+    descriptor = {}
+    for field in _fields(spec):
+        colon = field.find(":")
+        at = field.rfind("@")
+        name = field[:colon]
+        code = field[colon + 1:at]
+        offset = int(field[at + 1:])
+        if code[-1] == "}":
+            brace = code.find("{")
+            descriptor[name] = (
+                uctypes.ARRAY | offset, int(code[:brace]),
+                _parse(code[brace + 1:-1]))
+        elif len(code) > 1:
+            descriptor[name] = (
+                uctypes.ARRAY | offset, _TYPES[code[-1]] | int(code[:-1]))
+        else:
+            descriptor[name] = _TYPES[code] | offset
+    return descriptor
+
+
+def expand(spec, module="IDB05A1"):
+    """
+    uctypes descriptor of the compact descriptor spec (its variant for
+    module, the first one if module has none), None if spec is None. The
+    descriptor is built once and shared, it must not be modified.
+    """
+    if spec is None:
+        return None
+    if isinstance(spec, tuple):
+        variants = spec
+        spec = variants[0][1]
+        for name, variant in variants:
+            if name == module:
+                spec = variant
+                break
+        if spec is None:
+            return None
+    descriptor = _DESCRIPTORS.get(spec)
+    if descriptor is None:
+        descriptor = _parse(spec)
+        _DESCRIPTORS[spec] = descriptor
+    return descriptor
+
+
+class Descriptors(object):
+    """
+    uctypes descriptors of the compact ones for module, descriptors[spec]
+    is expand(spec, module) (None for a None spec), cached per spec
+    """
+    __slots__ = ("module", "_cache")
+
+    def __init__(self, module="IDB05A1"):
+        self.module = module
+        self._cache = {}
+
+    def __repr__(self):
+        return "<Descriptors module={:s} {:d} cached>".format(
+            self.module, len(self._cache))
+
+    def bind(self, module):
+        """Resolve the variants of module from now on"""
+        if module != self.module:
+            self.module = module
+            self._cache = {}
+
+    def __getitem__(self, spec):
+        try:
+            return self._cache[spec]
+        except KeyError:
+            descriptor = expand(spec, self.module)
+            self._cache[spec] = descriptor
+            return descriptor
+
+
+# descriptors of the controller in use, see Descriptors.bind()
+DESCRIPTORS = Descriptors()
+_MODULES = {}
+
+
+def descriptors(module=None):
+    """
+    Descriptors of module (a module name or a Descriptors), DESCRIPTORS if
+    None: the module bound at the time of the lookup
+    """
+    if module is None:
+        return DESCRIPTORS
+    if isinstance(module, Descriptors):
+        return module
+    bound = _MODULES.get(module)
+    if bound is None:
+        bound = Descriptors(module)
+        _MODULES[module] = bound
+    return bound
+
+
+def _compact_field(name, field):
+    if not isinstance(field, tuple):
+        return "{:s}:{:s}@{:d}".format(
+            name, _TYPE_CODES[field & ~_OFFSET_MASK], field & _OFFSET_MASK)
+    offset = field[0] & _OFFSET_MASK
+    if len(field) == 3:
+        return "{:s}:{:d}{{{:s}}}@{:d}".format(
+            name, field[1], compact(field[2]), offset)
+    return "{:s}:{:d}{:s}@{:d}".format(
+        name, field[1] & _OFFSET_MASK,
+        _TYPE_CODES[field[1] & ~_OFFSET_MASK], offset)
+
+
+def compact(descriptor):
+    """Compact descriptor of a uctypes descriptor, the inverse of expand()"""
+    if descriptor is None:
+        return None
+    values = list(descriptor.values())
+    if values and all(value is None or isinstance(value, dict)
+                      for value in values):
+        return tuple((module, compact(variant))
+                     for module, variant in descriptor.items())
+    return " ".join(_compact_field(name, field)
+                    for name, field in descriptor.items())
+
+
+class LazyTable(object):
+    """
+    Mapping of codes to descriptors, imported by group on first use
+
+    package: package of the group modules
+    groups: (first, last, module) tuples, module defines the DESCRIPTORS
+    of the codes first..last
+    """
+    __slots__ = ("_groups", "_table")
+
+    def __init__(self, package="", groups=()):
+        self._groups = [
+            (first, last, package + "." + module if package else module)
+            for first, last, module in groups]
+        self._table = {}
+
+    def __repr__(self):
+        return "<LazyTable {:d} groups, {:d} loaded>".format(
+            len(self._groups), len(self.loaded()))
+
+    def _load(self, code):
+        for group in self._groups:
+            if group[0] <= code <= group[1]:
+                if group[2] is None:
+                    # loaded, without code
+                    break
+                self._import(group)
+                return self._table[code]
+        raise KeyError(code)
+
+    def _import(self, group):
+        module = __import__(group[2], None, None, ("DESCRIPTORS",))
+        self._table.update(module.DESCRIPTORS)
+        # loaded once, looked up in _table from now on
+        self._groups.remove(group)
+        self._groups.append((group[0], group[1], None))
+
+    def __getitem__(self, code):
+        value = self._table.get(code)
+        if value is None:
+            value = self._load(code)
+        return value
+
+    def get(self, code, default=None):
+        """get"""
+        try:
+            return self[code]
+        except KeyError:
+            return default
+
+    def __contains__(self, code):
+        return self.get(code) is not None
+
+    def load(self):
+        """Import every group, as the eager dict did"""
+        for group in list(self._groups):
+            if group[2] is not None:
+                self._import(group)
+
+    def loaded(self):
+        """Codes ranges of the groups imported so far"""
+        return [(group[0], group[1])
+                for group in self._groups if group[2] is None]
+
+    def update(self, other):
+        """Add the groups of the LazyTable other, or the entries of a dict"""
+        if isinstance(other, LazyTable):
+            self._groups.extend(other._groups)
+            self._table.update(other._table)
+        else:
+            self._table.update(other)
+
+    def __len__(self):
+        self.load()
+        return len(self._table)
+
+    def __iter__(self):
+        self.load()
+        return iter(self._table)
+
+    def keys(self):
+        """keys"""
+        self.load()
+        return self._table.keys()
+
+    def values(self):
+        """values"""
+        self.load()
+        return self._table.values()
+
+    def items(self):
+        """items"""
+        self.load()
+        return self._table.items()
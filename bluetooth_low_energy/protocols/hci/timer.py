@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0103
+# pylint: disable=C0111
+import utime
+
+"""
+Timers of the event loop
+
+A TimerWheel keeps one-shot and periodic timers in `slots` lists, a timer
+being hashed into the slot of the tick (tick_ms) of its deadline. advance()
+only visits the slots of the ticks elapsed since the previous call (every
+slot at most once however long that was), and returns at once while the
+earliest deadline is not reached, so it can be called on every iteration
+of the event loop.
+
+Periodic timers are drift free: the next deadline is the previous one plus
+the period, not the time of the call plus the period. A timer late by
+more than a period skips the deadlines it missed (counted in `missed`)
+rather than firing in a burst. The lateness of every call is kept per timer
+(max and total, in ms) as a measure of the jitter of the loop.
+"""
+
+
+class Timer(object):
+    """Timer, see TimerWheel.call_later() and TimerWheel.call_every()"""
+
+    __slots__ = (
+        "callback",
+        "period",
+        "deadline",
+        "fired",
+        "missed",
+        "late_max",
+        "late_total",
+        "_slot")
+
+    def __init__(self, callback, deadline, period=0):
+        self.callback = callback
+        self.period = period
+        self.deadline = deadline
+        self.fired = 0
+        self.missed = 0
+        self.late_max = 0
+        self.late_total = 0
+        self._slot = None
+
+    def __repr__(self):
+        return "<Timer period={:d} fired={:d} missed={:d}>".format(
+            self.period, self.fired, self.missed)
+
+    @property
+    def active(self):
+        return self._slot is not None
+
+    def stats(self):
+        """Calls, missed deadlines and lateness (ms) of the calls"""
+        return {
+            "fired": self.fired,
+            "missed": self.missed,
+            "late_max_ms": self.late_max,
+            "late_avg_ms": (
+                self.late_total // self.fired if self.fired else 0)
+        }
+
+
+class TimerWheel(object):
+    """TimerWheel"""
+
+    def __init__(self, slots=32, tick_ms=10):
+        if slots < 1 or tick_ms < 1:
+            raise ValueError("slots")
+        self._slots = [[] for _ in range(slots)]
+        self._cursor = 0
+        self._last = utime.ticks_ms()
+        self._next = None
+        self._count = 0
+        self.count = slots
+        self.tick_ms = tick_ms
+
+    def __len__(self):
+        return self._count
+
+    def _add(self, timer):
+        if not self._count:
+            self._last = utime.ticks_ms()
+        ticks = utime.ticks_diff(timer.deadline, self._last) // self.tick_ms
+        slot = (self._cursor + max(ticks, 0)) % self.count
+        self._slots[slot].append(timer)
+        timer._slot = slot
+        self._count += 1
+        # _next is None while unknown, see next_deadline()
+        if self._count == 1:
+            self._next = timer.deadline
+        elif self._next is not None and \
+                utime.ticks_diff(timer.deadline, self._next) < 0:
+            self._next = timer.deadline
+
+    def call_later(self, delay_ms, callback):
+        """Call callback() once in delay_ms, return the Timer"""
+        timer = Timer(
+            callback, utime.ticks_add(utime.ticks_ms(), delay_ms))
+        self._add(timer)
+        return timer
+
+    def call_every(self, period_ms, callback, delay_ms=None):
+        """
+        Call callback() every period_ms, the first time in delay_ms
+        (default period_ms), return the Timer
+        """
+        if period_ms < 1:
+            raise ValueError("period_ms")
+        if delay_ms is None:
+            delay_ms = period_ms
+        timer = Timer(
+            callback, utime.ticks_add(utime.ticks_ms(), delay_ms), period_ms)
+        self._add(timer)
+        return timer
+
+    def cancel(self, timer):
+        """Stop timer, nothing happens if it is not active"""
+        if timer._slot is None:
+            return
+        self._slots[timer._slot].remove(timer)
+        timer._slot = None
+        self._count -= 1
+        if timer.deadline == self._next:
+            self._next = None
+
+    def clear(self):
+        """Stop every timer"""
+        for timers in self._slots:
+            for timer in timers:
+                timer._slot = None
+            del timers[:]
+        self._count = 0
+        self._next = None
+
+    def next_deadline(self):
+        """ticks_ms() of the earliest deadline, None without timers"""
+        if self._next is None and self._count:
+            for timers in self._slots:
+                for timer in timers:
+                    if self._next is None or utime.ticks_diff(
+                            timer.deadline, self._next) < 0:
+                        self._next = timer.deadline
+        return self._next
+
+    def advance(self, now=None):
+        """Call the timers due at now (default ticks_ms()), return how many"""
+        if not self._count:
+            return 0
+        if now is None:
+            now = utime.ticks_ms()
+        deadline = self.next_deadline()
+        if utime.ticks_diff(now, deadline) < 0:
+            return 0
+        steps = utime.ticks_diff(now, self._last) // self.tick_ms
+        if steps < 0:
+            steps = 0
+        due = []
+        for step in range(min(steps + 1, self.count)):
+            timers = self._slots[(self._cursor + step) % self.count]
+            for timer in list(timers):
+                if utime.ticks_diff(now, timer.deadline) >= 0:
+                    timers.remove(timer)
+                    timer._slot = None
+                    self._count -= 1
+                    due.append(timer)
+        self._cursor = (self._cursor + steps) % self.count
+        self._last = utime.ticks_add(self._last, steps * self.tick_ms)
+        self._next = None
+        for index, timer in enumerate(due):
+            late = utime.ticks_diff(now, timer.deadline)
+            timer.fired += 1
+            timer.late_total += late
+            if late > timer.late_max:
+                timer.late_max = late
+            if timer.period:
+                # drift free, the deadlines missed are skipped
+                missed = late // timer.period
+                timer.missed += missed
+                timer.deadline = utime.ticks_add(
+                    timer.deadline, (missed + 1) * timer.period)
+                self._add(timer)
+            try:
+                timer.callback()
+            except BaseException:
+                # the timers not called yet stay due
+                for pending in due[index + 1:]:
+                    self._add(pending)
+                raise
+        return len(due)
+
+    def stats(self):
+        """Active timers, their calls, missed deadlines and lateness (ms)"""
+        timers = [timer for slot in self._slots for timer in slot]
+        fired = sum(timer.fired for timer in timers)
+        return {
+            "timers": self._count,
+            "fired": fired,
+            "missed": sum(timer.missed for timer in timers),
+            "late_max_ms": max([timer.late_max for timer in timers] or [0]),
+            "late_avg_ms": (
+                sum(timer.late_total for timer in timers) // fired
+                if fired else 0)
+        }
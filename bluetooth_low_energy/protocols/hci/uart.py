@@ -3,14 +3,17 @@
 # pylint: disable=C0111
 import ustruct
 from ubinascii import hexlify, unhexlify
+from micropython import const
 
 
 from bluetooth_low_energy.protocols.hci import (
+    HCI_READ_PACKET_SIZE,
     HCI_COMMAND_PKT as COMMAND,
     HCI_ACLDATA_PKT as ACLDATA,
     HCI_SCODATA_PKT as SCODATA,
     HCI_EVENT_PKT as EVENT,
     HCI_VENDOR_PKT as VENDOR)
+from bluetooth_low_energy.protocols.hci.pool import PacketBuffer
 """
 HCI Packet types for UART Transport layer
 Core specification 4.1 [vol 4] Part A (Section 2) - Protocol
@@ -23,26 +26,57 @@ HCI_UART_PKT_TYPES = {
     VENDOR: "VENDOR"
 }
 
+"""
+Packet headers following the packet type byte
+Core specification 4.1 [vol 2] Part E (Section 5.4) - Exchange of HCI-specific
+information
+
+    COMMAND: | opcode (LE16) | length |
+    ACLDATA: | handle + flags (LE16) | length (LE16) |
+    SCODATA: | handle + flags (LE16) | length |
+    EVENT:   | event code | length |
+
+packet type: (header size, offset of the length, size of the length)
+"""
+HCI_UART_HEADERS = {
+    COMMAND: (3, 2, 1),
+    ACLDATA: (4, 2, 2),
+    SCODATA: (3, 2, 1),
+    EVENT: (2, 1, 1)
+}
+
+_FRAMER_TYPE = const(0)
+_FRAMER_HEADER = const(1)
+_FRAMER_PAYLOAD = const(2)
+_FRAMER_SKIP = const(3)
+
 
 class HCI_UART(object):
     """HCI_UART"""
     struct_format = "<B"
     struct_size = ustruct.calcsize(struct_format)
 
+    __slots__ = (
+        "_pkt_type",
+        "_pkt_type_name",
+        "_data")
+
     def __init__(self, pkt_type, data=b''):
         self._pkt_type = pkt_type
         self._pkt_type_name = HCI_UART_PKT_TYPES[pkt_type]
         self._data = data
 
-    def __getattr__(self, name):
-        if name == "pkt_type":
-            return self._pkt_type
-        elif name == "pkt_type_name":
-            return self._pkt_type_name
-        elif name == "data":
-            return self._data
-        else:
-            raise AttributeError(name)
+    @property
+    def pkt_type(self):
+        return self._pkt_type
+
+    @property
+    def pkt_type_name(self):
+        return self._pkt_type_name
+
+    @property
+    def data(self):
+        return self._data
 
     def __str__(self):
         return "<{:s} pkt_type={:s}(0x{:02x}) data={:s}>".format(
@@ -65,18 +99,133 @@ class HCI_UART(object):
         Bluetooth Host Controller, and HCI ACL/Synchronous Data Packets can be
         sent both to and from the Bluetooth Host Controller.
 
+        The data of the packet is a memoryview of data, nothing is copied:
+        copy() it to keep the packet past the reuse of the buffer.
+
         References can be found here:
         * https://www.bluetooth.org/en-us/specification/adopted-specifications
         ** Core specification 4.1
         ** [vol 4] Part A (Section 2) Protocol
         """
-        pkt_type = ustruct.unpack(
-            HCI_UART.struct_format, data[:HCI_UART.struct_size]
-        )[0]
-        return HCI_UART(pkt_type, data[HCI_UART.struct_size:])
+        if not isinstance(data, memoryview):
+            data = memoryview(data)
+        return HCI_UART(data[0], data[HCI_UART.struct_size:])
+
+    def copy(self):
+        """HCI_UART owning a copy of its data"""
+        return HCI_UART(self._pkt_type, bytes(self._data))
 
     def to_buffer(self):
         """
         Get data string
         """
         return ustruct.pack(HCI_UART.struct_format, self.pkt_type) + self.data
+
+
+class HCI_UART_FRAMER(object):
+    """
+    Incremental H4 parser for a byte stream (machine.UART, pty, ...)
+
+    consume() copies bytes of arbitrary sized chunks into a reusable buffer,
+    keeping the packet type / header / payload state across calls, and stops
+    right after a complete packet: `frame` is then a memoryview of the whole
+    H4 packet (type byte included) valid until the next call.
+
+    Bytes that are not a known packet type are skipped (sync_errors),
+    packets larger than the buffer are discarded (dropped).
+    """
+
+    def __init__(self, size=HCI_READ_PACKET_SIZE):
+        self._buf = PacketBuffer(size)
+        self.frame = None
+        self.frames = 0
+        self.dropped = 0
+        self.sync_errors = 0
+        self.reset()
+
+    def reset(self):
+        """Forget a partially received packet"""
+        self._state = _FRAMER_TYPE
+        self._pos = 0
+        self._need = 1
+        self._header = None
+
+    def consume(self, data, start=0, end=-1):
+        """
+        Parse data[start:end] up to the end of the first complete packet,
+        return the offset of the first byte not consumed.
+
+        Pass a memoryview to avoid copying the payload twice.
+        """
+        if end < 0:
+            end = len(data)
+        self.frame = None
+        buf = self._buf.buffer
+        i = start
+        while i < end:
+            state = self._state
+            if state == _FRAMER_TYPE:
+                header = HCI_UART_HEADERS.get(data[i])
+                if header is None:
+                    self.sync_errors += 1
+                else:
+                    buf[0] = data[i]
+                    self._header = header
+                    self._pos = 1
+                    self._need = 1 + header[0]
+                    self._state = _FRAMER_HEADER
+                i += 1
+                continue
+            count = self._need - self._pos
+            if count > end - i:
+                count = end - i
+            if state == _FRAMER_SKIP:
+                self._pos += count
+                i += count
+                if self._pos == self._need:
+                    self.reset()
+                continue
+            pos = self._pos
+            if count == 1:
+                buf[pos] = data[i]
+            else:
+                buf[pos:pos + count] = data[i:i + count]
+            pos += count
+            i += count
+            self._pos = pos
+            if pos < self._need:
+                continue
+            if state == _FRAMER_HEADER:
+                header_size, length_offset, length_size = self._header
+                length = buf[1 + length_offset]
+                if length_size == 2:
+                    length |= buf[2 + length_offset] << 8
+                self._need = pos + length
+                if self._need > self._buf.size:
+                    self.dropped += 1
+                    self._state = _FRAMER_SKIP
+                    continue
+                self._state = _FRAMER_PAYLOAD
+                if length:
+                    continue
+            self.frame = self._buf.view(pos)
+            self.frames += 1
+            self.reset()
+            return i
+        return i
+
+    def feed(self, data, callback):
+        """
+        Parse the whole chunk calling callback(frame) for every complete
+        packet, return the number of packets
+        """
+        data = memoryview(data)
+        frames = 0
+        start = 0
+        end = len(data)
+        while start < end:
+            start = self.consume(data, start, end)
+            if self.frame is not None:
+                frames += 1
+                callback(self.frame)
+        return frames
@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0111
+from bluetooth_low_energy.protocols.hci.vendor_specifics.st_microelectronics.bluenrg_ms.cmd import (
+    OCF_GAP_SET_NON_DISCOVERABLE,
+    OCF_GAP_SET_LIMITED_DISCOVERABLE,
+    OCF_GAP_SET_DISCOVERABLE,
+    OCF_GAP_SET_DIRECT_CONNECTABLE,
+    OCF_GAP_SET_IO_CAPABILITY,
+    OCF_GAP_SET_AUTH_REQUIREMENT,
+    OCF_GAP_SET_AUTHOR_REQUIREMENT,
+    OCF_GAP_PASSKEY_RESPONSE,
+    OCF_GAP_AUTHORIZATION_RESPONSE,
+    OCF_GAP_INIT,
+    OCF_GAP_SET_NON_CONNECTABLE,
+    OCF_GAP_SET_UNDIRECTED_CONNECTABLE,
+    OCF_GAP_SLAVE_SECURITY_REQUEST,
+    OCF_GAP_UPDATE_ADV_DATA,
+    OCF_GAP_DELETE_AD_TYPE,
+    OCF_GAP_GET_SECURITY_LEVEL,
+    OCF_GAP_SET_EVT_MASK,
+    OCF_GAP_CONFIGURE_WHITELIST,
+    OCF_GAP_TERMINATE,
+    OCF_GAP_CLEAR_SECURITY_DB,
+    OCF_GAP_ALLOW_REBOND_DB,
+    OCF_GAP_START_LIMITED_DISCOVERY_PROC,
+    OCF_GAP_START_GENERAL_DISCOVERY_PROC,
+    OCF_GAP_START_NAME_DISCOVERY_PROC,
+    OCF_GAP_START_AUTO_CONN_ESTABLISH_PROC,
+    OCF_GAP_START_GENERAL_CONN_ESTABLISH_PROC,
+    OCF_GAP_START_SELECTIVE_CONN_ESTABLISH_PROC,
+    OCF_GAP_CREATE_CONNECTION,
+    OCF_GAP_TERMINATE_GAP_PROCEDURE,
+    OCF_GAP_START_CONNECTION_UPDATE,
+    OCF_GAP_SEND_PAIRING_REQUEST,
+    OCF_GAP_RESOLVE_PRIVATE_ADDRESS,
+    OCF_GAP_SET_BROADCAST_MODE,
+    OCF_GAP_START_OBSERVATION_PROC,
+    OCF_GAP_GET_BONDED_DEVICES,
+    OCF_GAP_IS_DEVICE_BONDED)
+
+"""
+BlueNRG-MS GAP vendor specific commands (OCF 0x0080-0x00FF),
+loaded on first use by HCI_VENDOR_COMMANDS (cmd.py)
+"""
+
+DESCRIPTORS = {
+    OCF_GAP_SET_NON_DISCOVERABLE: (
+        "GAP_SET_NON_DISCOVERABLE",
+        None,
+        "status:B@0"
+    ),
+    OCF_GAP_SET_LIMITED_DISCOVERABLE: (
+        "GAP_SET_LIMITED_DISCOVERABLE",
+        None,
+        "status:B@0"
+    ),
+    OCF_GAP_SET_DISCOVERABLE: (
+        "GAP_SET_DISCOVERABLE",
+        None,
+        "status:B@0"
+    ),
+    OCF_GAP_SET_DIRECT_CONNECTABLE: (
+        "GAP_SET_DIRECT_CONNECTABLE",
+        (
+            (
+                "IDB05A1",
+                "own_bdaddr_type:B@0 directed_adv_type:B@1 "
+                "direct_bdaddr_type:B@2 direct_bdaddr:6B@3 adv_interv_min:H@9 "
+                "adv_interv_max:H@11"
+            ),
+            (
+                "IDB04A1",
+                "own_bdaddr_type:B@0 direct_bdaddr_type:B@1 direct_bdaddr:6B@2"
+            )
+        ),
+        "status:B@0"
+    ),
+    OCF_GAP_SET_IO_CAPABILITY: (
+        "GAP_SET_IO_CAPABILITY",
+        "io_capability:B@0",
+        "status:B@0"
+    ),
+    OCF_GAP_SET_AUTH_REQUIREMENT: (
+        "GAP_SET_AUTH_REQUIREMENT",
+        "mitm_mode:B@0 oob_enable:B@1 oob_data:16B@2 "
+        "min_encryption_key_size:B@18 max_encryption_key_size:B@19 "
+        "use_fixed_pin:B@20 fixed_pin:I@21 bonding_mode:B@25",
+        "status:B@0"
+    ),
+    OCF_GAP_SET_AUTHOR_REQUIREMENT: (
+        "GAP_SET_AUTHOR_REQUIREMENT",
+        "conn_handle:H@0 authorization_enable:B@2",
+        "status:B@0"
+    ),
+    OCF_GAP_PASSKEY_RESPONSE: (
+        "GAP_PASSKEY_RESPONSE",
+        "conn_handle:H@0 passkey:I@2",
+        "status:B@0"
+    ),
+    OCF_GAP_AUTHORIZATION_RESPONSE: (
+        "GAP_AUTHORIZATION_RESPONSE",
+        "conn_handle:H@0 authorize:B@2",
+        "status:B@0"
+    ),
+    OCF_GAP_INIT: (
+        "GAP_INIT",
+        (
+            (
+                "IDB05A1",
+                "role:B@0 privacy_enabled:B@1 device_name_char_len:B@2"
+            ),
+            ("IDB04A1", "role:B@0")
+        ),
+        "status:B@0 service_handle:H@1 dev_name_char_handle:H@3 "
+        "appearance_char_handle:H@5"
+    ),
+    OCF_GAP_SET_NON_CONNECTABLE: (
+        "GAP_SET_NON_CONNECTABLE",
+        (
+            ("IDB05A1", "advertising_event_type:B@0 own_address_type:B@1"),
+            ("IDB04A1", "advertising_event_type:B@0")
+        ),
+        "status:B@0"
+    ),
+    OCF_GAP_SET_UNDIRECTED_CONNECTABLE: (
+        "GAP_SET_UNDIRECTED_CONNECTABLE",
+        "adv_filter_policy:B@0 own_addr_type:B@1",
+        "status:B@0"
+    ),
+    OCF_GAP_SLAVE_SECURITY_REQUEST: (
+        "GAP_SLAVE_SECURITY_REQUEST",
+        "conn_handle:H@0 bonding:B@2 mitm_protection:B@3",
+        "status:B@0"
+    ),
+    OCF_GAP_UPDATE_ADV_DATA: (
+        "GAP_UPDATE_ADV_DATA",
+        None,
+        "status:B@0"
+    ),
+    OCF_GAP_DELETE_AD_TYPE: (
+        "GAP_DELETE_AD_TYPE",
+        "ad_type:B@0",
+        "status:B@0"
+    ),
+    OCF_GAP_GET_SECURITY_LEVEL: (
+        "GAP_GET_SECURITY_LEVEL",
+        None,
+        "status:B@0 mitm_protection:B@1 bonding:B@2 oob_data:B@3 "
+        "passkey_required:B@4"
+    ),
+    OCF_GAP_SET_EVT_MASK: (
+        "GAP_SET_EVT_MASK",
+        "evt_mask:H@0",
+        "status:B@0"
+    ),
+    OCF_GAP_CONFIGURE_WHITELIST: (
+        "GAP_CONFIGURE_WHITELIST",
+        None,
+        "status:B@0"
+    ),
+    OCF_GAP_TERMINATE: (
+        "GAP_TERMINATE",
+        "handle:H@0 reason:B@1",
+        "status:B@0"
+    ),
+    OCF_GAP_CLEAR_SECURITY_DB: (
+        "GAP_CLEAR_SECURITY_DB",
+        None,
+        "status:B@0"
+    ),
+    OCF_GAP_ALLOW_REBOND_DB: (
+        "GAP_ALLOW_REBOND_DB",
+        "conn_handle:H@0",
+        "status:B@0"
+    ),
+    OCF_GAP_START_LIMITED_DISCOVERY_PROC: (
+        "GAP_START_LIMITED_DISCOVERY_PROC",
+        "scan_interval:H@0 scan_window:H@2 own_address_type:H@2 "
+        "filter_duplicates:B@5",
+        "status:B@0"
+    ),
+    OCF_GAP_START_GENERAL_DISCOVERY_PROC: (
+        "GAP_START_GENERAL_DISCOVERY_PROC",
+        "scan_interval:H@0 scan_window:H@2 own_address_type:H@2 "
+        "filter_duplicates:B@5",
+        "status:B@0"
+    ),
+    OCF_GAP_START_NAME_DISCOVERY_PROC: (
+        "GAP_START_NAME_DISCOVERY_PROC",
+        "scan_interval:H@0 scan_window:H@2 peer_bdaddr_type:B@4 "
+        "peer_bdaddr:6B@5 own_bdaddr_type:B@11 conn_min_interval:H@12 "
+        "conn_max_interval:H@14 conn_latency:H@16 supervision_timeout:H@18 "
+        "min_conn_length:H@20 max_conn_length:H@22",
+        "status:B@0"
+    ),
+    OCF_GAP_START_AUTO_CONN_ESTABLISH_PROC: (
+        "GAP_START_AUTO_CONN_ESTABLISH_PROC",
+        None,
+        "status:B@0"
+    ),
+    OCF_GAP_START_GENERAL_CONN_ESTABLISH_PROC: (
+        "GAP_START_GENERAL_CONN_ESTABLISH_PROC",
+        (
+            (
+                "IDB05A1",
+                "scan_type:B@0 scan_interval:H@1 scan_window:H@3 "
+                "own_address_type:B@5 filter_duplicates:B@6"
+            ),
+            (
+                "IDB04A1",
+                "scan_type:B@0 scan_interval:H@1 scan_window:H@3 "
+                "own_address_type:B@5 filter_duplicates:B@6 reconn_addr:6B@7"
+            )
+        ),
+        "status:B@0"
+    ),
+    OCF_GAP_START_SELECTIVE_CONN_ESTABLISH_PROC: (
+        "GAP_START_SELECTIVE_CONN_ESTABLISH_PROC",
+        "scan_type:B@0 scan_interval:H@1 scan_window:H@3 own_address_type:B@5 "
+        "filter_duplicates:B@6 num_whitelist_entries:B@7 addr_array:120B@8",
+        "status:B@0"
+    ),
+    OCF_GAP_CREATE_CONNECTION: (
+        "GAP_CREATE_CONNECTION",
+        "scan_interval:H@0 scan_window:H@2 peer_bdaddr_type:B@4 "
+        "peer_bdaddr:6B@5 own_bdaddr_type:B@11 conn_min_interval:H@12 "
+        "conn_max_interval:H@14 conn_latency:H@16 supervision_timeout:H@18 "
+        "min_conn_length:H@20 max_conn_length:H@22",
+        "status:B@0"
+    ),
+    OCF_GAP_TERMINATE_GAP_PROCEDURE: (
+        "GAP_TERMINATE_GAP_PROCEDURE",
+        None,
+        "status:B@0"
+    ),
+    OCF_GAP_START_CONNECTION_UPDATE: (
+        "GAP_START_CONNECTION_UPDATE",
+        "conn_handle:H@0 conn_min_interval:H@2 conn_max_interval:H@4 "
+        "conn_latency:H@6 supervision_timeout:H@8 min_conn_length:H@10 "
+        "max_conn_length:H@12",
+        "status:B@0"
+    ),
+    OCF_GAP_SEND_PAIRING_REQUEST: (
+        "GAP_SEND_PAIRING_REQUEST",
+        "conn_handle:H@0 force_rebond:B@2",
+        "status:B@0"
+    ),
+    OCF_GAP_RESOLVE_PRIVATE_ADDRESS: (
+        "GAP_RESOLVE_PRIVATE_ADDRESS",
+        (
+            ("IDB05A1", "address:6B@0"),
+            ("IDB04A1", None)
+        ),
+        "status:B@0"
+    ),
+    OCF_GAP_SET_BROADCAST_MODE: (
+        "GAP_SET_BROADCAST_MODE",
+        "adv_interv_min:H@0 adv_interv_max:H@2 dv_type:B@4 own_addr_type:B@5 "
+        "var_len_data:122B@6",
+        "status:B@0"
+    ),
+    OCF_GAP_START_OBSERVATION_PROC: (
+        "GAP_START_OBSERVATION_PROC",
+        "scan_interval:H@0 scan_window:H@2 scan_type:B@4 own_address_type:B@5 "
+        "filter_duplicates:B@6",
+        "status:B@0"
+    ),
+    OCF_GAP_GET_BONDED_DEVICES: (
+        "GAP_GET_BONDED_DEVICES",
+        None,
+        "status:B@0 num_addr:B@1 dev_list:126B@2"
+    ),
+    OCF_GAP_IS_DEVICE_BONDED: (
+        "GAP_IS_DEVICE_BONDED",
+        "peer_address_type:B@0 peer_address:6B@1",
+        "status:B@0"
+    )
+}
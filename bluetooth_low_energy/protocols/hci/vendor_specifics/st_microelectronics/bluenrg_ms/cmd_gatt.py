@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0111
+from bluetooth_low_energy.protocols.hci.vendor_specifics.st_microelectronics.bluenrg_ms.cmd import (
+    OCF_GATT_INIT,
+    OCF_GATT_ADD_SERV,
+    OCF_GATT_INCLUDE_SERV,
+    OCF_GATT_ADD_CHAR,
+    OCF_GATT_ADD_CHAR_DESC,
+    OCF_GATT_UPD_CHAR_VAL,
+    OCF_GATT_DEL_CHAR,
+    OCF_GATT_DEL_SERV,
+    OCF_GATT_DEL_INC_SERV,
+    OCF_GATT_SET_EVT_MASK,
+    OCF_GATT_EXCHANGE_CONFIG,
+    OCF_ATT_FIND_INFO_REQ,
+    OCF_ATT_FIND_BY_TYPE_VALUE_REQ,
+    OCF_ATT_READ_BY_TYPE_REQ,
+    OCF_ATT_READ_BY_GROUP_TYPE_REQ,
+    OCF_ATT_PREPARE_WRITE_REQ,
+    OCF_ATT_EXECUTE_WRITE_REQ,
+    OCF_GATT_DISC_ALL_PRIM_SERVICES,
+    OCF_GATT_DISC_PRIM_SERVICE_BY_UUID,
+    OCF_GATT_FIND_INCLUDED_SERVICES,
+    OCF_GATT_DISC_ALL_CHARAC_OF_SERV,
+    OCF_GATT_DISC_CHARAC_BY_UUID,
+    OCF_GATT_DISC_ALL_CHARAC_DESCRIPTORS,
+    OCF_GATT_READ_CHARAC_VAL,
+    OCF_GATT_READ_USING_CHARAC_UUID,
+    OCF_GATT_READ_LONG_CHARAC_VAL,
+    OCF_GATT_READ_MULTIPLE_CHARAC_VAL,
+    OCF_GATT_WRITE_CHAR_VALUE,
+    OCF_GATT_WRITE_LONG_CHARAC_VAL,
+    OCF_GATT_WRITE_CHARAC_RELIABLE,
+    OCF_GATT_WRITE_LONG_CHARAC_DESC,
+    OCF_GATT_READ_LONG_CHARAC_DESC,
+    OCF_GATT_WRITE_CHAR_DESC,
+    OCF_GATT_READ_CHAR_DESC,
+    OCF_GATT_WRITE_WITHOUT_RESPONSE,
+    OCF_GATT_SIGNED_WRITE_WITHOUT_RESPONSE,
+    OCF_GATT_CONFIRM_INDICATION,
+    OCF_GATT_WRITE_RESPONSE,
+    OCF_GATT_ALLOW_READ,
+    OCF_GATT_SET_SECURITY_PERMISSION,
+    OCF_GATT_SET_DESC_VAL,
+    OCF_GATT_READ_HANDLE_VALUE,
+    OCF_GATT_READ_HANDLE_VALUE_OFFSET,
+    OCF_GATT_UPD_CHAR_VAL_EXT)
+
+"""
+BlueNRG-MS GATT/ATT vendor specific commands (OCF 0x0100-0x017F),
+loaded on first use by HCI_VENDOR_COMMANDS (cmd.py)
+"""
+
+DESCRIPTORS = {
+    OCF_GATT_INIT: (
+        "GATT_INIT",
+        None,
+        "status:B@0"
+    ),
+    OCF_GATT_ADD_SERV: (
+        "GATT_ADD_SERV",
+        None,
+        "status:B@0 handle:H@1"
+    ),
+    OCF_GATT_INCLUDE_SERV: (
+        "GATT_INCLUDE_SERV",
+        None,
+        "status:B@0 handle:H@1"
+    ),
+    OCF_GATT_ADD_CHAR: (
+        "GATT_ADD_CHAR",
+        None,
+        "status:B@0 handle:H@1"
+    ),
+    OCF_GATT_ADD_CHAR_DESC: (
+        "GATT_ADD_CHAR_DESC",
+        None,
+        "status:B@0 handle:H@1"
+    ),
+    OCF_GATT_UPD_CHAR_VAL: (
+        "GATT_UPD_CHAR_VAL",
+        None,
+        "status:B@0"
+    ),
+    OCF_GATT_DEL_CHAR: (
+        "GATT_DEL_CHAR",
+        "service_handle:H@0 char_handle:H@2",
+        "status:B@0"
+    ),
+    OCF_GATT_DEL_SERV: (
+        "GATT_DEL_SERV",
+        "service_handle:H@0",
+        "status:B@0"
+    ),
+    OCF_GATT_DEL_INC_SERV: (
+        "GATT_DEL_INC_SERV",
+        "service_handle:H@0 inc_serv_handle:H@2",
+        "status:B@0"
+    ),
+    OCF_GATT_SET_EVT_MASK: (
+        "GATT_SET_EVT_MASK",
+        "evt_mask:I@0",
+        "status:B@0"
+    ),
+    OCF_GATT_EXCHANGE_CONFIG: (
+        "GATT_EXCHANGE_CONFIG",
+        "conn_handle:H@0",
+        "status:B@0"
+    ),
+    OCF_ATT_FIND_INFO_REQ: (
+        "ATT_FIND_INFO_REQ",
+        "conn_handle:H@0 start_handle:H@2 end_handle:H@4",
+        "status:B@0"
+    ),
+    OCF_ATT_FIND_BY_TYPE_VALUE_REQ: (
+        "ATT_FIND_BY_TYPE_VALUE_REQ",
+        "conn_handle:H@0 start_handle:H@2 end_handle:H@4 uuid:2B@6 "
+        "attr_val_len:B@8 attr_val:119B@9",
+        "status:B@0"
+    ),
+    OCF_ATT_READ_BY_TYPE_REQ: (
+        "ATT_READ_BY_TYPE_REQ",
+        "conn_handle:H@0 start_handle:H@2 end_handle:H@4 uuid_type:B@6 "
+        "uuid:16B@7",
+        "status:B@0"
+    ),
+    OCF_ATT_READ_BY_GROUP_TYPE_REQ: (
+        "ATT_READ_BY_GROUP_TYPE_REQ",
+        "conn_handle:H@0 start_handle:H@2 end_handle:H@4 uuid_type:B@6 "
+        "uuid:16B@7",
+        "status:B@0"
+    ),
+    OCF_ATT_PREPARE_WRITE_REQ: (
+        "ATT_PREPARE_WRITE_REQ",
+        "conn_handle:H@0 attr_handle:H@2 value_offset:H@4 attr_val_len:B@6 "
+        "attr_val:121B@7",
+        "status:B@0"
+    ),
+    OCF_ATT_EXECUTE_WRITE_REQ: (
+        "ATT_EXECUTE_WRITE_REQ",
+        "conn_handle:H@0 execute:B@2",
+        "status:B@0"
+    ),
+    OCF_GATT_DISC_ALL_PRIM_SERVICES: (
+        "GATT_DISC_ALL_PRIM_SERVICES",
+        "conn_handle:H@0",
+        "status:B@0"
+    ),
+    OCF_GATT_DISC_PRIM_SERVICE_BY_UUID: (
+        "GATT_DISC_PRIM_SERVICE_BY_UUID",
+        "conn_handle:H@0 uuid_type:B@2 uuid:16B@3",
+        "status:B@0"
+    ),
+    OCF_GATT_FIND_INCLUDED_SERVICES: (
+        "GATT_FIND_INCLUDED_SERVICES",
+        "conn_handle:H@0 start_handle:H@2 end_handle:H@4",
+        "status:B@0"
+    ),
+    OCF_GATT_DISC_ALL_CHARAC_OF_SERV: (
+        "GATT_DISC_ALL_CHARAC_OF_SERV",
+        "conn_handle:H@0 start_handle:H@2 end_handle:H@4",
+        "status:B@0"
+    ),
+    OCF_GATT_DISC_CHARAC_BY_UUID: (
+        "GATT_DISC_CHARAC_BY_UUID",
+        None,
+        "status:B@0"
+    ),
+    OCF_GATT_DISC_ALL_CHARAC_DESCRIPTORS: (
+        "GATT_DISC_ALL_CHARAC_DESCRIPTORS",
+        "conn_handle:H@0 start_handle:H@2 end_handle:H@4",
+        "status:B@0"
+    ),
+    OCF_GATT_READ_CHARAC_VAL: (
+        "GATT_READ_CHARAC_VAL",
+        "conn_handle:H@0 attr_handle:H@2",
+        "status:B@0"
+    ),
+    OCF_GATT_READ_USING_CHARAC_UUID: (
+        "GATT_READ_USING_CHARAC_UUID",
+        "conn_handle:H@0 start_handle:H@2 end_handle:H@4 uuid_type:B@6 "
+        "uuid:16B@7",
+        "status:B@0"
+    ),
+    OCF_GATT_READ_LONG_CHARAC_VAL: (
+        "GATT_READ_LONG_CHARAC_VAL",
+        "conn_handle:H@0 attr_handle:H@2 val_offset:H@4",
+        "status:B@0"
+    ),
+    OCF_GATT_READ_MULTIPLE_CHARAC_VAL: (
+        "GATT_READ_MULTIPLE_CHARAC_VAL",
+        "conn_handle:H@0 num_handles:B@2 set_of_handles:125B@3",
+        "status:B@0"
+    ),
+    OCF_GATT_WRITE_CHAR_VALUE: (
+        "GATT_WRITE_CHAR_VALUE",
+        None,
+        "status:B@0"
+    ),
+    OCF_GATT_WRITE_LONG_CHARAC_VAL: (
+        "GATT_WRITE_LONG_CHARAC_VAL",
+        "conn_handle:H@0 attr_handle:H@2 val_offset:H@4 val_len:B@6 "
+        "attr_val:121B@7",
+        "status:B@0"
+    ),
+    OCF_GATT_WRITE_CHARAC_RELIABLE: (
+        "GATT_WRITE_CHARAC_RELIABLE",
+        "conn_handle:H@0 attr_handle:H@2 val_offset:H@4 val_len:B@6 "
+        "attr_val:121B@7",
+        "status:B@0"
+    ),
+    OCF_GATT_WRITE_LONG_CHARAC_DESC: (
+        "GATT_WRITE_LONG_CHARAC_DESC",
+        "conn_handle:H@0 attr_handle:H@2 val_offset:H@4 val_len:B@6 "
+        "attr_val:121B@7",
+        "status:B@0"
+    ),
+    OCF_GATT_READ_LONG_CHARAC_DESC: (
+        "GATT_READ_LONG_CHARAC_DESC",
+        "conn_handle:H@0 attr_handle:H@2 val_offset:H@4",
+        "status:B@0"
+    ),
+    OCF_GATT_WRITE_CHAR_DESC: (
+        "GATT_WRITE_CHAR_DESC",
+        None,
+        "status:B@0"
+    ),
+    OCF_GATT_READ_CHAR_DESC: (
+        "GATT_READ_CHAR_DESC",
+        "conn_handle:H@0 attr_handle:H@2",
+        "status:B@0"
+    ),
+    OCF_GATT_WRITE_WITHOUT_RESPONSE: (
+        "GATT_WRITE_WITHOUT_RESPONSE",
+        "conn_handle:H@0 attr_handle:H@2 val_len:B@4 attr_val:123B@5",
+        "status:B@0"
+    ),
+    OCF_GATT_SIGNED_WRITE_WITHOUT_RESPONSE: (
+        "GATT_SIGNED_WRITE_WITHOUT_RESPONSE",
+        "conn_handle:H@0 attr_handle:H@2 val_len:B@4 attr_val:123B@5",
+        "status:B@0"
+    ),
+    OCF_GATT_CONFIRM_INDICATION: (
+        "GATT_CONFIRM_INDICATION",
+        "conn_handle:H@0",
+        "status:B@0"
+    ),
+    OCF_GATT_WRITE_RESPONSE: (
+        "GATT_WRITE_RESPONSE",
+        None,
+        "status:B@0"
+    ),
+    OCF_GATT_ALLOW_READ: (
+        "GATT_ALLOW_READ",
+        "conn_handle:H@0",
+        "status:B@0"
+    ),
+    OCF_GATT_SET_SECURITY_PERMISSION: (
+        "GATT_SET_SECURITY_PERMISSION",
+        "service_handle:H@0 attr_handle:H@2 security_permission:B@4",
+        "status:B@0"
+    ),
+    OCF_GATT_SET_DESC_VAL: (
+        "GATT_SET_DESC_VAL",
+        None,
+        "status:B@0"
+    ),
+    OCF_GATT_READ_HANDLE_VALUE: (
+        "GATT_READ_HANDLE_VALUE",
+        "attr_handle:H@0",
+        "status:B@0 value_len:H@1 value:125B@3"
+    ),
+    OCF_GATT_READ_HANDLE_VALUE_OFFSET: (
+        "GATT_READ_HANDLE_VALUE_OFFSET",
+        "attr_handle:H@0 offset:B@2",
+        "status:B@0 value_len:H@1 value:125B@3"
+    ),
+    OCF_GATT_UPD_CHAR_VAL_EXT: (
+        "GATT_UPD_CHAR_VAL_EXT",
+        "service_handle:H@0 char_handle:H@2 update_type:B@4 char_length:H@5 "
+        "value_offset:H@7 value_length:B@9 value:118B@10",
+        "status:B@0"
+    )
+}
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0111
+from bluetooth_low_energy.protocols.hci.vendor_specifics.st_microelectronics.bluenrg_ms.cmd import (
+    OCF_HAL_GET_FW_BUILD_NUMBER,
+    OCF_HAL_WRITE_CONFIG_DATA,
+    OCF_HAL_READ_CONFIG_DATA,
+    OCF_HAL_SET_TX_POWER_LEVEL,
+    OCF_HAL_DEVICE_STANDBY,
+    OCF_HAL_LE_TX_TEST_PACKET_NUMBER,
+    OCF_HAL_TONE_START,
+    OCF_HAL_TONE_STOP,
+    OCF_HAL_GET_LINK_STATUS,
+    OCF_HAL_GET_ANCHOR_PERIOD)
+
+"""
+BlueNRG-MS HAL vendor specific commands (OCF 0x0000-0x001F),
+loaded on first use by HCI_VENDOR_COMMANDS (cmd.py)
+"""
+
+DESCRIPTORS = {
+    OCF_HAL_GET_FW_BUILD_NUMBER: (
+        "HAL_GET_FW_BUILD_NUMBER",
+        None,
+        "status:B@0 build_number:H@1"
+    ),
+    OCF_HAL_WRITE_CONFIG_DATA: (
+        "HAL_WRITE_CONFIG_DATA",
+        None,
+        "status:B@0"
+    ),
+    OCF_HAL_READ_CONFIG_DATA: (
+        "HAL_READ_CONFIG_DATA",
+        None,
+        "offset:B@0"
+    ),
+    OCF_HAL_SET_TX_POWER_LEVEL: (
+        "HAL_SET_TX_POWER_LEVEL",
+        "en_high_power:B@0 pa_level:B@1",
+        "status:B@0"
+    ),
+    OCF_HAL_DEVICE_STANDBY: (
+        "HAL_DEVICE_STANDBY",
+        None,
+        "status:B@0"
+    ),
+    OCF_HAL_LE_TX_TEST_PACKET_NUMBER: (
+        "HAL_LE_TX_TEST_PACKET_NUMBER",
+        None,
+        "status:B@0 number_of_packets:I@1"
+    ),
+    OCF_HAL_TONE_START: (
+        "HAL_TONE_START",
+        "rf_channel:B@0",
+        "status:B@0"
+    ),
+    OCF_HAL_TONE_STOP: (
+        "HAL_TONE_STOP",
+        "rf_channel:B@0",
+        "status:B@0"
+    ),
+    OCF_HAL_GET_LINK_STATUS: (
+        "HAL_GET_LINK_STATUS",
+        None,
+        "status:B@0 link_status:8B@1 conn_handle:8H@9"
+    ),
+    OCF_HAL_GET_ANCHOR_PERIOD: (
+        "HAL_GET_ANCHOR_PERIOD",
+        None,
+        "status:B@0 anchor_period:I@1 max_free_slot:I@5"
+    )
+}
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0111
+from bluetooth_low_energy.protocols.hci.vendor_specifics.st_microelectronics.bluenrg_ms.cmd import (
+    OCF_L2CAP_CONN_PARAM_UPDATE_REQ,
+    OCF_L2CAP_CONN_PARAM_UPDATE_RESP)
+
+"""
+BlueNRG-MS L2CAP vendor specific commands (OCF 0x0180-0x01FF),
+loaded on first use by HCI_VENDOR_COMMANDS (cmd.py)
+"""
+
+DESCRIPTORS = {
+    OCF_L2CAP_CONN_PARAM_UPDATE_REQ: (
+        "L2CAP_CONN_PARAM_UPDATE_REQ",
+        "conn_handle:H@0 interval_min:H@2 interval_max:H@4 slave_latency:H@6 "
+        "timeout_multiplier:H@8",
+        "status:B@0"
+    ),
+    OCF_L2CAP_CONN_PARAM_UPDATE_RESP: (
+        "L2CAP_CONN_PARAM_UPDATE_RESP",
+        (
+            (
+                "IDB05A1",
+                "conn_handle:H@0 interval_min:H@2 interval_max:H@4 "
+                "slave_latency:H@6 timeout_multiplier:H@8 min_ce_length:H@10 "
+                "max_ce_length:H@12 id:B@14 accept:B@15"
+            ),
+            (
+                "IDB04A1",
+                "conn_handle:H@0 interval_min:H@2 interval_max:H@4 "
+                "slave_latency:H@6 timeout_multiplier:H@8 id:B@10 accept:B@11"
+            )
+        ),
+        "status:B@0"
+    )
+}
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0111
+from bluetooth_low_energy.protocols.hci.vendor_specifics.st_microelectronics.bluenrg_ms.cmd import (
+    OCF_UPDATER_START,
+    OCF_UPDATER_REBOOT,
+    OCF_GET_UPDATER_VERSION,
+    OCF_GET_UPDATER_BUFSIZE,
+    OCF_UPDATER_ERASE_BLUE_FLAG,
+    OCF_UPDATER_RESET_BLUE_FLAG,
+    OCF_UPDATER_ERASE_SECTOR,
+    OCF_UPDATER_READ_DATA_BLOCK,
+    OCF_UPDATER_PROG_DATA_BLOCK,
+    OCF_UPDATER_CALC_CRC,
+    OCF_UPDATER_HW_VERSION)
+
+"""
+BlueNRG-MS updater vendor specific commands (OCF 0x0020-0x007F),
+loaded on first use by HCI_VENDOR_COMMANDS (cmd.py)
+"""
+
+DESCRIPTORS = {
+    OCF_UPDATER_START: (
+        "UPDATER_START",
+        None,
+        "status:B@0"
+    ),
+    OCF_UPDATER_REBOOT: (
+        "UPDATER_REBOOT",
+        None,
+        "status:B@0"
+    ),
+    OCF_GET_UPDATER_VERSION: (
+        "GET_UPDATER_VERSION",
+        None,
+        "status:B@0 version:B@1"
+    ),
+    OCF_GET_UPDATER_BUFSIZE: (
+        "GET_UPDATER_BUFSIZE",
+        None,
+        "status:B@0 buffer_size:B@1"
+    ),
+    OCF_UPDATER_ERASE_BLUE_FLAG: (
+        "UPDATER_ERASE_BLUE_FLAG",
+        None,
+        "status:B@0"
+    ),
+    OCF_UPDATER_RESET_BLUE_FLAG: (
+        "UPDATER_RESET_BLUE_FLAG",
+        None,
+        "status:B@0"
+    ),
+    OCF_UPDATER_ERASE_SECTOR: (
+        "UPDATER_ERASE_SECTOR",
+        "address:I@0",
+        "status:B@0"
+    ),
+    OCF_UPDATER_READ_DATA_BLOCK: (
+        "UPDATER_READ_DATA_BLOCK",
+        "address:I@0 data_len:H@4",
+        "status:B@0"
+    ),
+    OCF_UPDATER_PROG_DATA_BLOCK: (
+        "UPDATER_PROG_DATA_BLOCK",
+        "address:I@0 data_len:H@4 data:122B@6",
+        "status:B@0 data:127B@1"
+    ),
+    OCF_UPDATER_CALC_CRC: (
+        "UPDATER_CALC_CRC",
+        "address:I@0 num_sectors:B@4",
+        "status:B@0 crc:I@1"
+    ),
+    OCF_UPDATER_HW_VERSION: (
+        "UPDATER_HW_VERSION",
+        None,
+        "status:B@0 version:B@1"
+    )
+}
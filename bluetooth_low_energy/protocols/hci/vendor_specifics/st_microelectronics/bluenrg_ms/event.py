@@ -1,9 +1,8 @@
 # -*- coding: utf-8 -*-
 # pylint: disable=C0111
-import uctypes
 from micropython import const
 
-from bluetooth_low_energy.protocols.hci import HCI_MAX_PAYLOAD_SIZE
+from bluetooth_low_energy.protocols.hci.table import LazyTable
 
 EVT_BLUE_HAL_INITIALIZED = const(0x0001)
 EVT_BLUE_HAL_EVENTS_LOST_IDB05A1 = const(0x0002)
@@ -99,348 +98,12 @@ EVT_LL_CONNECTION_UPDATE_COMPLETE_BIT = const(46)
 EVT_LL_READ_REMOTE_USED_FEATURES_BIT = const(47)
 EVT_LL_LTK_REQUEST_BIT = const(48)
 
-HCI_VENDOR_EVENTS = {
-    EVT_BLUE_HAL_INITIALIZED: [
-        "BLUE_HAL_INITIALIZED",
-        {
-            "reason_code": uctypes.UINT8 | 0
-        }
-    ],
-    EVT_BLUE_HAL_EVENTS_LOST_IDB05A1: [
-        "BLUE_HAL_EVENTS_LOST_IDB05A1",
-        {
-            "lost_events": (uctypes.ARRAY | 0, uctypes.UINT8 | 8)
-        }
-    ],
-    EVT_BLUE_HAL_CRASH_INFO_IDB05A1: [
-        "BLUE_HAL_CRASH_INFO_IDB05A1",
-        {
-            "crash_type": uctypes.UINT8 | 0,
-            "sp": uctypes.UINT32 | 1,
-            "sp1": uctypes.UINT32 | 5,
-            "r0": uctypes.UINT32 | 9,
-            "r1": uctypes.UINT32 | 13,
-            "r2": uctypes.UINT32 | 17,
-            "r3": uctypes.UINT32 | 21,
-            "r12": uctypes.UINT32 | 25,
-            "lr": uctypes.UINT32 | 29,
-            "pc": uctypes.UINT32 | 33,
-            "xpsr": uctypes.UINT32 | 37,
-            "debug_data_len": uctypes.UINT8 | 41,
-            "debug_data":
-            (uctypes.ARRAY | 46, uctypes.UINT8 | HCI_MAX_PAYLOAD_SIZE - 46)
-        }
-    ],
-    EVT_BLUE_GAP_LIMITED_DISCOVERABLE: [
-        "BLUE_GAP_LIMITED_DISCOVERABLE",
-        None
-    ],
-    EVT_BLUE_GAP_PAIRING_CMPLT: [
-        "BLUE_GAP_PAIRING_CMPLT",
-        {
-            "conn_handle": uctypes.UINT16 | 0,
-            "status": uctypes.UINT8 | 2
-        }
-    ],
-    EVT_BLUE_GAP_PASS_KEY_REQUEST: [
-        "BLUE_GAP_PASS_KEY_REQUEST",
-        {
-            "conn_handle": uctypes.UINT16 | 0
-        }
-    ],
-    EVT_BLUE_GAP_SLAVE_SECURITY_INITIATED: [
-        "BLUE_GAP_SLAVE_SECURITY_INITIATED",
-        None
-    ],
-    EVT_BLUE_GAP_BOND_LOST: [
-        "BLUE_GAP_BOND_LOST",
-        None
-    ],
-    EVT_BLUE_GAP_DEVICE_FOUND: [
-        "BLUE_GAP_DEVICE_FOUND",
-        {
-            "evt_type": uctypes.UINT8 | 0,
-            "bdaddr_type": uctypes.UINT8 | 1,
-            "bdaddr": (uctypes.ARRAY | 2, uctypes.UINT8 | 6),
-            "data_length": uctypes.UINT8 | 8,
-            "data_rssi":
-            (uctypes.ARRAY | 9, uctypes.UINT8 | HCI_MAX_PAYLOAD_SIZE - 9)
-        }
-    ],
-    EVT_BLUE_GAP_PROCEDURE_COMPLETE: [
-        "BLUE_GAP_PROCEDURE_COMPLETE",
-        {
-            "procedure_code": uctypes.UINT8 | 0,
-            "status": uctypes.UINT8 | 1,
-            "data":
-            (uctypes.ARRAY | 2, uctypes.UINT8 | HCI_MAX_PAYLOAD_SIZE - 2)
-        }
-    ],
-    EVT_BLUE_GAP_ADDR_NOT_RESOLVED_IDB05A1: [
-        "BLUE_GAP_ADDR_NOT_RESOLVED_IDB05A1",
-        {
-            "conn_handle": uctypes.UINT16 | 0
-        }
-    ],
-    EVT_BLUE_GAP_RECONNECTION_ADDRESS_IDB04A1: [
-        "BLUE_GAP_RECONNECTION_ADDRESS_IDB04A1",
-        {
-            "reconnection_address": (uctypes.ARRAY | 0, uctypes.UINT8 | 6)
-        }
-    ],
-    EVT_BLUE_GAP_AUTHORIZATION_REQUEST: [
-        "BLUE_GAP_AUTHORIZATION_REQUEST",
-        {
-            "conn_handle": uctypes.UINT16 | 0
-        }
-    ],
-    EVT_BLUE_L2CAP_CONN_UPD_RESP: [
-        "BLUE_L2CAP_CONN_UPD_RESP",
-        {
-            "conn_handle": uctypes.UINT16 | 0,
-            "event_data_length": uctypes.UINT8 | 2,
-            "code": uctypes.UINT8 | 3,
-            "identifier": uctypes.UINT8 | 4,
-            "l2cap_length": uctypes.UINT16 | 5,
-            "result": uctypes.UINT16 | 7
-        }
-    ],
-    EVT_BLUE_L2CAP_PROCEDURE_TIMEOUT: [
-        "BLUE_L2CAP_PROCEDURE_TIMEOUT",
-        {
-            "conn_handle": uctypes.UINT16 | 0,
-            "event_data_length": uctypes.UINT8 | 2
-        }
-    ],
-    EVT_BLUE_L2CAP_CONN_UPD_REQ: [
-        "BLUE_L2CAP_CONN_UPD_REQ",
-        {
-            "conn_handle": uctypes.UINT16 | 0,
-            "event_data_length": uctypes.UINT8 | 2,
-            "identifier": uctypes.UINT8 | 3,
-            "l2cap_length": uctypes.UINT16 | 4,
-            "interval_min": uctypes.UINT16 | 6,
-            "interval_max": uctypes.UINT16 | 8,
-            "slave_latency": uctypes.UINT16 | 10,
-            "timeout_mult": uctypes.UINT16 | 12
-        }
-    ],
-    EVT_BLUE_GATT_ATTRIBUTE_MODIFIED: [
-        "BLUE_GATT_ATTRIBUTE_MODIFIED",
-        {
-            "IDB05A1": {
-                "conn_handle": uctypes.UINT16 | 0,
-                "attr_handle": uctypes.UINT16 | 2,
-                "data_length": uctypes.UINT8 | 4,
-                "offset": uctypes.UINT16 | 5,
-                "att_data":
-                (uctypes.ARRAY | 7, uctypes.UINT8 | HCI_MAX_PAYLOAD_SIZE - 7)
-            },
-            "IDB04A1": {
-                "conn_handle": uctypes.UINT16 | 0,
-                "attr_handle": uctypes.UINT16 | 2,
-                "data_length": uctypes.UINT8 | 4,
-                "att_data":
-                (uctypes.ARRAY | 5, uctypes.UINT8 | HCI_MAX_PAYLOAD_SIZE - 5)
-            }
-        }
-    ],
-    EVT_BLUE_GATT_PROCEDURE_TIMEOUT: [
-        "BLUE_GATT_PROCEDURE_TIMEOUT",
-        {
-            "conn_handle": uctypes.UINT16 | 0
-        }
-    ],
-    EVT_BLUE_ATT_EXCHANGE_MTU_RESP: [
-        "BLUE_ATT_EXCHANGE_MTU_RESP",
-        {
-            "conn_handle": uctypes.UINT16 | 0,
-            "event_data_length": uctypes.UINT8 | 2,
-            "server_rx_mtu": uctypes.UINT16 | 3
-        }
-    ],
-    EVT_BLUE_ATT_FIND_INFORMATION_RESP: [
-        "BLUE_ATT_FIND_INFORMATION_RESP",
-        {
-            "conn_handle": uctypes.UINT16 | 0,
-            "event_data_length": uctypes.UINT8 | 2,
-            "format": uctypes.UINT8 | 3,
-            "handle_uuid_pair":
-            (uctypes.ARRAY | 4, uctypes.UINT8 | HCI_MAX_PAYLOAD_SIZE - 4)
-        }
-    ],
-    EVT_BLUE_ATT_FIND_BY_TYPE_VAL_RESP: [
-        "BLUE_ATT_FIND_BY_TYPE_VAL_RESP",
-        {
-            "conn_handle": uctypes.UINT16 | 0,
-            "event_data_length": uctypes.UINT8 | 2,
-            "handles_info_list":
-            (uctypes.ARRAY | 3, uctypes.UINT8 | HCI_MAX_PAYLOAD_SIZE - 3)
-        }
-    ],
-    EVT_BLUE_ATT_READ_BY_TYPE_RESP: [
-        "BLUE_ATT_READ_BY_TYPE_RESP",
-        {
-            "conn_handle": uctypes.UINT16 | 0,
-            "event_data_length": uctypes.UINT8 | 2,
-            "handle_value_pair_length": uctypes.UINT8 | 3,
-            "handle_value_pair":
-            (uctypes.ARRAY | 4, uctypes.UINT8 | HCI_MAX_PAYLOAD_SIZE - 4)
-        }
-    ],
-    EVT_BLUE_ATT_READ_RESP: [
-        "BLUE_ATT_READ_RESP",
-        {
-            "conn_handle": uctypes.UINT16 | 0,
-            "event_data_length": uctypes.UINT8 | 2,
-            "attribute_value":
-            (uctypes.ARRAY | 3, uctypes.UINT8 | HCI_MAX_PAYLOAD_SIZE - 3)
-        }
-    ],
-    EVT_BLUE_ATT_READ_BLOB_RESP: [
-        "BLUE_ATT_READ_BLOB_RESP",
-        {
-            "conn_handle": uctypes.UINT16 | 0,
-            "event_data_length": uctypes.UINT8 | 2,
-            "part_attribute_value":
-            (uctypes.ARRAY | 3, uctypes.UINT8 | HCI_MAX_PAYLOAD_SIZE - 3)
-        }
-    ],
-    EVT_BLUE_ATT_READ_MULTIPLE_RESP: [
-        "BLUE_ATT_READ_MULTIPLE_RESP",
-        {
-            "conn_handle": uctypes.UINT16 | 0,
-            "event_data_length": uctypes.UINT8 | 2,
-            "set_of_values":
-            (uctypes.ARRAY | 3, uctypes.UINT8 | HCI_MAX_PAYLOAD_SIZE - 3)
-        }
-    ],
-    EVT_BLUE_ATT_READ_BY_GROUP_TYPE_RESP: [
-        "BLUE_ATT_READ_BY_GROUP_TYPE_RESP",
-        {
-            "conn_handle": uctypes.UINT16 | 0,
-            "event_data_length": uctypes.UINT8 | 2,
-            "attribute_data_length": uctypes.UINT8 | 3,
-            "attribute_data_list":
-            (uctypes.ARRAY | 4, uctypes.UINT8 | HCI_MAX_PAYLOAD_SIZE - 4)
-        }
-    ],
-    EVT_BLUE_ATT_PREPARE_WRITE_RESP: [
-        "BLUE_ATT_PREPARE_WRITE_RESP",
-        {
-            "conn_handle": uctypes.UINT16 | 0,
-            "event_data_length": uctypes.UINT8 | 2,
-            "attribute_handle": uctypes.UINT16 | 3,
-            "offset": uctypes.UINT16 | 5,
-            "part_attr_value":
-            (uctypes.ARRAY | 7, uctypes.UINT8 | HCI_MAX_PAYLOAD_SIZE - 7)
-        }
-    ],
-    EVT_BLUE_ATT_EXEC_WRITE_RESP: [
-        "BLUE_ATT_EXEC_WRITE_RESP",
-        {
-            "conn_handle": uctypes.UINT16 | 0,
-            "event_data_length": uctypes.UINT8 | 2,
-        }
-    ],
-    EVT_BLUE_GATT_INDICATION: [
-        "BLUE_GATT_INDICATION",
-        {
-            "conn_handle": uctypes.UINT16 | 0,
-            "event_data_length": uctypes.UINT8 | 2,
-            "attr_handle": uctypes.UINT16 | 3,
-            "attr_value":
-            (uctypes.ARRAY | 5, uctypes.UINT8 | HCI_MAX_PAYLOAD_SIZE - 5)
-        }
-    ],
-    EVT_BLUE_GATT_NOTIFICATION: [
-        "BLUE_GATT_NOTIFICATION",
-        {
-            "conn_handle": uctypes.UINT16 | 0,
-            "event_data_length": uctypes.UINT8 | 2,
-            "attr_handle": uctypes.UINT16 | 3,
-            "attr_value":
-            (uctypes.ARRAY | 5, uctypes.UINT8 | HCI_MAX_PAYLOAD_SIZE - 5)
-        }
-    ],
-    EVT_BLUE_GATT_PROCEDURE_COMPLETE: [
-        "BLUE_GATT_PROCEDURE_COMPLETE",
-        {
-            "conn_handle": uctypes.UINT16 | 0,
-            "data_length": uctypes.UINT8 | 2,
-            "error_code": uctypes.UINT8 | 3
-        }
-    ],
-    EVT_BLUE_GATT_ERROR_RESP: [
-        "BLUE_GATT_ERROR_RESP",
-        {
-            "conn_handle": uctypes.UINT16 | 0,
-            "event_data_length": uctypes.UINT8 | 2,
-            "req_opcode": uctypes.UINT8 | 3,
-            "attr_handle": uctypes.UINT16 | 4,
-            "error_code":  uctypes.UINT8 | 6
-        }
-    ],
-    EVT_BLUE_GATT_DISC_READ_CHAR_BY_UUID_RESP: [
-        "BLUE_GATT_DISC_READ_CHAR_BY_UUID_RESP",
-        {
-            "conn_handle": uctypes.UINT16 | 0,
-            "event_data_length": uctypes.UINT8 | 2,
-            "attr_handle": uctypes.UINT16 | 3,
-            "attr_value":
-            (uctypes.ARRAY | 5, uctypes.UINT8 | HCI_MAX_PAYLOAD_SIZE - 5)
-        }
-    ],
-    EVT_BLUE_GATT_WRITE_PERMIT_REQ: [
-        "BLUE_GATT_WRITE_PERMIT_REQ",
-        {
-            "conn_handle": uctypes.UINT16 | 0,
-            "attr_handle": uctypes.UINT16 | 2,
-            "data_length": uctypes.UINT8 | 4,
-            "data_buffer":
-            (uctypes.ARRAY | 5, uctypes.UINT8 | HCI_MAX_PAYLOAD_SIZE - 5)
-        }
-    ],
-    EVT_BLUE_GATT_READ_PERMIT_REQ: [
-        "BLUE_GATT_READ_PERMIT_REQ",
-        {
-            "conn_handle": uctypes.UINT16 | 0,
-            "attr_handle": uctypes.UINT16 | 2,
-            "data_length": uctypes.UINT8 | 4,
-            "offset": uctypes.UINT16 | 5
-        }
-    ],
-    EVT_BLUE_GATT_READ_MULTI_PERMIT_REQ: [
-        "BLUE_GATT_READ_MULTI_PERMIT_REQ",
-        {
-            "conn_handle": uctypes.UINT16 | 0,
-            "data_length": uctypes.UINT8 | 2,
-            "data":
-            (uctypes.ARRAY | 3, uctypes.UINT8 | HCI_MAX_PAYLOAD_SIZE - 3)
-        }
-    ],
-    EVT_BLUE_GATT_TX_POOL_AVAILABLE: [
-        "BLUE_GATT_TX_POOL_AVAILABLE",
-        {
-            "conn_handle": uctypes.UINT16 | 0,
-            "available_buffers": uctypes.UINT16 | 2
-        }
-    ],
-    EVT_BLUE_GATT_SERVER_CONFIRMATION_EVENT: [
-        "BLUE_GATT_SERVER_CONFIRMATION_EVENT",
-        {
-            "conn_handle": uctypes.UINT16 | 0,
-        }
-    ],
-    EVT_BLUE_GATT_PREPARE_WRITE_PERMIT_REQ: [
-        "BLUE_GATT_PREPARE_WRITE_PERMIT_REQ",
-        {
-            "conn_handle": uctypes.UINT16 | 0,
-            "attr_handle": uctypes.UINT16 | 2,
-            "offset": uctypes.UINT16 | 4,
-            "data_length": uctypes.UINT8 | 6,
-            "data":
-            (uctypes.ARRAY | 7, uctypes.UINT8 | HCI_MAX_PAYLOAD_SIZE - 7)
-        }
-    ]
-}
+HCI_VENDOR_EVENTS = LazyTable(
+    "bluetooth_low_energy.protocols.hci.vendor_specifics.st_microelectronics.bluenrg_ms",
+    (
+        (0x0000, 0x03FF, "event_hal"),
+        (0x0400, 0x07FF, "event_gap"),
+        (0x0800, 0x0BFF, "event_l2cap"),
+        (0x0C00, 0x0FFF, "event_gatt")
+    )
+)
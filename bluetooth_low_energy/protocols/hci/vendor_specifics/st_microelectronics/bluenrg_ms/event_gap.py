@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0111
+from bluetooth_low_energy.protocols.hci.vendor_specifics.st_microelectronics.bluenrg_ms.event import (
+    EVT_BLUE_GAP_LIMITED_DISCOVERABLE,
+    EVT_BLUE_GAP_PAIRING_CMPLT,
+    EVT_BLUE_GAP_PASS_KEY_REQUEST,
+    EVT_BLUE_GAP_SLAVE_SECURITY_INITIATED,
+    EVT_BLUE_GAP_BOND_LOST,
+    EVT_BLUE_GAP_DEVICE_FOUND,
+    EVT_BLUE_GAP_PROCEDURE_COMPLETE,
+    EVT_BLUE_GAP_ADDR_NOT_RESOLVED_IDB05A1,
+    EVT_BLUE_GAP_RECONNECTION_ADDRESS_IDB04A1,
+    EVT_BLUE_GAP_AUTHORIZATION_REQUEST)
+
+"""
+BlueNRG-MS GAP vendor specific events (ecode 0x0400-0x07FF),
+loaded on first use by HCI_VENDOR_EVENTS (event.py)
+"""
+
+DESCRIPTORS = {
+    EVT_BLUE_GAP_LIMITED_DISCOVERABLE: (
+        "BLUE_GAP_LIMITED_DISCOVERABLE",
+        None
+    ),
+    EVT_BLUE_GAP_PAIRING_CMPLT: (
+        "BLUE_GAP_PAIRING_CMPLT",
+        "conn_handle:H@0 status:B@2"
+    ),
+    EVT_BLUE_GAP_PASS_KEY_REQUEST: (
+        "BLUE_GAP_PASS_KEY_REQUEST",
+        "conn_handle:H@0"
+    ),
+    EVT_BLUE_GAP_SLAVE_SECURITY_INITIATED: (
+        "BLUE_GAP_SLAVE_SECURITY_INITIATED",
+        None
+    ),
+    EVT_BLUE_GAP_BOND_LOST: (
+        "BLUE_GAP_BOND_LOST",
+        None
+    ),
+    EVT_BLUE_GAP_DEVICE_FOUND: (
+        "BLUE_GAP_DEVICE_FOUND",
+        "evt_type:B@0 bdaddr_type:B@1 bdaddr:6B@2 data_length:B@8 "
+        "data_rssi:119B@9"
+    ),
+    EVT_BLUE_GAP_PROCEDURE_COMPLETE: (
+        "BLUE_GAP_PROCEDURE_COMPLETE",
+        "procedure_code:B@0 status:B@1 data:126B@2"
+    ),
+    EVT_BLUE_GAP_ADDR_NOT_RESOLVED_IDB05A1: (
+        "BLUE_GAP_ADDR_NOT_RESOLVED_IDB05A1",
+        "conn_handle:H@0"
+    ),
+    EVT_BLUE_GAP_RECONNECTION_ADDRESS_IDB04A1: (
+        "BLUE_GAP_RECONNECTION_ADDRESS_IDB04A1",
+        "reconnection_address:6B@0"
+    ),
+    EVT_BLUE_GAP_AUTHORIZATION_REQUEST: (
+        "BLUE_GAP_AUTHORIZATION_REQUEST",
+        "conn_handle:H@0"
+    )
+}
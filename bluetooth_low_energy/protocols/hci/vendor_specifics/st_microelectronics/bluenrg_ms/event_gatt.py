@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0111
+from bluetooth_low_energy.protocols.hci.vendor_specifics.st_microelectronics.bluenrg_ms.event import (
+    EVT_BLUE_GATT_ATTRIBUTE_MODIFIED,
+    EVT_BLUE_GATT_PROCEDURE_TIMEOUT,
+    EVT_BLUE_ATT_EXCHANGE_MTU_RESP,
+    EVT_BLUE_ATT_FIND_INFORMATION_RESP,
+    EVT_BLUE_ATT_FIND_BY_TYPE_VAL_RESP,
+    EVT_BLUE_ATT_READ_BY_TYPE_RESP,
+    EVT_BLUE_ATT_READ_RESP,
+    EVT_BLUE_ATT_READ_BLOB_RESP,
+    EVT_BLUE_ATT_READ_MULTIPLE_RESP,
+    EVT_BLUE_ATT_READ_BY_GROUP_TYPE_RESP,
+    EVT_BLUE_ATT_PREPARE_WRITE_RESP,
+    EVT_BLUE_ATT_EXEC_WRITE_RESP,
+    EVT_BLUE_GATT_INDICATION,
+    EVT_BLUE_GATT_NOTIFICATION,
+    EVT_BLUE_GATT_PROCEDURE_COMPLETE,
+    EVT_BLUE_GATT_ERROR_RESP,
+    EVT_BLUE_GATT_DISC_READ_CHAR_BY_UUID_RESP,
+    EVT_BLUE_GATT_WRITE_PERMIT_REQ,
+    EVT_BLUE_GATT_READ_PERMIT_REQ,
+    EVT_BLUE_GATT_READ_MULTI_PERMIT_REQ,
+    EVT_BLUE_GATT_TX_POOL_AVAILABLE,
+    EVT_BLUE_GATT_SERVER_CONFIRMATION_EVENT,
+    EVT_BLUE_GATT_PREPARE_WRITE_PERMIT_REQ)
+
+"""
+BlueNRG-MS GATT/ATT vendor specific events (ecode 0x0C00-0x0FFF),
+loaded on first use by HCI_VENDOR_EVENTS (event.py)
+"""
+
+DESCRIPTORS = {
+    EVT_BLUE_GATT_ATTRIBUTE_MODIFIED: (
+        "BLUE_GATT_ATTRIBUTE_MODIFIED",
+        (
+            (
+                "IDB05A1",
+                "conn_handle:H@0 attr_handle:H@2 data_length:B@4 offset:H@5 "
+                "att_data:121B@7"
+            ),
+            (
+                "IDB04A1",
+                "conn_handle:H@0 attr_handle:H@2 data_length:B@4 "
+                "att_data:123B@5"
+            )
+        )
+    ),
+    EVT_BLUE_GATT_PROCEDURE_TIMEOUT: (
+        "BLUE_GATT_PROCEDURE_TIMEOUT",
+        "conn_handle:H@0"
+    ),
+    EVT_BLUE_ATT_EXCHANGE_MTU_RESP: (
+        "BLUE_ATT_EXCHANGE_MTU_RESP",
+        "conn_handle:H@0 event_data_length:B@2 server_rx_mtu:H@3"
+    ),
+    EVT_BLUE_ATT_FIND_INFORMATION_RESP: (
+        "BLUE_ATT_FIND_INFORMATION_RESP",
+        "conn_handle:H@0 event_data_length:B@2 format:B@3 "
+        "handle_uuid_pair:124B@4"
+    ),
+    EVT_BLUE_ATT_FIND_BY_TYPE_VAL_RESP: (
+        "BLUE_ATT_FIND_BY_TYPE_VAL_RESP",
+        "conn_handle:H@0 event_data_length:B@2 handles_info_list:125B@3"
+    ),
+    EVT_BLUE_ATT_READ_BY_TYPE_RESP: (
+        "BLUE_ATT_READ_BY_TYPE_RESP",
+        "conn_handle:H@0 event_data_length:B@2 handle_value_pair_length:B@3 "
+        "handle_value_pair:124B@4"
+    ),
+    EVT_BLUE_ATT_READ_RESP: (
+        "BLUE_ATT_READ_RESP",
+        "conn_handle:H@0 event_data_length:B@2 attribute_value:125B@3"
+    ),
+    EVT_BLUE_ATT_READ_BLOB_RESP: (
+        "BLUE_ATT_READ_BLOB_RESP",
+        "conn_handle:H@0 event_data_length:B@2 part_attribute_value:125B@3"
+    ),
+    EVT_BLUE_ATT_READ_MULTIPLE_RESP: (
+        "BLUE_ATT_READ_MULTIPLE_RESP",
+        "conn_handle:H@0 event_data_length:B@2 set_of_values:125B@3"
+    ),
+    EVT_BLUE_ATT_READ_BY_GROUP_TYPE_RESP: (
+        "BLUE_ATT_READ_BY_GROUP_TYPE_RESP",
+        "conn_handle:H@0 event_data_length:B@2 attribute_data_length:B@3 "
+        "attribute_data_list:124B@4"
+    ),
+    EVT_BLUE_ATT_PREPARE_WRITE_RESP: (
+        "BLUE_ATT_PREPARE_WRITE_RESP",
+        "conn_handle:H@0 event_data_length:B@2 attribute_handle:H@3 "
+        "offset:H@5 part_attr_value:121B@7"
+    ),
+    EVT_BLUE_ATT_EXEC_WRITE_RESP: (
+        "BLUE_ATT_EXEC_WRITE_RESP",
+        "conn_handle:H@0 event_data_length:B@2"
+    ),
+    EVT_BLUE_GATT_INDICATION: (
+        "BLUE_GATT_INDICATION",
+        "conn_handle:H@0 event_data_length:B@2 attr_handle:H@3 "
+        "attr_value:123B@5"
+    ),
+    EVT_BLUE_GATT_NOTIFICATION: (
+        "BLUE_GATT_NOTIFICATION",
+        "conn_handle:H@0 event_data_length:B@2 attr_handle:H@3 "
+        "attr_value:123B@5"
+    ),
+    EVT_BLUE_GATT_PROCEDURE_COMPLETE: (
+        "BLUE_GATT_PROCEDURE_COMPLETE",
+        "conn_handle:H@0 data_length:B@2 error_code:B@3"
+    ),
+    EVT_BLUE_GATT_ERROR_RESP: (
+        "BLUE_GATT_ERROR_RESP",
+        "conn_handle:H@0 event_data_length:B@2 req_opcode:B@3 attr_handle:H@4 "
+        "error_code:B@6"
+    ),
+    EVT_BLUE_GATT_DISC_READ_CHAR_BY_UUID_RESP: (
+        "BLUE_GATT_DISC_READ_CHAR_BY_UUID_RESP",
+        "conn_handle:H@0 event_data_length:B@2 attr_handle:H@3 "
+        "attr_value:123B@5"
+    ),
+    EVT_BLUE_GATT_WRITE_PERMIT_REQ: (
+        "BLUE_GATT_WRITE_PERMIT_REQ",
+        "conn_handle:H@0 attr_handle:H@2 data_length:B@4 data_buffer:123B@5"
+    ),
+    EVT_BLUE_GATT_READ_PERMIT_REQ: (
+        "BLUE_GATT_READ_PERMIT_REQ",
+        "conn_handle:H@0 attr_handle:H@2 data_length:B@4 offset:H@5"
+    ),
+    EVT_BLUE_GATT_READ_MULTI_PERMIT_REQ: (
+        "BLUE_GATT_READ_MULTI_PERMIT_REQ",
+        "conn_handle:H@0 data_length:B@2 data:125B@3"
+    ),
+    EVT_BLUE_GATT_TX_POOL_AVAILABLE: (
+        "BLUE_GATT_TX_POOL_AVAILABLE",
+        "conn_handle:H@0 available_buffers:H@2"
+    ),
+    EVT_BLUE_GATT_SERVER_CONFIRMATION_EVENT: (
+        "BLUE_GATT_SERVER_CONFIRMATION_EVENT",
+        "conn_handle:H@0"
+    ),
+    EVT_BLUE_GATT_PREPARE_WRITE_PERMIT_REQ: (
+        "BLUE_GATT_PREPARE_WRITE_PERMIT_REQ",
+        "conn_handle:H@0 attr_handle:H@2 offset:H@4 data_length:B@6 "
+        "data:121B@7"
+    )
+}
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0111
+from bluetooth_low_energy.protocols.hci.vendor_specifics.st_microelectronics.bluenrg_ms.event import (
+    EVT_BLUE_HAL_INITIALIZED,
+    EVT_BLUE_HAL_EVENTS_LOST_IDB05A1,
+    EVT_BLUE_HAL_CRASH_INFO_IDB05A1)
+
+"""
+BlueNRG-MS HAL vendor specific events (ecode 0x0000-0x03FF),
+loaded on first use by HCI_VENDOR_EVENTS (event.py)
+"""
+
+DESCRIPTORS = {
+    EVT_BLUE_HAL_INITIALIZED: (
+        "BLUE_HAL_INITIALIZED",
+        "reason_code:B@0"
+    ),
+    EVT_BLUE_HAL_EVENTS_LOST_IDB05A1: (
+        "BLUE_HAL_EVENTS_LOST_IDB05A1",
+        "lost_events:8B@0"
+    ),
+    EVT_BLUE_HAL_CRASH_INFO_IDB05A1: (
+        "BLUE_HAL_CRASH_INFO_IDB05A1",
+        "crash_type:B@0 sp:I@1 sp1:I@5 r0:I@9 r1:I@13 r2:I@17 r3:I@21 "
+        "r12:I@25 lr:I@29 pc:I@33 xpsr:I@37 debug_data_len:B@41 "
+        "debug_data:82B@46"
+    )
+}
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0111
+from bluetooth_low_energy.protocols.hci.vendor_specifics.st_microelectronics.bluenrg_ms.event import (
+    EVT_BLUE_L2CAP_CONN_UPD_RESP,
+    EVT_BLUE_L2CAP_PROCEDURE_TIMEOUT,
+    EVT_BLUE_L2CAP_CONN_UPD_REQ)
+
+"""
+BlueNRG-MS L2CAP vendor specific events (ecode 0x0800-0x0BFF),
+loaded on first use by HCI_VENDOR_EVENTS (event.py)
+"""
+
+DESCRIPTORS = {
+    EVT_BLUE_L2CAP_CONN_UPD_RESP: (
+        "BLUE_L2CAP_CONN_UPD_RESP",
+        "conn_handle:H@0 event_data_length:B@2 code:B@3 identifier:B@4 "
+        "l2cap_length:H@5 result:H@7"
+    ),
+    EVT_BLUE_L2CAP_PROCEDURE_TIMEOUT: (
+        "BLUE_L2CAP_PROCEDURE_TIMEOUT",
+        "conn_handle:H@0 event_data_length:B@2"
+    ),
+    EVT_BLUE_L2CAP_CONN_UPD_REQ: (
+        "BLUE_L2CAP_CONN_UPD_REQ",
+        "conn_handle:H@0 event_data_length:B@2 identifier:B@3 "
+        "l2cap_length:H@4 interval_min:H@6 interval_max:H@8 "
+        "slave_latency:H@10 timeout_mult:H@12"
+    )
+}
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0103
+# pylint: disable=C0111
+from bluetooth_low_energy.protocols.hci import HCI_READ_PACKET_SIZE
+
+"""
+HCI transports
+
+A transport carries H4 framed HCI packets (packet type byte first) between
+the host stack and the controller:
+
+    send(header, param)  write one packet, header includes the type byte
+    recv_into(buf, size) read at most one packet into a PacketBuffer and
+                         return a memoryview of it, None if nothing is pending
+    any()                True while the controller has data to be read
+    irq(handler)         call handler(transport) from interrupt context when
+                         data becomes available, None to disable
+
+recv_into() makes a single attempt and never sleeps, retries and delays are
+up to the caller.
+"""
+
+
+class Transport(object):
+    """Transport"""
+
+    # True while a transfer is in progress
+    busy = False
+
+    def reset(self):
+        """Hardware reset of the controller, if wired"""
+        pass
+
+    def any(self):
+        raise NotImplementedError()
+
+    def send(self, header, param=b'', retry=5):
+        raise NotImplementedError()
+
+    def recv_into(self, buf, size=HCI_READ_PACKET_SIZE):
+        raise NotImplementedError()
+
+    def irq(self, handler=None):
+        raise NotImplementedError()
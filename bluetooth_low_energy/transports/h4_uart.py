@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0103
+# pylint: disable=C0111
+# pylint: disable=W0235
+import utime
+
+from bluetooth_low_energy.protocols.hci import HCI_READ_PACKET_SIZE
+from bluetooth_low_energy.protocols.hci.uart import HCI_UART_FRAMER
+from bluetooth_low_energy.transports import Transport
+
+"""
+H4 (UART) transport, Core specification 4.1 [vol 4] Part A
+
+Every packet is preceded by its packet type byte, see HCI_UART_HEADERS.
+"""
+
+
+class H4UART(Transport):
+    """
+    HCI over machine.UART (8N1, RTS/CTS as configured by the caller)
+
+    Received bytes are read in chunks of what the UART has available and
+    parsed by an HCI_UART_FRAMER, so recv_into() never waits for the rest
+    of a packet: it returns None and resumes on the next call.
+    """
+
+    def __init__(self, uart, rst_pin=None, size=HCI_READ_PACKET_SIZE, chunk=64):
+        super(H4UART, self).__init__()
+
+        if not hasattr(uart, "readinto"):
+            raise TypeError("")
+
+        self._uart = uart
+        self._rst_pin = rst_pin
+        self.framer = HCI_UART_FRAMER(size)
+        self._chunk = bytearray(chunk)
+        self._chunk_view = memoryview(self._chunk)
+        self._start = 0
+        self._end = 0
+
+    def reset(self):
+        """reset"""
+        if self._rst_pin is not None:
+            self._rst_pin.off()
+            utime.sleep_us(5)
+            self._rst_pin.on()
+            utime.sleep_us(5)
+        self.framer.reset()
+        self._start = self._end = 0
+
+    def any(self):
+        """any"""
+        return self._start < self._end or self._uart.any() > 0
+
+    def irq(self, handler=None):
+        """Call handler(transport) when the RX line goes idle"""
+        if not hasattr(self._uart, "IRQ_RXIDLE"):
+            raise NotImplementedError()
+        if handler is None:
+            self._uart.irq(handler=None)
+        else:
+            self._uart.irq(
+                handler=lambda uart: handler(self),
+                trigger=self._uart.IRQ_RXIDLE
+            )
+
+    def send(self, header, param=b'', retry=5):
+        """send"""
+        self.busy = True
+        try:
+            self._uart.write(header)
+            if param:
+                self._uart.write(param)
+        finally:
+            self.busy = False
+        return header
+
+    def recv_into(self, buf, size=HCI_READ_PACKET_SIZE):
+        """
+        Copy the next complete H4 packet into buf, None if the UART has no
+        complete packet yet. Packets longer than size are truncated.
+        """
+        if size > buf.size:
+            size = buf.size
+        self.busy = True
+        try:
+            while True:
+                if self._start == self._end:
+                    available = self._uart.any()
+                    if not available:
+                        return None
+                    count = self._uart.readinto(
+                        self._chunk,
+                        min(available, len(self._chunk))
+                    )
+                    if not count:
+                        return None
+                    self._start = 0
+                    self._end = count
+                self._start = self.framer.consume(
+                    self._chunk_view,
+                    self._start,
+                    self._end
+                )
+                frame = self.framer.frame
+                if frame is not None:
+                    length = min(len(frame), size)
+                    result = buf.view(length)
+                    if length == len(frame):
+                        result[:] = frame
+                    else:
+                        result[:] = frame[:length]
+                    return result
+        finally:
+            self.busy = False
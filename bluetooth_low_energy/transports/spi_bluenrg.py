@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0103
+# pylint: disable=C0111
+# pylint: disable=W0235
+import utime
+
+from bluetooth_low_energy.protocols.hci import HCI_READ_PACKET_SIZE
+from bluetooth_low_energy.protocols.hci.pool import PacketBuffer
+from bluetooth_low_energy.transports import Transport
+
+"""
+BlueNRG-MS SPI protocol
+
+Every transaction starts with a 5 bytes header exchange while CS is low:
+
+    master: | 0x0A (write) or 0x0B (read) | 0x00 | 0x00 | 0x00 | 0x00 |
+    slave:  | 0x02 (ready) | write buffer size | 0x00 | read size (LE16) |
+
+followed, if the slave is ready, by the bytes to write or by read size
+bytes clocked out with a 0xFF filler. The slave asserts the IRQ line while
+it has data to be read.
+"""
+
+_READ_HEADER_MASTER = b'\x0B\x00\x00\x00\x00'
+_WRITE_HEADER_MASTER = b'\x0A\x00\x00\x00\x00'
+
+
+class CSContext(object):
+
+    def __init__(self, pin):
+        self._pin = pin
+        self.active = False
+
+    def __enter__(self):
+        # Assert CS line
+        self.active = True
+        self._pin.off()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Release CS line
+        self._pin.on()
+        self.active = False
+        return exc_type is None and exc_value is None and traceback is None
+
+
+class SPIBlueNRG(Transport):
+    """
+    BlueNRG-MS SPI link: machine.SPI bus plus IRQ, RST and NSS pins
+    """
+
+    def __init__(self, spi_bus, irq_pin, rst_pin, nss_pin):
+        super(SPIBlueNRG, self).__init__()
+
+        if not hasattr(spi_bus, "write_readinto"):
+            raise TypeError("")
+
+        m_pins = (irq_pin, rst_pin, nss_pin)
+        if not all([hasattr(pin, "value") for pin in m_pins]):
+            raise TypeError("")
+
+        self._spi_bus = spi_bus
+
+        self._irq_pin = irq_pin
+        self._rst_pin = rst_pin
+        self._nss_pin = nss_pin
+
+        self._rw_header_slave = bytearray(5)
+        self._cs = CSContext(self._nss_pin)
+        self._filler = PacketBuffer(HCI_READ_PACKET_SIZE)
+        for i in range(self._filler.size):
+            self._filler.buffer[i] = 0xFF
+        self._irq_handler = None
+        self._irq_pin_handler_ref = self._irq_pin_handler
+
+        # Release CS line
+        self._nss_pin.on()
+
+    @property
+    def busy(self):
+        """True while CS is asserted"""
+        return self._cs.active
+
+    def reset(self):
+        """
+        Reset BlueNRG-MS module
+        """
+        self._rst_pin.off()
+        utime.sleep_us(5)
+        self._rst_pin.on()
+        utime.sleep_us(5)
+
+    def any(self):
+        """any"""
+        return bool(self._irq_pin.value())
+
+    def set_irq_as_output(self):
+        """Pull IRQ high"""
+        self._irq_pin.init(mode=self._irq_pin.OUT_PP,
+                           pull=self._irq_pin.PULL_NONE, value=1)
+
+    def set_irq_as_input(self):
+        """IRQ input"""
+        self._irq_pin.init(mode=self._irq_pin.IN,
+                           pull=self._irq_pin.PULL_DOWN)
+
+    def irq(self, handler=None):
+        """Call handler(transport) on the rising edge of the IRQ line"""
+        self._irq_handler = handler
+        if handler is None:
+            self._irq_pin.irq(handler=None)
+        else:
+            self._irq_pin.irq(
+                handler=self._irq_pin_handler_ref,
+                trigger=self._irq_pin.IRQ_RISING
+            )
+
+    def _irq_pin_handler(self, pin):
+        self._irq_handler(self)
+
+    def recv_into(self, buf, size=HCI_READ_PACKET_SIZE):
+        """
+        Read packet from BlueNRG-MS module into a preallocated PacketBuffer
+
+        Single header exchange, returns a memoryview of the filled slice or
+        None, nothing is allocated once the packet length has been seen by buf.
+        """
+        if size > buf.size:
+            size = buf.size
+        with self._cs:
+            # Exchange header
+            self._spi_bus.write_readinto(
+                _READ_HEADER_MASTER,
+                self._rw_header_slave
+            )
+            rx_read_bytes = (
+                self._rw_header_slave[4] << 8
+            ) | self._rw_header_slave[3]
+            if self._rw_header_slave[0] == 0x02 and rx_read_bytes > 0:
+                # SPI is ready
+                # avoid to read more data that size of the buffer
+                if rx_read_bytes > size:
+                    rx_read_bytes = size
+                result = buf.view(rx_read_bytes)
+                self._spi_bus.write_readinto(
+                    self._filler.view(rx_read_bytes),
+                    result
+                )
+                return result
+        return None
+
+    def send(self, header, param=b'', retry=5):
+        """
+        Write packet to BlueNRG-MS module
+        """
+        result = None
+        while retry:
+            with self._cs:
+                # Exchange header
+                self._spi_bus.write_readinto(
+                    _WRITE_HEADER_MASTER,
+                    self._rw_header_slave
+                )
+                rx_write_bytes = self._rw_header_slave[1]
+                rx_read_bytes = (
+                    self._rw_header_slave[4] << 8
+                ) | self._rw_header_slave[3]
+                if self._rw_header_slave[0] == 0x02 and (
+                        rx_write_bytes > 0 or rx_read_bytes > 0):
+                    # SPI is ready
+                    if header:
+                        # avoid to write more data that size of the buffer
+                        if rx_write_bytes >= len(header):
+                            result = bytearray(len(header))
+                            self._spi_bus.write_readinto(header, result)
+                            if param:
+                                rx_write_bytes -= len(header)
+                                # avoid to read more data that size of the
+                                # buffer
+                                if len(param) > rx_write_bytes:
+                                    tx_bytes = rx_write_bytes
+                                else:
+                                    tx_bytes = len(param)
+                                result = bytearray(tx_bytes)
+                                self._spi_bus.write_readinto(param, result)
+                                break
+                            else:
+                                break
+                        else:
+                            break
+                    else:
+                        break
+                else:
+                    utime.sleep_us(50)
+            retry -= 1
+
+        return result
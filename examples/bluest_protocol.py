@@ -14,8 +14,6 @@ from binascii import hexlify
 from bluetooth_low_energy.modules.st_microelectronics.spbtle_rf import SPBTLE_RF
 from bluetooth_low_energy.protocols.hci.vendor_specifics.st_microelectronics.bluenrg_ms import event as st_event
 from bluetooth_low_energy.protocols.hci.vendor_specifics.st_microelectronics.bluenrg_ms import constant as st_constant
-from bluetooth_low_energy.protocols.hci import HCI_EVENT_PKT
-from bluetooth_low_energy.protocols.hci import uart
 from bluetooth_low_energy.protocols.hci import event
 from bluetooth_low_energy.protocols.hci import status
 
@@ -60,6 +58,7 @@ class BlueSTProtocol(SPBTLE_RF):
         self.name = b'PyBLE'
 
         self.connection_handle = None
+        self.update_timers = []
 
         self.service_handle = None
         self.dev_name_char_handle = None
@@ -67,23 +66,32 @@ class BlueSTProtocol(SPBTLE_RF):
 
         self.hw_serv_handle = None
         self.acc_gyro_mag_bluest_char_handle = None
+        self.acc_gyro_mag_bluest_char_cmd = None
         self.pressure_bluest_char_handle = None
+        self.pressure_bluest_char_cmd = None
         self.temperature_bluest_char_handle = None
+        self.temperature_bluest_char_cmd = None
         self.pwr_bluest_char_handle = None
-
-    def run(self, *args, **kwargs):
-        def callback():
-            if self.connection_handle is not None:
-                if any([ACCELEROMETER_EXAMPLE, GYROSCOPE_EXAMPLE, MAGNETOMETER_EXAMPLE]):
-                    self.accgyromag_update()
-                if TEMPERATURE_EXAMPLE:
-                    self.temp_update()
-                if PRESS_EXAMPLE:
-                    self.press_update()
-                if PWR_EXAMPE:
-                    self.pwr_update()
-
-        super(BlueSTProtocol, self).run(callback=callback, callback_time=1000)
+        self.pwr_bluest_char_cmd = None
+
+        # Process events received from BlueNRG-MS
+        self.on(event.EVT_DISCONN_COMPLETE,
+                handler=lambda hci_evt: self.gap_disconnection_complete_cb())
+        self.on(event.EVT_LE_META_EVENT, event.EVT_LE_CONN_COMPLETE,
+                lambda hci_evt: self.gap_connection_complete_cb(
+                    bytes(hci_evt.struct.peer_bdaddr),
+                    hci_evt.struct.handle))
+        self.on(event.EVT_VENDOR, st_event.EVT_BLUE_GATT_ATTRIBUTE_MODIFIED,
+                lambda hci_evt: self.attribute_modified_cb(
+                    hci_evt.struct.attr_handle,
+                    hci_evt.struct.data_length,
+                    bytes(hci_evt.struct.att_data[
+                        :hci_evt.struct.data_length])))
+        self.on(event.EVT_VENDOR, st_event.EVT_BLUE_GATT_WRITE_PERMIT_REQ,
+                self.write_permit_req_cb)
+        self.on(event.EVT_VENDOR, st_event.EVT_BLUE_GATT_READ_PERMIT_REQ,
+                lambda hci_evt: self.read_request_cb(
+                    hci_evt.struct.attr_handle))
 
     def __start__(self):
         # Reset BlueNRG-MS
@@ -127,11 +135,9 @@ class BlueSTProtocol(SPBTLE_RF):
                 result.status))
         log.debug("aci_gatt_init %02x", result.status)
 
-        # Init BlueNRG GAP layer as peripheral or central
-        result = self.aci_gap_init_IDB05A1(
-            role=st_constant.GAP_PERIPHERAL_ROLE_IDB05A1,
-            privacy_enabled=bool(st_constant.PRIVACY_DISABLED),
-            device_name_char_len=len(self.name)).response_struct
+        # Init BlueNRG GAP layer as peripheral (of the module detected)
+        result = self.gap_init(
+            "peripheral", device_name_char_len=len(self.name)).response_struct
         if result.status != status.BLE_STATUS_SUCCESS:
             raise ValueError("aci_gap_init status: {:02x}".format(
                 result.status))
@@ -179,6 +185,21 @@ class BlueSTProtocol(SPBTLE_RF):
                 result.status))
         log.debug("aci_hal_set_tx_power_level %02x", result.status)
 
+        # update rate of each characteristic, while connected
+        rates = []
+        if any([ACCELEROMETER_EXAMPLE, GYROSCOPE_EXAMPLE, MAGNETOMETER_EXAMPLE]):
+            rates.append((100, self.accgyromag_update))
+        if TEMPERATURE_EXAMPLE:
+            rates.append((1000, self.temp_update))
+        if PRESS_EXAMPLE:
+            rates.append((1000, self.press_update))
+        if PWR_EXAMPE:
+            rates.append((5000, self.pwr_update))
+        self.update_timers = [
+            self.call_every_connected(period_ms, update)
+            for period_ms, update in rates
+        ]
+
     def add_feature_service(self):
         hw_sens_bluest_service_uuid = bytes(
             reversed([0x00, 0x00, 0x00, 0x00,
@@ -222,6 +243,10 @@ class BlueSTProtocol(SPBTLE_RF):
             raise ValueError("aci_gatt_add_char status: {:02x}".format(
                 result.status))
         self.acc_gyro_mag_bluest_char_handle = result.handle
+        self.acc_gyro_mag_bluest_char_cmd = self.aci_gatt_prepare_char_value(
+            serv_handle=self.hw_serv_handle,
+            char_handle=self.acc_gyro_mag_bluest_char_handle,
+            char_value_len=(2+3*3*2))
         log.info("#acc_gyro_mag_bluest_char_handle: %04x",
             self.acc_gyro_mag_bluest_char_handle)
 
@@ -239,6 +264,10 @@ class BlueSTProtocol(SPBTLE_RF):
             raise ValueError("aci_gatt_add_char status: {:02x}".format(
                 result.status))
         self.pressure_bluest_char_handle = result.handle
+        self.pressure_bluest_char_cmd = self.aci_gatt_prepare_char_value(
+            serv_handle=self.hw_serv_handle,
+            char_handle=self.pressure_bluest_char_handle,
+            char_value_len=(4+2))
         log.info("#pressure_bluest_char_handle: %04x",
                  self.pressure_bluest_char_handle)
 
@@ -256,6 +285,10 @@ class BlueSTProtocol(SPBTLE_RF):
             raise ValueError("aci_gatt_add_char status: {:02x}".format(
                 result.status))
         self.temperature_bluest_char_handle = result.handle
+        self.temperature_bluest_char_cmd = self.aci_gatt_prepare_char_value(
+            serv_handle=self.hw_serv_handle,
+            char_handle=self.temperature_bluest_char_handle,
+            char_value_len=(2+2))
         log.info("#temperature_bluest_char_handle: %04x",
                  self.temperature_bluest_char_handle)
 
@@ -273,6 +306,10 @@ class BlueSTProtocol(SPBTLE_RF):
             raise ValueError("aci_gatt_add_char status: {:02x}".format(
                 result.status))
         self.pwr_bluest_char_handle = result.handle
+        self.pwr_bluest_char_cmd = self.aci_gatt_prepare_char_value(
+            serv_handle=self.hw_serv_handle,
+            char_handle=self.pwr_bluest_char_handle,
+            char_value_len=9)
         log.info("#pwr_bluest_char_handle: %04x",
                  self.pwr_bluest_char_handle)
 
@@ -301,12 +338,8 @@ class BlueSTProtocol(SPBTLE_RF):
             acc_axis_x, acc_axis_y, acc_axis_z,
             gyto_axis_x, gyto_axis_y, gyto_axis_z,
             mag_axis_x, mag_axis_y, mag_axis_z)
-        result = self.aci_gatt_update_char_value(
-            serv_handle=self.hw_serv_handle,
-            char_handle=self.acc_gyro_mag_bluest_char_handle,
-            char_val_offset=0,
-            char_value_len=len(buffer),
-            char_value=buffer).response_struct
+        result = self.aci_gatt_update_prepared_char_value(
+            self.acc_gyro_mag_bluest_char_cmd, buffer)
         if result.status != status.BLE_STATUS_SUCCESS:
             raise ValueError("aci_gatt_update_char_value status: {:02x}".format(
                 result.status))
@@ -318,12 +351,8 @@ class BlueSTProtocol(SPBTLE_RF):
             "<HB",
             tick,
             (270 + urandom.randint(0, 32767)))
-        result = self.aci_gatt_update_char_value(
-            serv_handle=self.hw_serv_handle,
-            char_handle=self.temperature_bluest_char_handle,
-            char_val_offset=0,
-            char_value_len=len(buffer),
-            char_value=buffer).response_struct
+        result = self.aci_gatt_update_prepared_char_value(
+            self.temperature_bluest_char_cmd, buffer)
         if result.status != status.BLE_STATUS_SUCCESS:
             raise ValueError("aci_gatt_update_char_value status: {:02x}".format(
                 result.status))
@@ -339,12 +368,8 @@ class BlueSTProtocol(SPBTLE_RF):
             "<HHHHB",
             tick,
             chg, voltage, current, npwrstat)
-        result = self.aci_gatt_update_char_value(
-            serv_handle=self.hw_serv_handle,
-            char_handle=self.pwr_bluest_char_handle,
-            char_val_offset=0,
-            char_value_len=len(buffer),
-            char_value=buffer).response_struct
+        result = self.aci_gatt_update_prepared_char_value(
+            self.pwr_bluest_char_cmd, buffer)
         if result.status != status.BLE_STATUS_SUCCESS:
             raise ValueError("aci_gatt_update_char_value status: {:02x}".format(
                 result.status))
@@ -356,12 +381,8 @@ class BlueSTProtocol(SPBTLE_RF):
             "<HI",
             tick,
             100000 + urandom.randint(0, 32767))
-        result = self.aci_gatt_update_char_value(
-            serv_handle=self.hw_serv_handle,
-            char_handle=self.pressure_bluest_char_handle,
-            char_val_offset=0,
-            char_value_len=len(buffer),
-            char_value=buffer).response_struct
+        result = self.aci_gatt_update_prepared_char_value(
+            self.pressure_bluest_char_cmd, buffer)
         if result.status != status.BLE_STATUS_SUCCESS:
             raise ValueError("aci_gatt_update_char_value status: {:02x}".format(
                 result.status))
@@ -450,48 +471,29 @@ class BlueSTProtocol(SPBTLE_RF):
         log.debug("aci_gap_update_adv_data %02x", result.status)
 
     def __stop__(self):
+        for timer in self.update_timers:
+            self.cancel_timer(timer)
+        self.update_timers = []
+
         # Reset BlueNRG-MS
         self.reset()
 
-    def __process__(self, evt):
-        # Process event received from BlueNRG-MS
-        hci_uart = uart.HCI_UART.from_buffer(evt)
-        log.debug(hci_uart)
-        if hci_uart.pkt_type == HCI_EVENT_PKT:
-            hci_evt = event.HCI_EVENT.from_buffer(hci_uart.data)
-            log.debug(hci_evt)
-            if hci_evt.evtcode == event.EVT_DISCONN_COMPLETE:
-                self.gap_disconnection_complete_cb()
-            elif hci_evt.evtcode == event.EVT_LE_META_EVENT:
-                if hci_evt.subevtcode == event.EVT_LE_CONN_COMPLETE:
-                    self.gap_connection_complete_cb(
-                        hci_evt.struct.peer_bdaddr,
-                        hci_evt.struct.handle
-                    )
-            elif hci_evt.evtcode == event.EVT_VENDOR:
-                if hci_evt.subevtcode == st_event.EVT_BLUE_GATT_ATTRIBUTE_MODIFIED:
-                    self.attribute_modified_cb(
-                        hci_evt.struct.attr_handle,
-                        hci_evt.struct.data_length,
-                        hci_evt.struct.att_data[:hci_evt.struct.data_length]
-                    )
-                elif hci_evt.subevtcode == st_event.EVT_BLUE_GATT_WRITE_PERMIT_REQ:
-                    result = self.aci_gatt_write_response(
-                        conn_handle=self.connection_handle,
-                        attr_handle=hci_evt.struct.attr_handle,
-                        write_status=False,
-                        err_code=0,
-                        att_val_len=hci_evt.struct.data_length,
-                        att_val=hci_evt.struct.data_buffer[:hci_evt.struct.data_length]
-                        ).response_struct
-                    if result.status != status.BLE_STATUS_SUCCESS:
-                        self.attribute_modified_cb(
-                            hci_evt.struct.attr_handle,
-                            hci_evt.struct.data_length,
-                            hci_evt.struct.data_buffer[:hci_evt.struct.data_length]
-                        )
-                elif hci_evt.subevtcode == st_event.EVT_BLUE_GATT_READ_PERMIT_REQ:
-                    self.read_request_cb(hci_evt.struct.attr_handle)
+    def write_permit_req_cb(self, hci_evt):
+        data = bytes(hci_evt.struct.data_buffer[:hci_evt.struct.data_length])
+        result = self.aci_gatt_write_response(
+            conn_handle=self.connection_handle,
+            attr_handle=hci_evt.struct.attr_handle,
+            write_status=False,
+            err_code=0,
+            att_val_len=len(data),
+            att_val=data
+            ).response_struct
+        if result.status != status.BLE_STATUS_SUCCESS:
+            self.attribute_modified_cb(
+                hci_evt.struct.attr_handle,
+                len(data),
+                data
+            )
 
     def gap_connection_complete_cb(self, address, handle):
         log.info("gap_connection_complete_cb")
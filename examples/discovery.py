@@ -21,9 +21,6 @@ from bluetooth_low_energy.protocols.hci.vendor_specifics.st_microelectronics.blu
     CONFIG_DATA_PUBADDR_LEN,
     CONFIG_DATA_PUBADDR_OFFSET,
     RESET_NORMAL,
-    GAP_CENTRAL_ROLE_IDB05A1,
-    GAP_PERIPHERAL_ROLE_IDB05A1,
-    PRIVACY_DISABLED,
     ADV_IND,
     SCAN_RSP,
     ADV_DIRECT_IND,
@@ -35,17 +32,12 @@ from bluetooth_low_energy.protocols.hci.vendor_specifics.st_microelectronics.blu
     MIN_ENCRY_KEY_SIZE,
     USE_FIXED_PIN_FOR_PAIRING,
     BONDING)
-from bluetooth_low_energy.protocols.hci.uart import (
-    HCI_UART)
-from bluetooth_low_energy.protocols.hci import (
-    HCI_EVENT_PKT)
 from bluetooth_low_energy.protocols.hci.event import (
     EVT_LE_ADVERTISING_REPORT,
     EVT_DISCONN_COMPLETE,
     EVT_LE_CONN_COMPLETE,
     EVT_LE_META_EVENT,
-    EVT_VENDOR,
-    HCI_EVENT)
+    EVT_VENDOR)
 from bluetooth_low_energy.modules.st_microelectronics.spbtle_rf import (
     SPBTLE_RF)
 from bluetooth_low_energy.protocols.hci.status import (
@@ -68,6 +60,44 @@ class Discovery(SPBTLE_RF):
         self.connect_bdaddr = bdaddr
         self.client_connection = (isinstance(self.connect_bdaddr, (bytes, bytearray)) and len(self.connect_bdaddr) == 6)
 
+        # Process events received from BlueNRG-MS
+        self.on(EVT_DISCONN_COMPLETE,
+                handler=self.disconnection_complete_evt)
+        self.on(EVT_LE_META_EVENT, EVT_LE_CONN_COMPLETE,
+                self.connection_complete_evt)
+        self.on(EVT_LE_META_EVENT, EVT_LE_ADVERTISING_REPORT,
+                self.advertising_report_evt)
+        self.on(EVT_VENDOR, EVT_BLUE_GATT_ATTRIBUTE_MODIFIED,
+                lambda hci_evt: self.attribute_modified_cb(
+                    hci_evt.struct.attr_handle,
+                    hci_evt.struct.data_length,
+                    bytes(hci_evt.struct.att_data[
+                        :hci_evt.struct.data_length])))
+        self.on(EVT_VENDOR, EVT_BLUE_GATT_NOTIFICATION,
+                lambda hci_evt: self.notification_cb(
+                    hci_evt.struct.attr_handle,
+                    hci_evt.struct.event_data_length - 2,
+                    bytes(hci_evt.struct.attr_value[
+                        :hci_evt.struct.event_data_length - 2])))
+        self.on(EVT_VENDOR, EVT_BLUE_L2CAP_CONN_UPD_RESP,
+                lambda hci_evt: log.debug(
+                    "EVT_BLUE_L2CAP_CONN_UPD_RESP: %02x",
+                    hci_evt.struct.result))
+        self.on(EVT_VENDOR, EVT_BLUE_GAP_PROCEDURE_COMPLETE,
+                self.gap_procedure_complete_evt)
+        self.on(EVT_VENDOR, EVT_BLUE_GATT_DISC_READ_CHAR_BY_UUID_RESP,
+                lambda hci_evt: log.debug(
+                    "EVT_BLUE_GATT_DISC_READ_CHAR_BY_UUID_RESP: %02x",
+                    hci_evt.struct.attr_handle))
+        # Wait for gatt procedure complete event trigger related to
+        # Discovery Charac by UUID
+        self.on(EVT_VENDOR, EVT_BLUE_GATT_PROCEDURE_COMPLETE,
+                lambda hci_evt: log.debug("EVT_BLUE_GATT_PROCEDURE_COMPLETE"))
+        # New event available on BlueNRG-MS FW stack 7.1.b to know
+        # when there is a buffer available on GATT pool
+        self.on(EVT_VENDOR, EVT_BLUE_GATT_TX_POOL_AVAILABLE,
+                lambda hci_evt: log.debug("EVT_BLUE_GATT_TX_POOL_AVAILABLE"))
+
 
     def run(self, *args, **kwargs):
         def callback():
@@ -131,10 +161,8 @@ class Discovery(SPBTLE_RF):
         log.debug("aci_gatt_init %02x", result.status)
 
         # Init BlueNRG-MS GAP layer as peripheral or central
-        result = self.aci_gap_init_IDB05A1(
-            role=GAP_CENTRAL_ROLE_IDB05A1 \
-                if not self.client_connection else GAP_PERIPHERAL_ROLE_IDB05A1,
-            privacy_enabled=bool(PRIVACY_DISABLED),
+        result = self.gap_init(
+            "central" if not self.client_connection else "peripheral",
             device_name_char_len=len(self.name)).response_struct
         if result.status != BLE_STATUS_SUCCESS:
             raise ValueError("aci_gap_init status: {:02x}".format(
@@ -214,84 +242,44 @@ class Discovery(SPBTLE_RF):
                 result.status))
         log.info("aci_gap_create_connection %02x", result.status)
 
-    def __process__(self, event):
-        # Process event received from BlueNRG-MS
-        hci_uart = HCI_UART.from_buffer(event)
-        log.debug("%s", hci_uart)
-        if hci_uart.pkt_type == HCI_EVENT_PKT:
-            hci_evt = HCI_EVENT.from_buffer(hci_uart.data)
-            log.debug("%s", hci_evt)
-            if hci_evt.evtcode == EVT_DISCONN_COMPLETE:
-                log.info("EVT_DISCONN_COMPLETE")
-                self.disconnection_complete_cb()
-
-            elif hci_evt.evtcode == EVT_LE_META_EVENT:
-                log.info("EVT_LE_META_EVENT")
-
-                if hci_evt.subevtcode == EVT_LE_CONN_COMPLETE:
-                    log.info("EVT_LE_CONN_COMPLETE")
-                    self.connection_complete_cb(hci_evt.struct.peer_bdaddr, hci_evt.struct.handle)
-                    # result = self.aci_gap_terminate_gap_procedure(
-                    #     procedure_code=0x00
-                    # ).response_struct
-                    # if result.status != BLE_STATUS_SUCCESS:
-                    #     raise ValueError("aci_gap_terminate_gap_procedure status: {:02x}".format(
-                    #         result.status))
-                    # log.info("aci_gap_terminate_gap_procedure %02x", result.status)
-
-                elif hci_evt.subevtcode == EVT_LE_ADVERTISING_REPORT:
-                    hci_evt.data = hci_evt.data[1:]
-
-                    log.info("EVT_LE_ADVERTISING_REPORT %02x %s %d %s",
-                             hci_evt.struct.evt_type,
-                             hexlify(hci_evt.struct.bdaddr, ':'),
-                             hci_evt.struct.data_length,
-                             hexlify(hci_evt.struct.data_RSSI[:hci_evt.struct.data_length]))
-
-                    if hci_evt.struct.evt_type == ADV_IND:
-                        log.info("ADV_IND")
-                    elif hci_evt.struct.evt_type == SCAN_RSP:
-                        log.info("SCAN_RSP")
-                    elif hci_evt.struct.evt_type == ADV_DIRECT_IND:
-                        log.info("ADV_DIRECT_IND")
-
-            elif hci_evt.evtcode == EVT_VENDOR:
-                if hci_evt.subevtcode == EVT_BLUE_GATT_ATTRIBUTE_MODIFIED:
-                    log.debug("EVT_BLUE_GATT_ATTRIBUTE_MODIFIED")
-                    self.attribute_modified_cb(
-                        hci_evt.struct.attr_handle,
-                        hci_evt.struct.data_length,
-                        hci_evt.struct.att_data[:hci_evt.struct.data_length]
-                    )
-                elif hci_evt.subevtcode == EVT_BLUE_GATT_NOTIFICATION:
-                    log.debug("EVT_BLUE_GATT_NOTIFICATION")
-                    self.notification_cb(
-                        hci_evt.struct.attr_handle,
-                        hci_evt.struct.event_data_length - 2,
-                        hci_evt.struct.attr_value)
-                elif hci_evt.subevtcode == EVT_BLUE_L2CAP_CONN_UPD_RESP:
-                    log.debug(
-                        "EVT_BLUE_L2CAP_CONN_UPD_RESP: %02x",
-                        hci_evt.struct.result)
-                elif hci_evt.subevtcode == EVT_BLUE_GAP_PROCEDURE_COMPLETE:
-                    log.debug(
-                        "EVT_BLUE_GAP_PROCEDURE_COMPLETE: %02x",
-                        hci_evt.struct.procedure_code)
-                    if hci_evt.struct.procedure_code == GAP_GENERAL_DISCOVERY_PROC:
-                        log.info("GAP_GENERAL_DISCOVERY_PROC")
-                        self.start_discovery()
-                elif hci_evt.subevtcode == EVT_BLUE_GATT_DISC_READ_CHAR_BY_UUID_RESP:
-                    log.debug(
-                        "EVT_BLUE_GATT_DISC_READ_CHAR_BY_UUID_RESP: %02x",
-                        hci_evt.struct.attr_handle)
-                elif hci_evt.subevtcode == EVT_BLUE_GATT_PROCEDURE_COMPLETE:
-                    # Wait for gatt procedure complete event trigger related to
-                    # Discovery Charac by UUID
-                    log.debug("EVT_BLUE_GATT_PROCEDURE_COMPLETE")
-                elif hci_evt.subevtcode == EVT_BLUE_GATT_TX_POOL_AVAILABLE:
-                    # New event available on BlueNRG-MS FW stack 7.1.b to know
-                    # when there is a buffer available on GATT pool
-                    log.debug("EVT_BLUE_GATT_TX_POOL_AVAILABLE")
+    def disconnection_complete_evt(self, hci_evt):
+        log.info("EVT_DISCONN_COMPLETE")
+        self.disconnection_complete_cb()
+
+    def connection_complete_evt(self, hci_evt):
+        log.info("EVT_LE_CONN_COMPLETE")
+        self.connection_complete_cb(bytes(hci_evt.struct.peer_bdaddr), hci_evt.struct.handle)
+        # result = self.aci_gap_terminate_gap_procedure(
+        #     procedure_code=0x00
+        # ).response_struct
+        # if result.status != BLE_STATUS_SUCCESS:
+        #     raise ValueError("aci_gap_terminate_gap_procedure status: {:02x}".format(
+        #         result.status))
+        # log.info("aci_gap_terminate_gap_procedure %02x", result.status)
+
+    def advertising_report_evt(self, hci_evt):
+        hci_evt.data = hci_evt.data[1:]
+
+        log.info("EVT_LE_ADVERTISING_REPORT %02x %s %d %s",
+                 hci_evt.struct.evt_type,
+                 hexlify(hci_evt.struct.bdaddr, ':'),
+                 hci_evt.struct.data_length,
+                 hexlify(hci_evt.struct.data_RSSI[:hci_evt.struct.data_length]))
+
+        if hci_evt.struct.evt_type == ADV_IND:
+            log.info("ADV_IND")
+        elif hci_evt.struct.evt_type == SCAN_RSP:
+            log.info("SCAN_RSP")
+        elif hci_evt.struct.evt_type == ADV_DIRECT_IND:
+            log.info("ADV_DIRECT_IND")
+
+    def gap_procedure_complete_evt(self, hci_evt):
+        log.debug(
+            "EVT_BLUE_GAP_PROCEDURE_COMPLETE: %02x",
+            hci_evt.struct.procedure_code)
+        if hci_evt.struct.procedure_code == GAP_GENERAL_DISCOVERY_PROC:
+            log.info("GAP_GENERAL_DISCOVERY_PROC")
+            self.start_discovery()
 
     def attribute_modified_cb(self, handle, data_length, att_data):
         log.info("attribute_modified_cb %04x %d %s",
@@ -11,8 +11,6 @@ import logging
 from bluetooth_low_energy.modules.st_microelectronics.spbtle_rf import SPBTLE_RF
 from bluetooth_low_energy.protocols.hci.vendor_specifics.st_microelectronics.bluenrg_ms import event as st_event
 from bluetooth_low_energy.protocols.hci.vendor_specifics.st_microelectronics.bluenrg_ms import constant as st_constant
-from bluetooth_low_energy.protocols.hci import HCI_EVENT_PKT
-from bluetooth_low_energy.protocols.hci import uart
 from bluetooth_low_energy.protocols.hci import event
 from bluetooth_low_energy.protocols.hci import status
 
@@ -147,6 +145,13 @@ class Eddystone(SPBTLE_RF):
         self.dev_name_char_handle = None
         self.appearance_char_handle = None
         self.adv_count = 0
+
+        # Process events received from BlueNRG-MS
+        self.on(event.EVT_DISCONN_COMPLETE,
+                handler=lambda hci_evt: self.disconnection_complete_cb())
+        self.on(event.EVT_LE_META_EVENT, event.EVT_LE_CONN_COMPLETE,
+                lambda hci_evt: self.connection_complete_cb(
+                    bytes(hci_evt.struct.peer_bdaddr), hci_evt.struct.handle))
         if beacon_type is not None:
             global EDDYSTONE_BEACON_TYPE
             if beacon_type == 1:
@@ -167,8 +172,11 @@ class Eddystone(SPBTLE_RF):
         def callback():
             """ callback """
             log.debug("memory free %d", gc.mem_free())
+            log.debug("power %s", self.power_stats())
 
-        super(Eddystone, self).run(callback=callback, callback_time=1000)
+        # a beacon only wakes up for the controller and the callback
+        super(Eddystone, self).run(
+            callback=callback, callback_time=1000, low_power=True)
 
     def __start__(self):
         """ __start__ """
@@ -214,11 +222,9 @@ class Eddystone(SPBTLE_RF):
                 result.status))
         log.debug("aci_gatt_init %02x", result.status)
 
-        # Init BlueNRG GAP layer as peripheral
-        result = self.aci_gap_init_IDB05A1(
-            role=st_constant.GAP_PERIPHERAL_ROLE_IDB05A1,
-            privacy_enabled=bool(st_constant.PRIVACY_DISABLED),
-            device_name_char_len=len(self.name)).response_struct
+        # Init BlueNRG GAP layer as peripheral (of the module detected)
+        result = self.gap_init(
+            "peripheral", device_name_char_len=len(self.name)).response_struct
         if result.status != status.BLE_STATUS_SUCCESS:
             raise ValueError("aci_gap_init status: {:02x}".format(
                 result.status))
@@ -250,22 +256,6 @@ class Eddystone(SPBTLE_RF):
         # Reset BlueNRG-MS
         self.reset()
 
-    def __process__(self, evt):
-        """ Process event received from BlueNRG-MS """
-        hci_uart = uart.HCI_UART.from_buffer(evt)
-        log.debug("%s", hci_uart)
-        if hci_uart.pkt_type == HCI_EVENT_PKT:
-            hci_evt = event.HCI_EVENT.from_buffer(hci_uart.data)
-            log.debug("%s", hci_evt)
-            if hci_evt.evtcode == event.EVT_DISCONN_COMPLETE:
-                self.disconnection_complete_cb()
-            elif hci_evt.evtcode == event.EVT_LE_META_EVENT:
-                if hci_evt.subevtcode == event.EVT_LE_CONN_COMPLETE:
-                    self.connection_complete_cb(
-                        hci_evt.struct.peer_bdaddr, hci_evt.struct.handle)
-            elif hci_evt.evtcode == event.EVT_VENDOR:
-                pass
-
     def connection_complete_cb(self, bdaddr, handle):
         """ connection_complete_cb """
         log.info("connection_complete_cb %s", hexlify(bdaddr, ':'))
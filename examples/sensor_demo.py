@@ -11,15 +11,12 @@ import logging
 from binascii import hexlify
 
 from bluetooth_low_energy.modules.st_microelectronics.spbtle_rf import SPBTLE_RF
-from bluetooth_low_energy.protocols.hci import HCI_EVENT_PKT
 from bluetooth_low_energy.protocols.hci.event import (
     EVT_DISCONN_COMPLETE,
     EVT_LE_CONN_COMPLETE,
     EVT_LE_META_EVENT,
-    EVT_VENDOR,
-    HCI_EVENT)
+    EVT_VENDOR)
 from bluetooth_low_energy.protocols.hci.status import BLE_STATUS_SUCCESS
-from bluetooth_low_energy.protocols.hci.uart import HCI_UART
 from bluetooth_low_energy.protocols.hci.vendor_specifics.st_microelectronics.bluenrg_ms.constant import (
     AD_TYPE_COMPLETE_LOCAL_NAME,
     ADV_IND,
@@ -40,8 +37,6 @@ from bluetooth_low_energy.protocols.hci.vendor_specifics.st_microelectronics.blu
     FORMAT_SINT16,
     FORMAT_SINT24,
     FORMAT_UINT16,
-    GAP_CENTRAL_ROLE_IDB05A1,
-    GAP_PERIPHERAL_ROLE_IDB05A1,
     GATT_DONT_NOTIFY_EVENTS,
     GATT_NOTIFY_ATTRIBUTE_WRITE,
     GATT_NOTIFY_READ_REQ_AND_WAIT_FOR_APPL_RESP,
@@ -52,7 +47,6 @@ from bluetooth_low_energy.protocols.hci.vendor_specifics.st_microelectronics.blu
     NO_WHITE_LIST_USE,
     OOB_AUTH_DATA_ABSENT,
     PRIMARY_SERVICE,
-    PRIVACY_DISABLED,
     PUBLIC_ADDR,
     RESET_NORMAL,
     SECONDARY_SERVICE,
@@ -101,29 +95,40 @@ class SensorDemo(SPBTLE_RF):
         self.bdaddr = bytes(reversed([0x14, 0x34, 0x00, 0xE1, 0x80, 0x02]))
         self.connection_handle = None
         self.name = b'BlueNRG'
+        self.update_timers = []
 
         self.acc_serv_handle = None
         self.free_fall_char_handle = None
         self.acc_char_handle = None
+        self.acc_char_cmd = None
 
         self.env_serv_handle = None
         self.temp_char_handle = None
+        self.temp_char_cmd = None
         self.press_char_handle = None
+        self.press_char_cmd = None
         self.humidity_char_handle = None
+        self.humidity_char_cmd = None
+
+        # Process events received from BlueNRG-MS
+        self.on(EVT_DISCONN_COMPLETE,
+                handler=lambda hci_evt: self.gap_disconnection_complete_cb())
+        self.on(EVT_LE_META_EVENT, EVT_LE_CONN_COMPLETE,
+                lambda hci_evt: self.gap_connection_complete_cb(
+                    bytes(hci_evt.struct.peer_bdaddr),
+                    hci_evt.struct.handle))
+        self.on(EVT_VENDOR, EVT_BLUE_GATT_ATTRIBUTE_MODIFIED,
+                lambda hci_evt: self.attribute_modified_cb(
+                    hci_evt.struct.attr_handle,
+                    hci_evt.struct.data_length,
+                    bytes(hci_evt.struct.att_data[
+                        :hci_evt.struct.data_length])))
+        self.on(EVT_VENDOR, EVT_BLUE_GATT_READ_PERMIT_REQ,
+                lambda hci_evt: self.read_request_cb(
+                    hci_evt.struct.attr_handle))
 
         self.reset()
 
-    def run(self, *args, **kwargs):
-        def callback():
-            if self.connection_handle is not None:
-                # self.free_fall_notify()
-                self.acc_update()
-                self.temp_update()
-                self.press_update()
-                self.humidity_update()
-
-        super(SensorDemo, self).run(callback=callback, callback_time=1000)
-
     def __start__(self):
 
         # Reset BlueNRG-MS
@@ -175,11 +180,9 @@ class SensorDemo(SPBTLE_RF):
                 result.status))
         log.debug("aci_gatt_init %02x", result.status)
 
-        # Init BlueNRG GAP layer as peripheral or central
-        result = self.aci_gap_init_IDB05A1(
-            role=GAP_PERIPHERAL_ROLE_IDB05A1,
-            privacy_enabled=bool(PRIVACY_DISABLED),
-            device_name_char_len=len(self.name)).response_struct
+        # Init BlueNRG GAP layer as peripheral (of the module detected)
+        result = self.gap_init(
+            "peripheral", device_name_char_len=len(self.name)).response_struct
         if result.status != BLE_STATUS_SUCCESS:
             raise ValueError("aci_gap_init status: {:02x}".format(
                 result.status))
@@ -230,6 +233,15 @@ class SensorDemo(SPBTLE_RF):
 
         self.set_connectable()
 
+        # update rate of each characteristic, while connected
+        self.update_timers = [
+            # self.call_every_connected(1000, self.free_fall_notify),
+            self.call_every_connected(200, self.acc_update),
+            self.call_every_connected(1000, self.temp_update),
+            self.call_every_connected(1000, self.press_update),
+            self.call_every_connected(2000, self.humidity_update)
+        ]
+
     def add_acc_service(self):
         acc_service_uuid = bytes(
             reversed([0x02, 0x36, 0x6e, 0x80, 0xcf, 0x3a, 0x11, 0xe1,
@@ -282,6 +294,10 @@ class SensorDemo(SPBTLE_RF):
             raise ValueError("aci_gatt_add_char status: {:02x}".format(
                 result.status))
         self.acc_char_handle = result.handle
+        self.acc_char_cmd = self.aci_gatt_prepare_char_value(
+            serv_handle=self.acc_serv_handle,
+            char_handle=self.acc_char_handle,
+            char_value_len=6)
         log.info("#acc_char_handle: %04x", self.acc_char_handle)
 
     def free_fall_notify(self):
@@ -306,12 +322,8 @@ class SensorDemo(SPBTLE_RF):
         buffer = ustruct.pack(
             "<HHH",
             axis_x, axis_y, axis_z)
-        result = self.aci_gatt_update_char_value(
-            serv_handle=self.acc_serv_handle,
-            char_handle=self.acc_char_handle,
-            char_val_offset=0,
-            char_value_len=len(buffer),
-            char_value=buffer).response_struct
+        result = self.aci_gatt_update_prepared_char_value(
+            self.acc_char_cmd, buffer)
         if result.status != BLE_STATUS_SUCCESS:
             raise ValueError("aci_gatt_update_char_value status: {:02x}".format(
                 result.status))
@@ -361,6 +373,10 @@ class SensorDemo(SPBTLE_RF):
             raise ValueError("aci_gatt_add_char status: {:02x}".format(
                 result.status))
         self.temp_char_handle = result.handle
+        self.temp_char_cmd = self.aci_gatt_prepare_char_value(
+            serv_handle=self.env_serv_handle,
+            char_handle=self.temp_char_handle,
+            char_value_len=2)
         log.info("#temp_char_handle: %04x", self.temp_char_handle)
 
         uuid16 = ustruct.pack(
@@ -404,6 +420,10 @@ class SensorDemo(SPBTLE_RF):
             raise ValueError("aci_gatt_add_char status: {:02x}".format(
                 result.status))
         self.press_char_handle = result.handle
+        self.press_char_cmd = self.aci_gatt_prepare_char_value(
+            serv_handle=self.env_serv_handle,
+            char_handle=self.press_char_handle,
+            char_value_len=2)
         log.info("#press_char_handle: %04x", self.press_char_handle)
 
         char_format = ustruct.pack(
@@ -443,6 +463,10 @@ class SensorDemo(SPBTLE_RF):
             raise ValueError("aci_gatt_add_char status: {:02x}".format(
                 result.status))
         self.humidity_char_handle = result.handle
+        self.humidity_char_cmd = self.aci_gatt_prepare_char_value(
+            serv_handle=self.env_serv_handle,
+            char_handle=self.humidity_char_handle,
+            char_value_len=2)
         log.info("#humidity_char_handle: %04x", self.humidity_char_handle)
 
         char_format = ustruct.pack(
@@ -471,12 +495,8 @@ class SensorDemo(SPBTLE_RF):
         buffer = ustruct.pack(
             "<B",
             (270 + urandom.randint(0, 32767)))
-        result = self.aci_gatt_update_char_value(
-            serv_handle=self.env_serv_handle,
-            char_handle=self.temp_char_handle,
-            char_val_offset=0,
-            char_value_len=len(buffer),
-            char_value=buffer).response_struct
+        result = self.aci_gatt_update_prepared_char_value(
+            self.temp_char_cmd, buffer)
         if result.status != BLE_STATUS_SUCCESS:
             raise ValueError("aci_gatt_update_char_value status: {:02x}".format(
                 result.status))
@@ -486,12 +506,8 @@ class SensorDemo(SPBTLE_RF):
         buffer = ustruct.pack(
             "<H",
             100000 + urandom.randint(0, 32767))
-        result = self.aci_gatt_update_char_value(
-            serv_handle=self.env_serv_handle,
-            char_handle=self.press_char_handle,
-            char_val_offset=0,
-            char_value_len=len(buffer),
-            char_value=buffer).response_struct
+        result = self.aci_gatt_update_prepared_char_value(
+            self.press_char_cmd, buffer)
         if result.status != BLE_STATUS_SUCCESS:
             raise ValueError("aci_gatt_update_char_value status: {:02x}".format(
                 result.status))
@@ -501,12 +517,8 @@ class SensorDemo(SPBTLE_RF):
         buffer = ustruct.pack(
             "<H",
             (450 + urandom.randint(0, 32767) * 100))
-        result = self.aci_gatt_update_char_value(
-            serv_handle=self.env_serv_handle,
-            char_handle=self.humidity_char_handle,
-            char_val_offset=0,
-            char_value_len=len(buffer),
-            char_value=buffer).response_struct
+        result = self.aci_gatt_update_prepared_char_value(
+            self.humidity_char_cmd, buffer)
         if result.status != BLE_STATUS_SUCCESS:
             raise ValueError("aci_gatt_update_char_value status: {:02x}".format(
                 result.status))
@@ -548,34 +560,13 @@ class SensorDemo(SPBTLE_RF):
         log.debug("aci_gap_set_discoverable %02x", result.status)
 
     def __stop__(self):
+        for timer in self.update_timers:
+            self.cancel_timer(timer)
+        self.update_timers = []
+
         # Reset BlueNRG-MS
         self.reset()
 
-    def __process__(self, event):
-        # Process event received from BlueNRG-MS
-        hci_uart = HCI_UART.from_buffer(event)
-        log.debug(hci_uart)
-        if hci_uart.pkt_type == HCI_EVENT_PKT:
-            hci_evt = HCI_EVENT.from_buffer(hci_uart.data)
-            log.debug(hci_evt)
-            if hci_evt.evtcode == EVT_DISCONN_COMPLETE:
-                self.gap_disconnection_complete_cb()
-            elif hci_evt.evtcode == EVT_LE_META_EVENT:
-                if hci_evt.subevtcode == EVT_LE_CONN_COMPLETE:
-                    self.gap_connection_complete_cb(
-                        hci_evt.struct.peer_bdaddr,
-                        hci_evt.struct.handle
-                    )
-            elif hci_evt.evtcode == EVT_VENDOR:
-                if hci_evt.subevtcode == EVT_BLUE_GATT_ATTRIBUTE_MODIFIED:
-                    self.attribute_modified_cb(
-                        hci_evt.struct.attr_handle,
-                        hci_evt.struct.data_length,
-                        hci_evt.struct.att_data[:hci_evt.struct.data_length]
-                    )
-                elif hci_evt.subevtcode == EVT_BLUE_GATT_READ_PERMIT_REQ:
-                    self.read_request_cb(hci_evt.struct.attr_handle)
-
     def gap_connection_complete_cb(self, address, handle):
         log.info("gap_connection_complete_cb")
         self.connection_handle = handle
@@ -1,6 +1,23 @@
 # -*- coding: utf-8 -*-
+import ustruct
+
+from bluetooth_low_energy.modules.base_hci import BaseHCI
 from bluetooth_low_energy.protocols.hci import \
     cmd
+from bluetooth_low_energy.protocols.hci.encoder import (
+    HCI_COMMAND_BUFFER,
+    HCI_ENCODER,
+    HCI_PREPARED_COMMAND)
+from bluetooth_low_energy.protocols.hci.scheduler import (
+    HCI_COMMAND_SCHEDULER)
+from bluetooth_low_energy.protocols.hci.table import (
+    LazyTable,
+    compact,
+    expand)
+from bluetooth_low_energy.protocols.hci.vendor_specifics.st_microelectronics.bluenrg_ms.cmd import (
+    HCI_VENDOR_COMMANDS,
+    OCF_GAP_RESOLVE_PRIVATE_ADDRESS,
+    OCF_GATT_UPD_CHAR_VAL)
 
 def test_hci_command():
     names = (
@@ -40,5 +57,143 @@ def test_hci_command():
         hci_command = cmd.HCI_COMMAND(ogf=ogf, ocf=ocf)
         print(hci_command)
 
+def test_hci_encoder():
+    buf = HCI_COMMAND_BUFFER()
+    # layout from the request descriptor
+    encoder = HCI_ENCODER.get(cmd.OGF_LE_CTL, cmd.OCF_LE_SET_ADV_DATA)
+    length = encoder.encode(buf, 3, 3, b'\x02\x01\x06')
+    expected = ustruct.pack("<BHBB3s", 0x01, encoder.opcode, 4, 3,
+                            b'\x02\x01\x06')
+    if bytes(buf.buffer[:4 + length]) != expected:
+        raise ValueError(encoder.layout)
+    # explicit layout, variable strings padded and truncated
+    encoder = HCI_ENCODER.get(cmd.OGF_LE_CTL, cmd.OCF_LE_SET_ADV_DATA,
+                              "<B*H*")
+    length = encoder.encode(buf, 1, 4, b'\x01\x02', 0x0203, 1, b'\x05\x06')
+    if bytes(buf.param(length)) != ustruct.pack(
+            "<B4sH1s", 1, b'\x01\x02', 0x0203, b'\x05'):
+        raise ValueError(encoder.layout)
+    print(encoder.layout, length)
+
+class _Sent(BaseHCI):
+
+    def hci_send_cmd(self, cmd, is_async=False, timeout=1000, retry=5):
+        self.sent = bytes(cmd.request_data)
+
+
+def test_command_method():
+    hci = _Sent()
+    # bools pack as 0 / 1, arguments by name or position, 0 by default
+    hci.hci_le_set_scan_enable(True)
+    if hci.sent != b'\x01\x00':
+        raise ValueError(hci.sent)
+    hci.hci_le_set_scan_enable(filter_dup=1, enable=False)
+    if hci.sent != b'\x00\x01':
+        raise ValueError(hci.sent)
+    try:
+        hci.hci_le_set_scan_enable(enabled=True)
+    except TypeError:
+        pass
+    else:
+        raise ValueError("enabled")
+    # a returned command keeps its parameters once the next one is packed
+    advertise = hci.hci_le_set_advertise_enable(enable=1)
+    hci.hci_le_set_scan_enable(enable=0, filter_dup=1)
+    if advertise.request_struct.enable != 1 or \
+            bytes(advertise.request_data) != b'\x01':
+        raise ValueError(advertise.request_data)
+    print(hci.hci_le_set_scan_enable.__doc__)
+
+
+def _read_local_version():
+    return cmd.HCI_COMMAND(
+        ogf=cmd.OGF_INFO_PARAM, ocf=cmd.OCF_READ_LOCAL_VERSION)
+
+
+def test_command_scheduler():
+    scheduler = HCI_COMMAND_SCHEDULER(credits=2)
+    first, second = _read_local_version(), _read_local_version()
+    scheduler.submit(first)
+    scheduler.submit(second)
+    if scheduler.next() is not first or scheduler.next() is not second:
+        raise ValueError("next")
+    # no completion since they were sent: the credit comes back
+    scheduler.expire(first)
+    if scheduler.credits != 1:
+        raise ValueError(scheduler.credits)
+    # the controller answered in the meantime, its ncmd counts
+    scheduler.complete(0, 0)
+    scheduler.expire(second)
+    if scheduler.credits or scheduler:
+        raise ValueError(scheduler.credits)
+    # completed by another event, the credits are the ncmd ones
+    scheduler.complete(0, 1)
+    scheduler.submit(first)
+    scheduler.next()
+    scheduler.remove(first)
+    if scheduler.credits or scheduler:
+        raise ValueError(scheduler.credits)
+
+
+def test_hci_prepared_command():
+    cmd.HCI_COMMANDS[cmd.OGF_VENDOR_CMD] = HCI_VENDOR_COMMANDS
+    prepared = HCI_PREPARED_COMMAND(
+        cmd.OGF_VENDOR_CMD, OCF_GATT_UPD_CHAR_VAL,
+        ustruct.pack("<HHBB", 0x000C, 0x000E, 0, 0), 6, length_offset=5)
+    for value in (b'\x01\x02\x03\x04\x05\x06', b'\x07'):
+        prepared.set_value(value)
+        header, param = prepared.to_buffer(split=True)
+        expected = ustruct.pack(
+            "<BHBHHBB{:d}s".format(len(value)), 0x01, prepared.opcode,
+            6 + len(value), 0x000C, 0x000E, 0, len(value), value)
+        if bytes(header) + bytes(param) != expected:
+            raise ValueError(value)
+    prepared.response_data = b'\x00'
+    if prepared.status != 0 or prepared.response_struct.status != 0:
+        raise ValueError("status")
+    print(prepared)
+
+def test_hci_vendor_tables():
+    table = LazyTable(
+        "bluetooth_low_energy.protocols.hci.vendor_specifics."
+        "st_microelectronics.bluenrg_ms",
+        ((0x0080, 0x00FF, "cmd_gap"), (0x0100, 0x017F, "cmd_gatt")))
+    if table.loaded() or OCF_GATT_UPD_CHAR_VAL not in table:
+        raise ValueError(table)
+    if table.loaded() != [(0x0100, 0x017F)] or \
+            table[OCF_GATT_UPD_CHAR_VAL][0] != "GATT_UPD_CHAR_VAL":
+        raise ValueError(table.loaded())
+    # outside of the groups, or not in the DESCRIPTORS of a group
+    if table.get(0x0200) is not None or 0x017F in table:
+        raise ValueError(table)
+    if len(table) != len(list(table.items())) or len(table.loaded()) != 2:
+        raise ValueError(table)
+    print(table)
+
+def test_hci_descriptor_tables():
+    spec = "num_hndl:B@0 hndl:30{hndl:H@0 num_comp_pkts:H@2}@1"
+    descriptor = expand(spec)
+    if descriptor is not expand(spec) or compact(descriptor) != spec:
+        raise ValueError(descriptor)
+    # the variant of the module, None for none
+    entry = HCI_VENDOR_COMMANDS[1][OCF_GAP_RESOLVE_PRIVATE_ADDRESS]
+    if "address" not in expand(entry[1], "IDB05A1") or \
+            expand(entry[1], "IDB04A1") is not None:
+        raise ValueError(entry)
+    command = cmd.HCI_COMMAND(
+        ogf=cmd.OGF_LE_CTL, ocf=cmd.OCF_LE_READ_BUFFER_SIZE)
+    command.response_data = b'\x00\x1b\x00\x08'
+    if command.request_struct is not None or \
+            command.response_struct.pkt_len != 27 or \
+            command.response_struct.max_pkt != 8:
+        raise ValueError(command)
+    print(spec)
+
 if __name__ == "__main__":
     test_hci_command()
+    test_hci_encoder()
+    test_command_method()
+    test_command_scheduler()
+    test_hci_prepared_command()
+    test_hci_vendor_tables()
+    test_hci_descriptor_tables()
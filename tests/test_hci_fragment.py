@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+import logging
+import utime
+
+from bluetooth_low_energy.modules.st_microelectronics.bluenrg_ms import (
+    BlueNRG_MS)
+from bluetooth_low_energy.modules.st_microelectronics.virtual_bluenrg_ms import (
+    VirtualBlueNRG_MS)
+from bluetooth_low_energy.protocols.hci import acl, fragment, l2cap, uart
+from bluetooth_low_energy.protocols.hci.event import EVT_DISCONN_COMPLETE
+
+logging.basicConfig(level=logging.INFO)
+log = logging.getLogger("test_hci_fragment")
+
+
+def _packets(fragmenter, handle, cid, payload):
+    return [bytes(header) + bytes(data) for header, data in
+            fragmenter.fragments(handle, cid, payload)]
+
+
+def _feed(reassembler, packet):
+    return reassembler.feed(
+        acl.HCI_ACL.from_buffer(uart.HCI_UART.from_buffer(packet).data))
+
+
+def test_hci_fragment():
+    fragmenter = fragment.ACL_FRAGMENTER(pkt_len=27)
+    reassembler = fragment.ACL_REASSEMBLER(mtu=247, connections=2)
+    payload = bytes(range(200))
+
+    # interleaved fragments of two connections
+    first = _packets(fragmenter, 0x0801, l2cap.L2CAP_CID_ATT, payload)
+    second = _packets(fragmenter, 0x0802, l2cap.L2CAP_CID_ATT, payload[:60])
+    if len(first) != fragmenter.count(len(payload)) or len(second) != 3:
+        raise ValueError(len(first), len(second))
+    pdus = []
+    for index in range(len(first)):
+        for packets in (first, second):
+            if index < len(packets):
+                pdu = _feed(reassembler, packets[index])
+                if pdu is not None:
+                    pdus.append((pdu.cid, bytes(pdu.data)))
+    if pdus != [(l2cap.L2CAP_CID_ATT, payload[:60]),
+                (l2cap.L2CAP_CID_ATT, payload)] or len(reassembler):
+        raise ValueError(pdus)
+
+    # single packet PDU: a view of the packet itself
+    packet = _packets(fragmenter, 0x0801, l2cap.L2CAP_CID_ATT, b'\x0b\x40')
+    if len(packet) != 1 or bytes(_feed(reassembler, packet[0]).data) != \
+            b'\x0b\x40':
+        raise ValueError(packet)
+
+    # continuation without start, PDU beyond the MTU
+    _feed(reassembler, first[1])
+    _feed(reassembler, _packets(
+        fragmenter, 0x0801, l2cap.L2CAP_CID_ATT, bytes(300))[0])
+    if reassembler.dropped != 2 or len(reassembler):
+        raise ValueError(reassembler.dropped)
+    log.info("fragment: %d + %d packets, %d dropped",
+             len(first), len(second), reassembler.dropped)
+
+
+def test_hci_send_acl():
+    controller = VirtualBlueNRG_MS(latency_us=0, boot_us=0, acl_pkt_len=27)
+    bluenrg = BlueNRG_MS(**controller.wiring())
+    bluenrg.reset()
+    bluenrg.acl_init(mtu=247)
+    bluenrg.hci_send_acl(0x0801, l2cap.L2CAP_CID_ATT, bytes(100))
+    # 4 + 100 bytes in 27 bytes packets
+    if controller.acl_packets != 4:
+        raise ValueError(controller.acl_packets)
+    log.info("send: %d ACL packets", controller.acl_packets)
+
+
+def test_hci_acl_flow_control():
+    pdus = 20
+    payload = bytes(100)
+    # 2 buffers held 1 ms each
+    controller = VirtualBlueNRG_MS(
+        latency_us=0, boot_us=0, acl_buffers=2, acl_pkt_len=27,
+        acl_latency_us=1000)
+    bluenrg = BlueNRG_MS(**controller.wiring())
+    bluenrg.reset()
+    bluenrg.acl_init()
+
+    # without flow control the controller buffers are overrun
+    fragmenter = fragment.ACL_FRAGMENTER(pkt_len=27)
+    for header, data in fragmenter.fragments(
+            0x0801, l2cap.L2CAP_CID_ATT, payload):
+        bluenrg.write(header, data)
+    if not controller.acl_overruns:
+        raise ValueError("overrun")
+    bluenrg.reset()
+    controller.acl_packets = controller.acl_overruns = 0
+
+    start = utime.ticks_us()
+    for _ in range(pdus):
+        if not bluenrg.hci_send_acl(0x0801, l2cap.L2CAP_CID_ATT, payload):
+            raise ValueError("queued")
+    if not bluenrg.hci_acl_flush(timeout=1000):
+        raise ValueError("flush")
+    elapsed = utime.ticks_diff(utime.ticks_us(), start)
+    stats = bluenrg.acl_stats()
+    if controller.acl_overruns or controller.acl_packets != pdus * 4 or \
+            stats["sent"] != pdus * 4:
+        raise ValueError(controller.acl_overruns, controller.acl_packets)
+    log.info("flow control: %d packets, %d bytes/s, %d PDUs queued at most",
+             stats["sent"], pdus * len(payload) * 1000000 // max(elapsed, 1),
+             stats["max_queued"])
+
+
+class _Disconnected(BlueNRG_MS):
+
+    def __init__(self, controller):
+        super(_Disconnected, self).__init__(**controller.wiring())
+        self.controller = controller
+        self.events = []
+
+    def __start__(self):
+        self.reset()
+        self.acl_init()
+        # one buffer, never given back: the other PDUs stay queued
+        for _ in range(3):
+            self.hci_send_acl(0x0801, l2cap.L2CAP_CID_ATT, bytes(10))
+        self.controller.disconnect(0x0801)
+
+    def __stop__(self):
+        pass
+
+    def __process__(self, event):
+        self.events.append(event[1])
+        if event[1] == EVT_DISCONN_COMPLETE:
+            raise StopIteration()
+
+
+def test_acl_disconnection():
+    controller = VirtualBlueNRG_MS(
+        latency_us=0, boot_us=0, acl_buffers=1, acl_latency_us=10000000)
+    bluenrg = _Disconnected(controller)
+    try:
+        bluenrg.run()
+    except StopIteration:
+        pass
+    # the buffers are freed and the event still reaches __process__()
+    stats = bluenrg.acl_stats()
+    if EVT_DISCONN_COMPLETE not in bluenrg.events or stats["queued"] or \
+            stats["credits"] != 1:
+        raise ValueError(bluenrg.events, stats)
+    log.info("disconnection: %s", stats)
+
+
+if __name__ == "__main__":
+    test_hci_fragment()
+    test_hci_send_acl()
+    test_hci_acl_flow_control()
+    test_acl_disconnection()
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+import logging
+import uasyncio as asyncio
+import utime
+
+from bluetooth_low_energy.modules.st_microelectronics.bluenrg_ms import (
+    BlueNRG_MS)
+from bluetooth_low_energy.modules.st_microelectronics.virtual_bluenrg_ms import (
+    VirtualBlueNRG_MS)
+from bluetooth_low_energy.protocols.hci.cmd import (
+    HCI_COMMAND,
+    OCF_READ_LOCAL_VERSION,
+    OGF_INFO_PARAM)
+from bluetooth_low_energy.protocols.hci.future import HCI_FUTURE
+from bluetooth_low_energy.protocols.hci.vendor_specifics.st_microelectronics.bluenrg_ms.event import (
+    EVT_BLUE_HAL_INITIALIZED)
+
+logging.basicConfig(level=logging.INFO)
+log = logging.getLogger("test_hci_future")
+
+
+def _read_local_version():
+    return HCI_COMMAND(ogf=OGF_INFO_PARAM, ocf=OCF_READ_LOCAL_VERSION)
+
+
+def test_hci_future():
+    done = []
+    future = HCI_FUTURE(_read_local_version(), timeout=10)
+    future.add_done_callback(done.append)
+    try:
+        future.result()
+    except ValueError:
+        pass
+    else:
+        raise ValueError("pending")
+    if future.expired(utime.ticks_ms()) or \
+            not future.expired(utime.ticks_add(future.deadline, 1)):
+        raise ValueError("expired")
+    future.set_result()
+    # resolved once, the later resolutions are ignored
+    future.set_exception(ValueError("late"))
+    if done != [future] or future.result() is not future.cmd or \
+            future.expired(utime.ticks_add(future.deadline, 1)):
+        raise ValueError(done)
+
+    future = HCI_FUTURE(_read_local_version())
+    future.set_exception(ValueError("timeout"))
+    try:
+        future.result()
+    except ValueError as ex:
+        if ex.args != ("timeout",):
+            raise
+    else:
+        raise ValueError("set_exception")
+
+
+def test_hci_async():
+    controller = VirtualBlueNRG_MS(latency_us=1000, boot_us=0)
+    bluenrg = BlueNRG_MS(**controller.wiring())
+    bluenrg.reset()
+    bluenrg.hci_wait_event(subevtcode=EVT_BLUE_HAL_INITIALIZED)
+
+    # resolved by the completion read by hci_flush()
+    future = bluenrg.hci_async(bluenrg.aci_gatt_init)
+    if future is None or future.done():
+        raise ValueError("hci_async")
+    bluenrg.hci_flush()
+    if not future.done() or future.result().response_struct.status:
+        raise ValueError("resolved")
+
+    # never completed: failed by hci_expire_futures() after its timeout
+    controller.latency_us = 5000000
+    future = bluenrg.hci_send_cmd(
+        _read_local_version(), is_async=True, timeout=20)
+    bluenrg.hci_expire_futures()
+    if future.done():
+        raise ValueError("expired early")
+    utime.sleep_ms(30)
+    bluenrg.hci_expire_futures()
+    try:
+        future.result()
+    except ValueError as ex:
+        if ex.args != ("timeout",):
+            raise
+    else:
+        raise ValueError("expired")
+    # its credit is given back
+    controller.latency_us = 1000
+    if bluenrg.get_version() != "7.2c":
+        raise ValueError("get_version")
+    log.info("hci_async: %s", future.cmd)
+
+
+class _Task(BlueNRG_MS):
+
+    def __start__(self):
+        self.reset()
+        self.hci_wait_event(subevtcode=EVT_BLUE_HAL_INITIALIZED)
+
+    def __stop__(self):
+        pass
+
+
+def test_run_async():
+    controller = VirtualBlueNRG_MS(latency_us=2000, boot_us=0)
+    bluenrg = _Task(**controller.wiring())
+    ticks = []
+
+    async def other():
+        while True:
+            ticks.append(utime.ticks_ms())
+            await asyncio.sleep_ms(0)
+
+    async def main():
+        task = asyncio.create_task(bluenrg.run_async())
+        other_task = asyncio.create_task(other())
+        # the reset of __start__() fails the futures already pending
+        await asyncio.sleep_ms(0)
+        try:
+            cmd = await bluenrg.hci_async(bluenrg.hci_le_read_local_version)
+            if cmd is None:
+                raise ValueError("hci_le_read_local_version")
+            cmd = await bluenrg.hci_async(
+                bluenrg.aci_gatt_add_serv, service_uuid_type=1,
+                service_uuid=b'\x0F\x18', service_type=1, max_attr_records=4)
+            if not cmd.response_struct.handle:
+                raise ValueError(cmd.response_data)
+            # the other task runs while the commands are in flight
+            if not ticks:
+                raise ValueError("ticks")
+
+            controller.latency_us = 5000000
+            try:
+                await bluenrg.hci_send_cmd(
+                    _read_local_version(), is_async=True, timeout=20)
+            except ValueError as ex:
+                if ex.args != ("timeout",):
+                    raise
+            else:
+                raise ValueError("timeout")
+        finally:
+            other_task.cancel()
+            task.cancel()
+
+    asyncio.run(main())
+    log.info("run_async: %d ticks of the other task", len(ticks))
+
+
+class _Busy(_Task):
+
+    def __init__(self, *args, **kwargs):
+        super(_Busy, self).__init__(*args, **kwargs)
+        self.events = 0
+
+    def __process__(self, event):
+        self.events += 1
+
+
+def test_run_async_busy():
+    controller = VirtualBlueNRG_MS(latency_us=2000, boot_us=0)
+    bluenrg = _Busy(**controller.wiring())
+
+    async def main():
+        task = asyncio.create_task(bluenrg.run_async())
+        await asyncio.sleep_ms(0)
+        try:
+            # an event to read on every iteration of the loop
+            controller.advertise(5000)
+            controller.latency_us = 5000000
+            start = utime.ticks_ms()
+            # due before the future expires
+            fired = []
+            bluenrg.call_later(10, lambda: fired.append(utime.ticks_ms()))
+            try:
+                await bluenrg.hci_send_cmd(
+                    _read_local_version(), is_async=True, timeout=20)
+            except ValueError as ex:
+                if ex.args != ("timeout",):
+                    raise
+            else:
+                raise ValueError("timeout")
+            if utime.ticks_diff(utime.ticks_ms(), start) > 500:
+                raise ValueError("expired late")
+            if not fired or utime.ticks_diff(fired[0], start) > 500:
+                raise ValueError("timer")
+        finally:
+            task.cancel()
+
+    asyncio.run(main())
+    if not bluenrg.events:
+        raise ValueError("events")
+    log.info("run_async busy: %d events", bluenrg.events)
+
+
+if __name__ == "__main__":
+    test_hci_future()
+    test_hci_async()
+    test_run_async()
+    test_run_async_busy()
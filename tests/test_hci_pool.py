@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+import logging
+from micropython import heap_lock, heap_unlock
+
+# registers the vendor specific events
+from bluetooth_low_energy.modules.st_microelectronics.bluenrg_ms import (
+    BlueNRG_MS)
+from bluetooth_low_energy.modules.st_microelectronics.virtual_bluenrg_ms import (
+    VirtualBlueNRG_MS,
+    connection_complete,
+    gatt_attribute_modified)
+from bluetooth_low_energy.protocols.hci import pool
+from bluetooth_low_energy.protocols.hci.vendor_specifics.st_microelectronics.bluenrg_ms.event import (
+    EVT_BLUE_HAL_INITIALIZED)
+
+logging.basicConfig(level=logging.INFO)
+log = logging.getLogger("test_hci_pool")
+
+
+def test_hci_pool():
+    lengths = (4, 7, 15, 43)
+    rx_pool = pool.PacketPool(count=4)
+    rx_pool.prime(lengths)
+
+    # steady state: no allocation allowed
+    heap_lock()
+    try:
+        for _ in range(100):
+            for length in lengths:
+                buf = rx_pool.next()
+                view = buf.view(length)
+                view[length - 1] = 0xFF
+    finally:
+        heap_unlock()
+
+    log.info("%d buffers, %d lengths: no allocation", rx_pool.count, len(lengths))
+
+
+def test_packet_ring_take():
+    ring = pool.PacketRing(count=6, guard=1)
+    # around the end of the buffers
+    for _ in range(3):
+        ring.commit(ring.reserve().view(1))
+        ring.get()
+    for value in (1, 2, 3, 4):
+        buf = ring.reserve()
+        buf.buffer[0] = value
+        ring.commit(buf.view(1))
+    if ring.take(lambda packet: packet[0] == 5) is not None or \
+            ring.take(lambda packet: packet[0] == 3)[0] != 3:
+        raise ValueError("take")
+    buf = ring.reserve()
+    buf.buffer[0] = 5
+    ring.commit(buf.view(1))
+    packets = []
+    while len(ring):
+        packets.append(ring.get()[0])
+    if packets != [1, 2, 4, 5]:
+        raise ValueError(packets)
+    log.info("ring take: %s", packets)
+
+
+def test_event_pool():
+    event_pool = pool.EventPool(count=1)
+    packets = [memoryview(bytearray(packet)) for packet in (
+        gatt_attribute_modified(0x0801, 0x000E, b'\x01\x02'),
+        connection_complete(0x0801, b'\x01\x02\x03\x04\x05\x06'),
+        gatt_attribute_modified(0x0801, 0x0011, b'\x03\x04'))]
+    structs = []
+    for packet, field in zip(packets, ("conn_handle", "handle", "conn_handle")):
+        record = event_pool.acquire(packet)
+        structs.append(record.struct)
+        if getattr(record.struct, field) != 0x0801:
+            raise ValueError(record)
+        event_pool.release(record)
+    # one record, one struct per event type
+    if event_pool.records != 1 or structs[0] is not structs[2] or \
+            structs[2].attr_handle != 0x0011:
+        raise ValueError(structs)
+
+    kept = event_pool.acquire(packets[0]).retain()
+    event_pool.release(kept)
+    record = event_pool.acquire(packets[1])
+    if record is kept or event_pool.records != 2 or \
+            kept.struct.attr_handle != 0x000E:
+        raise ValueError(kept)
+    log.info("event pool: %d records, %d retained",
+             event_pool.records, event_pool.retained)
+
+
+def test_read_heap_lock():
+    controller = VirtualBlueNRG_MS(latency_us=0, boot_us=0)
+    bluenrg = BlueNRG_MS(**controller.wiring())
+    bluenrg.reset()
+    bluenrg.hci_wait_event(subevtcode=EVT_BLUE_HAL_INITIALIZED)
+    packets = [bytearray(packet) for packet in (
+        gatt_attribute_modified(0x0801, 0x000E, b'\x01\x02'),
+        connection_complete(0x0801, b'\x01\x02\x03\x04\x05\x06'))]
+    bluenrg.prime([len(packet) for packet in packets])
+
+    # steady state: the SPI receive path does not allocate
+    lengths = []
+    for _ in range(10):
+        for packet in packets:
+            controller.inject(packet)
+        heap_lock()
+        try:
+            for _ in packets:
+                lengths.append(len(bluenrg.read()))
+        finally:
+            heap_unlock()
+    if lengths != [len(packet) for packet in packets] * 10:
+        raise ValueError(lengths)
+    log.info("read: %d packets under heap_lock", len(lengths))
+
+
+if __name__ == "__main__":
+    test_hci_pool()
+    test_packet_ring_take()
+    test_event_pool()
+    test_read_heap_lock()
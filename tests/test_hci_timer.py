@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+import logging
+import utime
+
+from bluetooth_low_energy.protocols.hci.timer import TimerWheel
+
+logging.basicConfig(level=logging.INFO)
+log = logging.getLogger("test_hci_timer")
+
+
+def test_hci_timer():
+    wheel = TimerWheel(slots=8, tick_ms=5)
+    calls = []
+    fast = wheel.call_every(20, lambda: calls.append("fast"))
+    slow = wheel.call_every(70, lambda: calls.append("slow"))
+    once = wheel.call_later(33, lambda: calls.append("once"))
+    start = utime.ticks_add(fast.deadline, -20)
+
+    # 1 ms steps, then a step of 300 ms: the missed deadlines are skipped
+    for now in range(1, 501):
+        wheel.advance(utime.ticks_add(start, now))
+    if (calls.count("fast"), calls.count("slow"), calls.count("once")) != \
+            (25, 7, 1) or once.active:
+        raise ValueError(calls)
+    # drift free, whatever the lateness of the previous calls
+    if utime.ticks_diff(fast.deadline, start) != 520 or fast.late_max:
+        raise ValueError(fast.stats())
+    wheel.advance(utime.ticks_add(start, 800))
+    if fast.missed != 14 or slow.missed != 3 or \
+            utime.ticks_diff(fast.deadline, start) != 820:
+        raise ValueError(fast.stats(), slow.stats())
+    log.info("timers: %s", wheel.stats())
+
+    wheel.cancel(fast)
+    wheel.cancel(slow)
+    if len(wheel) or wheel.next_deadline() is not None:
+        raise ValueError(len(wheel))
+
+
+if __name__ == "__main__":
+    test_hci_timer()
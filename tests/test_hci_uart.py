@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import logging
+import ustruct
 
 from bluetooth_low_energy.protocols.hci import (
     acl,
@@ -52,5 +53,86 @@ def test_hci_uart():
             hci_evt = event.HCI_EVENT.from_buffer(hci_uart.data)
             log.info("%s", hci_evt)
 
+
+def test_hci_uart_framer():
+    buffers = (
+        b'\x04\x0e\x0c\x01\x01\x10\x00\x07\x071\x070\x00\x13\x00',
+        b'\x02@ \x07\x00\x03\x00\x04\x00\x0b@\x04',
+        b'\x01\x03\x0c\x00',
+        b'\x04>\x13\x01\x00\x01\x08\x01\x01\xc5l\x0c\xc36T\x18\x00\x00\x00H\x00\x05'
+    )
+    stream = b''.join(buffers)
+
+    for chunk in (1, 3, 64):
+        framer = uart.HCI_UART_FRAMER()
+        frames = []
+        for i in range(0, len(stream), chunk):
+            framer.feed(stream[i:i + chunk], lambda frame: frames.append(bytes(frame)))
+        log.info("chunk %d: %d frames", chunk, len(frames))
+        if tuple(frames) != buffers:
+            raise ValueError(frames)
+
+
+def test_hci_uart_zero_copy():
+    buffer = bytearray(b'\x02@ \x07\x00\x03\x00\x04\x00\x0b@\x04')
+    hci_acl = acl.HCI_ACL.from_buffer(uart.HCI_UART.from_buffer(buffer).data)
+    attp = att.ATT.from_buffer(l2cap.L2CAP.from_buffer(hci_acl.data).data)
+    kept = attp.copy()
+    # the views follow the receive buffer, the copy does not
+    buffer[-1] = 0x05
+    if bytes(attp.data) != b'@\x05' or bytes(kept.data) != b'@\x04':
+        raise ValueError(attp)
+    buffer = bytearray(
+        b'\x04>\x13\x01\x00\x01\x08\x01\x01\xc5l\x0c\xc36T\x18\x00\x00\x00H\x00\x05')
+    hci_evt = event.HCI_EVENT.from_buffer(uart.HCI_UART.from_buffer(buffer).data)
+    kept = hci_evt.copy()
+    buffer[4:] = bytes(len(buffer) - 4)
+    if kept.subevtcode != event.EVT_LE_CONN_COMPLETE or \
+            kept.struct.handle != 0x0801 or hci_evt.struct.handle:
+        raise ValueError(kept)
+    log.info("%s", kept)
+
+
+def test_hci_event_peek():
+    packets = (
+        (b'\x04\x0e\x0c\x01\x01\x10\x00\x07\x071\x070\x00\x13\x00',
+         event.EVT_CMD_COMPLETE, 0),
+        (b'\x04>\x13\x01\x00\x01\x08\x01\x01\xc5l\x0c\xc36T\x18\x00\x00\x00H\x00\x05',
+         event.EVT_LE_META_EVENT, event.EVT_LE_CONN_COMPLETE),
+        (b'\x02@ \x07\x00\x03\x00\x04\x00\x0b@\x04', 0, 0)
+    )
+    for packet, evtcode, subevtcode in packets:
+        if event.HCI_EVENT.peek_evtcode(packet) != evtcode or \
+                event.HCI_EVENT.peek_subevtcode(packet) != subevtcode:
+            raise ValueError(packet)
+        if evtcode:
+            hci_evt = event.HCI_EVENT.from_buffer(
+                uart.HCI_UART.from_buffer(packet).data)
+            if hci_evt.subevtcode != subevtcode or \
+                    hci_evt.struct is not hci_evt.struct:
+                raise ValueError(hci_evt)
+    log.info("peek: %d packets", len(packets))
+
+
+def test_hci_acl_header():
+    buf = bytearray(4)
+    for handle, pb, bc, length in ((0x0801, 2, 0, 7), (0x0fff, 1, 3, 0xffff),
+                                   (0, 0, 0, 0)):
+        acl.ACL_HEADER.pack_into(buf, 0, handle, pb, bc, length)
+        if acl.ACL_HEADER.unpack_from(buf) != (handle, pb, bc, length):
+            raise ValueError(buf)
+        if ustruct.unpack("<I", buf)[0] != \
+                handle | pb << 12 | bc << 14 | length << 16:
+            raise ValueError(buf)
+    hci_acl = acl.HCI_ACL(0x0801, 2, 0, b'\x03\x00\x04\x00\x0b\x40\x04')
+    if hci_acl.to_buffer() != b'\x01\x28\x07\x00\x03\x00\x04\x00\x0b@\x04':
+        raise ValueError(hci_acl.to_buffer())
+    log.info("acl header: %s", hci_acl)
+
+
 if __name__ == "__main__":
     test_hci_uart()
+    test_hci_uart_framer()
+    test_hci_uart_zero_copy()
+    test_hci_event_peek()
+    test_hci_acl_header()
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+import logging
+import ustruct
+
+from bluetooth_low_energy.modules.st_microelectronics.bluenrg_ms import (
+    BlueNRG_MS)
+from bluetooth_low_energy.protocols.hci import HCI_EVENT_PKT
+from bluetooth_low_energy.protocols.hci.event import EVT_CMD_COMPLETE
+from bluetooth_low_energy.transports.h4_uart import H4UART
+from bluetooth_low_energy.transports.loopback import Loopback
+
+logging.basicConfig(level=logging.INFO)
+log = logging.getLogger("test_transports")
+
+# HCI_Read_Local_Version_Information of an IDB05A1, firmware 7.2c
+_READ_LOCAL_VERSION = 0x1001
+_LOCAL_VERSION = ustruct.pack("<BBHBHH", 0, 0x07, 0x3107, 0x07, 0x0030, 0x23)
+
+
+def _controller(packet):
+    # command complete of the HCI command packet, None if unknown
+    opcode = packet[1] | packet[2] << 8
+    if opcode != _READ_LOCAL_VERSION:
+        return None
+    return ustruct.pack(
+        "<BBBBH", HCI_EVENT_PKT, EVT_CMD_COMPLETE, 3 + len(_LOCAL_VERSION),
+        1, opcode) + _LOCAL_VERSION
+
+
+class _UART(object):
+    """machine.UART answering the commands written to it"""
+
+    def __init__(self):
+        self._rx = bytearray()
+
+    def write(self, buf):
+        packet = bytes(buf)
+        if len(packet) >= 4:
+            response = _controller(packet)
+            if response is not None:
+                self._rx.extend(response)
+        return len(buf)
+
+    def any(self):
+        return len(self._rx)
+
+    def readinto(self, buf, nbytes):
+        # one byte at a time, the framer resumes on every call
+        count = min(nbytes, len(self._rx), 1)
+        buf[:count] = self._rx[:count]
+        self._rx = self._rx[count:]
+        return count
+
+
+def test_loopback():
+    transport = Loopback(
+        lambda transport, packet: transport.inject(_controller(packet)))
+    bluenrg = BlueNRG_MS(transport=transport)
+    if bluenrg.get_version() != "7.2c":
+        raise ValueError(transport.rx_packets)
+    if (transport.tx_packets, transport.rx_packets) != (1, 1):
+        raise ValueError(transport.tx_packets, transport.rx_packets)
+    log.info("loopback: %d sent, %d received",
+             transport.tx_packets, transport.rx_packets)
+
+
+def test_h4_uart():
+    bluenrg = BlueNRG_MS(transport=H4UART(_UART()))
+    if bluenrg.get_version() != "7.2c":
+        raise ValueError("get_version")
+    log.info("h4 uart: %s", bluenrg.get_version())
+
+
+if __name__ == "__main__":
+    test_loopback()
+    test_h4_uart()
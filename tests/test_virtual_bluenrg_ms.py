@@ -0,0 +1,410 @@
+# -*- coding: utf-8 -*-
+import logging
+import utime
+
+from bluetooth_low_energy.api.peripheral import Peripheral
+from bluetooth_low_energy.modules.st_microelectronics.bluenrg_ms import (
+    BlueNRG_MS)
+from bluetooth_low_energy.modules.st_microelectronics.virtual_bluenrg_ms import (
+    VirtualBlueNRG_MS)
+from bluetooth_low_energy.protocols.hci.cmd import (
+    HCI_COMMAND,
+    OCF_LE_CREATE_CONN,
+    OGF_LE_CTL)
+from bluetooth_low_energy.protocols.hci.event import (
+    EVT_CMD_COMPLETE,
+    EVT_DISCONN_COMPLETE,
+    EVT_LE_CONN_COMPLETE,
+    EVT_LE_META_EVENT,
+    EVT_VENDOR)
+from bluetooth_low_energy.protocols.hci.table import DESCRIPTORS
+from bluetooth_low_energy.protocols.hci.vendor_specifics.st_microelectronics.bluenrg_ms.event import (
+    EVT_BLUE_GATT_ATTRIBUTE_MODIFIED,
+    EVT_BLUE_HAL_INITIALIZED)
+from bluetooth_low_energy.protocols.hci.vendor_specifics.st_microelectronics.bluenrg_ms.status import (
+    BLE_STATUS_TIMEOUT)
+
+logging.basicConfig(level=logging.INFO)
+log = logging.getLogger("test_virtual_bluenrg_ms")
+
+
+def test_virtual_bluenrg_ms():
+    for module, version in (("IDB05A1", "7.2c"), ("IDB04A1", "6.4")):
+        controller = VirtualBlueNRG_MS(module=module, latency_us=0, boot_us=0)
+        bluenrg = BlueNRG_MS(**controller.wiring())
+        bluenrg.reset()
+        if bluenrg.get_version() != version:
+            raise ValueError(module)
+
+        bluenrg.aci_gatt_init()
+        first = bluenrg.aci_gatt_add_serv(
+            service_uuid_type=1, service_uuid=b'\x0F\x18', service_type=1,
+            max_attr_records=4).response_struct.handle
+        second = bluenrg.aci_gatt_add_serv(
+            service_uuid_type=1, service_uuid=b'\x0A\x18', service_type=1,
+            max_attr_records=4).response_struct.handle
+        if first == second:
+            raise ValueError("handle")
+
+        controller.gatt_write(0x000C, b'\x01\x02')
+        if not bluenrg.any():
+            raise ValueError("irq")
+        if bytes(bluenrg.read())[-2:] != b'\x01\x02':
+            raise ValueError("gatt_write")
+
+        log.info("%s: %d commands, %d events", module,
+                 controller.commands, controller.events)
+
+
+class _Collector(BlueNRG_MS):
+
+    def __init__(self, controller, count):
+        super(_Collector, self).__init__(**controller.wiring())
+        self.controller = controller
+        self.count = count
+        self.events = []
+
+    def __start__(self):
+        self.reset()
+        self.hci_wait_event(subevtcode=EVT_BLUE_HAL_INITIALIZED)
+        # connection and GATT write arrive before the command completion
+        self.controller.latency_us = 2000
+        self.controller.connect()
+        self.controller.gatt_write(0x000C, b'\x01')
+        self.get_version()
+
+    def __stop__(self):
+        pass
+
+    def __process__(self, event):
+        self.events.append(event[1])
+        if len(self.events) == self.count:
+            raise StopIteration()
+
+
+def test_event_queue():
+    controller = VirtualBlueNRG_MS(latency_us=0, boot_us=0)
+    bluenrg = _Collector(controller, 2)
+    try:
+        bluenrg.run()
+    except StopIteration:
+        pass
+    if bluenrg.events != [EVT_LE_META_EVENT, EVT_VENDOR]:
+        raise ValueError(bluenrg.events)
+    stats = bluenrg.event_queue_stats()
+    if stats["deferred"] != 2 or stats["dropped"]:
+        raise ValueError(stats)
+    log.info("event queue: %s", stats)
+
+
+def test_wait_deferred():
+    controller = VirtualBlueNRG_MS(latency_us=0, boot_us=0)
+    bluenrg = _started(controller)
+    # read while waiting for the completion of get_version()
+    controller.latency_us = 2000
+    controller.connect()
+    controller.gatt_write(0x000C, b'\x01')
+    controller.disconnect()
+    bluenrg.get_version()
+    if bluenrg.event_queue_stats()["queued"] != 3:
+        raise ValueError(bluenrg.event_queue_stats())
+    # evtcode and subevtcode both match: not the attribute modified one
+    if bluenrg.hci_wait_event(evtcode=EVT_VENDOR,
+                              subevtcode=EVT_BLUE_HAL_INITIALIZED,
+                              timeout=20) is not None or \
+            bluenrg.event_queue_stats()["queued"] != 3:
+        raise ValueError("evtcode and subevtcode")
+
+    start = utime.ticks_ms()
+    hci_evt = bluenrg.hci_wait_event(subevtcode=EVT_BLUE_GATT_ATTRIBUTE_MODIFIED)
+    if hci_evt is None or utime.ticks_diff(utime.ticks_ms(), start) > 100:
+        raise ValueError("hci_wait_event")
+    # the others are left in order
+    codes = [bluenrg.hci_wait_event().evtcode for _ in range(2)]
+    if codes != [EVT_LE_META_EVENT, EVT_DISCONN_COMPLETE] or \
+            bluenrg.event_queue_stats()["queued"]:
+        raise ValueError(codes)
+    # a completion returned completes its command first
+    future = bluenrg.hci_async(bluenrg.hci_le_read_local_version)
+    hci_evt = bluenrg.hci_wait_event()
+    if hci_evt is None or hci_evt.evtcode != EVT_CMD_COMPLETE or \
+            not future.done() or future.result().response_struct.status:
+        raise ValueError("completion")
+    log.info("wait deferred: %s", codes)
+
+
+def test_event_dispatch():
+    controller = VirtualBlueNRG_MS(latency_us=0, boot_us=0)
+    bluenrg = _Collector(controller, 0)
+    writes = []
+
+    def attribute_modified(hci_evt):
+        writes.append(bytes(
+            hci_evt.struct.att_data[:hci_evt.struct.data_length]))
+        raise StopIteration()
+
+    bluenrg.on(EVT_VENDOR, EVT_BLUE_GATT_ATTRIBUTE_MODIFIED,
+               attribute_modified,
+               lambda hci_evt: hci_evt.struct.attr_handle == 0x000C)
+    try:
+        bluenrg.run()
+    except StopIteration:
+        pass
+    # the connection has no handler, it goes to __process__()
+    if bluenrg.events != [EVT_LE_META_EVENT] or writes != [b'\x01']:
+        raise ValueError(bluenrg.events, writes)
+    log.info("dispatch: %s", writes)
+
+
+def _started(controller):
+    bluenrg = BlueNRG_MS(**controller.wiring())
+    bluenrg.reset()
+    bluenrg.hci_wait_event(subevtcode=EVT_BLUE_HAL_INITIALIZED)
+    return bluenrg
+
+
+def _add_serv(bluenrg, uuid):
+    return bluenrg.aci_gatt_add_serv(
+        service_uuid_type=1, service_uuid=uuid, service_type=1,
+        max_attr_records=4)
+
+
+def test_pipelined():
+    # 5 commands of 300 ms each, one at a time (ncmd 1): 1.5 s in all
+    controller = VirtualBlueNRG_MS(latency_us=300000, boot_us=0)
+    bluenrg = _started(controller)
+    with bluenrg.pipelined():
+        cmds = [_add_serv(bluenrg, bytes([0x0F, index])) for index in range(5)]
+    handles = set(cmd.response_struct.handle for cmd in cmds)
+    if len(handles) != 5 or [cmd.response_struct.status for cmd in cmds] != \
+            [0] * 5:
+        raise ValueError(handles)
+    log.info("pipelined: %s", sorted(handles))
+
+
+def test_pipelined_timeout():
+    controller = VirtualBlueNRG_MS(latency_us=0, boot_us=0)
+    bluenrg = _started(controller)
+    controller.latency_us = 5000000
+    try:
+        with bluenrg.pipelined(timeout=50):
+            cmds = [_add_serv(bluenrg, b'\x0F\x18'),
+                    _add_serv(bluenrg, b'\x0A\x18')]
+    except ValueError as ex:
+        if ex.args != ("timeout",):
+            raise
+    else:
+        raise ValueError("pipelined")
+    # never completed, failed one by one (the second once the first failed)
+    if [cmd.response_struct.status for cmd in cmds] != \
+            [BLE_STATUS_TIMEOUT] * 2 or not bluenrg.hci_flush():
+        raise ValueError([cmd.response_data for cmd in cmds])
+    log.info("pipelined timeout: %d commands", len(cmds))
+
+
+def test_pipelined_error():
+    controller = VirtualBlueNRG_MS(latency_us=1000, boot_us=0)
+    bluenrg = _started(controller)
+    # a CMD_STATUS error in the middle of the flush
+    controller.reject(OGF_LE_CTL, OCF_LE_CREATE_CONN, 0x0C)
+    create_conn = HCI_COMMAND(
+        ogf=OGF_LE_CTL, ocf=OCF_LE_CREATE_CONN, evtcode=EVT_LE_CONN_COMPLETE)
+    try:
+        with bluenrg.pipelined():
+            first = _add_serv(bluenrg, b'\x0F\x18')
+            bluenrg.hci_send_cmd(create_conn)
+            last = _add_serv(bluenrg, b'\x0A\x18')
+    except ValueError as ex:
+        if ex.args != (0x0C,):
+            raise
+    else:
+        raise ValueError("pipelined")
+    # the commands around it are completed all the same
+    if not first.response_data or not last.response_data or \
+            first.response_struct.handle == last.response_struct.handle or \
+            create_conn.response_struct.status != 0x0C:
+        raise ValueError(first.response_data, last.response_data)
+    if bluenrg.get_version() != "7.2c":
+        raise ValueError("get_version")
+    log.info("pipelined error: %s", create_conn.response_data)
+
+
+def test_irq_mode():
+    controller = VirtualBlueNRG_MS(latency_us=0, boot_us=0)
+    bluenrg = _started(controller)
+    bluenrg.enable_irq()
+    try:
+        for attr_handle in (0x000C, 0x000F, 0x0012):
+            controller.gatt_write(attr_handle, b'\x01')
+        # the rising edge schedules the drain, run before the next sleep
+        controller.poll()
+        utime.sleep_ms(1)
+        stats = bluenrg.burst_stats()
+        if (stats["bursts"], stats["packets"], stats["max_burst"]) != \
+                (1, 3, 3):
+            raise ValueError(stats)
+        # served from the ring, no SPI transfer
+        exchanges = controller.header_exchanges
+        handles = [bluenrg.read()[7] for _ in range(3)]
+        if handles != [0x0C, 0x0F, 0x12] or \
+                controller.header_exchanges != exchanges:
+            raise ValueError(handles)
+        if bluenrg.read() is not None:
+            raise ValueError("ring")
+    finally:
+        bluenrg.disable_irq()
+    log.info("irq: %s", bluenrg.burst_stats())
+
+
+def test_burst_mode():
+    # the first header after the IRQ edge reports nothing to read
+    controller = VirtualBlueNRG_MS(latency_us=0, boot_us=0, wake_headers=1)
+    bluenrg = _started(controller)
+    bluenrg.enable_burst(slots=8)
+    try:
+        for attr_handle in range(0x0C, 0x13):
+            controller.gatt_write(attr_handle, b'\x01')
+        # 7 packets, the ring holds 5: two bursts
+        handles = [bluenrg.read()[7] for _ in range(7)]
+        if handles != list(range(0x0C, 0x13)):
+            raise ValueError(handles)
+        stats = bluenrg.burst_stats()
+        if stats != {"bursts": 2, "packets": 7, "max_burst": 5,
+                     "wasted_headers": 1, "ring_full": 1}:
+            raise ValueError(stats)
+    finally:
+        bluenrg.disable_burst()
+    log.info("burst: %s", stats)
+
+
+def test_low_power():
+    controller = VirtualBlueNRG_MS(latency_us=0, boot_us=0)
+    bluenrg = _Collector(controller, 3)
+    calls = []
+
+    def callback():
+        calls.append(len(bluenrg.events))
+        if len(calls) == 3:
+            raise StopIteration()
+
+    try:
+        bluenrg.run(callback=callback, callback_time=5, low_power=True)
+    except StopIteration:
+        pass
+    stats = bluenrg.power_stats()
+    # the events are processed, the callbacks are due while asleep
+    if bluenrg.events != [EVT_LE_META_EVENT, EVT_VENDOR] or \
+            len(calls) != 3 or not stats["wakeups"] or \
+            stats["asleep_us"] < 5000:
+        raise ValueError(bluenrg.events, calls, stats)
+    log.info("low power: %s", stats)
+
+
+class _Sampler(BlueNRG_MS):
+
+    def __init__(self, controller):
+        super(_Sampler, self).__init__(**controller.wiring())
+        self.controller = controller
+        self.connection_handle = None
+        self.samples = 0
+        self.timer = None
+        self.on(EVT_LE_META_EVENT, EVT_LE_CONN_COMPLETE, self.connected)
+
+    def connected(self, hci_evt):
+        self.connection_handle = hci_evt.struct.handle
+
+    def __start__(self):
+        self.reset()
+        self.hci_wait_event(subevtcode=EVT_BLUE_HAL_INITIALIZED)
+        self.connection_handle = None
+        self.samples = 0
+        self.controller.connect(delay_us=30000)
+        self.timer = self.call_every_connected(5, self.sample)
+
+    def __stop__(self):
+        self.cancel_timer(self.timer)
+
+    def sample(self):
+        self.samples += 1
+        if self.samples == 3:
+            raise StopIteration()
+
+
+def test_call_every_connected():
+    controller = VirtualBlueNRG_MS(latency_us=0, boot_us=0)
+    bluenrg = _Sampler(controller)
+    # run() again does not stack the timers of the previous run
+    for _ in range(2):
+        try:
+            bluenrg.run()
+        except StopIteration:
+            pass
+        # skipped until the connection, 30 ms after __start__()
+        if bluenrg.samples != 3 or bluenrg.timer.fired < 6 or \
+                bluenrg.timer_stats()["timers"]:
+            raise ValueError(bluenrg.timer.stats())
+    log.info("call_every_connected: %s", bluenrg.timer.stats())
+
+
+def test_detect_module():
+    try:
+        for module in ("IDB04A1", "IDB05A1"):
+            controller = VirtualBlueNRG_MS(
+                module=module, latency_us=0, boot_us=0)
+            bluenrg = BlueNRG_MS(**controller.wiring())
+            bluenrg.reset()
+            if bluenrg.detect_module() != module:
+                raise ValueError(module)
+            if DESCRIPTORS.module != module:
+                raise ValueError("descriptors")
+            # the unsuffixed wrapper is the variant of the module
+            request = bluenrg.aci_gap_init(role=1).request_struct
+            if hasattr(request, "privacy_enabled") != (module == "IDB05A1"):
+                raise ValueError("aci_gap_init")
+            # gap_init detects the module and maps the role to its variant
+            controller = VirtualBlueNRG_MS(
+                module=module, latency_us=0, boot_us=0)
+            bluenrg = BlueNRG_MS(**controller.wiring())
+            bluenrg.reset()
+            hci_cmd = bluenrg.gap_init("central", device_name_char_len=4)
+            if bluenrg.module != module or \
+                    hci_cmd.request_struct.role != (
+                        0x04 if module == "IDB05A1" else 0x03) or \
+                    hci_cmd.response_struct.status:
+                raise ValueError("gap_init")
+            log.info("%s: %s", module, DESCRIPTORS)
+    finally:
+        DESCRIPTORS.bind("IDB05A1")
+
+
+def test_peripheral_module():
+    try:
+        for module in ("IDB04A1", "IDB05A1"):
+            controller = VirtualBlueNRG_MS(
+                module=module, latency_us=0, boot_us=0)
+            peripheral = Peripheral(
+                'aabbccddeeff', name=b'uble', **controller.wiring())
+            # detected once the HAL is initialized, before aci_gap_init
+            peripheral.__start__()
+            if peripheral.module != module or \
+                    peripheral.service_handle is None:
+                raise ValueError(module)
+            log.info("peripheral: %s", module)
+    finally:
+        DESCRIPTORS.bind("IDB05A1")
+
+
+if __name__ == "__main__":
+    test_virtual_bluenrg_ms()
+    test_event_queue()
+    test_wait_deferred()
+    test_event_dispatch()
+    test_pipelined()
+    test_pipelined_timeout()
+    test_pipelined_error()
+    test_irq_mode()
+    test_burst_mode()
+    test_low_power()
+    test_call_every_connected()
+    test_detect_module()
+    test_peripheral_module()